@@ -45,6 +45,9 @@ class BaseAgent(ABC):
         self.emotion_system = EmotionSystem()
         self.memory_system = MemorySystem(name)
 
+        # Random source (global RNG until a seeded battle hands over its own)
+        self.rng = random
+
         # Will be injected by BattleEngine or demo
         self.event_bus: Optional[EventBus] = None
         self.comm_channel: Optional[CommunicationChannel] = None
@@ -176,14 +179,9 @@ class BaseAgent(ABC):
 
         # Publish gift event
         if self.event_bus:
-            self.event_bus.publish(
+            self.event_bus.publish_fields(
                 EventType.GIFT_SENT,
-                {
-                    "agent": self.name,
-                    "gift": gift_name,
-                    "points": actual_points,
-                    "emotion": self.emotion_system.current_state.name
-                },
+                (self.name, gift_name, actual_points, self.emotion_system.current_state.name),
                 source=self.name,
                 timestamp=current_time
             )
@@ -252,7 +250,25 @@ class BaseAgent(ABC):
         """
         modifiers = self.emotion_system.get_modifiers()
         adjusted_prob = probability * modifiers.gift_frequency_multiplier
-        return random.random() < adjusted_prob
+        return self.rng.random() < adjusted_prob
+
+    def set_rng(self, rng):
+        """
+        Use a per-battle random source for this agent and its subsystems.
+
+        Args:
+            rng: random.Random instance owned by the battle
+        """
+        self.rng = rng
+        self.emotion_system.rng = rng
+        if self.strategic_intel:
+            self.strategic_intel.rng = rng
+
+        learning_agent = getattr(self, 'learning_agent', None)
+        for q_learner in (getattr(self, 'q_learner', None),
+                          getattr(learning_agent, 'q_learner', None)):
+            if q_learner is not None and hasattr(q_learner, 'rng'):
+                q_learner.rng = rng
 
     def get_stats(self) -> dict:
         """Get agent statistics."""
@@ -540,6 +556,7 @@ class BaseAgent(ABC):
             self.strategic_intel.max_deficit = 0
             self.strategic_intel.upcoming_boosts.clear()
             self.strategic_intel.strategy_changes.clear()
+            self.strategic_intel.clear_recovery_cache()
 
     def __repr__(self):
         return f"{self.__class__.__name__}(name={self.name}, emotion={self.emotion_system.current_state.name})"
@@ -14,7 +14,6 @@ Key features:
 
 import sys
 import os
-import random
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
@@ -178,7 +177,7 @@ class BudgetAwareKinetik(BaseAgent):
             if effective_budget >= 1000:
                 mid_range = [g for g in affordable if 500 <= g.coins <= effective_budget]
                 if mid_range:
-                    return random.choice(mid_range)
+                    return self.rng.choice(mid_range)
             return min(affordable, key=lambda g: g.coins)
         else:
             # Prefer impact - get biggest
@@ -101,19 +101,15 @@ class EmotionSystem:
             risk_tolerance=0.2,
             cooperation_level=0.5
         ),
-        EmotionalState.CHAOTIC: EmotionModifiers(
-            gift_frequency_multiplier=random.uniform(0.5, 2.5),
-            gift_size_multiplier=random.uniform(0.5, 2.0),
-            message_verbosity=random.uniform(0.5, 2.0),
-            risk_tolerance=random.uniform(0.3, 1.0),
-            cooperation_level=random.uniform(0.0, 1.0)
-        ),
+        # CHAOTIC is rolled per agent in _get_chaotic_modifiers()
     }
 
-    def __init__(self, initial_state: EmotionalState = EmotionalState.CALM):
+    def __init__(self, initial_state: EmotionalState = EmotionalState.CALM, rng=None):
         self.current_state = initial_state
         self.state_history = [(0, initial_state)]  # (time, state)
         self._emotional_momentum = 0  # Tracks how long in current state
+        self.rng = rng or random  # Per-battle random.Random (defaults to global RNG)
+        self._chaotic_modifiers: Optional[EmotionModifiers] = None
 
     def update_emotion(self, battle_context: dict) -> Optional[EmotionalState]:
         """
@@ -186,8 +182,22 @@ class EmotionSystem:
 
     def get_modifiers(self) -> EmotionModifiers:
         """Get current behavior modifiers based on emotion."""
+        if self.current_state == EmotionalState.CHAOTIC:
+            return self._get_chaotic_modifiers()
         return self.EMOTION_PROFILES[self.current_state]
 
+    def _get_chaotic_modifiers(self) -> EmotionModifiers:
+        """Roll this agent's CHAOTIC profile once, from its own random source."""
+        if self._chaotic_modifiers is None:
+            self._chaotic_modifiers = EmotionModifiers(
+                gift_frequency_multiplier=self.rng.uniform(0.5, 2.5),
+                gift_size_multiplier=self.rng.uniform(0.5, 2.0),
+                message_verbosity=self.rng.uniform(0.5, 2.0),
+                risk_tolerance=self.rng.uniform(0.3, 1.0),
+                cooperation_level=self.rng.uniform(0.0, 1.0)
+            )
+        return self._chaotic_modifiers
+
     def force_emotion(self, emotion: EmotionalState, time: int = 0):
         """Manually set emotion (for special events)."""
         self.current_state = emotion
@@ -522,10 +522,10 @@ class EvolvingStrikeMaster(BaseAgent):
         should_send = False
         send_reason = ""
 
-        if in_boost and random.random() < self.params['prefer_boost_phase']:
+        if in_boost and self.rng.random() < self.params['prefer_boost_phase']:
             should_send = True
             send_reason = "boost phase (learned preference)"
-        elif in_last_30s and random.random() < self.params['prefer_last_30s']:
+        elif in_last_30s and self.rng.random() < self.params['prefer_last_30s']:
             should_send = True
             send_reason = "last 30s (learned preference)"
         elif self.gloves_sent < self.params['min_gloves_per_battle'] and time_remaining < 60:
@@ -645,7 +645,7 @@ class EvolvingPhaseTracker(BaseAgent):
 
         # SUSPENSE: Wait 15-20 seconds before starting qualification
         # This creates tension - only 10-15 seconds left to qualify!
-        self.qualification_delay = random.randint(15, 20)
+        self.qualification_delay = self.rng.randint(15, 20)
         self.suspense_announced = False
 
         self._load_learned_params()
@@ -669,6 +669,11 @@ class EvolvingPhaseTracker(BaseAgent):
         """Set phase manager reference."""
         self.phase_manager = pm
 
+    def set_rng(self, rng):
+        """Use the battle's random source and redraw the qualification delay."""
+        super().set_rng(rng)
+        self.qualification_delay = self.rng.randint(15, 20)
+
     def reset_for_battle(self):
         """Reset state for new battle."""
         self.gifts_sent = 0
@@ -677,7 +682,7 @@ class EvolvingPhaseTracker(BaseAgent):
         self.urgent_mode_active = False
         self.total_donated = 0
         # Randomize qualification delay for suspense (15-20 seconds)
-        self.qualification_delay = random.randint(15, 20)
+        self.qualification_delay = self.rng.randint(15, 20)
         self.suspense_announced = False
 
     def decide_action(self, battle):
@@ -808,7 +813,7 @@ class EvolvingPhaseTracker(BaseAgent):
             send_chance = self.params['aggression_in_window']
 
         # Send gift
-        if random.random() < send_chance:
+        if self.rng.random() < send_chance:
             points = int(points * self.params['gift_size_multiplier'])
 
             mode_str = "🚨URGENT" if self.urgent_mode_active else ("🏁RACING" if self.race_mode_active else "")
@@ -117,8 +117,7 @@ class GPTPoweredAgent(BaseAgent):
             # Optional: Add reasoning as message
             if "reasoning" in decision and len(decision["reasoning"]) < 50:
                 # Sometimes add internal reasoning as flavor text
-                import random
-                if random.random() > 0.7:
+                if self.rng.random() > 0.7:
                     self.send_message(f"({decision['reasoning']})", message_type="internal")
 
         elif action == "message":
@@ -147,12 +146,11 @@ class GPTPoweredAgent(BaseAgent):
             return {"action": "wait", "reasoning": "Not critical"}
 
         else:  # random mode
-            import random
-            if random.random() > 0.85:  # 15% chance to act
+            if self.rng.random() > 0.85:  # 15% chance to act
                 return {
                     "action": "gift",
                     "gift_type": "Random Gift",
-                    "gift_value": random.randint(50, 200),
+                    "gift_value": self.rng.randint(50, 200),
                     "reasoning": "Random fallback action"
                 }
             return {"action": "wait", "reasoning": "Random wait"}
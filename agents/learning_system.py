@@ -9,20 +9,32 @@ Implements reinforcement learning and strategy optimization for agents:
 - Adaptive learning rates
 """
 
+import ast
 import math
 import random
+import uuid
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Callable
 from enum import Enum
 import json
 from datetime import datetime
 
+import numpy as np
+
 # Import database
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.battle_history import BattleHistoryDB, generate_battle_id
+from core.q_table_format import (
+    DEFAULT_CHUNK_ROWS, Q_TABLE_FILE_EXTENSION, QTableSnapshot, open_q_table, write_q_table,
+)
+from agents.strategy_search import (
+    GLOVE_SPACE, PHASE_TRACKER_SPACE, SNIPER_SPACE, ParamSpace,
+    evolve, glove_fitness, phase_tracker_fitness, rescore, sniper_fitness, to_columns,
+)
 
 
 class ActionType(Enum):
@@ -149,6 +161,282 @@ class Experience:
     done: bool
 
 
+ACTIONS: List[ActionType] = list(ActionType)
+ACTION_INDEX: Dict[ActionType, int] = {a: i for i, a in enumerate(ACTIONS)}
+
+
+class QRow(MutableMapping):
+    """Write-through action -> value view of one Q-table row."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: 'QTable', row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, action: ActionType) -> float:
+        return float(self._table._values[self._row][ACTION_INDEX[action]])
+
+    def __setitem__(self, action: ActionType, value: float):
+        self._table.set(self._row, action, value)
+
+    def __delitem__(self, action: ActionType):
+        self[action] = 0.0
+
+    def __iter__(self) -> Iterator[ActionType]:
+        return iter(ACTIONS)
+
+    def __len__(self) -> int:
+        return len(ACTIONS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class QTable(MutableMapping):
+    """
+    Dense Q-table: state keys map to integer rows of a states x actions array.
+
+    Keys are the discretized State tuples (any hashable works). Rows are
+    allocated on first sight and the array grows by doubling, so memory is
+    rows * len(ActionType) * 8 bytes. A row can be allocated (e.g. for a
+    next state seen only as a bootstrap target) without being "visited";
+    only visited rows count as entries, matching the old dict semantics.
+
+    Mapping access stays compatible with the old
+    Dict[tuple, Dict[ActionType, float]]: q_table[key] returns a QRow view
+    that reads and writes the array.
+
+    Writes mark their chunk of `chunk_rows` rows dirty so checkpoints
+    (BattleHistoryDB.save_q_table) only rewrite chunks changed since the
+    last clear_dirty(). `generation` identifies the table across
+    checkpoints: a stored row from another generation is rewritten in full.
+    """
+
+    def __init__(self, capacity: int = 64, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        self._index: Dict[Any, int] = {}
+        self._keys: List[Any] = []
+        self._visited_count = 0
+        self._capacity = 0
+        self.chunk_rows = chunk_rows
+        self.generation = uuid.uuid4().hex
+        self._dirty: set = set()
+        self._values = np.zeros((0, len(ACTIONS)), dtype=np.float64)
+        self._visited = np.zeros(0, dtype=bool)
+        self._grow(max(1, capacity))
+
+    def _grow(self, capacity: int):
+        values = np.zeros((capacity, len(ACTIONS)), dtype=np.float64)
+        values[:self._capacity] = self._values
+        visited = np.zeros(capacity, dtype=bool)
+        visited[:self._capacity] = self._visited
+        self._values, self._visited = values, visited
+        self._capacity = capacity
+
+    # ------------------------------------------------------------------
+    # Row access
+    # ------------------------------------------------------------------
+
+    def row(self, key: Any, create: bool = False) -> int:
+        """Row index for a key (-1 if unknown and not created)."""
+        row = self._index.get(key)
+        if row is None:
+            if not create:
+                return -1
+            row = len(self._keys)
+            if row >= self._capacity:
+                self._grow(self._capacity * 2)
+            self._index[key] = row
+            self._keys.append(key)
+            self._dirty.add(row // self.chunk_rows)
+        return row
+
+    def visit(self, key: Any) -> int:
+        """Row index for a key, allocating it and marking it as a table entry."""
+        row = self.row(key, create=True)
+        if not self._visited[row]:
+            self._visited[row] = True
+            self._visited_count += 1
+            self._dirty.add(row // self.chunk_rows)
+        return row
+
+    def is_visited(self, row: int) -> bool:
+        return row >= 0 and bool(self._visited[row])
+
+    def get(self, row: int, action: ActionType) -> float:
+        return float(self._values[row][ACTION_INDEX[action]])
+
+    def set(self, row: int, action: ActionType, value: float):
+        self._values[row][ACTION_INDEX[action]] = value
+        self._dirty.add(row // self.chunk_rows)
+
+    def row_max(self, row: int) -> float:
+        return float(self._values[row].max())
+
+    def best_action(self, row: int, actions: Optional[List[ActionType]] = None) -> ActionType:
+        """Highest-valued action in the row (first one on ties)."""
+        values = self._values[row]
+        if actions is None:
+            return ACTIONS[int(values.argmax())]
+        return actions[int(values[[ACTION_INDEX[a] for a in actions]].argmax())]
+
+    @property
+    def values(self):
+        """The allocated rows (states x actions)."""
+        return self._values[:len(self._keys)]
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._values.nbytes + self._visited.nbytes)
+
+    # ------------------------------------------------------------------
+    # Mapping interface (visited rows only)
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: Any) -> QRow:
+        row = self._index.get(key)
+        if row is None or not self._visited[row]:
+            raise KeyError(key)
+        return QRow(self, row)
+
+    def __setitem__(self, key: Any, actions: Dict[ActionType, float]):
+        row = self.visit(key)
+        new_values = [0.0] * len(ACTIONS)
+        for action, value in actions.items():
+            new_values[ACTION_INDEX[action]] = value
+        self._values[row][:] = new_values
+        self._dirty.add(row // self.chunk_rows)
+
+    def __delitem__(self, key: Any):
+        row = self._index.get(key)
+        if row is None or not self._visited[row]:
+            raise KeyError(key)
+        self._visited[row] = False
+        self._visited_count -= 1
+        self._values[row][:] = [0.0] * len(ACTIONS)
+        self._dirty.add(row // self.chunk_rows)
+
+    def __contains__(self, key: Any) -> bool:
+        row = self._index.get(key)
+        return row is not None and bool(self._visited[row])
+
+    def __iter__(self) -> Iterator[Any]:
+        return (key for row, key in enumerate(self._keys) if self._visited[row])
+
+    def __len__(self) -> int:
+        return self._visited_count
+
+    # ------------------------------------------------------------------
+    # Persistence (see core.q_table_format)
+    # ------------------------------------------------------------------
+
+    def mark_dirty(self, rows):
+        """Mark the chunks holding these rows as changed (bulk array writes)."""
+        self._dirty.update((np.asarray(rows) // self.chunk_rows).tolist())
+
+    @property
+    def dirty_chunks(self) -> List[int]:
+        return sorted(self._dirty)
+
+    def clear_dirty(self):
+        """Call once the table has been checkpointed."""
+        self._dirty.clear()
+
+    @property
+    def action_names(self) -> List[str]:
+        """Column order of the value array."""
+        return [a.value for a in ACTIONS]
+
+    @property
+    def row_count(self) -> int:
+        """Allocated rows (visited or not)."""
+        return len(self._keys)
+
+    @property
+    def chunk_count(self) -> int:
+        return -(-len(self._keys) // self.chunk_rows)
+
+    def export_chunk(self, chunk: int) -> Tuple[List[Any], bytes, bytes]:
+        """Keys, visited flags (one byte per row) and float64 values of a chunk."""
+        start = chunk * self.chunk_rows
+        end = min(start + self.chunk_rows, len(self._keys))
+        visited = self._visited[start:end].astype(np.uint8).tobytes()
+        values = self._values[start:end].astype("<f8", copy=False).tobytes()
+        return self._keys[start:end], visited, values
+
+    def snapshot(self, meta: Optional[Dict[str, Any]] = None) -> QTableSnapshot:
+        """Whole table as a QTableSnapshot (for .qtbl files)."""
+        keys, visited, values = [], bytearray(), bytearray()
+        for chunk in range(self.chunk_count):
+            chunk_keys, chunk_visited, chunk_values = self.export_chunk(chunk)
+            keys.extend(chunk_keys)
+            visited += chunk_visited
+            values += chunk_values
+        return QTableSnapshot(self.action_names, keys, bytes(visited),
+                              bytes(values), dict(meta or {}))
+
+    @classmethod
+    def from_snapshot(cls, snapshot: QTableSnapshot,
+                      chunk_rows: int = DEFAULT_CHUNK_ROWS) -> 'QTable':
+        """
+        Build a table from raw snapshot buffers (no per-entry parsing).
+
+        Columns are matched by action name, so tables saved before an
+        ActionType was added or removed still load; new actions start at 0.
+        """
+        rows = snapshot.rows
+        table = cls(capacity=max(rows, 64), chunk_rows=chunk_rows)
+        table._keys = list(snapshot.keys)
+        table._index = {key: row for row, key in enumerate(table._keys)}
+
+        stored = list(snapshot.actions)
+        columns = [stored.index(a.value) if a.value in stored else -1 for a in ACTIONS]
+
+        values = np.frombuffer(snapshot.values, dtype="<f8").reshape(rows, len(stored))
+        if columns == list(range(len(stored))):
+            table._values[:rows] = values
+        else:
+            for col, src in enumerate(columns):
+                if src >= 0:
+                    table._values[:rows, col] = values[:, src]
+        table._visited[:rows] = np.frombuffer(snapshot.visited, dtype=np.uint8)[:rows] != 0
+        table._visited_count = int(table._visited.sum())
+        return table
+
+
+class ReplayBuffer:
+    """
+    Fixed-size ring buffer of experiences stored as Q-table row indices.
+
+    Appends overwrite the oldest entry in O(1) (instead of list.pop(0)),
+    and a sampled batch is a set of parallel arrays ready for a vectorized
+    update.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._pos = 0
+        self._size = 0
+        self.states = np.zeros(capacity, dtype=np.int64)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float64)
+        self.next_states = np.zeros(capacity, dtype=np.int64)
+        self.dones = np.zeros(capacity, dtype=bool)
+
+    def append(self, state: int, action: int, reward: float, next_state: int, done: bool):
+        i = self._pos
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        self._pos = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def __len__(self) -> int:
+        return self._size
+
+
 class QLearningAgent:
     """
     Q-Learning based agent that learns optimal strategies.
@@ -166,21 +454,23 @@ class QLearningAgent:
         discount_factor: float = 0.95,
         epsilon: float = 0.35,            # BALANCE v1.1: was 0.3 - more exploration
         epsilon_decay: float = 0.992,     # BALANCE v1.1: was 0.995 - explore longer
-        min_epsilon: float = 0.08         # BALANCE v1.1: was 0.05 - maintain some exploration
+        min_epsilon: float = 0.08,        # BALANCE v1.1: was 0.05 - maintain some exploration
+        rng: Optional[random.Random] = None
     ):
         self.agent_type = agent_type
+        self.rng = rng or random  # Per-battle random source (defaults to global RNG)
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
         self.epsilon = epsilon
         self.epsilon_decay = epsilon_decay
         self.min_epsilon = min_epsilon
 
-        # Q-table: state -> action -> value
-        self.q_table: Dict[tuple, Dict[ActionType, float]] = {}
+        # Q-table: state rows x action columns
+        self.q_table = QTable()
 
-        # Experience buffer for replay
-        self.experience_buffer: List[Experience] = []
+        # Experience ring buffer for replay
         self.max_buffer_size = 1000
+        self.replay_buffer = ReplayBuffer(self.max_buffer_size)
 
         # Statistics
         self.episodes = 0
@@ -189,18 +479,15 @@ class QLearningAgent:
 
     def get_q_value(self, state: State, action: ActionType) -> float:
         """Get Q-value for state-action pair."""
-        state_key = state.to_tuple()
-        if state_key not in self.q_table:
-            self.q_table[state_key] = {a: 0.0 for a in ActionType}
-        return self.q_table[state_key].get(action, 0.0)
+        return self.q_table.get(self.q_table.visit(state.to_tuple()), action)
 
     def get_best_action(self, state: State) -> ActionType:
         """Get action with highest Q-value."""
-        state_key = state.to_tuple()
-        if state_key not in self.q_table:
-            return random.choice(list(ActionType))
+        row = self.q_table.row(state.to_tuple())
+        if not self.q_table.is_visited(row):
+            return self.rng.choice(ACTIONS)
 
-        return max(self.q_table[state_key].items(), key=lambda x: x[1])[0]
+        return self.q_table.best_action(row)
 
     def choose_action(self, state: State, available_actions: List[ActionType] = None) -> ActionType:
         """
@@ -213,61 +500,70 @@ class QLearningAgent:
         Returns:
             Selected action
         """
-        if available_actions is None:
-            available_actions = list(ActionType)
+        all_actions = available_actions is None
+        if all_actions:
+            available_actions = ACTIONS
 
         # Epsilon-greedy exploration
-        if random.random() < self.epsilon:
-            return random.choice(available_actions)
+        if self.rng.random() < self.epsilon:
+            return self.rng.choice(available_actions)
 
         # Exploitation: choose best action
-        state_key = state.to_tuple()
-        if state_key not in self.q_table:
-            return random.choice(available_actions)
+        row = self.q_table.row(state.to_tuple())
+        if not self.q_table.is_visited(row):
+            return self.rng.choice(available_actions)
 
         # Get best available action
-        q_values = {a: self.q_table[state_key].get(a, 0.0) for a in available_actions}
-        return max(q_values.items(), key=lambda x: x[1])[0]
+        return self.q_table.best_action(row, None if all_actions else available_actions)
 
     def update(self, experience: Experience):
         """Update Q-value based on experience."""
-        state_key = experience.state.to_tuple()
-
-        if state_key not in self.q_table:
-            self.q_table[state_key] = {a: 0.0 for a in ActionType}
+        table = self.q_table
+        row = table.visit(experience.state.to_tuple())
 
         # Current Q-value
-        current_q = self.q_table[state_key][experience.action]
+        current_q = table.get(row, experience.action)
 
-        # Calculate target Q-value
+        # Calculate target Q-value (unvisited next states are all-zero rows)
         if experience.done:
+            next_row = -1
             target_q = experience.reward
         else:
-            next_state_key = experience.next_state.to_tuple()
-            if next_state_key in self.q_table:
-                max_next_q = max(self.q_table[next_state_key].values())
-            else:
-                max_next_q = 0.0
-            target_q = experience.reward + self.discount_factor * max_next_q
+            next_row = table.row(experience.next_state.to_tuple(), create=True)
+            target_q = experience.reward + self.discount_factor * table.row_max(next_row)
 
         # Update Q-value
-        self.q_table[state_key][experience.action] = (
-            current_q + self.learning_rate * (target_q - current_q)
-        )
+        table.set(row, experience.action, current_q + self.learning_rate * (target_q - current_q))
 
         # Store experience for replay
-        self.experience_buffer.append(experience)
-        if len(self.experience_buffer) > self.max_buffer_size:
-            self.experience_buffer.pop(0)
+        self.replay_buffer.append(row, ACTION_INDEX[experience.action], experience.reward,
+                                  next_row, experience.done)
 
     def experience_replay(self, batch_size: int = 32):
-        """Learn from random batch of past experiences."""
-        if len(self.experience_buffer) < batch_size:
+        """
+        Learn from random batch of past experiences.
+
+        The batch is applied as one vectorized update: targets use the
+        Q-values from before the batch, and repeated state-action pairs
+        accumulate their deltas.
+        """
+        buffer = self.replay_buffer
+        if len(buffer) < batch_size:
             return
 
-        batch = random.sample(self.experience_buffer, batch_size)
-        for exp in batch:
-            self.update(exp)
+        batch = self.rng.sample(range(len(buffer)), batch_size)
+        values = self.q_table._values
+
+        idx = np.asarray(batch)
+        states = buffer.states[idx]
+        actions = buffer.actions[idx]
+        dones = buffer.dones[idx]
+
+        next_max = values[np.where(dones, 0, buffer.next_states[idx])].max(axis=1)
+        targets = buffer.rewards[idx] + np.where(dones, 0.0, self.discount_factor * next_max)
+        deltas = self.learning_rate * (targets - values[states, actions])
+        np.add.at(values, (states, actions), deltas)
+        self.q_table.mark_dirty(states)
 
     def end_episode(self, won: bool, total_reward: float):
         """Called at end of each battle."""
@@ -292,11 +588,46 @@ class QLearningAgent:
             'win_rate': self.wins / max(self.episodes, 1),
             'avg_reward': self.total_rewards / max(self.episodes, 1),
             'epsilon': self.epsilon,
-            'q_table_size': len(self.q_table)
+            'q_table_size': len(self.q_table),
+            'q_table_bytes': self.q_table.nbytes
         }
 
+    def _persisted_stats(self) -> Dict[str, Any]:
+        return {
+            'agent_type': self.agent_type,
+            'episodes': self.episodes,
+            'total_rewards': self.total_rewards,
+            'wins': self.wins,
+            'epsilon': self.epsilon
+        }
+
+    def _restore_stats(self, data: Dict[str, Any]):
+        self.epsilon = data.get('epsilon', self.epsilon)
+        self.episodes = data.get('episodes', self.episodes)
+        self.total_rewards = data.get('total_rewards', self.total_rewards)
+        self.wins = data.get('wins', self.wins)
+
+    def _replace_q_table(self, table: QTable):
+        # Replay entries hold row indices into the old table
+        self.q_table = table
+        self.replay_buffer = ReplayBuffer(self.max_buffer_size)
+
+    def _merge_legacy_q_table(self, raw_q_table: Dict[str, Dict[str, float]]):
+        for state_str, actions in raw_q_table.items():
+            try:
+                state_key = ast.literal_eval(state_str)  # Convert string back to tuple
+                self.q_table[state_key] = {
+                    ActionType(a): v for a, v in actions.items()
+                }
+            except (ValueError, SyntaxError):
+                pass  # Skip invalid entries
+
     def save(self, filepath: str):
-        """Save Q-table to file."""
+        """Save Q-table to file (.qtbl paths use the binary format)."""
+        if filepath.endswith(Q_TABLE_FILE_EXTENSION):
+            write_q_table(filepath, self.q_table.snapshot(self._persisted_stats()))
+            return
+
         data = {
             'agent_type': self.agent_type,
             'q_table': {
@@ -310,50 +641,58 @@ class QLearningAgent:
             json.dump(data, f, indent=2)
 
     def load(self, filepath: str):
-        """Load Q-table from file."""
+        """Load Q-table from file (.qtbl files are memory-mapped)."""
+        if filepath.endswith(Q_TABLE_FILE_EXTENSION):
+            with open_q_table(filepath) as snapshot:
+                self._replace_q_table(QTable.from_snapshot(snapshot))
+                self._restore_stats(snapshot.meta)
+            return
+
         with open(filepath, 'r') as f:
             data = json.load(f)
 
         self.epsilon = data.get('epsilon', self.epsilon)
-        # Reconstruct Q-table
-        for state_str, actions in data.get('q_table', {}).items():
-            state_key = eval(state_str)  # Convert string back to tuple
-            self.q_table[state_key] = {
-                ActionType(a): v for a, v in actions.items()
-            }
+        self._merge_legacy_q_table(data.get('q_table', {}))
 
-    def save_to_db(self, db: 'BattleHistoryDB'):
-        """Save Q-table to database for persistence."""
+    def save_to_db(self, db: 'BattleHistoryDB', full: bool = False):
+        """
+        Checkpoint the Q-table to the database.
+
+        Only chunks changed since the last checkpoint are written unless
+        `full` is set (see BattleHistoryDB.save_q_table).
+        """
         db.save_q_table(
             agent_type=self.agent_type,
             q_table=self.q_table,
             episodes=self.episodes,
             total_rewards=self.total_rewards,
             wins=self.wins,
-            epsilon=self.epsilon
+            epsilon=self.epsilon,
+            full=full
         )
+        self.q_table.clear_dirty()
 
     def load_from_db(self, db: 'BattleHistoryDB') -> bool:
         """Load Q-table from database. Returns True if loaded."""
-        data = db.load_q_table(self.agent_type)
+        try:
+            data = db.load_q_table(self.agent_type)
+        except ValueError as e:
+            print(f"⚠️ {self.agent_type}: Could not load Q-table ({e})")
+            return False
         if not data:
             return False
 
-        self.epsilon = data.get('epsilon', self.epsilon)
-        self.episodes = data.get('episodes', 0)
-        self.total_rewards = data.get('total_rewards', 0.0)
-        self.wins = data.get('wins', 0)
+        self._restore_stats(data)
 
-        # Reconstruct Q-table
-        raw_q_table = data.get('q_table', {})
-        for state_str, actions in raw_q_table.items():
-            try:
-                state_key = eval(state_str)  # Convert string back to tuple
-                self.q_table[state_key] = {
-                    ActionType(a): v for a, v in actions.items()
-                }
-            except:
-                pass  # Skip invalid entries
+        snapshot = data.get('snapshot')
+        if snapshot is not None:
+            table = QTable.from_snapshot(snapshot, chunk_rows=data['chunk_rows'])
+            # Same generation as the stored chunks, so the next save can be incremental
+            table.generation = data.get('generation') or table.generation
+            self._replace_q_table(table)
+        else:
+            # Legacy JSON row: migrated to the binary format on the next save
+            self._merge_legacy_q_table(data.get('q_table', {}))
 
         print(f"📚 {self.agent_type}: Loaded Q-table ({len(self.q_table)} states, {self.episodes} episodes)")
         return True
@@ -364,15 +703,69 @@ class StrategyOptimizer:
     Optimizes strategy parameters using evolutionary approach.
 
     Parameters are evolved based on battle outcomes:
-    - Successful strategies have higher reproduction probability
-    - Mutation introduces variation
-    - Selection pressure improves over time
+    - History is loaded once per cycle as columns (tens of thousands of
+      battles) and each population is scored in one vectorized pass
+      (see agents.strategy_search)
+    - The heuristic estimate from winning battles seeds the search
+    - Selection keeps the best quarter; step sizes adapt to its spread
+    - Optionally, the final elite is re-scored by simulated battles,
+      in parallel through an executor (e.g. ProcessPoolExecutor)
     """
 
-    def __init__(self, db: BattleHistoryDB, population_size: int = 10):
+    def __init__(
+        self,
+        db: BattleHistoryDB,
+        population_size: int = 10,
+        generations: int = 25,
+        history_limit: int = 50000,
+        simulator: Optional[Callable[[str, Dict[str, float]], float]] = None,
+        executor=None,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            db: Battle history database
+            population_size: Candidates per generation
+            generations: Generations per parameter search
+            history_limit: Most recent battles loaded per agent type
+            simulator: Optional simulator(agent_type, params) -> score used
+                to re-score the final elite with real battles
+            executor: concurrent.futures executor for the simulator
+                (None = run in-process)
+            seed: Seed for reproducible searches
+        """
         self.db = db
         self.population_size = population_size
+        self.generations = generations
+        self.history_limit = history_limit
+        self.simulator = simulator
+        self.executor = executor
         self.generation = 0
+        self._rng = np.random.default_rng(seed)
+        self._columns: Optional[Dict[str, Dict[str, Any]]] = None  # per-cycle cache
+
+    def _history(self, name: str, loader: Callable[[], Dict[str, list]]) -> Dict[str, Any]:
+        """History columns as arrays, loaded once per cycle."""
+        if self._columns is not None and name in self._columns:
+            return self._columns[name]
+        raw = loader()
+        columns = to_columns(raw)
+        if self._columns is not None:
+            self._columns[name] = columns
+        return columns
+
+    def _search(self, agent_type: str, space: 'ParamSpace', fitness, initial: Dict[str, float]) -> Dict[str, float]:
+        """Refine a heuristic estimate with the evolutionary search."""
+        result = evolve(fitness, space, space.to_vector(initial),
+                        population_size=self.population_size,
+                        generations=self.generations, rng=self._rng)
+        candidates = [space.to_params(result.best)]
+        if self.simulator is None:
+            return candidates[0]
+
+        candidates += [space.to_params(v) for v in result.elite if not np.array_equal(v, result.best)]
+        scores = rescore(self.simulator, agent_type, candidates, self.executor)
+        return candidates[max(range(len(scores)), key=scores.__getitem__)]
 
     def optimize_sniper_params(self) -> Dict[str, float]:
         """Optimize Kinetik (sniper) parameters."""
@@ -385,33 +778,23 @@ class StrategyOptimizer:
         }
 
         # Get historical data
-        learning_data = self.db.get_learning_data('sniper', limit=50)
-        if len(learning_data) < 10:
-            return default_params
-
-        # Analyze successful battles
-        winning_battles = [b for b in learning_data if b['won']]
-        losing_battles = [b for b in learning_data if not b['won']]
-
-        if not winning_battles:
+        history = self._history('sniper', lambda: self.db.get_history_columns('sniper', self.history_limit))
+        won = [bool(w) for w in history['won']]
+        if len(won) < 10 or not any(won):
             return default_params
 
-        # Calculate optimal parameters based on winning patterns
-        avg_final_gifts_win = sum(b['final_phase_gifts'] for b in winning_battles) / len(winning_battles)
-        avg_margin_win = sum(b['margin'] for b in winning_battles) / len(winning_battles)
+        # Heuristic estimate from winning patterns
+        wins = sum(won)
+        avg_final_gifts_win = sum(g for g, w in zip(history['final_phase_gifts'], won) if w) / wins
+        avg_margin_win = sum(m for m, w in zip(history['margin'], won) if w) / wins
 
-        # Adjust snipe window based on success
-        optimal_snipe_window = max(3, min(10, 5 + (avg_final_gifts_win - 1) * 2))
-
-        # Adjust deficit thresholds based on margins
         optimal_params = {
-            'snipe_window': optimal_snipe_window,
+            'snipe_window': max(3, min(10, 5 + (avg_final_gifts_win - 1) * 2)),
             'min_deficit_for_universe': int(avg_margin_win * 1.2),
             'min_deficit_for_lion': int(avg_margin_win * 0.6),
             'min_deficit_for_phoenix': int(avg_margin_win * 0.1)
         }
-
-        return optimal_params
+        return self._search('sniper', SNIPER_SPACE, sniper_fitness(history), optimal_params)
 
     def optimize_glove_params(self) -> Dict[str, float]:
         """Optimize StrikeMaster (glove expert) parameters."""
@@ -423,15 +806,17 @@ class StrategyOptimizer:
         }
 
         # Analyze glove timing effectiveness
-        timing_data = self.db.get_optimal_gift_timing('glove_expert')
-        glove_timing = timing_data.get('glove_timing', {})
-
-        if not glove_timing:
+        glove_rows = self._history('glove_timing', lambda: self.db.get_gift_timing_columns('GLOVE'))
+        if not len(glove_rows['phase']):
             return default_params
 
-        # Find best phase for gloves
-        boost_rate = glove_timing.get('BOOST', {}).get('activation_rate', 0.4)
-        final_rate = glove_timing.get('FINAL', {}).get('activation_rate', 0.4)
+        def activation_rate(phase: str) -> float:
+            hits = [a for p, a in zip(glove_rows['phase'], glove_rows['activated_x5']) if p == phase]
+            return sum(hits) / len(hits) if hits else 0.4
+
+        # Heuristic estimate from the best phases for gloves
+        boost_rate = activation_rate('BOOST')
+        final_rate = activation_rate('FINAL')
 
         optimal_params = {
             'prefer_boost_phase': boost_rate / 0.4,  # Normalized to default
@@ -439,10 +824,11 @@ class StrategyOptimizer:
             'min_gloves_per_battle': 2 if boost_rate > 0.3 else 3,
             'max_gloves_per_battle': 5 if boost_rate > 0.5 else 4
         }
+        history = self._history('glove_expert',
+                                lambda: self.db.get_history_columns('glove_expert', self.history_limit))
+        return self._search('glove_expert', GLOVE_SPACE, glove_fitness(history, glove_rows), optimal_params)
 
-        return optimal_params
-
-    def optimize_phase_tracker_params(self) -> Dict[str, float]:
+    def optimize_phase_tracker_params(self, min_samples: int = 10) -> Dict[str, float]:
         """Optimize PhaseTracker parameters."""
         default_params = {
             'roses_to_trigger': 5,
@@ -450,19 +836,20 @@ class StrategyOptimizer:
             'urgency_threshold': 75
         }
 
-        # Analyze boost2 trigger success
-        win_conditions = self.db.get_win_conditions()
-        boost2_impact = win_conditions.get('boost2_impact', {})
-
-        with_boost2 = boost2_impact.get('with_boost2', {})
-        without_boost2 = boost2_impact.get('without_boost2', {})
+        # Analyze boost2 trigger success (creator wins with / without Boost #2)
+        battles = self._history('battles', lambda: self.db.get_battle_columns(self.history_limit))
+        margins = {True: [], False: []}
+        for won, boost2, margin in zip(battles['creator_won'], battles['boost2_triggered'], battles['margin']):
+            if won:
+                margins[bool(boost2)].append(margin or 0)
 
-        if not with_boost2:
+        if len(margins[True]) < min_samples:
             return default_params
 
         # If boost2 battles have better margins, prioritize triggering
-        boost2_margin = with_boost2.get('avg_margin', 0)
-        no_boost2_margin = without_boost2.get('avg_margin', 0)
+        boost2_margin = sum(margins[True]) / len(margins[True])
+        no_boost2_margin = (sum(margins[False]) / len(margins[False])
+                            if len(margins[False]) >= min_samples else 0)
 
         if boost2_margin > no_boost2_margin:
             # Boost2 is valuable, trigger early
@@ -478,18 +865,21 @@ class StrategyOptimizer:
                 'start_trigger_at': 65,  # Start later
                 'urgency_threshold': 80  # Less urgent
             }
-
-        return optimal_params
+        return self._search('phase_tracker', PHASE_TRACKER_SPACE,
+                            phase_tracker_fitness(battles), optimal_params)
 
     def run_optimization_cycle(self) -> Dict[str, Dict]:
         """Run full optimization cycle for all agent types."""
         self.generation += 1
-
-        optimized = {
-            'sniper': self.optimize_sniper_params(),
-            'glove_expert': self.optimize_glove_params(),
-            'phase_tracker': self.optimize_phase_tracker_params()
-        }
+        self._columns = {}
+        try:
+            optimized = {
+                'sniper': self.optimize_sniper_params(),
+                'glove_expert': self.optimize_glove_params(),
+                'phase_tracker': self.optimize_phase_tracker_params()
+            }
+        finally:
+            self._columns = None
 
         print(f"\n🧬 Generation {self.generation} Optimization Complete")
 
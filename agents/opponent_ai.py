@@ -236,11 +236,13 @@ class OpponentAI:
         difficulty: str = "medium",
         budget_manager: Optional['BudgetManager'] = None,
         strategy: Optional[StrategyProfile] = None,
-        enable_strategic_intelligence: bool = True
+        enable_strategic_intelligence: bool = True,
+        rng: Optional[random.Random] = None
     ):
         self.phase_manager = phase_manager
         self.difficulty = difficulty
         self.budget_manager = budget_manager
+        self.rng = rng or random
 
         # Select or assign strategy
         self.strategy = strategy or self._select_strategy()
@@ -309,7 +311,7 @@ class OpponentAI:
     def _select_strategy(self) -> StrategyProfile:
         """Randomly select a strategy profile based on budget."""
         if not self.budget_manager:
-            return random.choice(list(StrategyProfile))
+            return self.rng.choice(list(StrategyProfile))
 
         budget = self.budget_manager.opponent_starting
 
@@ -330,7 +332,7 @@ class OpponentAI:
         if not suitable_strategies:
             suitable_strategies = list(StrategyProfile)
 
-        return random.choice(suitable_strategies)
+        return self.rng.choice(suitable_strategies)
 
     def _calculate_reserves(self):
         """Calculate budget reserves based on strategy."""
@@ -357,7 +359,8 @@ class OpponentAI:
             self.strategic_intel = StrategicIntelligence(
                 budget_manager=self.budget_manager,
                 team="opponent",
-                battle_duration=self.phase_manager.battle_duration
+                battle_duration=self.phase_manager.battle_duration,
+                rng=self.rng
             )
         except ImportError:
             # Module not available, continue without it
@@ -393,6 +396,12 @@ class OpponentAI:
         print(f"\n👻 OPPONENT STRATEGY: {strategy_descriptions[self.strategy]}")
         print(f"   Budget: {budget_str} | Reserves: Boost #2={self.boost2_reserve:,}, Snipe={self.snipe_reserve:,}")
 
+    def set_rng(self, rng: random.Random):
+        """Use a per-battle random source (the strategy already drawn is kept)."""
+        self.rng = rng
+        if self.strategic_intel:
+            self.strategic_intel.rng = rng
+
     def reset_for_battle(self):
         """Reset state for new battle."""
         self.last_action_time = -10
@@ -504,7 +513,7 @@ class OpponentAI:
 
         # CHAOTIC randomization
         if self.strategy == StrategyProfile.CHAOTIC:
-            aggression = aggression * random.uniform(0.3, 1.7)
+            aggression = aggression * self.rng.uniform(0.3, 1.7)
             aggression = min(0.95, max(0.05, aggression))
 
         return aggression
@@ -563,7 +572,7 @@ class OpponentAI:
         """Select a gift based on chances and budget."""
 
         # Try whale gift
-        if random.random() < whale_chance and available_budget >= 10000:
+        if self.rng.random() < whale_chance and available_budget >= 10000:
             affordable_whales = [
                 (n, p) for n, p in self.whale_gifts
                 if p <= available_budget and self.can_afford(n)
@@ -573,16 +582,16 @@ class OpponentAI:
                 if self.snipe_mode_active:
                     affordable_whales.sort(key=lambda x: x[1], reverse=True)
                     return affordable_whales[0]
-                return random.choice(affordable_whales)
+                return self.rng.choice(affordable_whales)
 
         # Try medium gift
-        if available_budget >= 299 and random.random() < 0.4:
+        if available_budget >= 299 and self.rng.random() < 0.4:
             affordable_medium = [
                 (n, p) for n, p in self.medium_gifts
                 if p <= available_budget and self.can_afford(n)
             ]
             if affordable_medium:
-                return random.choice(affordable_medium)
+                return self.rng.choice(affordable_medium)
 
         # Small gift
         affordable_small = [
@@ -590,7 +599,7 @@ class OpponentAI:
             if p <= available_budget and self.can_afford(n)
         ]
         if affordable_small:
-            return random.choice(affordable_small)
+            return self.rng.choice(affordable_small)
 
         return ("Rose", 1)  # Fallback
 
@@ -647,7 +656,7 @@ class OpponentAI:
                              self.phase_manager.active_glove_owner == "creator")
             if creator_has_x5 and not self.hammer_used:
                 # Use hammer to deny enemy x5 even when surrendered
-                if random.random() < 0.5:
+                if self.rng.random() < 0.5:
                     if self.phase_manager.use_power_up(PowerUpType.HAMMER, "opponent", current_time):
                         self.hammer_used = True
                         result["power_up_used"] = "HAMMER"
@@ -683,7 +692,7 @@ class OpponentAI:
         # === PRIORITY 1: Use Hammer against creator's x5 ===
         if creator_has_x5 and not self.hammer_used:
             hammer_chance = 0.7 if in_boost or in_final_30s else 0.4
-            if random.random() < hammer_chance:
+            if self.rng.random() < hammer_chance:
                 if self.phase_manager.use_power_up(PowerUpType.HAMMER, "opponent", current_time):
                     self.hammer_used = True
                     result["power_up_used"] = "HAMMER"
@@ -704,7 +713,7 @@ class OpponentAI:
                 if not self.phase_manager.boost2_triggered and not in_final_30s:
                     glove_chance *= 0.2
 
-            if random.random() < glove_chance:
+            if self.rng.random() < glove_chance:
                 if self.phase_manager.use_power_up(PowerUpType.GLOVE, "opponent", current_time):
                     self.gloves_used += 1
                     result["power_up_used"] = "GLOVE"
@@ -716,7 +725,7 @@ class OpponentAI:
         aggression = self._get_current_aggression(current_time, time_remaining, in_boost, deficit)
 
         # Check if we should act
-        if random.random() > aggression:
+        if self.rng.random() > aggression:
             return result
 
         # Budget check (skip if no budget available for phase)
@@ -1128,13 +1137,14 @@ class OpponentBuilder:
         ]
         return "\n".join(lines)
 
-    def build(self, phase_manager, budget_manager=None) -> OpponentAI:
+    def build(self, phase_manager, budget_manager=None, rng=None) -> OpponentAI:
         """
         Build the custom opponent AI.
 
         Args:
             phase_manager: AdvancedPhaseManager instance
             budget_manager: Optional BudgetManager instance
+            rng: Optional random.Random for reproducible battles
 
         Returns:
             OpponentAI configured with custom strategy
@@ -1147,7 +1157,8 @@ class OpponentBuilder:
         opponent = OpponentAI(
             phase_manager=phase_manager,
             budget_manager=budget_manager,
-            strategy=StrategyProfile.CUSTOM
+            strategy=StrategyProfile.CUSTOM,
+            rng=rng
         )
 
         # Override the announcement
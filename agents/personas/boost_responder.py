@@ -120,7 +120,7 @@ class BoostResponder(BaseAgent):
 
         # SUSPENSE: Wait before qualifying for Boost #2
         # BoostResponder waits 16-21s (1s after PixelPixie starts)
-        self.qualification_delay = random.randint(16, 21)
+        self.qualification_delay = self.rng.randint(16, 21)
 
         # Load learned state
         self._load_learned_params()
@@ -145,6 +145,11 @@ class BoostResponder(BaseAgent):
         """Set phase manager reference."""
         self.phase_manager = pm
 
+    def set_rng(self, rng):
+        """Use the battle's random source and redraw the qualification delay."""
+        super().set_rng(rng)
+        self.qualification_delay = self.rng.randint(16, 21)
+
     def reset_for_battle(self):
         """Reset state for new battle."""
         self.last_action_time = -100  # Ready to act immediately
@@ -155,7 +160,7 @@ class BoostResponder(BaseAgent):
         self.last_x5_state = False  # Track x5 state changes
         self.threshold_gift_sent = False  # One gift for threshold qualification
         # Randomize qualification delay (1s after PixelPixie)
-        self.qualification_delay = random.randint(16, 21)
+        self.qualification_delay = self.rng.randint(16, 21)
 
         # Reset performance tracking
         self.phase_gifts = {
@@ -335,7 +340,7 @@ class BoostResponder(BaseAgent):
 
         # FINAL 30s MODE: Controlled push (respect budget intelligence)
         if in_final_30s:
-            if random.random() < 0.6:
+            if self.rng.random() < 0.6:
                 self._final_push_smart(battle, deficit, current_time, max_spend, gift_tier)
                 self.last_action_time = current_time
             return
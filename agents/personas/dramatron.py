@@ -16,7 +16,6 @@ Strategy:
 - Treats battle as performance art
 """
 
-import random
 from agents.base_agent import BaseAgent
 from agents.emotion_system import EmotionalState
 
@@ -74,11 +73,11 @@ class Dramatron(BaseAgent):
     def _perform_gift_act(self, battle, current_time):
         """Send gift with theatrical announcement."""
 
-        gift_value = random.randint(50, 100)
+        gift_value = self.rng.randint(50, 100)
 
         # Pre-gift announcement (30% chance)
-        if random.random() > 0.7:
-            self.send_message(random.choice([
+        if self.rng.random() > 0.7:
+            self.send_message(self.rng.choice([
                 "Observe mine generosity!",
                 "I bestow upon thee this gift!",
                 "Let it be known!"
@@ -87,7 +86,7 @@ class Dramatron(BaseAgent):
         self.send_gift(battle, "Theatrical Gift", gift_value)
 
         # Post-gift flourish (50% chance)
-        if random.random() > 0.5:
+        if self.rng.random() > 0.5:
             self.send_message("*flourishes cape dramatically*", message_type="chat")
 
     def _narrate_special_moments(self, battle, current_time):
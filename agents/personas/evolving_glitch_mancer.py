@@ -97,7 +97,7 @@ class EvolvingGlitchMancer(BaseAgent):
 
         # SUSPENSE: Wait before qualifying for Boost #2
         # EvolvingGlitchMancer waits 17-22s (2s after PixelPixie starts)
-        self.qualification_delay = random.randint(17, 22)
+        self.qualification_delay = self.rng.randint(17, 22)
 
         # === PERFORMANCE TRACKING ===
         self.phase_bursts = {
@@ -165,6 +165,11 @@ class EvolvingGlitchMancer(BaseAgent):
         """Set phase manager reference."""
         self.phase_manager = pm
 
+    def set_rng(self, rng):
+        """Use the battle's random source and redraw the qualification delay."""
+        super().set_rng(rng)
+        self.qualification_delay = self.rng.randint(17, 22)
+
     def reset_for_battle(self):
         """Reset state for new battle."""
         self.last_burst_time = -30
@@ -173,7 +178,7 @@ class EvolvingGlitchMancer(BaseAgent):
         self.last_x5_state = False
         self.threshold_gift_sent = False
         # Randomize qualification delay (2s after PixelPixie)
-        self.qualification_delay = random.randint(17, 22)
+        self.qualification_delay = self.rng.randint(17, 22)
 
         # Reset tracking
         self.phase_bursts = {
@@ -341,7 +346,7 @@ class EvolvingGlitchMancer(BaseAgent):
         if suggested_action == ActionType.WAIT:
             # Check aggression - maybe burst anyway
             aggression = self._get_aggression_for_phase(phase)
-            if random.random() > aggression:
+            if self.rng.random() > aggression:
                 return  # Respect the WAIT decision
 
         # === EXECUTE BURST ===
@@ -377,18 +382,18 @@ class EvolvingGlitchMancer(BaseAgent):
 
         # Determine burst count based on phase
         if phase == 'x5':
-            burst_count = random.randint(2, 4)
+            burst_count = self.rng.randint(2, 4)
         elif phase in ['boost1', 'boost2']:
-            burst_count = random.randint(2, 3)
+            burst_count = self.rng.randint(2, 3)
         elif phase in ['final_30s', 'final_5s']:
-            burst_count = random.randint(2, 4)
+            burst_count = self.rng.randint(2, 4)
         else:
-            burst_count = random.randint(1, 2)
+            burst_count = self.rng.randint(1, 2)
 
         # Print burst header
         phase_str = phase.upper().replace('_', ' ')
         print(f"🌀 EvolvingGlitchMancer: ⚡ {burst_type} BURST ({phase_str}) ⚡ [x{int(multiplier)}] [Budget: {max_spend:,}]")
-        self.send_message(random.choice(self.glitch_messages), message_type="chat")
+        self.send_message(self.rng.choice(self.glitch_messages), message_type="chat")
 
         # Send gifts
         total_points = 0
@@ -650,12 +655,12 @@ class EvolvingGlitchMancer(BaseAgent):
 ╚══════════════════════════════════════════════════════════════╝''')
 
         # Send 5-8 rapid small gifts
-        fog_count = random.randint(5, 8)
+        fog_count = self.rng.randint(5, 8)
         fog_gifts = [("Rose", 1), ("Heart", 5), ("Doughnut", 30)]
         gifts_sent = 0
 
         for i in range(fog_count):
-            gift_name, points = random.choice(fog_gifts)
+            gift_name, points = self.rng.choice(fog_gifts)
             if self.can_afford(gift_name):
                 if self.send_gift(battle, gift_name, points):
                     gifts_sent += 1
@@ -698,17 +703,17 @@ class EvolvingGlitchMancer(BaseAgent):
 
         # 10% chance to use psych warfare in normal phase when ahead
         if phase == 'normal' and score_diff > 10000:
-            if random.random() < 0.10:
-                return random.choice(['bluff', 'pause'])
+            if self.rng.random() < 0.10:
+                return self.rng.choice(['bluff', 'pause'])
 
         # 15% chance when behind to confuse opponent
         if score_diff < -20000 and time_remaining > 60:
-            if random.random() < 0.15:
-                return random.choice(['fog_burst', 'decoy'])
+            if self.rng.random() < 0.15:
+                return self.rng.choice(['fog_burst', 'decoy'])
 
         # 5% random chance otherwise
-        if random.random() < 0.05:
-            return random.choice(['bluff', 'fog_burst', 'pause'])
+        if self.rng.random() < 0.05:
+            return self.rng.choice(['bluff', 'fog_burst', 'pause'])
 
         return None
 
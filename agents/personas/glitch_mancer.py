@@ -49,12 +49,17 @@ class GlitchMancer(BaseAgent):
 
         # SUSPENSE: Wait before qualifying for Boost #2
         # GlitchMancer waits 17-22s (2s after PixelPixie starts)
-        self.qualification_delay = random.randint(17, 22)
+        self.qualification_delay = self.rng.randint(17, 22)
 
     def set_phase_manager(self, pm):
         """Set phase manager reference."""
         self.phase_manager = pm
 
+    def set_rng(self, rng):
+        """Use the battle's random source and redraw the qualification delay."""
+        super().set_rng(rng)
+        self.qualification_delay = self.rng.randint(17, 22)
+
     def reset_for_battle(self):
         """Reset state for new battle."""
         self.last_burst_time = -30
@@ -62,7 +67,7 @@ class GlitchMancer(BaseAgent):
         self.last_opponent_score = 0
         self.threshold_gift_sent = False  # One gift for threshold qualification
         # Randomize qualification delay (2s after PixelPixie)
-        self.qualification_delay = random.randint(17, 22)
+        self.qualification_delay = self.rng.randint(17, 22)
 
     def decide_action(self, battle):
         """Strategic burst decisions based on game state."""
@@ -127,7 +132,7 @@ class GlitchMancer(BaseAgent):
             burst_reason = f"X5 ACTIVE (x{int(multiplier)})"
 
         # PRIORITY 2: Boost is active - burst with medium/large gifts
-        elif in_boost and random.random() < 0.7:  # 70% chance during boost
+        elif in_boost and self.rng.random() < 0.7:  # 70% chance during boost
             should_burst = True
             burst_reason = f"BOOST MODE (x{int(multiplier)})"
 
@@ -137,7 +142,7 @@ class GlitchMancer(BaseAgent):
             if opponent_spike >= 10000:
                 should_burst = True
                 burst_reason = f"FINAL COUNTER ({opponent_spike:,} spike)"
-            elif random.random() < 0.5:  # 50% chance for regular final push
+            elif self.rng.random() < 0.5:  # 50% chance for regular final push
                 should_burst = True
                 burst_reason = "FINAL PUSH"
 
@@ -188,7 +193,7 @@ class GlitchMancer(BaseAgent):
             # X5 MODE - send whale gifts!
             print(f"🌀 GlitchMancer: ⚡ X5 CHAOS BURST! ⚡ ({reason}) [Budget: {max_spend:,}]")
             self.send_message("!!!WHALE_CHAOS.exe!!!", message_type="chat")
-            burst_count = random.randint(2, 3)
+            burst_count = self.rng.randint(2, 3)
             for _ in range(burst_count):
                 if not self._send_whale_gift(battle, max_spend):
                     break  # Stop if we run out of budget
@@ -196,8 +201,8 @@ class GlitchMancer(BaseAgent):
         elif mode == "BOOST":
             # BOOST MODE - send medium/large gifts
             print(f"🌀 GlitchMancer: ⚡ BOOST CHAOS! ⚡ ({reason}) [Budget: {max_spend:,}]")
-            self.send_message(random.choice(self.glitch_messages), message_type="chat")
-            burst_count = random.randint(2, 4)
+            self.send_message(self.rng.choice(self.glitch_messages), message_type="chat")
+            burst_count = self.rng.randint(2, 4)
             for _ in range(burst_count):
                 if not self._send_boost_gift(battle, max_spend):
                     break
@@ -205,8 +210,8 @@ class GlitchMancer(BaseAgent):
         elif mode == "FINAL":
             # FINAL MODE - aggressive mixed gifts
             print(f"🌀 GlitchMancer: ⚡ FINAL CHAOS! ⚡ ({reason}) [Budget: {max_spend:,}]")
-            self.send_message(random.choice(self.glitch_messages), message_type="chat")
-            burst_count = random.randint(3, 5)
+            self.send_message(self.rng.choice(self.glitch_messages), message_type="chat")
+            burst_count = self.rng.randint(3, 5)
             for _ in range(burst_count):
                 if not self._send_mixed_gift(battle, max_spend):
                     break
@@ -214,8 +219,8 @@ class GlitchMancer(BaseAgent):
         else:
             # OBSERVE MODE - small controlled burst
             print(f"🌀 GlitchMancer: ⚡ BURST MODE ⚡ ({reason}) [Budget: {max_spend:,}]")
-            self.send_message(random.choice(self.glitch_messages), message_type="chat")
-            burst_count = random.randint(2, 3)
+            self.send_message(self.rng.choice(self.glitch_messages), message_type="chat")
+            burst_count = self.rng.randint(2, 3)
             for _ in range(burst_count):
                 if not self._send_small_gift(battle):
                     break
@@ -261,7 +266,7 @@ class GlitchMancer(BaseAgent):
 
     def _send_mixed_gift(self, battle, max_spend: int = 999999) -> bool:
         """Send mixed size gift (30% large, 70% small) within budget. Returns True if sent."""
-        if random.random() < 0.3:
+        if self.rng.random() < 0.3:
             return self._send_boost_gift(battle, max_spend)
         else:
             return self._send_small_gift(battle)
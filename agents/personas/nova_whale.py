@@ -15,7 +15,6 @@ Strategy:
 - Sometimes taunts after a big play
 """
 
-import random
 from agents.base_agent import BaseAgent
 from agents.emotion_system import EmotionalState
 
@@ -39,7 +38,7 @@ class NovaWhale(BaseAgent):
         # Strategic waiting period
         if current_time < self.patience_threshold:
             # Occasionally send a small message to establish presence
-            if current_time == 20 and random.random() > 0.7:
+            if current_time == 20 and self.rng.random() > 0.7:
                 self.send_message("Watching... 🌊", message_type="chat")
             return
 
@@ -53,14 +52,14 @@ class NovaWhale(BaseAgent):
             self.has_acted = True
 
             # Victory message (70% chance)
-            if random.random() > 0.3:
+            if self.rng.random() > 0.3:
                 messages = [
                     "The tide has turned. 🌌",
                     "Consider it done.",
                     "Silent no more.",
                     "*emerges from the depths*"
                 ]
-                self.send_message(random.choice(messages), message_type="chat")
+                self.send_message(self.rng.choice(messages), message_type="chat")
 
             # Force CONFIDENT emotion after big play
             self.emotion_system.force_emotion(
@@ -91,7 +91,7 @@ class PixelPixie(BaseAgent):
 
         # SUSPENSE: Wait 15-20 seconds into threshold window before qualifying
         # This creates tension - will we qualify in time?!
-        self.qualification_delay = random.randint(
+        self.qualification_delay = self.rng.randint(
             int(self.params['qualification_delay_min']),
             int(self.params['qualification_delay_max'])
         )
@@ -130,6 +130,14 @@ class PixelPixie(BaseAgent):
         """Set phase manager reference."""
         self.phase_manager = pm
 
+    def set_rng(self, rng):
+        """Use the battle's random source and redraw the qualification delay."""
+        super().set_rng(rng)
+        self.qualification_delay = self.rng.randint(
+            int(self.params['qualification_delay_min']),
+            int(self.params['qualification_delay_max'])
+        )
+
     def reset_for_battle(self):
         """Reset state for new battle."""
         self.last_action_time = -5
@@ -149,7 +157,7 @@ class PixelPixie(BaseAgent):
         self.no_boost1_start_time = int(self.params['no_boost1_start_time'])
 
         # Randomize qualification delay for suspense (from learned params)
-        self.qualification_delay = random.randint(
+        self.qualification_delay = self.rng.randint(
             int(self.params['qualification_delay_min']),
             int(self.params['qualification_delay_max'])
         )
@@ -248,7 +256,7 @@ class PixelPixie(BaseAgent):
 
                 # Occasional message
                 if self.roses_sent % 5 == 0:
-                    self.send_message(random.choice(self.signaling_messages), message_type="cheer")
+                    self.send_message(self.rng.choice(self.signaling_messages), message_type="cheer")
 
                 # Update emotion
                 self.emotion_system.force_emotion(EmotionalState.CONFIDENT, current_time)
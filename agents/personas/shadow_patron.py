@@ -16,7 +16,6 @@ Strategy:
 - VENGEFUL emotion when activated
 """
 
-import random
 from agents.base_agent import BaseAgent
 from agents.emotion_system import EmotionalState
 
@@ -61,10 +60,10 @@ class ShadowPatron(BaseAgent):
             "Not on my watch.",
             "I've seen enough."
         ]
-        self.send_message(random.choice(reveal_messages), message_type="chat")
+        self.send_message(self.rng.choice(reveal_messages), message_type="chat")
 
         # Deliver sequence of 3-4 gifts
-        gift_count = random.randint(3, 4)
+        gift_count = self.rng.randint(3, 4)
         for i in range(gift_count):
             self.send_gift(battle, "GALAXY", 400)
 
@@ -23,7 +23,6 @@ from agents.coordination_mixin import CoordinationMixin
 from agents.learning_system import QLearningAgent, State, ActionType, LearningAgent
 from core.gift_catalog import get_gift_catalog, Gift
 from typing import Optional, List, Dict, Tuple
-import random
 
 
 class BudgetOptimizer(BaseAgent, CoordinationMixin):
@@ -188,7 +187,7 @@ class BudgetOptimizer(BaseAgent, CoordinationMixin):
             self.budget_reserved = 0
             rate = 0.5
 
-        return random.random() < rate
+        return self.rng.random() < rate
 
     def _select_optimal_gift(self, phase: str, multiplier: float) -> Optional[Gift]:
         """Select the most efficient gift for current conditions."""
@@ -222,9 +221,9 @@ class BudgetOptimizer(BaseAgent, CoordinationMixin):
         # Sort by ROI and pick best (with some randomness for exploration)
         gift_scores.sort(key=lambda x: x[1], reverse=True)
 
-        if random.random() < self.q_learner.epsilon:
+        if self.rng.random() < self.q_learner.epsilon:
             # Exploration: random selection
-            return random.choice(gift_scores)[0]
+            return self.rng.choice(gift_scores)[0]
         else:
             # Exploitation: best ROI
             return gift_scores[0][0]
@@ -268,7 +267,7 @@ class BudgetOptimizer(BaseAgent, CoordinationMixin):
             # Announce efficient plays
             roi = effective_points / gift.cost
             if roi >= 1.5:
-                msg = random.choice(self.efficiency_messages)
+                msg = self.rng.choice(self.efficiency_messages)
                 self.send_message(f"{msg} ({roi:.1f}x)", message_type="chat")
                 print(f"   [{self.emoji} BudgetOptimizer: {gift.name} @ {roi:.1f}x ROI]")
 
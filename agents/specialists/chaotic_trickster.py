@@ -141,8 +141,8 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
         self._check_active_tactics(current_time)
 
         # Random taunt (more frequent)
-        if random.random() < self.taunt_chance:
-            self.send_message(random.choice(self.taunt_messages), message_type="taunt")
+        if self.rng.random() < self.taunt_chance:
+            self.send_message(self.rng.choice(self.taunt_messages), message_type="taunt")
 
         # DECIDE TACTIC based on situation
         action = self._choose_chaotic_action(battle, current_time, time_remaining, score_diff)
@@ -229,9 +229,9 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
             weights["decoy"] = 0.15
 
         # Add chaos factor
-        if random.random() < self.chaos_level:
+        if self.rng.random() < self.chaos_level:
             # Truly chaotic - random weights
-            weights = {k: random.random() for k in weights}
+            weights = {k: self.rng.random() for k in weights}
 
         # Check cooldowns
         for tactic in ["bluff", "decoy", "pause", "fog_burst"]:
@@ -243,7 +243,7 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
         if total == 0:
             return "none"
 
-        roll = random.random() * total
+        roll = self.rng.random() * total
         cumulative = 0
         for action, weight in weights.items():
             cumulative += weight
@@ -258,7 +258,7 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
         self.bluff_end_time = current_time + 5  # Bluff lasts 5 seconds
 
         # Dramatic announcement
-        self.send_message(random.choice(self.bluff_messages), message_type="shout")
+        self.send_message(self.rng.choice(self.bluff_messages), message_type="shout")
         print(f"   [{self.emoji} ChaoticTrickster: BLUFF INITIATED!]")
 
         # Start cooldown
@@ -266,7 +266,7 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
         self.tactic_success["bluff"]["uses"] += 1
 
         # Send a few rapid small gifts
-        for _ in range(random.randint(2, 4)):
+        for _ in range(self.rng.randint(2, 4)):
             if self.can_afford("Rose"):
                 self.send_gift(battle, "Rose", 1)
 
@@ -293,7 +293,7 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
     def _execute_strategic_pause(self, current_time: int):
         """Execute a strategic pause - go silent to create uncertainty."""
         self.pause_active = True
-        self.pause_end_time = current_time + random.randint(8, 15)
+        self.pause_end_time = current_time + self.rng.randint(8, 15)
 
         # Silent exit
         self.send_message("...", message_type="whisper")
@@ -314,7 +314,7 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
             self.phase_manager.use_power_up(PowerUpType.FOG, "creator", current_time)
 
         # Rapid gift burst
-        burst_count = random.randint(5, 10)
+        burst_count = self.rng.randint(5, 10)
         for _ in range(burst_count):
             if self.can_afford("Rose"):
                 self.send_gift(battle, "Rose", 1)
@@ -328,7 +328,7 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
     def _send_chaos_gift(self, battle, current_time: int):
         """Send a chaotic gift - random selection."""
         # Chaotic gift selection
-        if random.random() < 0.7:
+        if self.rng.random() < 0.7:
             # Small chaos gift
             gifts = ["Rose", "Heart", "Doughnut"]
         else:
@@ -341,9 +341,9 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
                 self.send_gift(battle, gift.name, gift.coins)
 
                 # Random chaotic message
-                if random.random() < 0.3:
+                if self.rng.random() < 0.3:
                     chaos_msgs = ["*giggles*", "Catch!", "Or maybe not?", "Yes? No?"]
-                    self.send_message(random.choice(chaos_msgs), message_type="chat")
+                    self.send_message(self.rng.choice(chaos_msgs), message_type="chat")
                 break
 
     def _execute_real_attack(self, battle, current_time: int):
@@ -361,7 +361,7 @@ class ChaoticTrickster(BaseAgent, CoordinationMixin):
                 self.send_gift(battle, gift.name, gift.coins)
 
                 # Sometimes be serious
-                if random.random() < 0.4:
+                if self.rng.random() < 0.4:
                     self.send_message("This one's real.", message_type="chat")
                 break
 
@@ -23,7 +23,6 @@ from agents.coordination_mixin import CoordinationMixin
 from agents.learning_system import QLearningAgent, State, ActionType, LearningAgent
 from core.gift_catalog import get_gift_catalog
 from typing import Optional, List, Dict
-import random
 
 
 class DefenseMaster(BaseAgent, CoordinationMixin):
@@ -181,7 +180,7 @@ class DefenseMaster(BaseAgent, CoordinationMixin):
 
         if self.phase_manager.active_glove_x5 and self.phase_manager.active_glove_owner == "opponent":
             # Probability-based decision (learned threshold)
-            return random.random() < self.hammer_threshold
+            return self.rng.random() < self.hammer_threshold
 
         return False
 
@@ -207,7 +206,7 @@ class DefenseMaster(BaseAgent, CoordinationMixin):
             return False
 
         # Use fog in final 30s for hidden plays
-        if time_remaining <= 30 and random.random() < self.fog_before_whale_chance:
+        if time_remaining <= 30 and self.rng.random() < self.fog_before_whale_chance:
             return True
 
         # Use fog before team's coordinated strike (if coordinator signals)
@@ -233,11 +232,11 @@ class DefenseMaster(BaseAgent, CoordinationMixin):
         if self.opponent_gift_count >= 3:
             time_since_last = current_time - self.last_opponent_gift_time
             if time_since_last < 10:  # Opponent is active
-                return random.random() < self.counter_aggression
+                return self.rng.random() < self.counter_aggression
 
         # Counter if losing and need to respond
         if score_diff < -5000:
-            return random.random() < 0.3
+            return self.rng.random() < 0.3
 
         return False
 
@@ -258,15 +257,15 @@ class DefenseMaster(BaseAgent, CoordinationMixin):
     def _should_send_defensive_gift(self, time_remaining, score_diff) -> bool:
         """Determine if we should send a defensive gift."""
         # Proactive defensive presence
-        if random.random() < self.proactive_gift_rate:
+        if self.rng.random() < self.proactive_gift_rate:
             return True
 
         # More active in final phase
-        if time_remaining <= 60 and random.random() < 0.35:
+        if time_remaining <= 60 and self.rng.random() < 0.35:
             return True
 
         # Counter when losing
-        if score_diff < -3000 and random.random() < 0.3:
+        if score_diff < -3000 and self.rng.random() < 0.3:
             return True
 
         return False
@@ -295,7 +294,7 @@ class DefenseMaster(BaseAgent, CoordinationMixin):
         for gift_name, coins in gifts:
             if self.can_afford(gift_name):
                 self.send_gift(battle, gift_name, coins)
-                if random.random() < 0.2:
+                if self.rng.random() < 0.2:
                     self.send_message("🛡️ Holding the line!", message_type="chat")
                 break
 
@@ -20,7 +20,6 @@ from agents.coordination_mixin import CoordinationMixin, SpecialistCapabilities
 from core.gift_catalog import get_gift_catalog
 from core.team_coordinator import CoordinationPriority
 from typing import Optional, List
-import random
 
 
 class AgentSentinel(BaseAgent, CoordinationMixin):
@@ -86,7 +85,7 @@ class AgentSentinel(BaseAgent, CoordinationMixin):
 
         # PHASE 4: Standard defense (if losing badly)
         if score_diff > 2000 and current_time > 100:
-            if random.random() < 0.15:  # 15% chance to help defensively
+            if self.rng.random() < 0.15:  # 15% chance to help defensively
                 self.send_gift(battle, self.signature_gift.name, self.signature_gift.coins)
                 self.send_message("🛡️ Defense holding.", message_type="internal")
 
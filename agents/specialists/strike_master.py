@@ -141,9 +141,9 @@ class AgentStrikeMaster(BaseAgent, CoordinationMixin):
             near_optimal = any(abs(current_time - t) <= 5 for t in self.best_strike_times)
 
             if near_optimal:
-                return random.random() < 0.8  # 80% chance to strike at optimal time
+                return self.rng.random() < 0.8  # 80% chance to strike at optimal time
             else:
-                return random.random() < 0.4  # 40% chance during session
+                return self.rng.random() < 0.4  # 40% chance during session
 
         # OPTIMAL: Final 30s clutch strikes
         if in_final_30s:
@@ -151,7 +151,7 @@ class AgentStrikeMaster(BaseAgent, CoordinationMixin):
 
         # EMERGENCY: Can strike anytime if losing badly (3000+ behind)
         if score_diff > 3000:
-            return random.random() < 0.2  # 20% chance for emergency strike
+            return self.rng.random() < 0.2  # 20% chance for emergency strike
 
         return False
 
@@ -181,7 +181,7 @@ class AgentStrikeMaster(BaseAgent, CoordinationMixin):
             x5_triggered = battle.multiplier_manager.attempt_x5_strike(current_time, self.name)
         else:
             # Fallback: Simulate x5 trigger check
-            x5_triggered = random.random() < self.x5_success_rate
+            x5_triggered = self.rng.random() < self.x5_success_rate
 
         if x5_triggered:
             # SUCCESS! x5 multiplier activated
@@ -24,7 +24,6 @@ from agents.coordination_mixin import CoordinationMixin
 from agents.learning_system import QLearningAgent, State, ActionType, LearningAgent
 from core.gift_catalog import get_gift_catalog
 from typing import Optional, List, Dict, Set
-import random
 
 
 class ComboType:
@@ -160,7 +159,7 @@ class SynergyCoordinator(BaseAgent, CoordinationMixin):
         # Check combo cooldown
         if self.combo_cooldown > current_time:
             # During cooldown, send small supportive gifts
-            if random.random() < 0.1:
+            if self.rng.random() < 0.1:
                 self._send_support_gift(battle, current_time)
             return
 
@@ -174,7 +173,7 @@ class SynergyCoordinator(BaseAgent, CoordinationMixin):
 
         if combo:
             self._initiate_combo(battle, combo, current_time)
-        elif random.random() < 0.25:
+        elif self.rng.random() < 0.25:
             # No combo, send support gift more often
             self._send_support_gift(battle, current_time)
 
@@ -223,7 +222,7 @@ class SynergyCoordinator(BaseAgent, CoordinationMixin):
 
         # BOOST BLITZ - All-in during multiplier
         if in_boost and ready_count >= 2:
-            if score_diff < 0 or random.random() < self.combo_probs["boost_blitz"]:
+            if score_diff < 0 or self.rng.random() < self.combo_probs["boost_blitz"]:
                 return ComboType.BOOST_BLITZ
 
         # FINAL PUSH - Coordinated final 30s (always trigger if ready)
@@ -236,21 +235,21 @@ class SynergyCoordinator(BaseAgent, CoordinationMixin):
 
         # FOG + WHALE - If we have fog and a whale agent ready
         if self._has_capability("FOG") and self._has_capability("WHALE"):
-            if random.random() < self.combo_probs["fog_whale"]:
+            if self.rng.random() < self.combo_probs["fog_whale"]:
                 return ComboType.FOG_WHALE
 
         # GLOVE + WHALE - If glove and whale ready
         if self._has_capability("GLOVE") and self._has_capability("WHALE"):
-            if in_boost and random.random() < self.combo_probs["glove_whale"]:
+            if in_boost and self.rng.random() < self.combo_probs["glove_whale"]:
                 return ComboType.GLOVE_WHALE
 
         # TRIPLE THREAT - 3+ agents ready
-        if ready_count >= 3 and random.random() < self.combo_probs["triple_threat"]:
+        if ready_count >= 3 and self.rng.random() < self.combo_probs["triple_threat"]:
             return ComboType.TRIPLE_THREAT
 
         # WAVE ATTACK - Staggered for pressure
         if ready_count >= 2 and score_diff < -3000:  # Lowered threshold
-            if random.random() < self.combo_probs["wave_attack"]:
+            if self.rng.random() < self.combo_probs["wave_attack"]:
                 return ComboType.WAVE_ATTACK
 
         return None
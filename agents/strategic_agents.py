@@ -8,7 +8,6 @@ Specialized agents for 180s battles with phase system:
 - LoadoutMaster: Power-up inventory manager
 """
 
-import random
 from typing import Optional, Dict, List
 from agents.base_agent import BaseAgent
 from core.advanced_phase_system import AdvancedPhaseManager, PowerUpType
@@ -152,7 +151,7 @@ class StrikeMaster(BaseAgent):
             should_send = True
         elif in_boost or in_last_30s:
             # Either condition is good
-            should_send = random.random() < 0.5
+            should_send = self.rng.random() < 0.5
 
         if should_send:
             print(f"\n🥊 StrikeMaster sending GLOVE!")
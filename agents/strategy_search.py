@@ -0,0 +1,259 @@
+"""
+Strategy Search - population-based parameter optimization over battle history.
+
+Battle history is loaded once into columnar NumPy arrays (see
+BattleHistoryDB.get_history_columns) and a whole population of parameter
+vectors is scored in one pass: fitness functions take a
+(population x params) matrix and return one score per row, broadcasting
+against the (battles,) columns.
+
+Fitness is reward-weighted: each historical battle implies the parameter
+values that produced its behaviour (the heuristics StrategyOptimizer used
+to apply to winning battles only); wins pull candidates towards those
+values and losses push them away.
+
+The search is a diagonal evolution strategy (CMA-ES without the full
+covariance): sample around a mean, move the mean to the weighted average
+of the best quarter and adapt per-parameter step sizes to their spread.
+
+Candidates that need real simulated battles can be re-scored with a
+scalar simulator mapped over an executor (e.g. ProcessPoolExecutor; the
+simulator must then be a picklable module-level function).
+
+Usage:
+    history = to_columns(db.get_history_columns('sniper'))
+    result = evolve(sniper_fitness(history), SNIPER_SPACE, initial)
+    params = SNIPER_SPACE.to_params(result.best)
+"""
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+Fitness = Callable[[np.ndarray], np.ndarray]
+
+
+@dataclass(frozen=True)
+class ParamSpace:
+    """Named, bounded parameter vector (integer params are rounded)."""
+    names: Tuple[str, ...]
+    low: Tuple[float, ...]
+    high: Tuple[float, ...]
+    integer: Tuple[str, ...] = ()
+
+    @property
+    def span(self) -> np.ndarray:
+        return np.asarray(self.high, dtype=np.float64) - np.asarray(self.low, dtype=np.float64)
+
+    def clip(self, population: np.ndarray) -> np.ndarray:
+        """Clamp to bounds and round integer columns."""
+        population = np.clip(population, self.low, self.high)
+        for i, name in enumerate(self.names):
+            if name in self.integer:
+                population[..., i] = np.round(population[..., i])
+        return population
+
+    def to_vector(self, params: Mapping[str, float]) -> np.ndarray:
+        return self.clip(np.array([float(params[name]) for name in self.names]))
+
+    def to_params(self, vector: Sequence[float]) -> Dict[str, float]:
+        return {
+            name: int(round(value)) if name in self.integer else float(value)
+            for name, value in zip(self.names, vector)
+        }
+
+
+SNIPER_SPACE = ParamSpace(
+    names=('snipe_window', 'min_deficit_for_universe', 'min_deficit_for_lion', 'min_deficit_for_phoenix'),
+    low=(3.0, 0.0, 0.0, 0.0),
+    high=(10.0, 2_000_000.0, 1_000_000.0, 250_000.0),
+    integer=('min_deficit_for_universe', 'min_deficit_for_lion', 'min_deficit_for_phoenix'),
+)
+
+GLOVE_SPACE = ParamSpace(
+    names=('prefer_boost_phase', 'prefer_last_30s', 'min_gloves_per_battle', 'max_gloves_per_battle'),
+    low=(0.25, 0.25, 0.0, 1.0),
+    high=(2.5, 2.5, 6.0, 10.0),
+    integer=('min_gloves_per_battle', 'max_gloves_per_battle'),
+)
+
+PHASE_TRACKER_SPACE = ParamSpace(
+    names=('roses_to_trigger', 'start_trigger_at', 'urgency_threshold'),
+    low=(3.0, 45.0, 60.0),
+    high=(10.0, 90.0, 95.0),
+    integer=('roses_to_trigger', 'start_trigger_at', 'urgency_threshold'),
+)
+
+
+def to_columns(raw: Mapping[str, list]) -> Dict[str, np.ndarray]:
+    """DB column lists -> arrays (numeric columns as float64, NULL -> 0)."""
+    columns = {}
+    for name, values in raw.items():
+        if values and isinstance(values[0], str):
+            columns[name] = np.asarray(values, dtype=object)
+        else:
+            columns[name] = np.asarray([0 if v is None else v for v in values], dtype=np.float64)
+    return columns
+
+
+# =============================================================================
+# FITNESS
+# =============================================================================
+
+def kernel_fitness(targets: np.ndarray, weights: np.ndarray, bandwidth: np.ndarray,
+                   chunk: int = 8192) -> Fitness:
+    """
+    Reward-weighted Gaussian kernel score.
+
+    Args:
+        targets: (battles x params) parameter values each battle implies
+        weights: (battles,) positive for wins, negative for losses
+        bandwidth: (params,) kernel width per parameter
+        chunk: Battles per broadcast block (bounds the P x B x D temporary)
+    """
+    targets = np.asarray(targets, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    bandwidth = np.maximum(np.asarray(bandwidth, dtype=np.float64), 1e-9)
+    norm = float(np.abs(weights).sum()) or 1.0
+
+    def fitness(population: np.ndarray) -> np.ndarray:
+        scores = np.zeros(len(population))
+        for start in range(0, len(targets), chunk):
+            z = (population[:, None, :] - targets[None, start:start + chunk]) / bandwidth
+            scores += np.exp(-0.5 * np.einsum('pbd,pbd->pb', z, z)) @ weights[start:start + chunk]
+        return scores / norm
+
+    return fitness
+
+
+def _outcome_weights(won: np.ndarray, loss_weight: float) -> np.ndarray:
+    return np.where(won > 0, 1.0, -loss_weight)
+
+
+def sniper_fitness(history: Mapping[str, np.ndarray], loss_weight: float = 0.5) -> Fitness:
+    """Snipe window from final-phase gift counts, deficit thresholds from margins."""
+    final_gifts = history['final_phase_gifts']
+    margin = history['margin']
+    targets = np.column_stack([
+        np.clip(5 + (final_gifts - 1) * 2, 3, 10),
+        margin * 1.2,
+        margin * 0.6,
+        margin * 0.1,
+    ])
+    return kernel_fitness(targets, _outcome_weights(history['won'], loss_weight),
+                          SNIPER_SPACE.span * 0.1)
+
+
+def glove_fitness(history: Mapping[str, np.ndarray], glove_rows: Mapping[str, np.ndarray],
+                  loss_weight: float = 0.5, prior: float = 0.05) -> Fitness:
+    """
+    Glove count window from battles, phase preferences from x5 activations.
+
+    Score = share of wins (minus weighted losses) whose glove count falls in
+    [min, max] + preference-weighted activation rate, with a small pull of
+    the preferences towards 1.0 and a cost per glove of window width.
+    """
+    sent = history['gloves_sent']
+    signs = _outcome_weights(history['won'], loss_weight)
+    phase = glove_rows.get('phase', np.zeros(0, dtype=object))
+    activated = glove_rows.get('activated_x5', np.zeros(0))
+    is_boost = phase == 'BOOST'
+    is_final = phase == 'FINAL'
+
+    def fitness(population: np.ndarray) -> np.ndarray:
+        boost_pref, final_pref, low, high = population.T
+        scores = np.zeros(len(population))
+        if len(sent):
+            inside = (sent[None] >= low[:, None]) & (sent[None] <= high[:, None])
+            scores += inside @ signs / len(sent)
+        if len(activated):
+            w = np.where(is_boost, boost_pref[:, None], np.where(is_final, final_pref[:, None], 1.0))
+            scores += (w @ activated) / w.sum(axis=1)
+        scores -= prior * ((boost_pref - 1) ** 2 + (final_pref - 1) ** 2) + 0.01 * (high - low)
+        return np.where(low > high, -np.inf, scores)
+
+    return fitness
+
+
+def phase_tracker_fitness(battles: Mapping[str, np.ndarray], loss_weight: float = 0.5) -> Fitness:
+    """Early triggering in Boost #2 battles, later otherwise, weighted by margin."""
+    boost2 = battles['boost2_triggered'] > 0
+    margin = battles['margin']
+    targets = np.column_stack([
+        np.full(len(margin), 5.0),
+        np.where(boost2, 58.0, 65.0),
+        np.where(boost2, 70.0, 80.0),
+    ])
+    weights = _outcome_weights(battles['creator_won'], loss_weight) * margin / max(float(margin.mean()), 1.0)
+    return kernel_fitness(targets, weights, PHASE_TRACKER_SPACE.span * 0.1)
+
+
+# =============================================================================
+# SEARCH
+# =============================================================================
+
+@dataclass
+class SearchResult:
+    best: np.ndarray
+    score: float
+    elite: np.ndarray  # final generation's best candidates, best first
+    evaluations: int
+
+
+def evolve(fitness: Fitness, space: ParamSpace, initial: Sequence[float],
+           population_size: int = 16, generations: int = 30, sigma: float = 0.2,
+           rng: Optional[np.random.Generator] = None) -> SearchResult:
+    """
+    Diagonal evolution strategy over a ParamSpace.
+
+    The initial vector is always evaluated and kept unless a candidate
+    scores strictly better, so flat or missing history returns it unchanged.
+
+    Args:
+        fitness: (population x params) -> (population,) scores, higher is better
+        space: Parameter bounds
+        initial: Starting mean (e.g. the heuristic estimate)
+        population_size: Candidates per generation
+        generations: Generations to run
+        sigma: Initial step size as a fraction of each parameter's range
+        rng: NumPy random generator (seed it for reproducible searches)
+    """
+    rng = rng or np.random.default_rng()
+    population_size = max(4, population_size)
+    span = np.maximum(space.span, 1e-9)
+    mu = population_size // 4 or 1
+    weights = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+    weights /= weights.sum()
+
+    mean = space.clip(np.asarray(initial, dtype=np.float64))
+    scale = span * sigma
+    best = mean.copy()
+    best_score = float(fitness(best[None])[0])
+    elite = best[None]
+    evaluations = 1
+
+    for _ in range(generations):
+        population = space.clip(mean + scale * rng.standard_normal((population_size, len(span))))
+        scores = fitness(population)
+        evaluations += population_size
+
+        order = np.argsort(-scores)
+        elite = population[order[:mu]]
+        if scores[order[0]] > best_score:
+            best, best_score = population[order[0]].copy(), float(scores[order[0]])
+
+        spread = np.sqrt(weights @ (elite - mean) ** 2)
+        scale = np.clip(0.7 * scale + 0.3 * spread, span * 1e-3, span)
+        mean = weights @ elite
+
+    return SearchResult(best, best_score, elite, evaluations)
+
+
+def rescore(simulator: Callable[[str, Dict[str, float]], float], agent_type: str,
+            candidates: List[Dict[str, float]], executor: Optional[Executor] = None) -> List[float]:
+    """Score candidates with simulated battles, in parallel when an executor is given."""
+    map_fn = executor.map if executor is not None else map
+    return list(map_fn(simulator, [agent_type] * len(candidates), candidates))
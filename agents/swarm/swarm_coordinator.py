@@ -15,15 +15,22 @@ Enables:
 - Flocking behavior for boost phases
 - Dispersion for coverage
 - Hunting behavior for snipe opportunities
+
+Swarm state lives in NumPy arrays (one row per agent: position, velocity,
+signal, contribution), so a Boids step is a handful of array operations
+whether the swarm has 7 agents or a thousand simulated supporters.
+AgentPosition objects are built on demand as a read-only view.
 """
 
 import asyncio
 import logging
-import math
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +186,110 @@ class SwarmMetrics:
         }
 
 
+# =============================================================================
+# SWARM ARRAYS
+# =============================================================================
+
+# Rows per block in the pairwise neighbor pass (bounds the block x n temporaries)
+NEIGHBOR_BLOCK = 512
+
+
+class SwarmArrays:
+    """
+    Columnar swarm state, one row per agent.
+
+    pos/vel are (n, 3) float arrays over the (aggression, phase, budget)
+    axes; the remaining per-agent fields are (n,) arrays or lists.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.roles: List[BattleRole] = []
+        self.pos = np.zeros((0, 3))
+        self.vel = np.zeros((0, 3))
+        self.signal_strength = np.zeros(0)
+        self.signal_direction = np.zeros(0)
+        self.confidence = np.zeros(0)
+        self.energy = np.zeros(0)
+        self.points = np.zeros(0, dtype=np.int64)
+        self.gifts = np.zeros(0, dtype=np.int64)
+        self.updated_at = np.zeros(0)  # POSIX timestamps
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def store(self, positions: List[AgentPosition]):
+        """Insert or overwrite rows (keyed by agent_id) in one batch."""
+        if not positions:
+            return
+        new_rows = []
+        for p in positions:
+            if p.agent_id not in self.index:
+                self.index[p.agent_id] = len(self.ids) + len(new_rows)
+                new_rows.append(p.agent_id)
+        if new_rows:
+            grow = len(new_rows)
+            self.ids.extend(new_rows)
+            self.names.extend([""] * grow)
+            self.roles.extend([BattleRole.SUPPORT] * grow)
+            for name in ("pos", "vel"):
+                setattr(self, name, np.concatenate([getattr(self, name), np.zeros((grow, 3))]))
+            for name in ("signal_strength", "signal_direction", "confidence",
+                         "energy", "points", "gifts", "updated_at"):
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate([column, np.zeros(grow, dtype=column.dtype)]))
+
+        rows = [self.index[p.agent_id] for p in positions]
+        for row, p in zip(rows, positions):
+            self.names[row] = p.agent_name
+            self.roles[row] = p.role
+        self.pos[rows] = [(p.x, p.y, p.z) for p in positions]
+        self.vel[rows] = [(p.vx, p.vy, p.vz) for p in positions]
+        self.signal_strength[rows] = [p.signal_strength for p in positions]
+        self.signal_direction[rows] = [p.signal_direction for p in positions]
+        self.confidence[rows] = [p.confidence for p in positions]
+        self.energy[rows] = [p.energy for p in positions]
+        self.points[rows] = [p.points_contributed for p in positions]
+        self.gifts[rows] = [p.gifts_sent for p in positions]
+        self.updated_at[rows] = [p.last_update.timestamp() for p in positions]
+
+    def position(self, row: int) -> AgentPosition:
+        """Materialize one row as an AgentPosition (a snapshot, not live)."""
+        x, y, z = self.pos[row].tolist()
+        vx, vy, vz = self.vel[row].tolist()
+        return AgentPosition(
+            agent_id=self.ids[row],
+            agent_name=self.names[row],
+            x=x, y=y, z=z, vx=vx, vy=vy, vz=vz,
+            signal_strength=float(self.signal_strength[row]),
+            signal_direction=float(self.signal_direction[row]),
+            confidence=float(self.confidence[row]),
+            energy=float(self.energy[row]),
+            points_contributed=int(self.points[row]),
+            gifts_sent=int(self.gifts[row]),
+            role=self.roles[row],
+            last_update=datetime.fromtimestamp(self.updated_at[row], timezone.utc)
+        )
+
+
+class PositionView(Mapping):
+    """Read-only agent_id -> AgentPosition mapping over SwarmArrays."""
+
+    def __init__(self, arrays: SwarmArrays):
+        self._arrays = arrays
+
+    def __getitem__(self, agent_id: str) -> AgentPosition:
+        return self._arrays.position(self._arrays.index[agent_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._arrays.ids)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+
 # =============================================================================
 # SWARM COORDINATOR
 # =============================================================================
@@ -207,8 +318,9 @@ class SwarmCoordinator:
         """Initialize swarm coordinator."""
         self._config = config or SwarmConfig()
 
-        # Agent positions
-        self._positions: Dict[str, AgentPosition] = {}
+        # Agent state (arrays) and the AgentPosition view over it
+        self._arrays = SwarmArrays()
+        self._positions = PositionView(self._arrays)
 
         # Swarm state
         self._state = SwarmState.EXPLORING
@@ -235,16 +347,17 @@ class SwarmCoordinator:
         Returns:
             Number of agents synced
         """
-        synced = 0
+        positions = []
 
         for agent in agents:
             try:
-                position = self._map_agent_to_position(agent)
-                self._positions[position.agent_id] = position
-                synced += 1
+                positions.append(self._map_agent_to_position(agent))
             except Exception as e:
                 logger.warning(f"[SwarmCoordinator] Failed to sync agent: {e}")
 
+        self._arrays.store(positions)
+        synced = len(positions)
+
         self._metrics.active_agents = synced
         logger.debug(f"[SwarmCoordinator] Synced {synced} agents")
 
@@ -390,178 +503,104 @@ class SwarmCoordinator:
 
         return self._state
 
-    def _calculate_swarm_forces(self) -> Dict[str, Tuple[float, float, float]]:
-        """Calculate swarm forces for each agent using Boids algorithm."""
-        forces = {}
-        positions = list(self._positions.values())
+    def _calculate_swarm_forces(self) -> np.ndarray:
+        """
+        Calculate swarm forces for each agent using Boids algorithm.
 
-        for pos in positions:
-            neighbors = self._get_neighbors(pos, positions)
+        Neighbors are every other agent within neighbor_radius, found with a
+        pairwise distance pass in row blocks of NEIGHBOR_BLOCK. Agents without
+        neighbors get no force.
 
-            if not neighbors:
-                forces[pos.agent_id] = (0, 0, 0)
-                continue
+        Returns:
+            (n, 3) force per agent row
+        """
+        arrays = self._arrays
+        pos, vel = arrays.pos, arrays.vel
+        n = len(arrays)
+        cfg = self._config
+        radius_sq = cfg.neighbor_radius ** 2
+        forces = np.zeros((n, 3))
+
+        # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b, so each block is one matmul
+        sq_norms = np.einsum('ij,ij->i', pos, pos)
+        cross = -2.0 * pos.T
+        state = np.hstack([pos, vel])
+
+        for start in range(0, n, NEIGHBOR_BLOCK):
+            block = slice(start, min(start + NEIGHBOR_BLOCK, n))
+            own = pos[block]
+
+            dist_sq = own @ cross
+            dist_sq += sq_norms[block, None]
+            dist_sq += sq_norms[None, :]
+            np.maximum(dist_sq, 0.0, out=dist_sq)
+            neighbors = dist_sq < radius_sq
+            neighbors[np.arange(len(own)), np.arange(block.start, block.stop)] = False
+
+            count = neighbors.sum(axis=1)
+            has = count > 0
+            mask = neighbors.astype(np.float64)
+            means = (mask @ state) / np.maximum(count, 1)[:, None]
 
             # Cohesion: move toward center of neighbors
-            cx, cy, cz = self._calculate_cohesion(pos, neighbors)
-
+            cohesion = means[:, :3] - own
             # Alignment: align with neighbor velocities
-            ax, ay, az = self._calculate_alignment(pos, neighbors)
-
-            # Separation: avoid crowding
-            sx, sy, sz = self._calculate_separation(pos, neighbors)
-
-            # Weighted sum
-            cfg = self._config
-            fx = cfg.cohesion_weight * cx + cfg.alignment_weight * ax + cfg.separation_weight * sx
-            fy = cfg.cohesion_weight * cy + cfg.alignment_weight * ay + cfg.separation_weight * sy
-            fz = cfg.cohesion_weight * cz + cfg.alignment_weight * az + cfg.separation_weight * sz
-
-            forces[pos.agent_id] = (fx, fy, fz)
+            alignment = means[:, 3:] - vel[block]
+            # Separation: avoid crowding, 1 / (dist + 0.001)^2 per neighbor
+            repulsion = np.sqrt(dist_sq, out=dist_sq)
+            repulsion += 0.001
+            np.square(repulsion, out=repulsion)
+            np.divide(mask, repulsion, out=repulsion)
+            separation = repulsion.sum(axis=1)[:, None] * own - repulsion @ pos
+
+            force = (cfg.cohesion_weight * cohesion
+                     + cfg.alignment_weight * alignment
+                     + cfg.separation_weight * separation)
+            forces[block] = np.where(has[:, None], force, 0.0)
 
         return forces
 
-    def _get_neighbors(
-        self,
-        agent: AgentPosition,
-        all_agents: List[AgentPosition]
-    ) -> List[AgentPosition]:
-        """Get neighbors within radius."""
-        radius = self._config.neighbor_radius
-        neighbors = []
-
-        for other in all_agents:
-            if other.agent_id == agent.agent_id:
-                continue
-
-            dist = math.sqrt(
-                (other.x - agent.x) ** 2 +
-                (other.y - agent.y) ** 2 +
-                (other.z - agent.z) ** 2
-            )
-
-            if dist < radius:
-                neighbors.append(other)
-
-        return neighbors
-
-    def _calculate_cohesion(
-        self,
-        agent: AgentPosition,
-        neighbors: List[AgentPosition]
-    ) -> Tuple[float, float, float]:
-        """Calculate cohesion force (toward center of mass)."""
-        if not neighbors:
-            return (0, 0, 0)
-
-        cx = sum(n.x for n in neighbors) / len(neighbors)
-        cy = sum(n.y for n in neighbors) / len(neighbors)
-        cz = sum(n.z for n in neighbors) / len(neighbors)
-
-        return (cx - agent.x, cy - agent.y, cz - agent.z)
-
-    def _calculate_alignment(
-        self,
-        agent: AgentPosition,
-        neighbors: List[AgentPosition]
-    ) -> Tuple[float, float, float]:
-        """Calculate alignment force (match neighbor velocities)."""
-        if not neighbors:
-            return (0, 0, 0)
-
-        avg_vx = sum(n.vx for n in neighbors) / len(neighbors)
-        avg_vy = sum(n.vy for n in neighbors) / len(neighbors)
-        avg_vz = sum(n.vz for n in neighbors) / len(neighbors)
-
-        return (avg_vx - agent.vx, avg_vy - agent.vy, avg_vz - agent.vz)
-
-    def _calculate_separation(
-        self,
-        agent: AgentPosition,
-        neighbors: List[AgentPosition]
-    ) -> Tuple[float, float, float]:
-        """Calculate separation force (avoid crowding)."""
-        if not neighbors:
-            return (0, 0, 0)
-
-        sx, sy, sz = 0, 0, 0
-
-        for n in neighbors:
-            dx = agent.x - n.x
-            dy = agent.y - n.y
-            dz = agent.z - n.z
-            dist = math.sqrt(dx*dx + dy*dy + dz*dz) + 0.001
-
-            # Stronger repulsion when closer
-            sx += dx / (dist * dist)
-            sy += dy / (dist * dist)
-            sz += dz / (dist * dist)
-
-        return (sx, sy, sz)
-
-    def _apply_forces(self, forces: Dict[str, Tuple[float, float, float]]):
+    def _apply_forces(self, forces: np.ndarray):
         """Apply forces to update positions."""
+        arrays = self._arrays
         decay = self._config.signal_decay_rate
 
-        for agent_id, (fx, fy, fz) in forces.items():
-            if agent_id not in self._positions:
-                continue
-
-            pos = self._positions[agent_id]
-
-            # Update velocity
-            pos.vx = pos.vx * decay + fx * 0.1
-            pos.vy = pos.vy * decay + fy * 0.1
-            pos.vz = pos.vz * decay + fz * 0.1
+        # Update velocity, then position (clamped to the unit cube)
+        arrays.vel = arrays.vel * decay + forces * 0.1
+        arrays.pos = np.clip(arrays.pos + arrays.vel, 0.0, 1.0)
 
-            # Update position
-            pos.x = max(0, min(1, pos.x + pos.vx))
-            pos.y = max(0, min(1, pos.y + pos.vy))
-            pos.z = max(0, min(1, pos.z + pos.vz))
-
-            pos.last_update = datetime.now(timezone.utc)
+        arrays.updated_at[:] = datetime.now(timezone.utc).timestamp()
 
     def _update_metrics(self):
         """Update swarm metrics."""
-        positions = list(self._positions.values())
-        n = len(positions)
+        arrays = self._arrays
+        n = len(arrays)
 
         if n == 0:
             return
 
         # Position coherence (inverse of spread)
-        mean_x = sum(p.x for p in positions) / n
-        mean_y = sum(p.y for p in positions) / n
-        mean_z = sum(p.z for p in positions) / n
-
-        spread = sum(
-            math.sqrt((p.x - mean_x)**2 + (p.y - mean_y)**2 + (p.z - mean_z)**2)
-            for p in positions
-        ) / n
-
+        spread = float(np.linalg.norm(arrays.pos - arrays.pos.mean(axis=0), axis=1).mean())
         self._metrics.position_coherence = max(0, 1 - spread * 2)
 
         # Velocity alignment
-        mean_vy = sum(p.vy for p in positions) / n
-        velocity_var = sum((p.vy - mean_vy)**2 for p in positions) / n
+        velocity_var = float(arrays.vel[:, 1].var())
         self._metrics.velocity_alignment = max(0, 1 - velocity_var * 10)
 
         # Signal consensus
-        directions = [p.signal_direction for p in positions if p.signal_strength > 0.1]
-        if directions:
-            mean_dir = sum(directions) / len(directions)
-            consensus_var = sum((d - mean_dir)**2 for d in directions) / len(directions)
-            self._metrics.signal_consensus = max(0, 1 - consensus_var)
+        directions = arrays.signal_direction[arrays.signal_strength > 0.1]
+        if len(directions):
+            self._metrics.signal_consensus = max(0, 1 - float(directions.var()))
         else:
             self._metrics.signal_consensus = 0
 
         # Activity metrics
-        self._metrics.avg_signal_strength = sum(p.signal_strength for p in positions) / n
-        self._metrics.avg_confidence = sum(p.confidence for p in positions) / n
+        self._metrics.avg_signal_strength = float(arrays.signal_strength.mean())
+        self._metrics.avg_confidence = float(arrays.confidence.mean())
 
         # Performance
-        self._metrics.collective_points = sum(p.points_contributed for p in positions)
-        self._metrics.total_gifts = sum(p.gifts_sent for p in positions)
+        self._metrics.collective_points = int(arrays.points.sum())
+        self._metrics.total_gifts = int(arrays.gifts.sum())
 
     def _determine_state(self) -> SwarmState:
         """Determine current swarm state based on battle context."""
@@ -609,9 +648,9 @@ class SwarmCoordinator:
         Returns:
             Collective decision with action, strength, confidence
         """
-        positions = list(self._positions.values())
+        arrays = self._arrays
 
-        if not positions:
+        if not len(arrays):
             return {
                 "action": "wait",
                 "strength": 0,
@@ -621,20 +660,13 @@ class SwarmCoordinator:
             }
 
         # Weight by confidence and signal strength
-        total_weight = 0
-        weighted_direction = 0
-        weighted_strength = 0
-
-        for pos in positions:
-            weight = pos.confidence * pos.signal_strength
-            if weight > 0:
-                weighted_direction += pos.signal_direction * weight
-                weighted_strength += pos.signal_strength * weight
-                total_weight += weight
+        weight = arrays.confidence * arrays.signal_strength
+        weight = np.where(weight > 0, weight, 0.0)
+        total_weight = float(weight.sum())
 
         if total_weight > 0:
-            direction = weighted_direction / total_weight
-            strength = weighted_strength / total_weight
+            direction = float(weight @ arrays.signal_direction) / total_weight
+            strength = float(weight @ arrays.signal_strength) / total_weight
         else:
             direction = 0
             strength = 0
@@ -658,7 +690,7 @@ class SwarmCoordinator:
             "strength": round(strength, 4),
             "confidence": round(confidence, 4),
             "state": self._state.value,
-            "agents": len(positions),
+            "agents": len(arrays),
             "coherence": round(self._metrics.position_coherence, 4),
             "recommended_gift": self._recommend_gift(strength, direction)
         }
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Battle Analytics Benchmark - columnar action store vs dataclass rows.
+
+Records N actions into BattleAnalytics and reports memory per action
+(tracemalloc) against the previous layout, reproduced as the baseline: one
+ActionEvent dataclass per action in the timeline, referenced again from the
+agent's action list, plus the per-gift timing list. Then times
+get_full_report on the columns, cold (first call after recording) and
+cached.
+
+Run with: python benchmarks/bench_battle_analytics.py [--actions N [N ...]]
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.battle_analytics import ActionEvent, BattleAnalytics
+
+AGENTS = ["Kinetik", "StrategicKinetik", "PixelPixie", "EfficiencyTrader", "Sentinel", "GloveExpert"]
+GIFTS = [("Rose", 1), ("Heart Me", 5), ("Doughnut", 30), ("Lion", 29999), ("Universe", 44999)]
+
+
+def make_actions(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    actions = []
+    for i in range(count):
+        gift, cost = rng.choice(GIFTS)
+        multiplier = rng.choice([1.0, 1.0, 2.0, 3.0, 5.0])
+        actions.append((i * 300 // count, rng.choice(AGENTS), "gift", gift,
+                        int(cost * multiplier), multiplier, rng.random() < 0.1, cost))
+    return actions
+
+
+def dataclass_memory(actions) -> float:
+    tracemalloc.start()
+    timeline, by_agent, gift_timing = [], defaultdict(list), defaultdict(list)
+    for t, agent, kind, gift, points, multiplier, coordinated, _ in actions:
+        action = ActionEvent(t, agent, kind, gift, points, multiplier, coordinated, {})
+        timeline.append(action)
+        by_agent[agent].append(action)
+        gift_timing[gift].append(t)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(actions)
+
+
+def columnar(actions):
+    tracemalloc.start()
+    analytics = BattleAnalytics()
+    analytics.record_battle_start(300, len(AGENTS))
+    for name in AGENTS:
+        analytics.register_agent(name, "🤖")
+    for t, agent, kind, gift, points, multiplier, coordinated, cost in actions:
+        analytics.record_action(t, agent, kind, gift, points, multiplier, coordinated, cost=cost)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return analytics, current / len(actions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BattleAnalytics benchmark")
+    parser.add_argument("--actions", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Recorded actions per battle")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📊 BATTLE ANALYTICS BENCHMARK")
+    print("=" * 60)
+
+    for count in args.actions:
+        actions = make_actions(count)
+        baseline = dataclass_memory(actions)
+        analytics, memory = columnar(actions)
+
+        start = time.perf_counter()
+        analytics.get_full_report()
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        analytics.get_full_report()
+        cached = time.perf_counter() - start
+
+        print(f"\n   {count:,} actions:")
+        print(f"      memory      dataclass {baseline:>6.0f} B/action | columns {memory:>5.0f} B/action "
+              f"({baseline / memory:.1f}x)")
+        print(f"      full report cold {cold * 1000:>7.2f} ms | cached {cached * 1000:>6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
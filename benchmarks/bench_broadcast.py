@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Broadcast Benchmark - Socket.IO traffic during a gift storm.
+
+Replays a simulated live battle (gifts, score updates, viewer joins and
+audience votes) through a direct emitter and through BroadcastAggregator
+on a virtual clock, and compares messages/sec and bytes/sec sent to
+clients.
+
+Run with: python benchmarks/bench_broadcast.py [--seconds N] [--gifts-per-sec N] [--rate-hz N]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.backend.broadcast import BATCH, BroadcastAggregator
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def simulate(seconds: int, gifts_per_sec: int, rate_hz: float, seed: int = 42) -> dict:
+    """Run the storm through an aggregator (rate_hz=0 = direct) and return its stats."""
+    rng = random.Random(seed)
+    clock = VirtualClock()
+    broadcaster = BroadcastAggregator(lambda event, payload, to=None: None, rate_hz=rate_hz,
+                                      event_rates={'viewer_count': 2, 'vote_update': 4},
+                                      start_task=lambda fn: None, clock=clock, measure_bytes=True)
+
+    scores = {'creator_score': 0, 'opponent_score': 0}
+    votes = {'creator': 0, 'opponent': 0}
+    viewers = 0
+    steps = seconds * 100  # 10ms simulation steps
+    per_step = gifts_per_sec / 100
+
+    for step in range(steps):
+        clock.now = step / 100
+        for _ in range(int(per_step) + (rng.random() < per_step % 1)):
+            team = rng.choice(('creator', 'opponent'))
+            points = rng.choice((1, 1, 5, 10, 99, 500))
+            scores[f'{team}_score'] += points
+            broadcaster.emit('live_gift', {'team': team, 'gift': 'Rose', 'points': points,
+                                           'user': f'viewer_{rng.randrange(10000)}'}, mode=BATCH)
+            broadcaster.emit('live_score_update', dict(scores))
+
+        if rng.random() < 0.5:
+            viewers += 1
+            broadcaster.emit('viewer_count', {'count': viewers})
+        if rng.random() < 0.3:
+            votes[rng.choice(('creator', 'opponent'))] += 1
+            broadcaster.emit('vote_update', {'votes': dict(votes)})
+
+        if rate_hz > 0:
+            broadcaster.flush()
+
+    broadcaster.emit_now('live_battle_ended', {'winner': 'creator'})
+    return broadcaster.get_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Socket.IO broadcast aggregation benchmark")
+    parser.add_argument("--seconds", type=int, default=60, help="Simulated battle length")
+    parser.add_argument("--gifts-per-sec", type=int, default=500, help="Gift storm intensity")
+    parser.add_argument("--rate-hz", type=float, default=10, help="Aggregator frame rate")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📡 BROADCAST BENCHMARK")
+    print("=" * 60)
+    print(f"\n   {args.seconds}s battle, {args.gifts_per_sec} gifts/sec:")
+
+    results = {}
+    for label, rate in (("direct", 0), (f"aggregated @{args.rate_hz:g}Hz", args.rate_hz)):
+        stats = simulate(args.seconds, args.gifts_per_sec, rate)
+        stats["messages_out_per_sec"] = stats["messages_out"] / args.seconds
+        stats["bytes_out_per_sec"] = stats["bytes_out"] / args.seconds
+        results[label] = stats
+        print(f"      {label:<18} {stats['messages_out_per_sec']:>10,.1f} msgs/sec | "
+              f"{stats['bytes_out_per_sec'] / 1024:>8,.1f} KiB/sec")
+
+    direct, aggregated = results.values()
+    print(f"\n   Reduction: {direct['messages_out'] / aggregated['messages_out']:.1f}x messages, "
+          f"{direct['bytes_out'] / aggregated['bytes_out']:.1f}x bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Catch-up Planner Benchmark - knapsack plans vs fixed allocation heuristics.
+
+Draws one scenario per battle-farm spec: the spec seed drives an
+AdvancedPhaseManager (which boosts fire, x2/x3, when) and the creator
+budget. Both CatchUpOptimizer plans are then scored in points per budget
+coin, against the previous heuristics reproduced as the baselines:
+
+- catch-up:  min(multiplier_weight * 1.5, 0.7) of the remaining budget per
+             boost, the rest at x1
+- windows:   50/30/20% of the non-reserve budget for x5/x3/x2 boosts, plus
+             the final-30s reserve
+
+Every allocation is realized the same way: as many coins as the window's
+gift rate allows, times the window multiplier. Planner plans are scored
+without gloves (same rules as the baselines) and with the expected glove
+bonus. Finally times planner calls: solve (cache miss) and cache hit.
+
+Run with: python benchmarks/bench_catch_up_planner.py [--battles N] [--calls N]
+"""
+
+import argparse
+import io
+import random
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.advanced_phase_system import AdvancedPhaseManager
+from core.battle_farm import make_battle_specs
+from core.budget_system import BudgetManager
+from core.catch_up_planner import CatchUpPlanner, PlanWindow
+
+BOOST1_DURATION = 20
+BOOST2_DURATION = 30
+
+
+def make_scenario(seed: int, battle_duration: int):
+    """(budget, [(start, multiplier, duration)]) for one farm battle."""
+    rng = random.Random(seed)
+    with redirect_stdout(io.StringIO()):
+        phases = AdvancedPhaseManager(battle_duration=battle_duration, rng=rng)
+        budget = BudgetManager(rng=rng).creator_budget // rng.choice([1, 10, 100])
+
+    boosts = []
+    if phases.boost1_trigger_time is not None:
+        boosts.append((phases.boost1_trigger_time, phases.boost1_multiplier, BOOST1_DURATION))
+    if phases.boost2_trigger_time is not None:
+        boosts.append((phases.boost2_trigger_time, phases.boost2_multiplier, BOOST2_DURATION))
+    return budget, boosts
+
+
+def realize(planner: CatchUpPlanner, allocations) -> int:
+    """Points for [(multiplier, seconds, coins)] under the gift rate limit."""
+    table = planner.table
+    return sum(int(m * table.max_spend(int(coins), planner.capacity(seconds)))
+               for m, seconds, coins in allocations)
+
+
+def catch_up_windows(boosts, battle_duration: int):
+    windows = [PlanWindow(f"boost_{i + 1}", m, d, glove=True) for i, (_, m, d) in enumerate(boosts)]
+    normal = battle_duration - sum(d for _, _, d in boosts)
+    windows.append(PlanWindow("normal", 1.0, normal - 30))
+    windows.append(PlanWindow("final_30s", 1.0, 30, glove=True))
+    return windows
+
+
+def heuristic_catch_up(budget: int, boosts, battle_duration: int):
+    """The previous CatchUpOptimizer allocation."""
+    allocations, remaining = [], budget
+    ordered = sorted(boosts, key=lambda b: -b[1])
+    for _, multiplier, duration in ordered:
+        weight = multiplier / sum(b[1] for b in ordered)
+        allocation = int(remaining * min(weight * 1.5, 0.7))
+        allocations.append((multiplier, duration, allocation))
+        remaining -= allocation
+    allocations.append((1.0, battle_duration - sum(d for _, _, d in boosts), remaining))
+    return allocations
+
+
+def heuristic_windows(budget: int, boosts):
+    """The previous BudgetMaximizer allocation."""
+    reserve = min(budget * 0.3, 30000)
+    available = budget - reserve
+    allocations = []
+    for _, multiplier, duration in boosts:
+        share = 0.5 if multiplier >= 5.0 else 0.3 if multiplier >= 3.0 else 0.2 if multiplier >= 2.0 else 0
+        allocations.append((multiplier, duration, available * share))
+        available -= available * share
+    allocations.append((1.0, 30, reserve))
+    return allocations
+
+
+def planned(plan, windows):
+    return [(w.multiplier, pw.duration, w.budget) for w, pw in zip(plan.windows, windows)]
+
+
+def percentile(values, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Catch-up planner benchmark")
+    parser.add_argument("--battles", type=int, default=500, help="Farm battles (scenarios)")
+    parser.add_argument("--calls", type=int, default=2000, help="Timed planner calls")
+    parser.add_argument("--duration", type=int, default=300, help="Battle duration (s)")
+    args = parser.parse_args()
+
+    specs = make_battle_specs(args.battles, base_seed=42, battle_duration=args.duration)
+    scenarios = [make_scenario(spec.seed, spec.battle_duration) for spec in specs]
+    planner = CatchUpPlanner()
+    no_glove = CatchUpPlanner(glove_chance=0.0)
+
+    print("=" * 60)
+    print("🎯 CATCH-UP PLANNER BENCHMARK")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    planner.table
+    print(f"\n   min-gift table: {planner.table.size:,} entries, built in "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms (once per catalog)")
+
+    totals = {key: 0 for key in ("budget", "heuristic", "dp", "dp_glove", "w_heuristic", "w_dp", "w_dp_glove")}
+    for budget, boosts in scenarios:
+        windows = catch_up_windows(boosts, args.duration)
+        totals["budget"] += budget
+        totals["heuristic"] += realize(planner, heuristic_catch_up(budget, boosts, args.duration))
+        totals["dp"] += realize(planner, planned(no_glove.plan(budget, windows), windows))
+        totals["dp_glove"] += planner.plan(budget, windows).total_expected
+
+        reserve = int(min(budget * 0.3, 30000))
+        boost_windows = windows[:len(boosts)] + windows[-1:]
+        totals["w_heuristic"] += realize(planner, heuristic_windows(budget, boosts))
+        totals["w_dp"] += reserve + realize(planner, planned(no_glove.plan(budget - reserve, boost_windows),
+                                                             boost_windows))
+        totals["w_dp_glove"] += reserve + planner.plan(budget - reserve, boost_windows).total_expected
+
+    ppc = {key: value / totals["budget"] for key, value in totals.items()}
+    print(f"\n   {args.battles} farm battles, points per budget coin:")
+    print(f"      catch-up plan   heuristic {ppc['heuristic']:.3f} | dp {ppc['dp']:.3f} "
+          f"({ppc['dp'] / ppc['heuristic']:.2f}x) | dp + gloves {ppc['dp_glove']:.3f}")
+    print(f"      spend windows   heuristic {ppc['w_heuristic']:.3f} | dp {ppc['w_dp']:.3f} "
+          f"({ppc['w_dp'] / ppc['w_heuristic']:.2f}x) | dp + gloves {ppc['w_dp_glove']:.3f}")
+
+    rng = random.Random(7)
+    calls = [scenarios[rng.randrange(len(scenarios))] for _ in range(args.calls)]
+    solve, hit = [], []
+    for budget, boosts in calls:
+        windows = catch_up_windows(boosts, args.duration)
+        planner._layouts.clear()
+        start = time.perf_counter()
+        planner.plan(budget, windows)
+        solve.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        planner.plan(budget, windows)
+        hit.append(time.perf_counter() - start)
+
+    print(f"\n   latency over {args.calls:,} calls:")
+    for label, samples in (("solve (miss)", solve), ("cache hit", hit)):
+        print(f"      {label:<12} p50 {statistics.median(samples) * 1000:.3f} ms | "
+              f"p99 {percentile(samples, 0.99) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
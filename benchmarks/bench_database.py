@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Database Benchmark - insert rate and read latency under a concurrent writer.
+
+Measures ReplayRepository.save_replay_event inserts/sec with a fresh
+connection per call (DATABASE_POOL=0) versus pooled per-thread
+connections, then the latency of get_replay_events_range
+reads while another thread keeps writing, the ReplayEventWriter
+batched path, and analytics query latency over the statistics rollups.
+
+Run with: python benchmarks/bench_database.py [--events N] [--reads N] [--battles N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import database
+from core.database import BattleRepository, ReplayRepository
+from core.event_bus import EventBus, EventType
+from core.replay_writer import ReplayEventWriter
+
+
+def insert_rate(events: int, pooled: bool) -> float:
+    """save_replay_event calls per second."""
+    database.POOL_CONNECTIONS = pooled
+    battle_id = f"bench-{'pooled' if pooled else 'fresh'}"
+    BattleRepository.create_battle(battle_id, 300)
+
+    start = time.perf_counter()
+    for i in range(events):
+        ReplayRepository.save_replay_event(battle_id, i * 0.1, "gift_sent",
+                                           {"team": "creator", "points": 1})
+    return events / (time.perf_counter() - start)
+
+
+def writer_rate(events: int, background: bool) -> float:
+    """Events/sec published through a ReplayEventWriter, including the final flush."""
+    database.POOL_CONNECTIONS = True
+    battle_id = f"bench-writer-{'bg' if background else 'inline'}"
+    BattleRepository.create_battle(battle_id, 300)
+    bus = EventBus(keep_history=False)
+    writer = ReplayEventWriter(battle_id, background=background)
+    writer.attach(bus)
+
+    start = time.perf_counter()
+    for i in range(events):
+        bus.publish(EventType.GIFT_SENT, {"points": 1}, source="bench", timestamp=i * 0.1)
+    writer.close()
+    return events / (time.perf_counter() - start)
+
+
+def analytics_latency(battles: int) -> dict:
+    """Dashboard query latency (ms) after `battles` finished battles."""
+    database.POOL_CONNECTIONS = True
+    for i in range(battles):
+        battle_id = f"bench-stats-{i}"
+        BattleRepository.create_battle(battle_id, 300)
+        BattleRepository.end_battle(battle_id, i * 37 % 600000, i * 53 % 600000, "creator")
+        BattleRepository.add_agent_stats(battle_id, "NovaWhale", "persona", 1000, 10, 1000, 1.0)
+
+    latencies = {}
+    for name, query in (("overview", BattleRepository.get_advanced_statistics),
+                        ("distribution", BattleRepository.get_score_distribution),
+                        ("agents", BattleRepository.get_agent_statistics)):
+        start = time.perf_counter()
+        for _ in range(20):
+            query()
+        latencies[name] = (time.perf_counter() - start) / 20 * 1000
+    return latencies
+
+
+def read_latency_under_writer(reads: int, pooled: bool) -> dict:
+    """Range-read latency (ms) while a second thread inserts continuously."""
+    database.POOL_CONNECTIONS = pooled
+    battle_id = f"bench-read-{'pooled' if pooled else 'fresh'}"
+    BattleRepository.create_battle(battle_id, 300)
+    for i in range(2000):
+        ReplayRepository.save_replay_event(battle_id, i * 0.1, "gift_sent",
+                                           {"team": "creator", "points": 1})
+
+    stop = threading.Event()
+    written = [0]
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            ReplayRepository.save_replay_event("bench-writer", i * 0.1, "gift_sent",
+                                               {"team": "opponent", "points": 1})
+            i += 1
+        written[0] = i
+        database.close_connection()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+
+    latencies = []
+    started = time.perf_counter()
+    for i in range(reads):
+        t0 = time.perf_counter()
+        ReplayRepository.get_replay_events_range(battle_id, (i % 150) * 1.0, (i % 150) * 1.0 + 30)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    thread.join()
+
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "max": latencies[-1],
+        "writes_per_sec": written[0] / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite pooling/WAL benchmark")
+    parser.add_argument("--events", type=int, default=2000, help="Inserts per measurement")
+    parser.add_argument("--reads", type=int, default=300, help="Reads under concurrent writer")
+    parser.add_argument("--battles", type=int, default=5000, help="Battles before analytics queries")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DATABASE_PATH = os.path.join(tmp, "bench.db")
+        database.init_database()
+
+        print("=" * 60)
+        print("🗄️  DATABASE BENCHMARK")
+        print("=" * 60)
+
+        print(f"\n   save_replay_event ({args.events:,} inserts):")
+        for label, pooled in (("fresh connection", False), ("pooled + WAL", True)):
+            print(f"      {label:<18} {insert_rate(args.events, pooled):>10,.0f} inserts/sec")
+
+        print(f"\n   get_replay_events_range under a concurrent writer ({args.reads} reads):")
+        for label, pooled in (("fresh connection", False), ("pooled + WAL", True)):
+            stats = read_latency_under_writer(args.reads, pooled)
+            print(f"      {label:<18} p50 {stats['p50']:6.2f} ms | p95 {stats['p95']:6.2f} ms | "
+                  f"max {stats['max']:6.2f} ms | writer {stats['writes_per_sec']:,.0f}/s")
+
+        print(f"\n   ReplayEventWriter ({args.events:,} events):")
+        for label, background in (("inline batches", False), ("background thread", True)):
+            print(f"      {label:<18} {writer_rate(args.events, background):>10,.0f} events/sec")
+
+        print(f"\n   Analytics queries after {args.battles:,} battles:")
+        for name, ms in analytics_latency(args.battles).items():
+            print(f"      {name:<18} {ms:>10.3f} ms")
+
+        database.close_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Event Memory Benchmark - bytes/event and publish rate for BattleEvent.
+
+Compares the slotted BattleEvent (dict payloads via publish(), lazy tuple
+payloads via publish_fields()) against the previous plain dataclass with
+an eager data dict, using the engine's hot GIFT_SENT payload.
+
+Run with: python benchmarks/bench_event_memory.py [--events N]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.event_bus as event_bus_module
+from core.event_bus import BattleEvent, EventBus, EventType
+
+
+@dataclass
+class LegacyBattleEvent:
+    """The BattleEvent layout before slots/lazy payloads (for comparison)."""
+    event_type: EventType
+    timestamp: float
+    data: Dict[str, Any] = field(default_factory=dict)
+    source: str = "system"
+
+
+def _legacy_events(count: int):
+    events = []
+    for i in range(count):
+        events.append(LegacyBattleEvent(
+            EventType.GIFT_SENT, float(i),
+            {"agent": "NovaWhale", "gift": "Rose", "points": 1, "emotion": "CALM"},
+            "NovaWhale"
+        ))
+    return events
+
+
+def _dict_events(count: int):
+    events = []
+    for i in range(count):
+        events.append(BattleEvent(
+            EventType.GIFT_SENT, float(i),
+            {"agent": "NovaWhale", "gift": "Rose", "points": 1, "emotion": "CALM"},
+            "NovaWhale"
+        ))
+    return events
+
+
+def _lazy_events(count: int):
+    fields = ("agent", "gift", "points", "emotion")
+    events = []
+    for i in range(count):
+        events.append(BattleEvent.from_fields(
+            EventType.GIFT_SENT, float(i), fields, ("NovaWhale", "Rose", 1, "CALM"), "NovaWhale"
+        ))
+    return events
+
+
+def bytes_per_event(build, count: int) -> float:
+    """Measure retained bytes per event for a builder."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    return (after - before) / count
+
+
+def publish_rate(count: int, lazy: bool) -> float:
+    """Events/sec through EventBus with history on and one GIFT_SENT subscriber."""
+    bus = EventBus()
+    bus.subscribe(EventType.GIFT_SENT, lambda event: None)
+
+    start = time.perf_counter()
+    for i in range(count):
+        if lazy:
+            bus.publish_fields(EventType.GIFT_SENT, ("NovaWhale", "Rose", 1, "CALM"),
+                               source="NovaWhale", timestamp=i)
+        else:
+            bus.publish(EventType.GIFT_SENT,
+                        {"agent": "NovaWhale", "gift": "Rose", "points": 1, "emotion": "CALM"},
+                        source="NovaWhale", timestamp=i)
+    return count / (time.perf_counter() - start)
+
+
+def legacy_publish_rate(count: int) -> float:
+    """publish() throughput with the legacy dataclass swapped in as the event class."""
+    original = event_bus_module.BattleEvent
+    event_bus_module.BattleEvent = LegacyBattleEvent
+    try:
+        return publish_rate(count, lazy=False)
+    finally:
+        event_bus_module.BattleEvent = original
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BattleEvent memory and publish throughput")
+    parser.add_argument("--events", type=int, default=100_000, help="Events per measurement")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧠 EVENT MEMORY BENCHMARK")
+    print("=" * 60)
+    print(f"   Events per measurement: {args.events:,}\n")
+
+    print("   Bytes per retained GIFT_SENT event:")
+    for label, build in (("legacy dataclass", _legacy_events),
+                         ("slotted + dict", _dict_events),
+                         ("slotted + lazy", _lazy_events)):
+        print(f"      {label:<18} {bytes_per_event(build, args.events):8.1f} B")
+
+    print("\n   Publish throughput:")
+    print(f"      {'legacy dataclass':<18} {legacy_publish_rate(args.events):>12,.0f} events/sec")
+    print(f"      {'publish()':<18} {publish_rate(args.events, lazy=False):>12,.0f} events/sec")
+    print(f"      {'publish_fields()':<18} {publish_rate(args.events, lazy=True):>12,.0f} events/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Gift Index Benchmark - bisect queries vs per-call list scans.
+
+Times the per-tick gift questions (affordable gifts, biggest affordable
+gift, cheapest gift worth N points, most efficient gift) on GiftIndex
+against the previous implementation reproduced as the baseline: a list
+comprehension over the catalog followed by max/min, once per call.
+
+Run with: python benchmarks/bench_gift_index.py [--queries N] [--gifts N [N ...]]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.budget_manager import GiftEfficiency
+from core.gift_index import GiftIndex
+
+
+def make_catalog(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    gifts = []
+    for i in range(n):
+        coins = rng.choice([1, 5, 10, 30, 99, 100, 500, 999, 1000, 5000, 10000, 29999, 44999])
+        points = int(coins * rng.uniform(0.8, 1.2)) or 1
+        gifts.append(GiftEfficiency(f"gift_{i}", coins, points, points / coins, rng.choice("abcd")))
+    return gifts
+
+
+def scan_queries(gifts, by_efficiency, budget, target):
+    affordable = [g for g in gifts if g.coins <= budget]
+    if affordable:
+        max(affordable, key=lambda g: g.coins)
+        max(affordable, key=lambda g: g.points)
+    meeting = [g for g in gifts if g.coins <= budget and g.points >= target]
+    if meeting:
+        min(meeting, key=lambda g: g.coins)
+    next((g for g in by_efficiency if g.coins <= budget and g.points >= target), None)
+
+
+def index_queries(index, budget, target):
+    index.affordable(budget)
+    index.max_affordable(budget)
+    index.max_points_affordable(budget)
+    index.cheapest_at_least(target, budget)
+    index.most_efficient(budget, target)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GiftIndex benchmark")
+    parser.add_argument("--gifts", type=int, nargs="+", default=[24, 63, 500], help="Catalog sizes")
+    parser.add_argument("--queries", type=int, default=20000, help="Query rounds per catalog")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🎁 GIFT INDEX BENCHMARK")
+    print("=" * 60)
+    print(f"\n   {args.queries:,} rounds of 5 queries per catalog:")
+
+    rng = random.Random(7)
+    workload = [(rng.randint(0, 50000), rng.randint(0, 20000)) for _ in range(args.queries)]
+
+    for n in args.gifts:
+        gifts = make_catalog(n)
+
+        start = time.perf_counter()
+        index = GiftIndex(gifts)
+        build = time.perf_counter() - start
+
+        by_efficiency = sorted(gifts, key=lambda g: g.efficiency, reverse=True)
+        start = time.perf_counter()
+        for budget, target in workload:
+            scan_queries(gifts, by_efficiency, budget, target)
+        scan = (time.perf_counter() - start) / args.queries
+
+        start = time.perf_counter()
+        for budget, target in workload:
+            index_queries(index, budget, target)
+        indexed = (time.perf_counter() - start) / args.queries
+
+        print(f"      {n:>4} gifts | scan {scan * 1e6:>7.1f} µs/round | "
+              f"index {indexed * 1e6:>6.1f} µs/round ({scan / indexed:>5.1f}x) | build {build * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
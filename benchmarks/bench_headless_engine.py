@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Headless Engine Benchmark - battles/sec on the virtual clock.
+
+Runs the default persona team (NovaWhale, PixelPixie, GlitchMancer,
+ShadowPatron, Dramatron) through headless BattleEngine battles and reports
+throughput for 60s and 300s battles.
+
+Run with: python benchmarks/bench_headless_engine.py [--battles N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import BattleEngine
+from agents.personas import NovaWhale, PixelPixie, GlitchMancer, ShadowPatron, Dramatron
+
+DEFAULT_TEAM = [NovaWhale, PixelPixie, GlitchMancer, ShadowPatron, Dramatron]
+
+
+def run_headless_battle(duration: int) -> BattleEngine:
+    """Run one headless battle with a fresh default team."""
+    engine = BattleEngine(battle_duration=duration, headless=True)
+    for agent_class in DEFAULT_TEAM:
+        engine.add_agent(agent_class())
+    engine.run()
+    return engine
+
+
+def bench(duration: int, battles: int) -> float:
+    """Return battles/sec for the given battle duration."""
+    start = time.perf_counter()
+    for _ in range(battles):
+        run_headless_battle(duration)
+    elapsed = time.perf_counter() - start
+    return battles / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless BattleEngine throughput")
+    parser.add_argument("--battles", type=int, default=50, help="Battles per duration")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("⚡ HEADLESS ENGINE BENCHMARK")
+    print("=" * 60)
+    print(f"   Team: {', '.join(c.__name__ for c in DEFAULT_TEAM)}")
+    print(f"   Battles per duration: {args.battles}\n")
+
+    for duration in (60, 300):
+        rate = bench(duration, args.battles)
+        print(f"   {duration:>3}s battle: {rate:8.1f} battles/sec "
+              f"({rate * 60:,.0f} battles/min)")
+
+
+if __name__ == "__main__":
+    main()
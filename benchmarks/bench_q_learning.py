@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Q-Learning Benchmark - dict Q-table vs dense array Q-table.
+
+Compares the previous Dict[tuple, Dict[ActionType, float]] implementation
+(reproduced here as the baseline) with QLearningAgent's array-backed
+Q-table: action selection, single updates, experience replay batches and
+memory per state. Also compares per-battle database checkpoints: the
+legacy JSON row (whole table re-serialized every save) vs incremental
+binary chunks, and the matching load times.
+
+Run with: python benchmarks/bench_q_learning.py [--experiences N] [--replays N] [--battles N]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.learning_system import ActionType, Experience, QLearningAgent, State
+from core.battle_history import BattleHistoryDB
+
+
+class DictQLearner:
+    """The previous dict-of-dicts Q-learner (list buffer, per-experience replay)."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.learning_rate = 0.12
+        self.discount_factor = 0.95
+        self.epsilon = 0.0
+        self.q_table = {}
+        self.experience_buffer = []
+        self.max_buffer_size = 1000
+
+    def choose_action(self, state):
+        if self.rng.random() < self.epsilon:
+            return self.rng.choice(list(ActionType))
+        state_key = state.to_tuple()
+        if state_key not in self.q_table:
+            return self.rng.choice(list(ActionType))
+        q_values = {a: self.q_table[state_key].get(a, 0.0) for a in list(ActionType)}
+        return max(q_values.items(), key=lambda x: x[1])[0]
+
+    def update(self, experience):
+        state_key = experience.state.to_tuple()
+        if state_key not in self.q_table:
+            self.q_table[state_key] = {a: 0.0 for a in ActionType}
+        current_q = self.q_table[state_key][experience.action]
+        if experience.done:
+            target_q = experience.reward
+        else:
+            next_state_key = experience.next_state.to_tuple()
+            if next_state_key in self.q_table:
+                max_next_q = max(self.q_table[next_state_key].values())
+            else:
+                max_next_q = 0.0
+            target_q = experience.reward + self.discount_factor * max_next_q
+        self.q_table[state_key][experience.action] = current_q + self.learning_rate * (target_q - current_q)
+        self.experience_buffer.append(experience)
+        if len(self.experience_buffer) > self.max_buffer_size:
+            self.experience_buffer.pop(0)
+
+    def experience_replay(self, batch_size=32):
+        if len(self.experience_buffer) < batch_size:
+            return
+        for exp in self.rng.sample(self.experience_buffer, batch_size):
+            self.update(exp)
+
+
+def make_experiences(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    actions = list(ActionType)
+
+    def state():
+        return State(
+            time_remaining=rng.randrange(0, 300),
+            score_diff=rng.randrange(-150000, 150000),
+            multiplier=rng.choice([1.0, 2.0, 3.0, 5.0]),
+            in_boost=rng.random() < 0.3,
+            boost2_triggered=rng.random() < 0.5,
+            phase="NORMAL",
+            gloves_available=rng.randrange(0, 4),
+            power_ups_available=["HAMMER"] if rng.random() < 0.5 else [],
+            budget_ratio=rng.random()
+        )
+
+    return [Experience(state(), rng.choice(actions), rng.uniform(-50, 100), state(), rng.random() < 0.05)
+            for _ in range(count)]
+
+
+def measure(agent, experiences, replays: int) -> dict:
+    start = time.perf_counter()
+    for exp in experiences:
+        agent.update(exp)
+    update_rate = len(experiences) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for exp in experiences:
+        agent.choose_action(exp.state)
+    choose_rate = len(experiences) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(replays):
+        agent.experience_replay(batch_size=32)
+    replay_rate = replays / (time.perf_counter() - start)
+
+    return {'update': update_rate, 'choose': choose_rate, 'replay': replay_rate}
+
+
+def table_memory(factory, experiences) -> float:
+    """Bytes allocated per visited state while filling the Q-table."""
+    tracemalloc.start()
+    agent = factory()
+    for exp in experiences:
+        agent.update(exp)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / max(len(agent.q_table), 1)
+
+
+def measure_checkpoints(experiences, battles: int, updates_per_battle: int = 200) -> dict:
+    """Seconds per save/load for a fully trained table, one save per battle."""
+    agent = QLearningAgent('bench', epsilon=0.0, rng=random.Random(1))
+    for exp in experiences:
+        agent.update(exp)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        db = BattleHistoryDB(str(Path(tmp) / "bench.db"))
+        agent.save_to_db(db)  # initial full write
+        rng = random.Random(7)
+
+        for label in ('json', 'binary'):
+            elapsed = 0.0
+            for _ in range(battles):
+                for exp in rng.sample(experiences, updates_per_battle):
+                    agent.update(exp)
+                start = time.perf_counter()
+                if label == 'json':
+                    legacy = {key: dict(row) for key, row in agent.q_table.items()}
+                    db.save_q_table('bench_json', legacy, agent.episodes, 0.0, 0, agent.epsilon)
+                else:
+                    agent.save_to_db(db)
+                elapsed += time.perf_counter() - start
+
+            loader = QLearningAgent('bench_json' if label == 'json' else 'bench')
+            start = time.perf_counter()
+            loader.load_from_db(db)
+            results[label] = (elapsed / battles, time.perf_counter() - start)
+        db.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Q-table benchmark")
+    parser.add_argument("--experiences", type=int, default=20000, help="Updates / lookups per measurement")
+    parser.add_argument("--replays", type=int, default=2000, help="Replay batches of 32")
+    parser.add_argument("--battles", type=int, default=20, help="Checkpoints (one per battle)")
+    args = parser.parse_args()
+
+    experiences = make_experiences(args.experiences)
+    factories = {
+        'dict Q-table': lambda: DictQLearner(random.Random(1)),
+        'array Q-table': lambda: QLearningAgent('bench', epsilon=0.0, rng=random.Random(1)),
+    }
+
+    print("=" * 60)
+    print("🧠 Q-LEARNING BENCHMARK")
+    print("=" * 60)
+    print(f"\n   {args.experiences:,} experiences, {args.replays:,} replay batches:")
+
+    for label, factory in factories.items():
+        rates = measure(factory(), experiences, args.replays)
+        memory = table_memory(factory, experiences)
+        print(f"      {label:<14} update {rates['update']:>9,.0f}/s | choose {rates['choose']:>9,.0f}/s | "
+              f"replay {rates['replay']:>7,.0f} batches/s | {memory:>6,.0f} B/state")
+
+    print(f"\n   Checkpoint after each of {args.battles} battles (200 updates each):")
+    for label, (save, load) in measure_checkpoints(experiences, args.battles).items():
+        print(f"      {label:<14} save {save * 1000:>8.2f} ms | load {load * 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
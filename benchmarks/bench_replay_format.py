@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Replay Format Benchmark - file size and load/seek time for BattleRecorder replays.
+
+Records a synthetic battle with BattleRecorder, then compares the JSON
+replay file (save_to_file) with the compact columnar format for each
+codec: bytes on disk, full load time (every tick decoded) and the time to
+open a replay and seek to one tick.
+
+Run with: python benchmarks/bench_replay_format.py [--duration S] [--gifts-per-tick N]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.battle_history import BattleRecorder, ReplayData
+from core.replay_format import CODECS, CompactReplay, write_replay
+
+
+def record_battle(duration: int, gifts_per_tick: int, seed: int = 0) -> ReplayData:
+    """Synthetic replay with a boost phase in the middle."""
+    rng = random.Random(seed)
+    recorder = BattleRecorder("bench", duration=duration)
+    recorder.start_recording({"agents": ["NovaWhale", "PixelPixie", "GlitchMancer"]})
+
+    creator = opponent = 0
+    for t in range(duration):
+        boost = duration // 3 <= t < duration // 3 + 30
+        for _ in range(rng.randint(0, gifts_per_tick * 2)):
+            gift, points = rng.choice([("Rose", 1), ("Heart", 5), ("Doughnut", 30), ("Universe", 44999)])
+            creator += points
+            recorder.record_event(t, "gift", {"agent": rng.choice(["NovaWhale", "PixelPixie"]),
+                                              "gift": gift, "points": points})
+        opponent += rng.randint(0, 500)
+        recorder.record_tick(t, creator, opponent, "BOOST" if boost else "NORMAL", 3.0 if boost else 1.0)
+
+    recorder.finish_recording("creator" if creator > opponent else "opponent", creator, opponent)
+    return recorder.get_replay_data()
+
+
+def timed(fn, repeat: int = 5) -> float:
+    """Best-of-N wall time in ms."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay format size/load benchmark")
+    parser.add_argument("--duration", type=int, default=300, help="Battle length in seconds")
+    parser.add_argument("--gifts-per-tick", type=int, default=3, help="Average gifts per tick")
+    args = parser.parse_args()
+
+    replay = record_battle(args.duration, args.gifts_per_tick)
+    seek_time = args.duration * 2 // 3
+
+    print("=" * 60)
+    print("🎬 REPLAY FORMAT BENCHMARK")
+    print("=" * 60)
+    print(f"   {len(replay.ticks)} ticks, {sum(len(t.events) for t in replay.ticks):,} events")
+    print(f"\n   {'format':<14}{'size':>12}{'full load':>14}{'open+seek':>14}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "replay.json")
+        with open(json_path, "w") as f:
+            json.dump(replay.to_dict(), f, indent=2)
+
+        def load_json():
+            with open(json_path) as f:
+                return ReplayData.from_dict(json.load(f))
+
+        def seek_json():
+            ticks = load_json().ticks
+            return next(t for t in reversed(ticks) if t.time <= seek_time)
+
+        print(f"   {'json':<14}{os.path.getsize(json_path):>10,} B"
+              f"{timed(load_json):>11.2f} ms{timed(seek_json):>11.2f} ms")
+
+        for codec in sorted(CODECS):
+            path = os.path.join(tmp, f"replay-{codec}.bbr")
+            write_replay(replay, path, codec)
+
+            def load_compact():
+                with CompactReplay.open(path) as compact:
+                    return compact.to_replay_data(lazy=False)
+
+            def seek_compact():
+                with CompactReplay.open(path) as compact:
+                    return compact.tick_at(seek_time)
+
+            print(f"   {'bbr/' + codec:<14}{os.path.getsize(path):>10,} B"
+                  f"{timed(load_compact):>11.2f} ms{timed(seek_compact):>11.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
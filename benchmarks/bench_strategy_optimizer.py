@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Strategy Optimizer Benchmark - batch population search over battle history.
+
+Seeds a battle history database with N battles (sniper and glove expert
+performance rows, glove timing rows), then times StrategyOptimizer's
+run_optimization_cycle: one columnar history load per agent type plus
+the vectorized evolutionary search. For reference it also times a
+per-candidate Python loop scoring the same population against the same
+history (the row-at-a-time approach the batch fitness replaces).
+
+Run with: python benchmarks/bench_strategy_optimizer.py [--battles N [N ...]] [--population N]
+"""
+
+import argparse
+import math
+import random
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from agents.learning_system import StrategyOptimizer
+from agents.strategy_search import SNIPER_SPACE, sniper_fitness, to_columns
+from core.battle_history import BattleHistoryDB
+
+
+def seed_db(path: str, battles: int, seed: int = 42) -> BattleHistoryDB:
+    db = BattleHistoryDB(path)
+    rng = random.Random(seed)
+    battle_rows, perf_rows, glove_rows = [], [], []
+    for i in range(battles):
+        battle_id = f"battle_{i:06d}"
+        won = rng.random() < 0.55
+        battle_rows.append((battle_id, f"2026-01-01T{i:09d}", 180, "creator" if won else "opponent",
+                            0, 0, rng.randrange(1000, 400000), int(rng.random() < 0.5), 1, 0, 10))
+        for agent_type in ("sniper", "glove_expert"):
+            perf_rows.append((battle_id, agent_type, agent_type, 1000, 5, 200.0, 500, 1, 1, 1,
+                              rng.randrange(0, 4), rng.randrange(0, 7), 1, 0, int(won)))
+        glove_rows.append((battle_id, "glove_expert", "GLOVE", 30, rng.randrange(0, 180),
+                           rng.choice(["BOOST", "FINAL", "NORMAL"]), 1.0, 30, 0, int(rng.random() < 0.4)))
+
+    db.conn.executemany("INSERT INTO battles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", battle_rows)
+    db.conn.executemany("""
+        INSERT INTO agent_performance
+        (battle_id, agent_name, agent_type, points_donated, gifts_sent, avg_gift_value,
+         best_gift_value, early_phase_gifts, mid_phase_gifts, late_phase_gifts,
+         final_phase_gifts, gloves_sent, gloves_activated, power_ups_used, won)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, perf_rows)
+    db.conn.executemany("""
+        INSERT INTO gift_timing
+        (battle_id, agent_name, gift_type, gift_value, timestamp, phase,
+         multiplier, effective_value, score_diff_before, activated_x5)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, glove_rows)
+    db.conn.commit()
+    return db
+
+
+def loop_fitness(rows, candidate) -> float:
+    """Per-candidate, per-battle Python scoring (same kernel as sniper_fitness)."""
+    bandwidth = SNIPER_SPACE.span * 0.1
+    total = norm = 0.0
+    for row in rows:
+        weight = 1.0 if row['won'] else -0.5
+        implied = (max(3, min(10, 5 + (row['final_phase_gifts'] - 1) * 2)),
+                   row['margin'] * 1.2, row['margin'] * 0.6, row['margin'] * 0.1)
+        z2 = sum(((c - t) / b) ** 2 for c, t, b in zip(candidate, implied, bandwidth))
+        total += weight * math.exp(-0.5 * z2)
+        norm += abs(weight)
+    return total / norm
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StrategyOptimizer benchmark")
+    parser.add_argument("--battles", type=int, nargs="+", default=[1000, 10000, 50000],
+                        help="History sizes to benchmark")
+    parser.add_argument("--population", type=int, default=16, help="Candidates per generation")
+    parser.add_argument("--generations", type=int, default=25, help="Generations per search")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧬 STRATEGY OPTIMIZER BENCHMARK")
+    print("=" * 60)
+    print(f"\n   population {args.population}, {args.generations} generations per agent type:")
+
+    for battles in args.battles:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = seed_db(str(Path(tmp) / "bench.db"), battles)
+            optimizer = StrategyOptimizer(db, population_size=args.population,
+                                          generations=args.generations, seed=1)
+            start = time.perf_counter()
+            with redirect_stdout(StringIO()):
+                optimizer.run_optimization_cycle()
+            cycle = time.perf_counter() - start
+
+            # One generation: batch fitness vs per-candidate loop
+            population = SNIPER_SPACE.clip(np.random.default_rng(0).uniform(
+                SNIPER_SPACE.low, SNIPER_SPACE.high, (args.population, len(SNIPER_SPACE.names))))
+            fitness = sniper_fitness(to_columns(db.get_history_columns('sniper', battles)))
+            start = time.perf_counter()
+            fitness(population)
+            batch = time.perf_counter() - start
+
+            rows = db.get_learning_data('sniper', limit=battles)
+            start = time.perf_counter()
+            for candidate in population:
+                loop_fitness(rows, candidate)
+            loop = time.perf_counter() - start
+            db.close()
+
+        print(f"      {battles:>7,} battles | cycle {cycle:>6.2f}s | one generation: "
+              f"batch {batch * 1000:>7.1f} ms vs loop {loop * 1000:>8.1f} ms ({loop / batch:>4.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
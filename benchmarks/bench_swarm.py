@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Swarm Benchmark - vectorized Boids step vs per-pair Python loops.
+
+Times SwarmCoordinator.update (neighbor search, Boids forces, position
+update, metrics) for swarms of n agents, against the previous
+implementation reproduced as the baseline: an O(n^2) pass over
+AgentPosition objects with math.sqrt per pair, separate cohesion /
+alignment / separation loops and a datetime stamp per agent per update.
+
+Run with: python benchmarks/bench_swarm.py [--agents N [N ...]] [--steps N]
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.swarm.swarm_coordinator import AgentPosition, SwarmConfig, SwarmCoordinator
+
+
+class LoopSwarm:
+    """The previous per-agent Boids step over AgentPosition objects."""
+
+    def __init__(self, positions, config: SwarmConfig):
+        self.positions = {p.agent_id: p for p in positions}
+        self.config = config
+
+    def update(self):
+        cfg = self.config
+        agents = list(self.positions.values())
+        forces = {}
+        for pos in agents:
+            neighbors = [o for o in agents if o.agent_id != pos.agent_id and math.sqrt(
+                (o.x - pos.x) ** 2 + (o.y - pos.y) ** 2 + (o.z - pos.z) ** 2) < cfg.neighbor_radius]
+            if not neighbors:
+                forces[pos.agent_id] = (0, 0, 0)
+                continue
+            k = len(neighbors)
+            cohesion = (sum(o.x for o in neighbors) / k - pos.x, sum(o.y for o in neighbors) / k - pos.y,
+                        sum(o.z for o in neighbors) / k - pos.z)
+            alignment = (sum(o.vx for o in neighbors) / k - pos.vx, sum(o.vy for o in neighbors) / k - pos.vy,
+                         sum(o.vz for o in neighbors) / k - pos.vz)
+            sx = sy = sz = 0.0
+            for o in neighbors:
+                dx, dy, dz = pos.x - o.x, pos.y - o.y, pos.z - o.z
+                dist = math.sqrt(dx * dx + dy * dy + dz * dz) + 0.001
+                sx += dx / (dist * dist)
+                sy += dy / (dist * dist)
+                sz += dz / (dist * dist)
+            forces[pos.agent_id] = tuple(
+                cfg.cohesion_weight * c + cfg.alignment_weight * a + cfg.separation_weight * s
+                for c, a, s in zip(cohesion, alignment, (sx, sy, sz)))
+
+        for agent_id, (fx, fy, fz) in forces.items():
+            pos = self.positions[agent_id]
+            pos.vx = pos.vx * cfg.signal_decay_rate + fx * 0.1
+            pos.vy = pos.vy * cfg.signal_decay_rate + fy * 0.1
+            pos.vz = pos.vz * cfg.signal_decay_rate + fz * 0.1
+            pos.x = max(0, min(1, pos.x + pos.vx))
+            pos.y = max(0, min(1, pos.y + pos.vy))
+            pos.z = max(0, min(1, pos.z + pos.vz))
+            pos.last_update = datetime.now(timezone.utc)
+
+        n = len(agents)
+        mean = [sum(getattr(p, axis) for p in agents) / n for axis in "xyz"]
+        spread = sum(math.sqrt(sum((getattr(p, axis) - m) ** 2 for axis, m in zip("xyz", mean)))
+                     for p in agents) / n
+        return max(0, 1 - spread * 2)
+
+
+def make_positions(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    return [AgentPosition(f"supporter_{i}", f"supporter_{i}", x=rng.random(), y=rng.random(),
+                          z=rng.random(), signal_strength=rng.random(),
+                          signal_direction=rng.choice([-1.0, 1.0]), confidence=rng.random())
+            for i in range(n)]
+
+
+def time_steps(step, steps: int) -> float:
+    start = time.perf_counter()
+    for _ in range(steps):
+        step()
+    return (time.perf_counter() - start) / steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Swarm Boids benchmark")
+    parser.add_argument("--agents", type=int, nargs="+", default=[7, 100, 1000], help="Swarm sizes")
+    parser.add_argument("--steps", type=int, default=20, help="Updates per measurement")
+    args = parser.parse_args()
+
+    config = SwarmConfig()
+    context = {"time_remaining": 120, "deficit": 0, "boost_active": False}
+
+    print("=" * 60)
+    print("🐝 SWARM BOIDS BENCHMARK")
+    print("=" * 60)
+    print(f"\n   neighbor radius {config.neighbor_radius}, {args.steps} updates per size:")
+
+    for n in args.agents:
+        coordinator = SwarmCoordinator(config)
+        coordinator._arrays.store(make_positions(n))
+        vectorized = time_steps(lambda: coordinator.update(context), args.steps)
+
+        baseline = LoopSwarm(make_positions(n), config)
+        # The O(n^2) loop takes seconds per step at n=1000; fewer steps suffice
+        loop = time_steps(baseline.update, max(1, args.steps * 100 // max(n, 100)))
+
+        print(f"      n={n:>5,} | loop {loop * 1000:>9.2f} ms/step | "
+              f"vectorized {vectorized * 1000:>7.2f} ms/step ({loop / vectorized:>5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
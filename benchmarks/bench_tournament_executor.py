@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tournament Executor Benchmark - real-engine brackets, serial vs pooled.
+
+Runs a double-elimination bracket where every match is two headless
+BattleEngine battles with the same seed (one per side's lineup; each team
+fields three of the default personas). Compares:
+
+- serial:        one battle after another in the runner loop (the previous
+                 way to get real results: a simulate_match override)
+- pool/round:    BattleMatchExecutor, new worker pool per round
+- pool/reused:   BattleMatchExecutor as a context manager, one pool for
+                 the whole tournament
+
+All modes must crown the same champion with identical scores.
+
+Run with: python benchmarks/bench_tournament_executor.py [--teams N] [--workers N] [--duration S]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.battle_farm import DEFAULT_TEAM, run_battle
+from core.match_executor import BattleMatchExecutor, MatchPairing
+from core.tournament_bracket import DoubleEliminationRunner, DoubleEliminationTournament, TournamentTeam
+
+
+class SerialRunner(DoubleEliminationRunner):
+    """Real battles, played one at a time from simulate_match()."""
+
+    def __init__(self, tournament, executor):
+        super().__init__(tournament)
+        self.specs_for = executor
+
+    def simulate_match(self, match):
+        pairing = MatchPairing(match.match_id, match.team1, match.team2)
+        t1_spec, t2_spec = self.specs_for.make_specs([pairing])
+        t1_score, t2_score = (run_battle(spec)["summary"]["battle"]["final_scores"]["creator"]
+                              for spec in (t1_spec, t2_spec))
+        if t1_score == t2_score:
+            if match.team1.seed <= match.team2.seed:
+                t1_score += 1
+            else:
+                t2_score += 1
+        return t1_score, t2_score
+
+
+def make_lineups(teams: int):
+    """Three personas per team, rotating through the default team."""
+    size = len(DEFAULT_TEAM)
+    return {f"Team {i + 1}": [DEFAULT_TEAM[(i + k) % size] for k in range(3)] for i in range(teams)}
+
+
+def run(mode: str, teams: int, workers: int, duration: int):
+    tournament = DoubleEliminationTournament(
+        [TournamentTeam(name=f"Team {i + 1}", seed=i + 1) for i in range(teams)]
+    )
+    executor = BattleMatchExecutor(make_lineups(teams), base_seed=42, battle_duration=duration,
+                                   max_workers=workers)
+
+    start = time.perf_counter()
+    if mode == "serial":
+        runner = SerialRunner(tournament, executor)
+        runner.run_tournament(verbose=False)
+    elif mode == "pool/round":
+        runner = DoubleEliminationRunner(tournament, executor=executor)
+        runner.run_tournament(verbose=False)
+    else:
+        with executor:
+            runner = DoubleEliminationRunner(tournament, executor=executor)
+            runner.run_tournament(verbose=False)
+    elapsed = time.perf_counter() - start
+
+    results = [(h["team1_score"], h["team2_score"]) for h in runner.match_history]
+    return elapsed, tournament.champion.name, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tournament executor benchmark")
+    parser.add_argument("--teams", type=int, default=64, help="Bracket size (power of 2, <= 64)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--duration", type=int, default=300, help="Battle duration (s)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🏆 TOURNAMENT EXECUTOR BENCHMARK")
+    print("=" * 60)
+    print(f"   {args.teams}-team double elimination, {args.duration}s battles, "
+          f"{args.workers} worker(s)\n")
+
+    baseline = None
+    for mode in ("serial", "pool/round", "pool/reused"):
+        elapsed, champion, results = run(mode, args.teams, args.workers, args.duration)
+        if baseline is None:
+            baseline = (elapsed, champion, results)
+        same = (champion, results) == baseline[1:]
+        print(f"   {mode:<12} {elapsed:6.2f} s | {len(results)} matches | "
+              f"{2 * len(results) / elapsed:6.1f} battles/s | {baseline[0] / elapsed:4.1f}x | "
+              f"champion {champion} {'(identical)' if same else '(MISMATCH)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Audience Load Test - simulate thousands of viewers against a running server.
+
+Opens one Socket.IO connection per simulated viewer (ramping up in
+batches), has each one join and vote, then disconnects everyone and checks
+that /api/audience/votes and the viewer count add up. Reports connect and
+vote throughput plus how many vote_update / viewer_count messages the
+viewers received (throttled snapshots, not one per vote).
+
+Start the server first (python web/backend/app.py), then:
+
+Run with: python benchmarks/load_test_audience.py [--url URL] [--viewers 10000] [--ramp 500]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import socketio
+    SOCKETIO_CLIENT_AVAILABLE = True
+except ImportError:
+    SOCKETIO_CLIENT_AVAILABLE = False
+
+
+class Viewer:
+    """One simulated audience member with its own socket."""
+
+    def __init__(self, viewer_id: str):
+        self.viewer_id = viewer_id
+        self.client = socketio.AsyncClient(reconnection=False)
+        self.updates = 0
+        self.rejected = 0
+        self.client.on('vote_update', self._on_update)
+        self.client.on('viewer_count', self._on_update)
+        self.client.on('vote_error', self._on_rejected)
+
+    async def _on_update(self, data):
+        self.updates += 1
+
+    async def _on_rejected(self, data):
+        self.rejected += 1
+
+    async def connect(self, url: str):
+        await self.client.connect(url, transports=['websocket'])
+        await self.client.emit('viewer_join', {'viewer_id': self.viewer_id})
+
+    async def vote(self, rng: random.Random):
+        await self.client.emit('audience_vote', {
+            'viewer_id': self.viewer_id,
+            'vote': rng.choice(('creator', 'opponent'))
+        })
+
+    async def disconnect(self):
+        await self.client.disconnect()
+
+
+def get_json(url: str) -> dict:
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return json.loads(response.read())
+
+
+async def run(url: str, viewers: int, ramp: int, duplicate_rate: float, seed: int):
+    rng = random.Random(seed)
+    urllib.request.urlopen(urllib.request.Request(f"{url}/api/audience/reset", method='POST'), timeout=10)
+
+    crowd = [Viewer(f"load_{seed}_{i}") for i in range(viewers)]
+
+    # Ramp up connections in batches
+    start = time.perf_counter()
+    failures = 0
+    for i in range(0, viewers, ramp):
+        results = await asyncio.gather(*(v.connect(url) for v in crowd[i:i + ramp]), return_exceptions=True)
+        failures += sum(isinstance(r, Exception) for r in results)
+        print(f"      connected {min(i + ramp, viewers):>6,}/{viewers:,}", end="\r")
+    connect_time = time.perf_counter() - start
+    print()
+    connected = [v for v in crowd if v.client.connected]
+
+    # Vote burst (some viewers try to vote twice)
+    start = time.perf_counter()
+    await asyncio.gather(*(v.vote(rng) for v in connected))
+    duplicates = [v for v in connected if rng.random() < duplicate_rate]
+    await asyncio.gather(*(v.vote(rng) for v in duplicates))
+    vote_time = time.perf_counter() - start
+
+    await asyncio.sleep(2)  # let throttled snapshots and vote_errors arrive
+    during = get_json(f"{url}/api/audience/votes")
+
+    await asyncio.gather(*(v.disconnect() for v in connected), return_exceptions=True)
+    await asyncio.sleep(2)
+    after = get_json(f"{url}/api/audience/votes")
+
+    return {
+        'connected': len(connected),
+        'failures': failures,
+        'connect_rate': len(connected) / connect_time,
+        'vote_rate': (len(connected) + len(duplicates)) / vote_time,
+        'duplicates': len(duplicates),
+        'rejected': sum(v.rejected for v in connected),
+        'updates_per_viewer': sum(v.updates for v in connected) / max(len(connected), 1),
+        'votes': during['votes'],
+        'viewers_during': during['total_viewers'],
+        'viewers_after': after['total_viewers'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audience voting load test")
+    parser.add_argument("--url", default="http://localhost:5000", help="Server base URL")
+    parser.add_argument("--viewers", type=int, default=10000, help="Simulated viewers")
+    parser.add_argument("--ramp", type=int, default=500, help="Connections opened per batch")
+    parser.add_argument("--duplicate-rate", type=float, default=0.05, help="Fraction of viewers voting twice")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if not SOCKETIO_CLIENT_AVAILABLE:
+        print("python-socketio client not installed. Run: pip install 'python-socketio[asyncio_client]'")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("👥 AUDIENCE LOAD TEST")
+    print("=" * 60)
+    print(f"\n   {args.viewers:,} viewers against {args.url}:")
+
+    result = asyncio.run(run(args.url, args.viewers, args.ramp, args.duplicate_rate, args.seed))
+
+    total_votes = sum(result['votes'].values())
+    print(f"      connected          {result['connected']:>10,} ({result['failures']:,} failed)")
+    print(f"      connect rate       {result['connect_rate']:>10,.0f} viewers/sec")
+    print(f"      vote rate          {result['vote_rate']:>10,.0f} votes/sec")
+    print(f"      votes counted      {total_votes:>10,} (creator {result['votes']['creator']:,} / "
+          f"opponent {result['votes']['opponent']:,})")
+    print(f"      duplicates         {result['duplicates']:>10,} sent, {result['rejected']:,} rejected")
+    print(f"      updates / viewer   {result['updates_per_viewer']:>10,.1f}")
+    print(f"      viewers during     {result['viewers_during']:>10,}")
+    print(f"      viewers after      {result['viewers_after']:>10,}")
+
+    ok = total_votes == result['connected'] and result['viewers_after'] == 0
+    print(f"\n   {'✅ Counts consistent' if ok else '❌ Counts inconsistent'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
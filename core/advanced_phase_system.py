@@ -59,25 +59,28 @@ class PhaseCondition:
     time_window: int = 40  # 40 seconds window (120s-160s)
 
     @staticmethod
-    def generate_random_threshold() -> int:
+    def generate_random_threshold(rng=random) -> int:
         """
         Generate random point threshold for Boost #2.
         Range: 2 to 80,000+ coins with weighted distribution.
+
+        Args:
+            rng: Random source (default: global random module)
         """
-        roll = random.random()
+        roll = rng.random()
 
         if roll < 0.15:  # 15% - Very easy (2-50)
-            return random.randint(2, 50)
+            return rng.randint(2, 50)
         elif roll < 0.35:  # 20% - Easy (50-500)
-            return random.randint(50, 500)
+            return rng.randint(50, 500)
         elif roll < 0.60:  # 25% - Medium (500-5,000)
-            return random.randint(500, 5000)
+            return rng.randint(500, 5000)
         elif roll < 0.80:  # 20% - Hard (5,000-20,000)
-            return random.randint(5000, 20000)
+            return rng.randint(5000, 20000)
         elif roll < 0.95:  # 15% - Very hard (20,000-50,000)
-            return random.randint(20000, 50000)
+            return rng.randint(20000, 50000)
         else:  # 5% - Extreme (50,000-100,000)
-            return random.randint(50000, 100000)
+            return rng.randint(50000, 100000)
 
 
 class AdvancedPhaseManager:
@@ -93,8 +96,9 @@ class AdvancedPhaseManager:
     - Fog can hide glove activation in final seconds
     """
 
-    def __init__(self, battle_duration: int = 300, enigma_mode: bool = True):
+    def __init__(self, battle_duration: int = 300, enigma_mode: bool = True, rng=None):
         self.battle_duration = battle_duration
+        self.rng = rng or random  # Per-battle random source (default: global RNG)
         self.enigma_mode = enigma_mode  # Hide Boost #2 details for suspense!
         self.current_phase: Optional[PhaseDefinition] = None
         self.phases_history: List[PhaseDefinition] = []
@@ -109,9 +113,9 @@ class AdvancedPhaseManager:
         self.boost1_end_time = None
 
         # Decide randomly if Boost #1 will happen (70% chance)
-        if random.random() < 0.70:
-            self.boost1_trigger_time = random.randint(self.boost1_window_start, self.boost1_window_end)
-            self.boost1_multiplier = random.choice([2.0, 3.0])
+        if self.rng.random() < 0.70:
+            self.boost1_trigger_time = self.rng.randint(self.boost1_window_start, self.boost1_window_end)
+            self.boost1_multiplier = self.rng.choice([2.0, 3.0])
             print(f"\n🎲 Boost #1 scheduled at {self.boost1_trigger_time}s (x{int(self.boost1_multiplier)})")
         else:
             print(f"\n🎲 Boost #1 will NOT trigger this battle")
@@ -134,10 +138,10 @@ class AdvancedPhaseManager:
         self.boost2_opponent_qualified = False
 
         # Decide randomly if Boost #2 will happen (60% chance)
-        if random.random() < 0.60:
-            self.boost2_trigger_time = random.randint(self.boost2_window_start, self.boost2_window_end)
-            self.boost2_multiplier = random.choice([2.0, 3.0])
-            self.boost2_threshold = PhaseCondition.generate_random_threshold()
+        if self.rng.random() < 0.60:
+            self.boost2_trigger_time = self.rng.randint(self.boost2_window_start, self.boost2_window_end)
+            self.boost2_multiplier = self.rng.choice([2.0, 3.0])
+            self.boost2_threshold = PhaseCondition.generate_random_threshold(self.rng)
             if self.enigma_mode:
                 # ENIGMA MODE: Hide details, create mystery!
                 print(f"🔮 Boost #2: ??? (Enigma Mode - details hidden)")
@@ -479,7 +483,7 @@ class AdvancedPhaseManager:
         # Random activation (40% chance if conditions met)
         x5_activated = False
         if can_trigger_x5:
-            x5_activated = random.random() < 0.40
+            x5_activated = self.rng.random() < 0.40
 
         # Calculate the stacked multiplier (additive)
         base_multiplier = 1.0
@@ -529,8 +533,6 @@ class AdvancedPhaseManager:
         if power_up_type == PowerUpType.GLOVE:
             # Glove power-up: PROBABILISTIC x5 activation with BONUS MODIFIERS
             # Agent must learn which conditions stack for best activation chance
-            import random
-
             in_boost = self.boost1_active or self.boost2_active
             in_final_30s = current_time >= self.battle_duration - 30
             in_final_5s = current_time >= self.battle_duration - 5
@@ -614,7 +616,7 @@ class AdvancedPhaseManager:
             self.last_glove_final_chance = activation_chance
 
             # Roll the dice!
-            x5_activated = random.random() < activation_chance
+            x5_activated = self.rng.random() < activation_chance
 
             # Track stats by condition
             if in_boost:
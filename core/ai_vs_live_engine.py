@@ -20,7 +20,7 @@ Usage:
 
 import asyncio
 import time
-from typing import Optional, Dict, List, Callable, Any, Tuple
+from typing import Optional, Dict, List, Callable, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -34,6 +34,7 @@ from core.tiktok_live_connector import (
     TIKTOK_LIVE_AVAILABLE
 )
 from core.tiktok_gifts_catalog import TIKTOK_GIFTS_CATALOG
+from core.sliding_window import SlidingWindow
 from core.tiktok_battle_config import (
     TIKTOK_BATTLE_CONFIG,
     TOURNAMENT_CONFIG,
@@ -106,7 +107,7 @@ class LiveBurstDetector:
         self.burst_threshold = burst_threshold
         self.window_seconds = window_seconds
         self.critical_threshold = critical_threshold
-        self.gift_history: List[Tuple[float, str, int]] = []  # (timestamp, user, points)
+        self.window = SlidingWindow(window_seconds)  # Gifts keyed by user, valued in points
         self._active_burst: Optional[BurstEvent] = None
         self._last_burst_time: float = 0
         self._burst_cooldown: float = 5.0  # Seconds between bursts
@@ -120,11 +121,10 @@ class LiveBurstDetector:
         if timestamp is None:
             timestamp = time.time()
 
-        self.gift_history.append((timestamp, username, points))
+        self.window.add(timestamp, points, key=username)
 
-        # Clean old history
-        cutoff = timestamp - self.window_seconds
-        self.gift_history = [(t, u, p) for t, u, p in self.gift_history if t >= cutoff]
+        # Drop gifts older than the window
+        self.window.evict(timestamp)
 
         # Check if on cooldown from recent burst
         if timestamp - self._last_burst_time < self._burst_cooldown:
@@ -144,24 +144,18 @@ class LiveBurstDetector:
 
     def _detect_burst(self, current_time: float) -> Optional[BurstEvent]:
         """Detect if recent gifts constitute a burst."""
-        if len(self.gift_history) < 2:
+        if self.window.count < 2:
             return None
 
-        # Calculate total points in window
-        total_points = sum(p for _, _, p in self.gift_history)
+        # Total points in window (kept incrementally)
+        total_points = self.window.total
 
         if total_points < self.burst_threshold:
             return None
 
         # Find the user with most points
-        user_points: Dict[str, int] = {}
-        user_gifts: Dict[str, int] = {}
-        for _, user, pts in self.gift_history:
-            user_points[user] = user_points.get(user, 0) + pts
-            user_gifts[user] = user_gifts.get(user, 0) + 1
-
+        user_points = self.window.key_totals
         top_user = max(user_points.keys(), key=lambda u: user_points[u])
-        top_points = user_points[top_user]
 
         # Determine threat level
         if total_points >= self.critical_threshold * 2:
@@ -176,12 +170,11 @@ class LiveBurstDetector:
             return None
 
         # Calculate duration
-        timestamps = [t for t, _, _ in self.gift_history]
-        duration = max(timestamps) - min(timestamps) if len(timestamps) > 1 else 1.0
+        duration = self.window.newest - self.window.oldest
 
         return BurstEvent(
             username=top_user,
-            gift_count=len(self.gift_history),
+            gift_count=self.window.count,
             total_points=total_points,
             duration_seconds=max(duration, 0.1),
             threat_level=threat_level,
@@ -190,7 +183,7 @@ class LiveBurstDetector:
 
     def get_user_velocity(self, username: str) -> float:
         """Get current gift velocity (points per second) for a user."""
-        user_gifts = [(t, p) for t, u, p in self.gift_history if u == username]
+        user_gifts = [(t, p) for t, p, u, _ in self.window.entries() if u == username]
         if len(user_gifts) < 2:
             return 0.0
 
@@ -202,7 +195,7 @@ class LiveBurstDetector:
 
     def reset(self):
         """Reset detector for new round."""
-        self.gift_history.clear()
+        self.window.clear()
         self._active_burst = None
         self._last_burst_time = 0
 
@@ -235,7 +228,8 @@ class LiveFestDetector:
     ):
         self.detection_threshold = detection_threshold
         self.min_gifts_for_detection = min_gifts_for_detection
-        self.gift_history: List[Tuple[str, bool]] = []  # (gift_name, is_fest_gift)
+        # Cumulative counters (no expiry); fest gifts are keyed by name
+        self.window = SlidingWindow(duration=None)
         self._status = LiveFestStatus()
 
     def record_gift(self, gift_name: str) -> LiveFestStatus:
@@ -246,7 +240,7 @@ class LiveFestDetector:
         """
         # Check if this is a Live Fest gift
         is_fest = self._is_live_fest_gift(gift_name)
-        self.gift_history.append((gift_name, is_fest))
+        self.window.add(time.time(), key=gift_name if is_fest else None, flagged=is_fest)
 
         # Update status
         self._update_status()
@@ -260,8 +254,8 @@ class LiveFestDetector:
 
     def _update_status(self):
         """Update detection status based on gift history."""
-        total = len(self.gift_history)
-        fest_count = sum(1 for _, is_fest in self.gift_history if is_fest)
+        total = self.window.count
+        fest_count = self.window.flagged_count
 
         self._status.total_gifts_count = total
         self._status.fest_gifts_count = fest_count
@@ -283,9 +277,7 @@ class LiveFestDetector:
             if self._status.is_active and not was_active:
                 self._status.detection_time = time.time()
                 # Collect unique fest gift names
-                self._status.detected_fest_gifts = list(set(
-                    name for name, is_fest in self.gift_history if is_fest
-                ))
+                self._status.detected_fest_gifts = list(self.window.key_counts)
                 logger.info(f"🎪 LIVE FEST DETECTED! Ratio: {ratio:.1%}, "
                            f"Gifts: {self._status.detected_fest_gifts}")
 
@@ -295,7 +287,7 @@ class LiveFestDetector:
 
     def reset(self):
         """Reset detector for new round."""
-        self.gift_history.clear()
+        self.window.clear()
         self._status = LiveFestStatus()
 
 
@@ -0,0 +1,246 @@
+"""
+Analytics Store - columnar in-memory storage for battle timelines.
+
+BattleAnalytics records one row per action and per score tick. Instead of
+a dataclass instance per row (plus per-agent copies), rows are appended
+to typed `array` columns and repeated values (agents, gifts, action
+types, multipliers, phases) are interned to small integer codes:
+
+    ActionColumns: time i32 | agent i16 | action_type i16 | gift i16 (-1 = none)
+                   points i32 | cost i32 | multiplier i16 | coordinated i8 | phase i8
+    ScoreColumns:  time i32 | creator i64 | opponent i64 | phase i32
+
+That is 22 bytes per action instead of a few hundred. Per-action points
+and costs fit in 32 bits (the largest gift at x5 is ~225k); running score
+totals stay 64-bit. Reports work on
+whole columns with the NumPy group-by helpers below. Both stores are also read-only
+Sequences that materialize a row object on access, so existing code that
+iterates `analytics.action_timeline` keeps working.
+"""
+
+from array import array
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+class Interner:
+    """Bidirectional value <-> small int code table (names, multipliers)."""
+
+    __slots__ = ("codes", "names")
+
+    def __init__(self):
+        self.codes: Dict[Any, int] = {}
+        self.names: List[Any] = []
+
+    def intern(self, name: Any) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+# =============================================================================
+# GROUP-BY HELPERS
+# =============================================================================
+
+def to_array(column: array, dtype: str):
+    """Copy a column into a NumPy array (no buffer export left on the column)."""
+    return np.frombuffer(column, dtype=dtype).copy() if len(column) else np.zeros(0, dtype=dtype)
+
+
+def group_count(keys, size: int) -> List[int]:
+    return np.bincount(keys, minlength=size).tolist()
+
+
+def group_sum(keys, values, size: int) -> List[float]:
+    return np.bincount(keys, weights=values, minlength=size).tolist()
+
+
+def group_min_max(keys, values, size: int):
+    """Per-group (mins, maxs); empty groups are 0."""
+    mins = np.zeros(size, dtype=np.asarray(values).dtype)
+    maxs = mins.copy()
+    if len(keys):
+        # Sort into contiguous groups and reduce each run (ufunc.at is far slower)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        sorted_values = values[order]
+        mins[sorted_keys[starts]] = np.minimum.reduceat(sorted_values, starts)
+        maxs[sorted_keys[starts]] = np.maximum.reduceat(sorted_values, starts)
+    return mins.tolist(), maxs.tolist()
+
+
+def group_first_argmax(keys, values, rows, size: int) -> List[int]:
+    """Per group, the row of the first maximum value (-1 for empty groups)."""
+    best = np.full(size, -1, dtype=np.int64)
+    if len(keys):
+        order = np.lexsort((rows, -values, keys))
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        best[sorted_keys[starts]] = rows[order[starts]]
+    return best.tolist()
+
+
+# =============================================================================
+# STORES
+# =============================================================================
+
+def _append_row(columns, row):
+    """Append one value per column; on failure truncate back so columns stay aligned."""
+    size = len(columns[0])
+    try:
+        for column, value in zip(columns, row):
+            column.append(value)
+    except OverflowError:
+        for column in columns:
+            del column[size:]
+        raise
+
+
+class ActionColumns(Sequence):
+    """Append-only columnar action log."""
+
+    def __init__(self, row_factory: Callable[..., Any]):
+        """
+        Args:
+            row_factory: Builds a row object from (time, agent, action_type,
+                gift_name, points, multiplier, coordinated, metadata)
+        """
+        self._row_factory = row_factory
+        self.agents = Interner()
+        self.gifts = Interner()
+        self.action_types = Interner()
+        self.multipliers = Interner()
+
+        self.time = array("i")
+        self.agent = array("h")
+        self.action_type = array("h")
+        self.gift = array("h")
+        self.points = array("i")
+        self.cost = array("i")
+        self.multiplier = array("h")
+        self.coordinated = array("b")
+        self.phase = array("b")
+        self.metadata: Dict[int, Dict[str, Any]] = {}  # sparse: only rows that have any
+        self._columns = (self.time, self.agent, self.action_type, self.gift, self.points,
+                         self.cost, self.multiplier, self.coordinated, self.phase)
+
+    def append(self, time: int, agent: str, action_type: str, gift_name: Optional[str],
+               points: int, multiplier: float, coordinated: bool, cost: int, phase: int,
+               metadata: Optional[Dict[str, Any]] = None):
+        """
+        Append one action row. Numeric fields are truncated to int.
+
+        Raises:
+            TypeError, ValueError: A field is not numeric
+            OverflowError: A field does not fit its column (nothing is appended)
+        """
+        row = (
+            int(time), self.agents.intern(agent), self.action_types.intern(action_type),
+            -1 if gift_name is None else self.gifts.intern(gift_name),
+            int(points), int(cost), self.multipliers.intern(float(multiplier)),
+            bool(coordinated), int(phase),
+        )
+        _append_row(self._columns, row)
+        if metadata:
+            self.metadata[len(self.time) - 1] = metadata
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("action index out of range")
+        gift = self.gift[index]
+        return self._row_factory(
+            self.time[index], self.agents.names[self.agent[index]],
+            self.action_types.names[self.action_type[index]],
+            None if gift < 0 else self.gifts.names[gift],
+            self.points[index], self.multiplier_at(index), bool(self.coordinated[index]),
+            dict(self.metadata.get(index, {}))
+        )
+
+    def multiplier_at(self, index: int) -> float:
+        return self.multipliers.names[self.multiplier[index]]
+
+    def columns(self) -> Dict[str, Any]:
+        """
+        Every column as a NumPy array.
+
+        Code columns are widened to int64 so composite keys can't overflow;
+        "multiplier" is decoded to float values.
+        """
+        raw = {
+            "time": (self.time, "i4"), "agent": (self.agent, "i2"),
+            "action_type": (self.action_type, "i2"), "gift": (self.gift, "i2"),
+            "points": (self.points, "i4"), "cost": (self.cost, "i4"),
+            "coordinated": (self.coordinated, "i1"), "phase": (self.phase, "i1"),
+        }
+        multipliers = self.multipliers.names
+        columns = {name: to_array(column, dtype).astype(np.int64)
+                   for name, (column, dtype) in raw.items()}
+        columns["multiplier"] = np.asarray(multipliers, dtype=np.float64)[
+            to_array(self.multiplier, "i2")] if multipliers else np.zeros(0)
+        return columns
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.itemsize * len(c) for c in self._columns)
+
+
+class ScoreColumns(Sequence):
+    """Append-only columnar score timeline."""
+
+    def __init__(self, row_factory: Callable[..., Any]):
+        """
+        Args:
+            row_factory: Builds a row object from (time, creator_score,
+                opponent_score, score_diff, leader, phase)
+        """
+        self._row_factory = row_factory
+        self.phases = Interner()
+        self.time = array("i")
+        self.creator = array("q")
+        self.opponent = array("q")
+        self.phase = array("i")
+        self._columns = (self.time, self.creator, self.opponent, self.phase)
+
+    def append(self, time: int, creator_score: int, opponent_score: int, phase: str):
+        """Append one score tick (same coercion and errors as ActionColumns.append)."""
+        _append_row(self._columns, (int(time), int(creator_score), int(opponent_score),
+                                    self.phases.intern(phase)))
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("score index out of range")
+        creator, opponent = self.creator[index], self.opponent[index]
+        leader = "creator" if creator > opponent else "opponent" if opponent > creator else "tie"
+        return self._row_factory(self.time[index], creator, opponent, creator - opponent,
+                                 leader, self.phases.names[self.phase[index]])
+
+    def columns(self) -> Dict[str, Any]:
+        raw = {"time": (self.time, "i4"), "creator": (self.creator, "i8"),
+               "opponent": (self.opponent, "i8"), "phase": (self.phase, "i4")}
+        return {name: to_array(column, dtype) for name, (column, dtype) in raw.items()}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.itemsize * len(c) for c in self._columns)
@@ -19,6 +19,13 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
+from .analytics_store import (
+    ActionColumns, ScoreColumns,
+    group_count, group_first_argmax, group_min_max, group_sum, to_array,
+)
+
 
 @dataclass
 class ActionEvent:
@@ -86,33 +93,35 @@ class TacticEvent:
     success: bool = False
 
 
+PHASES = ("early", "mid", "late", "final")
+PHASE_INDEX = {name: i for i, name in enumerate(PHASES)}
+
+
 class BattleAnalytics:
     """
     Comprehensive analytics system for battle analysis.
 
     Collects data during battle and provides post-battle insights.
+
+    Actions and score snapshots live in columnar stores (see
+    core.analytics_store); per-agent, per-gift and per-phase statistics
+    are computed from whole columns when a report asks for them, and
+    cached until the next action is recorded.
     """
 
     def __init__(self, battle_duration: int = 180):
-        # Timeline data
-        self.score_timeline: List[ScoreSnapshot] = []
-        self.action_timeline: List[ActionEvent] = []
+        # Timeline data (columnar; iterate for ScoreSnapshot / ActionEvent rows)
+        self._scores = ScoreColumns(ScoreSnapshot)
+        self._actions = ActionColumns(ActionEvent)
         self.multiplier_sessions: List[MultiplierSession] = []
 
-        # Agent performance
-        self.agent_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+        # Per-agent data that isn't derived from actions
+        self._agent_info: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
             "emoji": "",
-            "total_donated": 0,
-            "total_cost": 0,
-            "actions": [],
-            "gifts_sent": 0,
-            "avg_gift_value": 0,
-            "best_gift": {"name": "", "value": 0},
-            "timing": {"early": 0, "mid": 0, "late": 0, "final": 0},
-            "gifts_by_type": defaultdict(int),
             "combos_participated": 0,
             "tactics_used": defaultdict(int)
         })
+        self._aggregate_cache: Optional[Tuple[int, Dict[str, Any]]] = None
 
         # Coordination tracking
         self.coordination_events: List[Dict[str, Any]] = []
@@ -126,13 +135,6 @@ class BattleAnalytics:
         self.winner: Optional[str] = None
         self.final_scores: Dict[str, int] = {}
 
-        # Gift analytics
-        self.gift_distribution: Dict[str, int] = defaultdict(int)
-        self.gift_timing: Dict[str, List[int]] = defaultdict(list)
-        self.gift_roi: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-            "count": 0, "total_points": 0, "total_cost": 0
-        })
-
         # NEW: Combo tracking
         self.combo_events: List[ComboEvent] = []
 
@@ -142,14 +144,12 @@ class BattleAnalytics:
         # NEW: Tactic tracking
         self.tactic_events: List[TacticEvent] = []
 
-        # NEW: Phase performance
-        self.phase_stats: Dict[str, Dict[str, Any]] = {
-            "early": {"gifts": 0, "points": 0, "cost": 0, "start": 0, "end": 60},
-            "mid": {"gifts": 0, "points": 0, "cost": 0, "start": 60, "end": 120},
-            "late": {"gifts": 0, "points": 0, "cost": 0, "start": 120, "end": 150},
-            "final": {"gifts": 0, "points": 0, "cost": 0, "start": 150, "end": battle_duration},
-            "boost": {"gifts": 0, "points": 0, "cost": 0, "duration": 0},
-            "x5": {"gifts": 0, "points": 0, "cost": 0, "duration": 0}
+        # NEW: Phase performance windows (totals come from the action columns)
+        self._phase_windows: Dict[str, Tuple[int, int]] = {
+            "early": (0, 60),
+            "mid": (60, 120),
+            "late": (120, 150),
+            "final": (150, battle_duration)
         }
 
         # NEW: Momentum tracking
@@ -161,6 +161,16 @@ class BattleAnalytics:
         # NEW: Timestamp
         self.start_timestamp = datetime.now()
 
+    @property
+    def score_timeline(self) -> ScoreColumns:
+        """Score snapshots (a Sequence of ScoreSnapshot)."""
+        return self._scores
+
+    @property
+    def action_timeline(self) -> ActionColumns:
+        """Recorded actions (a Sequence of ActionEvent)."""
+        return self._actions
+
     def record_battle_start(self, duration: int, agent_count: int):
         """Record battle initialization."""
         self.battle_start_time = 0
@@ -172,15 +182,7 @@ class BattleAnalytics:
         score_diff = creator_score - opponent_score  # Positive = creator winning
         leader = "creator" if creator_score > opponent_score else "opponent" if opponent_score > creator_score else "tie"
 
-        snapshot = ScoreSnapshot(
-            time=time,
-            creator_score=creator_score,
-            opponent_score=opponent_score,
-            score_diff=score_diff,
-            leader=leader,
-            phase=phase
-        )
-        self.score_timeline.append(snapshot)
+        self._scores.append(time, creator_score, opponent_score, phase)
 
         # Track momentum
         if score_diff > self.largest_lead:
@@ -196,71 +198,19 @@ class BattleAnalytics:
 
     def register_agent(self, agent_name: str, emoji: str = ""):
         """Register an agent for tracking."""
-        if agent_name not in self.agent_stats:
-            self.agent_stats[agent_name]  # Creates default
-        self.agent_stats[agent_name]["emoji"] = emoji
+        self._agent_info[agent_name]["emoji"] = emoji
 
     def record_action(self, time: int, agent: str, action_type: str,
                      gift_name: Optional[str] = None, points: int = 0,
                      multiplier: float = 1.0, coordinated: bool = False,
                      cost: int = 0, **metadata):
         """Record an agent action."""
-        action = ActionEvent(
-            time=time,
-            agent=agent,
-            action_type=action_type,
-            gift_name=gift_name,
-            points=points,
-            multiplier=multiplier,
-            coordinated=coordinated,
-            metadata=metadata
-        )
-        self.action_timeline.append(action)
-
-        # Update agent stats
-        if points > 0:
-            self.agent_stats[agent]["total_donated"] += points
-            self.agent_stats[agent]["total_cost"] += cost
-            self.agent_stats[agent]["gifts_sent"] += 1
-            self.agent_stats[agent]["actions"].append(action)
-
-            # Track best gift
-            if points > self.agent_stats[agent]["best_gift"]["value"]:
-                self.agent_stats[agent]["best_gift"] = {
-                    "name": gift_name or "Unknown",
-                    "value": points
-                }
+        self._actions.append(time, agent, action_type, gift_name, points, multiplier,
+                             coordinated, cost, PHASE_INDEX[self._get_phase(time)], metadata)
 
-            # Track timing
-            phase = self._get_phase(time)
-            self.agent_stats[agent]["timing"][phase] += 1
-
-            # Gift distribution
-            if gift_name:
-                self.gift_distribution[gift_name] += 1
-                self.gift_timing[gift_name].append(time)
-                self.agent_stats[agent]["gifts_by_type"][gift_name] += 1
-
-                # Track gift ROI
-                self.gift_roi[gift_name]["count"] += 1
-                self.gift_roi[gift_name]["total_points"] += points
-                self.gift_roi[gift_name]["total_cost"] += cost
-
-            # Update phase stats
-            if phase in self.phase_stats:
-                self.phase_stats[phase]["gifts"] += 1
-                self.phase_stats[phase]["points"] += points
-                self.phase_stats[phase]["cost"] += cost
-
-            # Track boost/x5 separately
-            if multiplier >= 5.0:
-                self.phase_stats["x5"]["gifts"] += 1
-                self.phase_stats["x5"]["points"] += points
-                self.phase_stats["x5"]["cost"] += cost
-            elif multiplier >= 2.0:
-                self.phase_stats["boost"]["gifts"] += 1
-                self.phase_stats["boost"]["points"] += points
-                self.phase_stats["boost"]["cost"] += cost
+        # Agents appear in reports in the order they first scored
+        if points > 0 and agent not in self._agent_info:
+            self._agent_info[agent]
 
     def record_combo(self, time: int, combo_type: str, initiator: str,
                     participants: List[str] = None, total_points: int = 0):
@@ -275,15 +225,15 @@ class BattleAnalytics:
         self.combo_events.append(combo)
 
         # Update agent combo participation
-        self.agent_stats[initiator]["combos_participated"] += 1
+        self._agent_info[initiator]["combos_participated"] += 1
         for p in (participants or []):
-            self.agent_stats[p]["combos_participated"] += 1
+            self._agent_info[p]["combos_participated"] += 1
 
     def record_tactic(self, time: int, agent: str, tactic: str, success: bool = False):
         """Record a psychological warfare tactic."""
         event = TacticEvent(time=time, agent=agent, tactic=tactic, success=success)
         self.tactic_events.append(event)
-        self.agent_stats[agent]["tactics_used"][tactic] += 1
+        self._agent_info[agent]["tactics_used"][tactic] += 1
 
     def record_clutch_moment(self, time: int, moment_type: str,
                             score_before: int = 0, score_after: int = 0,
@@ -335,11 +285,6 @@ class BattleAnalytics:
             "opponent": opponent_score
         }
 
-        # Calculate avg gift values
-        for agent, stats in self.agent_stats.items():
-            if stats["gifts_sent"] > 0:
-                stats["avg_gift_value"] = stats["total_donated"] / stats["gifts_sent"]
-
     def _get_phase(self, time: int) -> str:
         """Determine battle phase from time."""
         progress = time / self.battle_duration if self.battle_duration > 0 else 0
@@ -352,32 +297,183 @@ class BattleAnalytics:
         else:
             return "final"
 
+    # =========================================================================
+    # COLUMNAR AGGREGATES
+    # =========================================================================
+
+    def _aggregates(self) -> Dict[str, Any]:
+        """
+        Per-agent, per-gift and per-phase totals over scoring actions.
+
+        One pass of group-by sums over the action columns; cached until the
+        next action is recorded.
+        """
+        store = self._actions
+        if self._aggregate_cache is not None and self._aggregate_cache[0] == len(store):
+            return self._aggregate_cache[1]
+
+        columns = store.columns()
+        rows = np.flatnonzero(columns["points"] > 0)
+        c = {name: column[rows] for name, column in columns.items()}
+        agent_phase = c["agent"] * len(PHASES) + c["phase"]
+        has_gift = np.flatnonzero(c["gift"] >= 0)
+        g = {name: column[has_gift] for name, column in c.items()}
+        g_rows = rows[has_gift]
+        agent_gift = g["agent"] * len(store.gifts) + g["gift"]
+        x5 = c["multiplier"] >= 5.0
+        boost = (c["multiplier"] >= 2.0) & ~x5
+        tiers = {"x5": (int(x5.sum()), int(c["points"][x5].sum()), int(c["cost"][x5].sum())),
+                 "boost": (int(boost.sum()), int(c["points"][boost].sum()), int(c["cost"][boost].sum()))}
+
+        agents, gifts = len(store.agents), len(store.gifts)
+        first_row, _ = group_min_max(g["gift"], g_rows, gifts)
+        time_min, time_max = group_min_max(g["gift"], g["time"], gifts)
+        gift_count = group_count(g["gift"], gifts)
+        agent_gift_first, _ = group_min_max(agent_gift, g_rows, agents * gifts)
+
+        result = {
+            "agent_count": group_count(c["agent"], agents),
+            "agent_points": group_sum(c["agent"], c["points"], agents),
+            "agent_cost": group_sum(c["agent"], c["cost"], agents),
+            "agent_best_row": group_first_argmax(c["agent"], c["points"], rows, agents),
+            "agent_phase_count": group_count(agent_phase, agents * len(PHASES)),
+            "agent_gift_count": group_count(agent_gift, agents * gifts),
+            "agent_gift_first": agent_gift_first,
+            "phase_count": group_count(c["phase"], len(PHASES)),
+            "phase_points": group_sum(c["phase"], c["points"], len(PHASES)),
+            "phase_cost": group_sum(c["phase"], c["cost"], len(PHASES)),
+            "tiers": tiers,
+            # Gifts in order of their first scoring use
+            "gift_order": sorted((code for code in range(gifts) if gift_count[code]),
+                                 key=first_row.__getitem__),
+            "gift_count": gift_count,
+            "gift_points": group_sum(g["gift"], g["points"], gifts),
+            "gift_cost": group_sum(g["gift"], g["cost"], gifts),
+            "gift_time_min": time_min,
+            "gift_time_max": time_max,
+            "gift_time_sum": group_sum(g["gift"], g["time"], gifts),
+        }
+        self._aggregate_cache = (len(store), result)
+        return result
+
+    @property
+    def agent_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-agent statistics (built from the action columns on access)."""
+        agg = self._aggregates()
+        store = self._actions
+        gift_names = store.gifts.names
+        result = {}
+        for name, info in self._agent_info.items():
+            code = store.agents.codes.get(name)
+            if code is None:
+                gifts_sent, total, cost, best, timing, by_type = 0, 0, 0, None, [0] * len(PHASES), {}
+            else:
+                gifts_sent = agg["agent_count"][code]
+                total = int(agg["agent_points"][code])
+                cost = int(agg["agent_cost"][code])
+                best = agg["agent_best_row"][code]
+                timing = agg["agent_phase_count"][code * len(PHASES):(code + 1) * len(PHASES)]
+                base = code * len(gift_names)
+                counts = agg["agent_gift_count"][base:base + len(gift_names)]
+                first = agg["agent_gift_first"][base:base + len(gift_names)]
+                # In order of first use, like the per-agent counters this replaced
+                by_type = {gift_names[i]: counts[i] for i in
+                           sorted((i for i, n in enumerate(counts) if n), key=first.__getitem__)}
+
+            best_gift = {"name": "", "value": 0}
+            if best is not None and best >= 0:
+                gift = store.gift[best]
+                best_gift = {"name": gift_names[gift] if gift >= 0 else "Unknown",
+                             "value": store.points[best]}
+
+            result[name] = {
+                "emoji": info["emoji"],
+                "total_donated": total,
+                "total_cost": cost,
+                "gifts_sent": gifts_sent,
+                "avg_gift_value": total / gifts_sent if gifts_sent else 0,
+                "best_gift": best_gift,
+                "timing": dict(zip(PHASES, timing)),
+                "gifts_by_type": by_type,
+                "combos_participated": info["combos_participated"],
+                "tactics_used": info["tactics_used"]
+            }
+        return result
+
+    @property
+    def gift_roi(self) -> Dict[str, Dict[str, Any]]:
+        agg = self._aggregates()
+        names = self._actions.gifts.names
+        return {
+            names[code]: {"count": agg["gift_count"][code],
+                          "total_points": int(agg["gift_points"][code]),
+                          "total_cost": int(agg["gift_cost"][code])}
+            for code in agg["gift_order"]
+        }
+
+    @property
+    def gift_distribution(self) -> Dict[str, int]:
+        agg = self._aggregates()
+        names = self._actions.gifts.names
+        return {names[code]: agg["gift_count"][code] for code in agg["gift_order"]}
+
+    @property
+    def gift_timing(self) -> Dict[str, List[int]]:
+        """Gift name -> times it was sent (materialized; prefer get_gift_analysis)."""
+        store = self._actions
+        timing: Dict[str, List[int]] = {store.gifts.names[code]: [] for code in self._aggregates()["gift_order"]}
+        for t, gift, points in zip(store.time, store.gift, store.points):
+            if points > 0 and gift >= 0:
+                timing[store.gifts.names[gift]].append(t)
+        return timing
+
+    @property
+    def phase_stats(self) -> Dict[str, Dict[str, Any]]:
+        agg = self._aggregates()
+        stats = {}
+        for i, phase in enumerate(PHASES):
+            start, end = self._phase_windows[phase]
+            stats[phase] = {"gifts": agg["phase_count"][i], "points": int(agg["phase_points"][i]),
+                            "cost": int(agg["phase_cost"][i]), "start": start, "end": end}
+        for tier in ("boost", "x5"):
+            gifts, points, cost = agg["tiers"][tier]
+            stats[tier] = {"gifts": gifts, "points": points, "cost": cost, "duration": 0}
+        return stats
+
+    # =========================================================================
+    # REPORTS
+    # =========================================================================
+
     def get_score_progression(self) -> List[Dict[str, Any]]:
         """Get score progression data for charting."""
+        scores = self._scores
         return [
             {
-                "time": s.time,
-                "creator": s.creator_score,
-                "opponent": s.opponent_score,
-                "diff": s.score_diff,
-                "leader": s.leader
+                "time": t,
+                "creator": c,
+                "opponent": o,
+                "diff": c - o,
+                "leader": "creator" if c > o else "opponent" if o > c else "tie"
             }
-            for s in self.score_timeline
+            for t, c, o in zip(scores.time, scores.creator, scores.opponent)
         ]
 
     def get_action_timeline(self) -> List[Dict[str, Any]]:
         """Get chronological action timeline."""
+        store = self._actions
+        order = sorted(range(len(store)), key=store.time.__getitem__)
+        agents, gifts = store.agents.names, store.gifts.names
         return [
             {
-                "time": a.time,
-                "agent": a.agent,
-                "action": a.action_type,
-                "gift": a.gift_name,
-                "points": a.points,
-                "multiplier": a.multiplier,
-                "coordinated": a.coordinated
+                "time": store.time[i],
+                "agent": agents[store.agent[i]],
+                "action": store.action_types.names[store.action_type[i]],
+                "gift": gifts[store.gift[i]] if store.gift[i] >= 0 else None,
+                "points": store.points[i],
+                "multiplier": store.multiplier_at(i),
+                "coordinated": bool(store.coordinated[i])
             }
-            for a in sorted(self.action_timeline, key=lambda x: x.time)
+            for i in order
         ]
 
     def get_agent_performance(self, include_actions: bool = False) -> Dict[str, Dict[str, Any]]:
@@ -397,7 +493,7 @@ class BattleAnalytics:
                 "timing": stats["timing"]
             }
             if include_actions:
-                result[agent]["actions"] = stats["actions"]
+                result[agent]["actions"] = [a for a in self._actions if a.agent == agent and a.points > 0]
         return result
 
     def get_coordination_summary(self) -> Dict[str, Any]:
@@ -430,18 +526,21 @@ class BattleAnalytics:
 
     def get_gift_analysis(self) -> Dict[str, Any]:
         """Analyze gift usage patterns."""
+        agg = self._aggregates()
+        names = self._actions.gifts.names
+        distribution = self.gift_distribution
         return {
-            "distribution": dict(self.gift_distribution),
+            "distribution": distribution,
             "timing_patterns": {
-                gift: {
-                    "count": len(times),
-                    "first": min(times) if times else 0,
-                    "last": max(times) if times else 0,
-                    "avg_time": sum(times) / len(times) if times else 0
+                names[code]: {
+                    "count": agg["gift_count"][code],
+                    "first": int(agg["gift_time_min"][code]),
+                    "last": int(agg["gift_time_max"][code]),
+                    "avg_time": agg["gift_time_sum"][code] / agg["gift_count"][code]
                 }
-                for gift, times in self.gift_timing.items()
+                for code in agg["gift_order"]
             },
-            "most_used": max(self.gift_distribution.items(), key=lambda x: x[1])[0] if self.gift_distribution else None
+            "most_used": max(distribution.items(), key=lambda x: x[1])[0] if distribution else None
         }
 
     def get_complete_summary(self) -> Dict[str, Any]:
@@ -514,11 +613,12 @@ class BattleAnalytics:
 
     def get_gift_efficiency_report(self) -> Dict[str, Any]:
         """Get detailed gift efficiency analysis with ROI."""
-        total_points = sum(d["total_points"] for d in self.gift_roi.values())
-        total_cost = sum(d["total_cost"] for d in self.gift_roi.values())
+        gift_roi = self.gift_roi
+        total_points = sum(d["total_points"] for d in gift_roi.values())
+        total_cost = sum(d["total_cost"] for d in gift_roi.values())
 
         report = {
-            "total_gifts": sum(d["count"] for d in self.gift_roi.values()),
+            "total_gifts": sum(d["count"] for d in gift_roi.values()),
             "total_points": total_points,
             "total_cost": total_cost,
             "overall_roi": total_points / total_cost if total_cost > 0 else 0,
@@ -528,7 +628,7 @@ class BattleAnalytics:
         }
 
         # Calculate per-gift ROI
-        for gift_name, data in self.gift_roi.items():
+        for gift_name, data in gift_roi.items():
             if data["count"] > 0:
                 roi = data["total_points"] / data["total_cost"] if data["total_cost"] > 0 else 0
                 report["by_gift"][gift_name] = {
@@ -565,15 +665,16 @@ class BattleAnalytics:
 
     def get_phase_performance_report(self) -> Dict[str, Any]:
         """Get phase-by-phase performance breakdown."""
+        phase_stats = self.phase_stats
         report = {
             "phases": {},
             "best_phase": None,
             "worst_phase": None,
             "multiplier_utilization": {
-                "boost_gifts": self.phase_stats["boost"]["gifts"],
-                "boost_points": self.phase_stats["boost"]["points"],
-                "x5_gifts": self.phase_stats["x5"]["gifts"],
-                "x5_points": self.phase_stats["x5"]["points"]
+                "boost_gifts": phase_stats["boost"]["gifts"],
+                "boost_points": phase_stats["boost"]["points"],
+                "x5_gifts": phase_stats["x5"]["gifts"],
+                "x5_points": phase_stats["x5"]["points"]
             }
         }
 
@@ -581,7 +682,7 @@ class BattleAnalytics:
         worst_efficiency = float('inf')
 
         for phase_name in ["early", "mid", "late", "final"]:
-            stats = self.phase_stats[phase_name]
+            stats = phase_stats[phase_name]
             duration = stats["end"] - stats["start"]
             efficiency = stats["points"] / stats["cost"] if stats["cost"] > 0 else 0
             pps = stats["points"] / duration if duration > 0 else 0
@@ -607,7 +708,8 @@ class BattleAnalytics:
 
     def get_agent_contribution_report(self) -> Dict[str, Any]:
         """Get agent contribution breakdown."""
-        total_points = sum(s["total_donated"] for s in self.agent_stats.values())
+        agent_stats = self.agent_stats
+        total_points = sum(s["total_donated"] for s in agent_stats.values())
 
         report = {
             "agents": {},
@@ -620,7 +722,7 @@ class BattleAnalytics:
         max_efficiency = 0
         max_gifts = 0
 
-        for agent_name, stats in self.agent_stats.items():
+        for agent_name, stats in agent_stats.items():
             contrib_pct = (stats["total_donated"] / total_points * 100) if total_points > 0 else 0
             efficiency = stats["total_donated"] / stats["total_cost"] if stats["total_cost"] > 0 else 0
 
@@ -722,13 +824,14 @@ class BattleAnalytics:
         }
 
         # Sample score progression every 30 seconds
-        for snap in self.score_timeline:
-            if snap.time % 30 == 0 or snap.time == self.battle_duration:
+        scores = self._scores
+        for i, t in enumerate(scores.time):
+            if t % 30 == 0 or t == self.battle_duration:
                 report["score_progression"].append({
-                    "time": snap.time,
-                    "creator": snap.creator_score,
-                    "opponent": snap.opponent_score,
-                    "diff": snap.score_diff
+                    "time": t,
+                    "creator": scores.creator[i],
+                    "opponent": scores.opponent[i],
+                    "diff": scores.creator[i] - scores.opponent[i]
                 })
 
         return report
@@ -738,17 +841,20 @@ class BattleAnalytics:
         events = []
 
         # Sample gift events
-        step = max(1, len(self.action_timeline) // 30)
-        for i, action in enumerate(self.action_timeline):
-            if i % step == 0 or action.points >= 500:
-                events.append({
-                    "time": action.time,
-                    "type": "gift",
-                    "agent": action.agent,
-                    "gift": action.gift_name,
-                    "points": action.points,
-                    "multiplier": action.multiplier
-                })
+        store = self._actions
+        step = max(1, len(store) // 30)
+        sampled = np.flatnonzero((np.arange(len(store)) % step == 0)
+                                 | (to_array(store.points, "i4") >= 500)).tolist()
+        for i in sampled:
+            gift = store.gift[i]
+            events.append({
+                "time": store.time[i],
+                "type": "gift",
+                "agent": store.agents.names[store.agent[i]],
+                "gift": store.gifts.names[gift] if gift >= 0 else None,
+                "points": store.points[i],
+                "multiplier": store.multiplier_at(i)
+            })
 
         # Add combo events
         for combo in self.combo_events:
@@ -5,7 +5,10 @@ Coordinates time, scores, agents, and events for a complete battle.
 """
 
 import random
+import sys
+import threading
 import time as time_module
+from contextlib import contextmanager
 from typing import List, Optional
 
 from .event_bus import EventBus, EventType
@@ -27,6 +30,46 @@ except ImportError:
     LEADERBOARD_AVAILABLE = False
 
 
+_quiet = threading.local()
+_quiet_install_lock = threading.Lock()
+
+
+class _ThreadQuietStdout:
+    """
+    sys.stdout proxy that drops writes from threads inside quiet_output().
+
+    Installed once and never swapped back, so concurrent headless battles
+    can't restore each other's stream, and other threads keep printing.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        if getattr(_quiet, "depth", 0):
+            return len(text)
+        return self._stream.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextmanager
+def quiet_output():
+    """Swallow print() output from the calling thread only."""
+    with _quiet_install_lock:
+        if not isinstance(sys.stdout, _ThreadQuietStdout):
+            sys.stdout = _ThreadQuietStdout(sys.stdout)
+    _quiet.depth = getattr(_quiet, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _quiet.depth -= 1
+
+
 class BattleEngine:
     """
     Main battle simulation engine.
@@ -54,7 +97,13 @@ class BattleEngine:
                  event_bus: Optional[EventBus] = None,
                  enable_multipliers: bool = True,
                  time_extensions: int = 0,
-                 enable_analytics: bool = True):
+                 enable_analytics: bool = True,
+                 headless: bool = False,
+                 record_leaderboard: Optional[bool] = None,
+                 phase_manager=None,
+                 opponent=None,
+                 seed: Optional[int] = None,
+                 rng: Optional[random.Random] = None):
         """
         Initialize battle engine.
 
@@ -65,13 +114,44 @@ class BattleEngine:
             enable_multipliers: Enable x2/x3/x5 multiplier system (default True)
             time_extensions: Number of +20s extensions available (default 0)
             enable_analytics: Enable comprehensive battle analytics (default True)
+            headless: Run on a pure virtual clock - no sleeping between ticks,
+                      no console output, events stamped with battle time (default False)
+            record_leaderboard: Persist agent stats to the leaderboard at battle end
+                                (default: enabled unless headless)
+            phase_manager: Optional AdvancedPhaseManager, updated every tick; when set it
+                           scores creator gifts as well as opponent gifts
+            opponent: Optional OpponentAI driving opponent gifts instead of the scripted
+                      spikes (uses its own phase manager if none is given)
+            seed: Seed for a private per-battle random source shared by every component
+            rng: Explicit per-battle random.Random (overrides seed)
         """
-        self.event_bus = event_bus or EventBus()
+        # Per-battle random source; unseeded engines keep using the global RNG
+        self.seed = seed
+        self._seeded = rng is not None or seed is not None
+        if rng is not None:
+            self.rng = rng
+        elif seed is not None:
+            self.rng = random.Random(seed)
+        else:
+            self.rng = random
+
+        self.headless = headless
+        self.record_leaderboard = (not headless) if record_leaderboard is None else record_leaderboard
+        self.event_bus = event_bus or EventBus(
+            clock=self._virtual_clock if headless else time_module.time
+        )
         self.time_manager = TimeManager(battle_duration)
         self.score_tracker = ScoreTracker()
         self.analytics = BattleAnalytics() if enable_analytics else None
-        self.multiplier_manager = MultiplierManager(battle_duration, analytics=self.analytics) if enable_multipliers else None
+        self.multiplier_manager = MultiplierManager(battle_duration, analytics=self.analytics, rng=self.rng) if enable_multipliers else None
         self.time_extension_manager = TimeExtensionManager(time_extensions) if time_extensions > 0 else None
+        self.opponent = opponent
+        self.phase_manager = phase_manager or getattr(opponent, 'phase_manager', None)
+        if self._seeded:
+            if self.opponent:
+                self.opponent.set_rng(self.rng)
+            if self.phase_manager:
+                self.phase_manager.rng = self.rng
 
         self.agents = []
         self.tick_speed = tick_speed
@@ -86,7 +166,7 @@ class BattleEngine:
         self._agent_stats = {}  # agent_name -> {points, gifts, spent}
 
         # Subscribe to our own events for internal logic
-        self.event_bus.subscribe(EventType.GIFT_SENT, self._handle_gift)
+        self.event_bus.subscribe(EventType.GIFT_SENT, self._handle_gift, inline=True)
 
     def add_agent(self, agent):
         """
@@ -101,6 +181,10 @@ class BattleEngine:
         if hasattr(agent, 'event_bus'):
             agent.event_bus = self.event_bus
 
+        # Share the per-battle random source
+        if self._seeded and hasattr(agent, 'set_rng'):
+            agent.set_rng(self.rng)
+
         self.event_bus.publish(
             EventType.AGENT_JOINED,
             {"agent_name": agent.name},
@@ -114,16 +198,30 @@ class BattleEngine:
         Args:
             silent: If True, suppress console output
         """
+        if self.headless:
+            # Agents and the multiplier system print directly; swallow it for this thread
+            with quiet_output():
+                self._run_loop(silent=True)
+        else:
+            self._run_loop(silent)
+
+    def _run_loop(self, silent: bool):
+        """Start, tick until the battle is over, then end the battle."""
         self._is_running = True
         self._start_battle(silent)
 
         # Main battle loop
         while not self.time_manager.is_battle_over() and self._is_running:
             self._tick(silent)
-            time_module.sleep(self.tick_speed)
+            if not self.headless:
+                time_module.sleep(self.tick_speed)
 
         self._end_battle(silent)
 
+    def _virtual_clock(self) -> float:
+        """Battle time used to stamp events in headless mode."""
+        return float(self.time_manager.current_time)
+
     def _start_battle(self, silent: bool):
         """Initialize and announce battle start."""
         self.time_manager.reset()
@@ -176,14 +274,14 @@ class BattleEngine:
         if self.multiplier_manager:
             self.multiplier_manager.update(current_time)
 
+        # Update boost/glove phases
+        if self.phase_manager:
+            self.phase_manager.update(current_time)
+
         # Publish tick event
-        self.event_bus.publish(
+        self.event_bus.publish_fields(
             EventType.BATTLE_TICK,
-            {
-                "time": current_time,
-                "phase": self.time_manager.get_phase().name,
-                "time_remaining": self.time_manager.time_remaining()
-            },
+            (current_time, self.time_manager.get_phase().name, self.time_manager.time_remaining()),
             timestamp=current_time
         )
 
@@ -228,7 +326,13 @@ class BattleEngine:
         Scales based on battle duration:
         - 60s: Spikes at [15, 30, 45, 55]
         - 180s: Spikes at [45, 90, 135, 165]
+
+        When an OpponentAI is attached, it decides instead.
         """
+        if self.opponent:
+            self._simulate_opponent_ai(current_time)
+            return
+
         duration = self.time_manager.battle_duration
 
         # Scale spike times based on duration
@@ -242,16 +346,16 @@ class BattleEngine:
             drip_amount = (50, 150)
 
         # Major spikes at strategic times (70% chance)
-        if current_time in spike_times and random.random() > 0.3:
+        if current_time in spike_times and self.rng.random() > 0.3:
             # Spike size increases over time (proportional to duration)
             progress = current_time / duration
 
             if progress <= 0.33:  # Early
-                spike = random.randint(400, 800)
+                spike = self.rng.randint(400, 800)
             elif progress <= 0.67:  # Mid
-                spike = random.randint(600, 1200)
+                spike = self.rng.randint(600, 1200)
             else:  # Late
-                spike = random.randint(800, 1600)
+                spike = self.rng.randint(800, 1600)
 
             # Scale spike for longer battles
             if duration >= 180:
@@ -274,9 +378,33 @@ class BattleEngine:
 
         # Gradual drip: small amounts periodically (simulates steady supporters)
         if current_time % drip_interval == 0 and current_time > 0:
-            drip = random.randint(*drip_amount)
+            drip = self.rng.randint(*drip_amount)
             self.score_tracker.add_opponent_points(drip, current_time)
 
+    def _simulate_opponent_ai(self, current_time: int):
+        """Let the attached OpponentAI act and apply its gift with the phase multiplier."""
+        creator_score, opponent_score = self.score_tracker.get_scores()
+        result = self.opponent.update(current_time, creator_score, opponent_score)
+
+        if not result["gift_sent"]:
+            return
+
+        multiplier = self.phase_manager.get_current_multiplier() if self.phase_manager else 1.0
+        points = int(result["gift_points"] * multiplier)
+        self.score_tracker.add_opponent_points(points, current_time)
+
+        self.event_bus.publish(
+            EventType.SCORE_CHANGED,
+            {
+                "side": "opponent",
+                "points": points,
+                "reason": "gift",
+                "gift": result["gift_name"]
+            },
+            source="opponent",
+            timestamp=current_time
+        )
+
     def _handle_gift(self, event):
         """Handle GIFT_SENT events by updating score."""
         base_points = event.data.get("points", 0)
@@ -293,7 +421,11 @@ class BattleEngine:
 
         # Apply multiplier if system is active
         final_multiplier = 1.0
-        if self.multiplier_manager:
+        if self.phase_manager:
+            # Same multiplier source as opponent gifts (boosts and glove x5 count for both sides)
+            final_multiplier = self.phase_manager.record_gift(gift_name, base_points, "creator", current_time)
+            final_points = int(base_points * final_multiplier)
+        elif self.multiplier_manager:
             # Record gift for threshold tracking
             self.multiplier_manager.record_gift(current_time, gift_name, base_points)
 
@@ -477,16 +609,18 @@ class BattleEngine:
                 "creator_score": creator,
                 "opponent_score": opponent,
                 "score_diff": self.score_tracker.get_score_diff(),
-                "total_events": len(self.event_bus.get_history())
+                "total_events": self.event_bus.published_count
             }
         )
+        # Let queued subscribers catch up before results are read
+        self.event_bus.flush()
 
         # Print analytics summary
         if self.analytics and not silent:
             self.analytics.print_summary()
 
         # Update leaderboard with agent stats
-        if LEADERBOARD_AVAILABLE and self._agent_stats:
+        if LEADERBOARD_AVAILABLE and self.record_leaderboard and self._agent_stats:
             try:
                 creator_won = winner == "creator"
                 for agent_name, stats in self._agent_stats.items():
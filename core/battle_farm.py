@@ -0,0 +1,336 @@
+"""
+Battle Farm - Parallel Monte Carlo battles across a process pool.
+
+Fans seeded headless BattleEngine battles out to worker processes and
+streams their analytics summaries back, then merges them into aggregate
+win-rate and score-distribution statistics.
+
+Every battle is fully described by a picklable BattleSpec (team, opponent,
+seed), so runs can be reproduced and sharded across machines.
+
+Example:
+    specs = make_battle_specs(1000, base_seed=42, opponent=builder.to_dict())
+    farm = BattleFarm(max_workers=8)
+    report = farm.run(specs)
+    print(report["win_rate"]["creator"])
+"""
+
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .battle_engine import BattleEngine, quiet_output
+
+
+# Default persona team (same lineup as demo_battle.py)
+DEFAULT_TEAM = ["NovaWhale", "PixelPixie", "GlitchMancer", "ShadowPatron", "Dramatron"]
+
+
+def _persona_factories() -> Dict[str, Callable[[], Any]]:
+    """Agent name -> zero-argument factory for the built-in personas."""
+    from agents.personas import NovaWhale, PixelPixie, GlitchMancer, ShadowPatron, Dramatron
+    return {
+        "NovaWhale": NovaWhale,
+        "PixelPixie": PixelPixie,
+        "GlitchMancer": GlitchMancer,
+        "ShadowPatron": ShadowPatron,
+        "Dramatron": Dramatron,
+    }
+
+
+# Extra agent factories (name -> zero-argument callable).
+# Register before the farm starts its workers; they receive a copy through
+# the pool initializer (so factories must be picklable under spawn).
+AGENT_FACTORIES: Dict[str, Callable[[], Any]] = {}
+
+
+def register_agent(name: str, factory: Callable[[], Any]):
+    """Make an agent available to team specs by name."""
+    AGENT_FACTORIES[name] = factory
+
+
+def _init_worker(factories: Dict[str, Callable[[], Any]]):
+    """Pool initializer: install the parent's registered agents."""
+    AGENT_FACTORIES.update(factories)
+
+
+@dataclass
+class BattleSpec:
+    """
+    Complete, picklable description of one farm battle.
+
+    Attributes:
+        seed: RNG seed for this battle
+        battle_index: Position in the batch (results are reported by index)
+        team: Agent names resolved through the persona/registered factories
+        opponent: OpponentBuilder.to_dict() output, or None for scripted spikes
+        battle_duration: Battle length in seconds
+        opponent_budget: Opponent coin budget (None = unlimited)
+        enable_multipliers: Enable the creator multiplier system
+    """
+    seed: int
+    battle_index: int = 0
+    team: List[str] = field(default_factory=lambda: list(DEFAULT_TEAM))
+    opponent: Optional[Dict] = None
+    battle_duration: int = 300
+    opponent_budget: Optional[int] = None
+    enable_multipliers: bool = True
+
+
+def make_battle_specs(count: int, base_seed: int = 0, **kwargs) -> List[BattleSpec]:
+    """
+    Create `count` specs with consecutive seeds.
+
+    Args:
+        count: Number of battles
+        base_seed: Seed of the first battle (battle i uses base_seed + i)
+        **kwargs: Shared BattleSpec fields (team, opponent, battle_duration, ...)
+    """
+    return [
+        BattleSpec(seed=base_seed + i, battle_index=i, **kwargs)
+        for i in range(count)
+    ]
+
+
+def _build_agent(name: str):
+    """Instantiate an agent by spec name."""
+    factory = AGENT_FACTORIES.get(name) or _persona_factories().get(name)
+    if factory is None:
+        raise ValueError(f"Unknown agent in team spec: {name}")
+    return factory()
+
+
+def _build_opponent(spec: BattleSpec, rng: random.Random):
+    """Build an OpponentAI (with its own phase manager) from the spec."""
+    from core.advanced_phase_system import AdvancedPhaseManager
+    from core.budget_system import BudgetManager
+    from agents.opponent_ai import OpponentBuilder
+
+    phase_manager = AdvancedPhaseManager(battle_duration=spec.battle_duration, rng=rng)
+    budget_manager = None
+    if spec.opponent_budget:
+        budget_manager = BudgetManager(opponent_budget=spec.opponent_budget, rng=rng)
+
+    builder = OpponentBuilder.from_dict(spec.opponent)
+    return builder.build(phase_manager, budget_manager, rng=rng)
+
+
+def run_battle(spec: BattleSpec) -> Dict[str, Any]:
+    """
+    Run one seeded headless battle.
+
+    The battle draws from its own random.Random(spec.seed), so the result
+    is reproducible regardless of which worker (or thread) picks it up.
+
+    Returns:
+        Dict with battle_index, seed and the analytics complete summary
+    """
+    rng = random.Random(spec.seed)
+
+    with quiet_output():
+        opponent = _build_opponent(spec, rng) if spec.opponent else None
+
+        engine = BattleEngine(
+            battle_duration=spec.battle_duration,
+            enable_multipliers=spec.enable_multipliers,
+            headless=True,
+            opponent=opponent,
+            rng=rng
+        )
+        for name in spec.team:
+            engine.add_agent(_build_agent(name))
+
+        engine.run()
+
+    return {
+        "battle_index": spec.battle_index,
+        "seed": spec.seed,
+        "summary": engine.analytics.get_complete_summary(),
+    }
+
+
+def _run_chunk(specs: List[BattleSpec]) -> List[Dict[str, Any]]:
+    """Worker entry point: run a chunk of battles."""
+    return [run_battle(spec) for spec in specs]
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    """Summary statistics for a list of scores."""
+    if not values:
+        return {"mean": 0, "stdev": 0, "min": 0, "max": 0, "p10": 0, "p50": 0, "p90": 0}
+
+    ordered = sorted(values)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    return {
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.pstdev(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p10": percentile(0.10),
+        "p50": percentile(0.50),
+        "p90": percentile(0.90),
+    }
+
+
+def aggregate_summaries(summaries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge BattleAnalytics.get_complete_summary() outputs.
+
+    Returns:
+        Dict with battle count, win tallies/rates, score distributions
+        and per-agent averages
+    """
+    wins = {"creator": 0, "opponent": 0, "tie": 0}
+    creator_scores: List[float] = []
+    opponent_scores: List[float] = []
+    margins: List[float] = []
+    agents: Dict[str, Dict[str, float]] = {}
+
+    for summary in summaries:
+        battle = summary["battle"]
+        winner = battle.get("winner") or "tie"
+        wins[winner] = wins.get(winner, 0) + 1
+
+        creator = battle["final_scores"].get("creator", 0)
+        opponent = battle["final_scores"].get("opponent", 0)
+        creator_scores.append(creator)
+        opponent_scores.append(opponent)
+        margins.append(creator - opponent)
+
+        for agent_name, perf in summary.get("agents", {}).items():
+            totals = agents.setdefault(agent_name, {"battles": 0, "total_donated": 0, "gifts_sent": 0})
+            totals["battles"] += 1
+            totals["total_donated"] += perf.get("total_donated", 0)
+            totals["gifts_sent"] += perf.get("gifts_sent", 0)
+
+    battles = len(creator_scores)
+
+    return {
+        "battles": battles,
+        "wins": wins,
+        "win_rate": {
+            side: (count / battles if battles else 0.0)
+            for side, count in wins.items()
+        },
+        "creator_score": _distribution(creator_scores),
+        "opponent_score": _distribution(opponent_scores),
+        "margin": _distribution(margins),
+        "agents": {
+            name: {
+                "battles": totals["battles"],
+                "avg_donated": totals["total_donated"] / totals["battles"],
+                "avg_gifts": totals["gifts_sent"] / totals["battles"],
+            }
+            for name, totals in agents.items()
+        },
+    }
+
+
+class BattleFarm:
+    """
+    Runs batches of BattleSpecs on a ProcessPoolExecutor.
+
+    Battles are independent, so throughput scales with the number of
+    worker processes; specs are shipped in chunks to amortize IPC.
+
+    Used as a context manager, the farm keeps one worker pool open across
+    calls instead of starting a new one per batch:
+
+        with BattleFarm(max_workers=8) as farm:
+            for batch in batches:
+                farm.run(batch)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                 mp_context: Optional[BaseContext] = None):
+        """
+        Args:
+            max_workers: Worker processes (default: CPU count; 0 runs inline)
+            chunk_size: Battles per task (default: spread evenly, max 16)
+            mp_context: multiprocessing context for the workers (default: platform's)
+        """
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.chunk_size = chunk_size
+        self.mp_context = mp_context
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'BattleFarm':
+        if self.max_workers and self._pool is None:
+            self._pool = self._new_pool()
+        return self
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context,
+                                   initializer=_init_worker, initargs=(dict(AGENT_FACTORIES),))
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool kept open by the context manager."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _chunks(self, specs: List[BattleSpec]) -> List[List[BattleSpec]]:
+        size = self.chunk_size
+        if size is None:
+            size = max(1, min(16, len(specs) // (max(self.max_workers, 1) * 4)))
+        return [specs[i:i + size] for i in range(0, len(specs), size)]
+
+    def stream(self, specs: Iterable[BattleSpec]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield battle results as they complete (not in spec order).
+
+        Args:
+            specs: Battles to run
+        """
+        specs = list(specs)
+
+        if self.max_workers == 0:
+            for spec in specs:
+                yield run_battle(spec)
+            return
+
+        if self._pool is not None:
+            yield from self._stream_on(self._pool, specs)
+            return
+
+        with self._new_pool() as pool:
+            yield from self._stream_on(pool, specs)
+
+    def _stream_on(self, pool: ProcessPoolExecutor,
+                   specs: List[BattleSpec]) -> Iterator[Dict[str, Any]]:
+        futures = [pool.submit(_run_chunk, chunk) for chunk in self._chunks(specs)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+    def run(self, specs: Iterable[BattleSpec],
+            on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Run all specs and aggregate the results.
+
+        Args:
+            specs: Battles to run
+            on_result: Optional callback invoked for each streamed result
+
+        Returns:
+            aggregate_summaries() output plus per-battle results in index order
+        """
+        results = []
+        for result in self.stream(specs):
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        results.sort(key=lambda r: r["battle_index"])
+        report = aggregate_summaries(r["summary"] for r in results)
+        report["results"] = results
+        return report
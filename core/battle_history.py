@@ -188,7 +188,7 @@ class BattleHistoryDB:
             )
         """)
 
-        # Q-tables storage (JSON serialized)
+        # Q-tables storage (legacy JSON serialized; read for migration only)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS q_tables (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -202,6 +202,38 @@ class BattleHistoryDB:
             )
         """)
 
+        # Binary Q-tables (core.q_table_format): one meta row per agent type
+        # plus fixed-size row chunks so checkpoints rewrite only changed rows.
+        # `generation` identifies the in-memory table the chunks came from.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS q_table_meta (
+                agent_type TEXT PRIMARY KEY,
+                version INTEGER,
+                actions TEXT,
+                rows INTEGER,
+                chunk_rows INTEGER,
+                episodes INTEGER DEFAULT 0,
+                total_rewards REAL DEFAULT 0,
+                wins INTEGER DEFAULT 0,
+                epsilon REAL DEFAULT 0.3,
+                updated_at TEXT,
+                generation TEXT
+            )
+        """)
+        meta_columns = {row['name'] for row in cursor.execute("PRAGMA table_info(q_table_meta)")}
+        if 'generation' not in meta_columns:
+            cursor.execute("ALTER TABLE q_table_meta ADD COLUMN generation TEXT")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS q_table_chunks (
+                agent_type TEXT,
+                chunk INTEGER,
+                keys BLOB,
+                visited BLOB,
+                q_values BLOB,
+                PRIMARY KEY (agent_type, chunk)
+            )
+        """)
+
         # Create indexes for faster queries
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_agent_perf_name
@@ -411,6 +443,64 @@ class BattleHistoryDB:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    @staticmethod
+    def _fetch_columns(cursor) -> Dict[str, list]:
+        """Remaining rows of a query as {column: [values]}."""
+        names = [d[0] for d in cursor.description]
+        rows = cursor.fetchall()
+        if not rows:
+            return {name: [] for name in names}
+        return {name: list(values) for name, values in zip(names, zip(*rows))}
+
+    def get_history_columns(self, agent_type: str, limit: int = 50000) -> Dict[str, list]:
+        """
+        Agent performance joined with battle outcomes, newest first, as columns.
+
+        One query for the whole history; StrategyOptimizer turns the lists
+        into arrays instead of iterating per-battle dicts.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT
+                ap.won, ap.points_donated, ap.gifts_sent, ap.best_gift_value,
+                ap.early_phase_gifts, ap.mid_phase_gifts, ap.late_phase_gifts,
+                ap.final_phase_gifts, ap.gloves_sent, ap.gloves_activated,
+                b.duration, b.margin, b.boost2_triggered
+            FROM agent_performance ap
+            JOIN battles b ON ap.battle_id = b.battle_id
+            WHERE ap.agent_type = ?
+            ORDER BY b.timestamp DESC
+            LIMIT ?
+        """, (agent_type, limit))
+        return self._fetch_columns(cursor)
+
+    def get_battle_columns(self, limit: int = 50000) -> Dict[str, list]:
+        """Battle outcomes, newest first, as columns."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT
+                CASE WHEN winner = 'creator' THEN 1 ELSE 0 END AS creator_won,
+                duration, margin, boost2_triggered, gloves_activated
+            FROM battles
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (limit,))
+        return self._fetch_columns(cursor)
+
+    def get_gift_timing_columns(self, gift_type: Optional[str] = None,
+                                limit: int = 200000) -> Dict[str, list]:
+        """Gift timing rows (optionally one gift type), newest first, as columns."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT phase, timestamp, gift_value, multiplier, effective_value,
+                   score_diff_before, activated_x5
+            FROM gift_timing
+            WHERE ? IS NULL OR gift_type = ?
+            ORDER BY id DESC
+            LIMIT ?
+        """, (gift_type, gift_type, limit))
+        return self._fetch_columns(cursor)
+
     def save_strategy_params(
         self,
         agent_type: str,
@@ -541,13 +631,83 @@ class BattleHistoryDB:
     def save_q_table(
         self,
         agent_type: str,
-        q_table: Dict,
+        q_table,
         episodes: int,
         total_rewards: float,
         wins: int,
-        epsilon: float
-    ):
-        """Save Q-table for persistence across sessions."""
+        epsilon: float,
+        full: bool = False
+    ) -> int:
+        """
+        Save Q-table for persistence across sessions.
+
+        Array-backed tables (agents.learning_system.QTable) are stored in
+        the binary chunked format: only chunks the table reports dirty are
+        rewritten, unless `full` is set, the stored layout (actions, chunk
+        size, format version) differs, or the stored chunks belong to a
+        different table generation (the table was not loaded from or last
+        saved to this row). Plain dicts use the legacy JSON row.
+
+        Returns:
+            Number of chunks written (0 for the legacy format)
+        """
+        if not hasattr(q_table, 'export_chunk'):
+            self._save_legacy_q_table(agent_type, q_table, episodes, total_rewards, wins, epsilon)
+            return 0
+
+        from .q_table_format import FORMAT_VERSION, encode_keys
+
+        cursor = self.conn.cursor()
+        timestamp = datetime.now().isoformat()
+        actions = json.dumps(q_table.action_names)
+        generation = getattr(q_table, 'generation', None)
+
+        cursor.execute("""
+            SELECT version, actions, chunk_rows, generation FROM q_table_meta WHERE agent_type = ?
+        """, (agent_type,))
+        stored = cursor.fetchone()
+        full = full or stored is None or generation is None or (
+            stored['version'] != FORMAT_VERSION
+            or stored['actions'] != actions
+            or stored['chunk_rows'] != q_table.chunk_rows
+            or stored['generation'] != generation
+        )
+
+        if full:
+            cursor.execute("DELETE FROM q_table_chunks WHERE agent_type = ?", (agent_type,))
+            cursor.execute("DELETE FROM q_tables WHERE agent_type = ?", (agent_type,))
+            chunks = range(q_table.chunk_count)
+        else:
+            cursor.execute("""
+                DELETE FROM q_table_chunks WHERE agent_type = ? AND chunk >= ?
+            """, (agent_type, q_table.chunk_count))
+            chunks = [c for c in q_table.dirty_chunks if c < q_table.chunk_count]
+
+        rows = []
+        for chunk in chunks:
+            keys, visited, values = q_table.export_chunk(chunk)
+            rows.append((agent_type, chunk, sqlite3.Binary(encode_keys(keys)),
+                         sqlite3.Binary(visited), sqlite3.Binary(values)))
+        cursor.executemany("""
+            INSERT OR REPLACE INTO q_table_chunks
+            (agent_type, chunk, keys, visited, q_values)
+            VALUES (?, ?, ?, ?, ?)
+        """, rows)
+
+        cursor.execute("""
+            INSERT OR REPLACE INTO q_table_meta
+            (agent_type, version, actions, rows, chunk_rows, episodes,
+             total_rewards, wins, epsilon, updated_at, generation)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            agent_type, FORMAT_VERSION, actions, q_table.row_count, q_table.chunk_rows,
+            episodes, total_rewards, wins, epsilon, timestamp, generation
+        ))
+        self.conn.commit()
+        return len(rows)
+
+    def _save_legacy_q_table(self, agent_type: str, q_table: Dict, episodes: int,
+                             total_rewards: float, wins: int, epsilon: float):
         cursor = self.conn.cursor()
         timestamp = datetime.now().isoformat()
 
@@ -568,9 +728,50 @@ class BattleHistoryDB:
         self.conn.commit()
 
     def load_q_table(self, agent_type: str) -> Optional[Dict]:
-        """Load Q-table from database."""
+        """
+        Load Q-table from database.
+
+        Binary tables come back as {'snapshot': QTableSnapshot, 'chunk_rows', ...}
+        with the raw chunk buffers concatenated (no per-entry parsing);
+        legacy rows as {'q_table': {state_str: {action: value}}, ...}.
+
+        Raises:
+            ValueError: If the stored binary format is newer than this code
+        """
         cursor = self.conn.cursor()
 
+        cursor.execute("""
+            SELECT * FROM q_table_meta WHERE agent_type = ?
+        """, (agent_type,))
+        meta = cursor.fetchone()
+        if meta:
+            from .q_table_format import FORMAT_VERSION, QTableSnapshot, decode_keys
+            if meta['version'] > FORMAT_VERSION:
+                raise ValueError(f"Unsupported Q-table format version {meta['version']}")
+
+            keys, visited, values = [], bytearray(), bytearray()
+            cursor.execute("""
+                SELECT keys, visited, q_values FROM q_table_chunks
+                WHERE agent_type = ? ORDER BY chunk
+            """, (agent_type,))
+            for chunk in cursor.fetchall():
+                keys.extend(decode_keys(chunk['keys']))
+                visited += chunk['visited']
+                values += chunk['q_values']
+
+            return {
+                'agent_type': meta['agent_type'],
+                'snapshot': QTableSnapshot(json.loads(meta['actions']), keys,
+                                           bytes(visited), bytes(values)),
+                'chunk_rows': meta['chunk_rows'],
+                'generation': meta['generation'],
+                'episodes': meta['episodes'],
+                'total_rewards': meta['total_rewards'],
+                'wins': meta['wins'],
+                'epsilon': meta['epsilon'],
+                'updated_at': meta['updated_at']
+            }
+
         cursor.execute("""
             SELECT * FROM q_tables WHERE agent_type = ?
         """, (agent_type,))
@@ -730,6 +931,18 @@ class ReplayTick:
     multiplier: float
     events: List[Dict]  # List of events at this tick
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ReplayTick':
+        """Build from a serialized tick."""
+        return cls(
+            time=data['time'],
+            creator_score=data['creator_score'],
+            opponent_score=data['opponent_score'],
+            phase=data['phase'],
+            multiplier=data['multiplier'],
+            events=data.get('events', [])
+        )
+
 
 @dataclass
 class ReplayData:
@@ -744,6 +957,45 @@ class ReplayData:
     ticks: List[ReplayTick]
     agent_config: Dict  # Agent configuration used
 
+    def to_dict(self) -> dict:
+        """JSON-ready dict (the save_to_file layout)."""
+        return {
+            'replay_id': self.replay_id,
+            'battle_id': self.battle_id,
+            'recorded_at': self.recorded_at,
+            'duration': self.duration,
+            'winner': self.winner,
+            'final_creator_score': self.final_creator_score,
+            'final_opponent_score': self.final_opponent_score,
+            'ticks': [
+                {
+                    'time': t.time,
+                    'creator_score': t.creator_score,
+                    'opponent_score': t.opponent_score,
+                    'phase': t.phase,
+                    'multiplier': t.multiplier,
+                    'events': t.events
+                }
+                for t in self.ticks
+            ],
+            'agent_config': self.agent_config
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ReplayData':
+        """Build from the save_to_file layout."""
+        return cls(
+            replay_id=data['replay_id'],
+            battle_id=data['battle_id'],
+            recorded_at=data['recorded_at'],
+            duration=data['duration'],
+            winner=data['winner'],
+            final_creator_score=data['final_creator_score'],
+            final_opponent_score=data['final_opponent_score'],
+            ticks=[ReplayTick.from_dict(t) for t in data['ticks']],
+            agent_config=data.get('agent_config', {})
+        )
+
 
 class BattleRecorder:
     """
@@ -854,22 +1106,23 @@ class BattleRecorder:
             agent_config=self.agent_config
         )
 
-    def save_to_db(self, db: BattleHistoryDB) -> str:
-        """Save replay to database and return replay_id."""
+    def save_to_db(self, db: BattleHistoryDB, compact: bool = True, codec: str = "zlib") -> str:
+        """
+        Save replay to database and return replay_id.
+
+        Args:
+            db: Battle history database
+            compact: Store ticks in the compact columnar format (see
+                core.replay_format) instead of a JSON blob
+            codec: Compression codec for the compact format
+        """
         replay = self.get_replay_data()
 
-        # Serialize ticks
-        ticks_data = [
-            {
-                'time': t.time,
-                'creator_score': t.creator_score,
-                'opponent_score': t.opponent_score,
-                'phase': t.phase,
-                'multiplier': t.multiplier,
-                'events': t.events
-            }
-            for t in replay.ticks
-        ]
+        if compact:
+            from .replay_format import encode_replay
+            tick_data = sqlite3.Binary(encode_replay(replay, codec))
+        else:
+            tick_data = json.dumps(replay.to_dict()['ticks'])
 
         cursor = db.conn.cursor()
 
@@ -902,42 +1155,35 @@ class BattleRecorder:
             replay.winner,
             replay.final_creator_score,
             replay.final_opponent_score,
-            json.dumps(ticks_data),
+            tick_data,
             json.dumps(replay.agent_config)
         ))
 
         db.conn.commit()
         return replay.replay_id
 
-    def save_to_file(self, filepath: str):
-        """Save replay to JSON file."""
+    def save_to_file(self, filepath: str, compact: Optional[bool] = None, codec: str = "zlib"):
+        """
+        Save replay to a file.
+
+        Args:
+            filepath: Destination path
+            compact: Write the compact columnar format instead of JSON
+                (default: only for .bbr paths)
+            codec: Compression codec for the compact format
+        """
         replay = self.get_replay_data()
 
-        data = {
-            'replay_id': replay.replay_id,
-            'battle_id': replay.battle_id,
-            'recorded_at': replay.recorded_at,
-            'duration': replay.duration,
-            'winner': replay.winner,
-            'final_creator_score': replay.final_creator_score,
-            'final_opponent_score': replay.final_opponent_score,
-            'ticks': [
-                {
-                    'time': t.time,
-                    'creator_score': t.creator_score,
-                    'opponent_score': t.opponent_score,
-                    'phase': t.phase,
-                    'multiplier': t.multiplier,
-                    'events': t.events
-                }
-                for t in replay.ticks
-            ],
-            'agent_config': replay.agent_config
-        }
+        if compact is None:
+            compact = filepath.endswith('.bbr')
 
-        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        if compact:
+            from .replay_format import write_replay
+            write_replay(replay, filepath, codec)
+        else:
+            os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+            with open(filepath, 'w') as f:
+                json.dump(replay.to_dict(), f, indent=2)
 
         print(f"💾 Replay saved to: {filepath}")
 
@@ -1007,19 +1253,12 @@ class ReplayPlayer:
             print(f"❌ Replay not found: {replay_id}")
             return False
 
-        # Parse tick data
-        tick_data = json.loads(row['tick_data'])
-        ticks = [
-            ReplayTick(
-                time=t['time'],
-                creator_score=t['creator_score'],
-                opponent_score=t['opponent_score'],
-                phase=t['phase'],
-                multiplier=t['multiplier'],
-                events=t.get('events', [])
-            )
-            for t in tick_data
-        ]
+        # Parse tick data (compact blobs are decoded lazily, per tick)
+        if isinstance(row['tick_data'], bytes):
+            from .replay_format import CompactReplay
+            ticks = CompactReplay.from_bytes(row['tick_data'])
+        else:
+            ticks = [ReplayTick.from_dict(t) for t in json.loads(row['tick_data'])]
 
         self.replay_data = ReplayData(
             replay_id=row['replay_id'],
@@ -1036,38 +1275,24 @@ class ReplayPlayer:
         return True
 
     def load_from_file(self, filepath: str) -> bool:
-        """Load replay from JSON file."""
+        """Load replay from a JSON or compact (.bbr) file."""
         if not os.path.exists(filepath):
             print(f"❌ File not found: {filepath}")
             return False
 
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            magic = f.read(4)
 
-        ticks = [
-            ReplayTick(
-                time=t['time'],
-                creator_score=t['creator_score'],
-                opponent_score=t['opponent_score'],
-                phase=t['phase'],
-                multiplier=t['multiplier'],
-                events=t.get('events', [])
-            )
-            for t in data['ticks']
-        ]
+        from .replay_format import CompactReplay, is_compact_replay
+        if is_compact_replay(magic):
+            # Memory-mapped; ticks are decoded as playback reaches them
+            self.replay_data = CompactReplay.open(filepath).to_replay_data()
+            return True
 
-        self.replay_data = ReplayData(
-            replay_id=data['replay_id'],
-            battle_id=data['battle_id'],
-            recorded_at=data['recorded_at'],
-            duration=data['duration'],
-            winner=data['winner'],
-            final_creator_score=data['final_creator_score'],
-            final_opponent_score=data['final_opponent_score'],
-            ticks=ticks,
-            agent_config=data.get('agent_config', {})
-        )
+        with open(filepath, 'r') as f:
+            data = json.load(f)
 
+        self.replay_data = ReplayData.from_dict(data)
         return True
 
     def play(self, verbose: bool = True, step_callback: callable = None):
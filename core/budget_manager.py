@@ -16,6 +16,8 @@ from typing import Dict, List, Optional, Tuple
 from enum import Enum
 import logging
 
+from core.gift_index import GiftIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,6 +60,48 @@ class GiftEfficiency:
     tier: str
 
 
+# Default gift data: (name, coins, points, tier)
+_DEFAULT_GIFTS = [
+    # Budget tier (1-99 coins) - best efficiency
+    ("Rose", 1, 1, "budget"),
+    ("TikTok", 1, 1, "budget"),
+    ("Heart", 1, 1, "budget"),
+    ("Finger Heart", 5, 5, "budget"),
+    ("Friendship Necklace", 10, 10, "budget"),
+    ("Doughnut", 30, 30, "budget"),
+    ("Paper Crane", 99, 99, "budget"),
+
+    # Mid tier (100-999 coins)
+    ("Confetti", 100, 100, "mid"),
+    ("Hand Heart", 150, 150, "mid"),
+    ("Shooting Star", 300, 300, "mid"),
+    ("Sports Car", 500, 500, "mid"),
+    ("Swan", 699, 699, "mid"),
+    ("Diamond Ring", 999, 999, "mid"),
+
+    # Premium tier (1000-9999 coins)
+    ("Galaxy", 1000, 1000, "premium"),
+    ("Fireworks", 1088, 1088, "premium"),
+    ("Star of Red Carpet", 1999, 1999, "premium"),
+    ("Whale Diving", 2150, 2150, "premium"),
+    ("Private Jet", 3000, 3000, "premium"),
+    ("Yacht", 5000, 5000, "premium"),
+    ("Castle", 8000, 8000, "premium"),
+
+    # Ultra premium (10000+ coins)
+    ("Dragon Flame", 10000, 10000, "ultra"),
+    ("Adam's Dream", 15000, 15000, "ultra"),
+    ("Lion", 29999, 29999, "ultra"),
+    ("TikTok Universe", 44999, 44999, "ultra"),
+]
+
+DEFAULT_GIFT_INDEX: GiftIndex[GiftEfficiency] = GiftIndex(
+    GiftEfficiency(name=name, coins=coins, points=points,
+                   efficiency=points / coins if coins > 0 else 0, tier=tier)
+    for name, coins, points, tier in _DEFAULT_GIFTS
+)
+
+
 class BudgetManager:
     """
     Manages battle budget allocation and spending optimization.
@@ -117,8 +161,7 @@ class BudgetManager:
         self.total_spent = 0
         self.total_points_earned = 0
 
-        # Gift efficiency cache
-        self._gift_efficiency: List[GiftEfficiency] = []
+        # Gift efficiency index
         self._load_gift_efficiency(gift_catalog)
 
         # Battle state
@@ -129,55 +172,8 @@ class BudgetManager:
         logger.info(f"[BudgetManager] Initialized with {total_coins:,} coins, strategy={allocation_strategy}")
 
     def _load_gift_efficiency(self, catalog: Optional[Dict] = None):
-        """Load and calculate gift efficiency ratings."""
-        # Default gift data if no catalog provided
-        gifts = [
-            # Budget tier (1-99 coins) - best efficiency
-            ("Rose", 1, 1, "budget"),
-            ("TikTok", 1, 1, "budget"),
-            ("Heart", 1, 1, "budget"),
-            ("Finger Heart", 5, 5, "budget"),
-            ("Friendship Necklace", 10, 10, "budget"),
-            ("Doughnut", 30, 30, "budget"),
-            ("Paper Crane", 99, 99, "budget"),
-
-            # Mid tier (100-999 coins)
-            ("Confetti", 100, 100, "mid"),
-            ("Hand Heart", 150, 150, "mid"),
-            ("Shooting Star", 300, 300, "mid"),
-            ("Sports Car", 500, 500, "mid"),
-            ("Swan", 699, 699, "mid"),
-            ("Diamond Ring", 999, 999, "mid"),
-
-            # Premium tier (1000-9999 coins)
-            ("Galaxy", 1000, 1000, "premium"),
-            ("Fireworks", 1088, 1088, "premium"),
-            ("Star of Red Carpet", 1999, 1999, "premium"),
-            ("Whale Diving", 2150, 2150, "premium"),
-            ("Private Jet", 3000, 3000, "premium"),
-            ("Yacht", 5000, 5000, "premium"),
-            ("Castle", 8000, 8000, "premium"),
-
-            # Ultra premium (10000+ coins)
-            ("Dragon Flame", 10000, 10000, "ultra"),
-            ("Adam's Dream", 15000, 15000, "ultra"),
-            ("Lion", 29999, 29999, "ultra"),
-            ("TikTok Universe", 44999, 44999, "ultra"),
-        ]
-
-        self._gift_efficiency = []
-        for name, coins, points, tier in gifts:
-            efficiency = points / coins if coins > 0 else 0
-            self._gift_efficiency.append(GiftEfficiency(
-                name=name,
-                coins=coins,
-                points=points,
-                efficiency=efficiency,
-                tier=tier
-            ))
-
-        # Sort by efficiency (descending)
-        self._gift_efficiency.sort(key=lambda g: g.efficiency, reverse=True)
+        """Attach the gift efficiency index (shared, built once per process)."""
+        self._gift_efficiency: GiftIndex[GiftEfficiency] = DEFAULT_GIFT_INDEX
 
     def allocate_for_battle(self, custom_allocation: Optional[Dict[BattlePhase, float]] = None):
         """
@@ -327,18 +323,13 @@ class BudgetManager:
             if budget <= 0:
                 return None
 
-        # Filter affordable gifts
-        affordable = [g for g in self._gift_efficiency if g.coins <= budget and g.points >= min_impact]
-
-        if not affordable:
-            return None
-
         if prefer_efficiency:
             # Return most efficient gift
-            return affordable[0]  # Already sorted by efficiency
-        else:
-            # Return highest impact gift
-            return max(affordable, key=lambda g: g.points)
+            return self._gift_efficiency.most_efficient(budget, min_impact)
+
+        # Return highest impact gift
+        gift = self._gift_efficiency.max_points_affordable(budget)
+        return gift if gift is not None and gift.points >= min_impact else None
 
     def get_gift_for_target_points(
         self,
@@ -361,22 +352,13 @@ class BudgetManager:
         if allow_overspend:
             budget = self.remaining_coins
 
-        # Find gifts that meet or exceed target
-        candidates = [
-            g for g in self._gift_efficiency
-            if g.coins <= budget and g.points >= target_points
-        ]
-
-        if candidates:
-            # Return cheapest that meets target
-            return min(candidates, key=lambda g: g.coins)
+        # Cheapest gift that meets or exceeds target
+        gift = self._gift_efficiency.cheapest_at_least(target_points, budget)
+        if gift is not None:
+            return gift
 
         # If no single gift meets target, return the biggest we can afford
-        affordable = [g for g in self._gift_efficiency if g.coins <= budget]
-        if affordable:
-            return max(affordable, key=lambda g: g.points)
-
-        return None
+        return self._gift_efficiency.max_points_affordable(budget)
 
     def _borrow_from_reserves(self, requesting_phase: BattlePhase) -> int:
         """
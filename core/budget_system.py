@@ -16,11 +16,14 @@ Strategic implications:
 - Budget exhaustion = game over for that team
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 import random
 
+from core.gift_index import GiftIndex
+
 
 class BudgetTier(Enum):
     """Budget tier classification."""
@@ -68,23 +71,24 @@ GIFT_CATALOG = {
     "GLOVE": GiftCost("GLOVE", 100, 100, "🥊", "powerup"),
 }
 
+# Precomputed lookups over GIFT_CATALOG (cheapest first)
+GIFT_INDEX: GiftIndex[GiftCost] = GiftIndex(GIFT_CATALOG.values(), coins=attrgetter("cost"))
+
+# Tier ranks for tier-capped selection (unranked tiers count as "small")
+TIER_ORDER = ["small", "medium", "large", "whale"]
+
 
 def get_gift_cost(gift_name: str) -> int:
     """Get the cost of a gift by name."""
     # Handle case-insensitive lookup
-    for name, gift in GIFT_CATALOG.items():
-        if name.lower() == gift_name.lower():
-            return gift.cost
+    gift = GIFT_INDEX.get(gift_name, ignore_case=True)
     # Default cost for unknown gifts
-    return 100
+    return gift.cost if gift is not None else 100
 
 
 def get_gift_info(gift_name: str) -> Optional[GiftCost]:
     """Get full gift info by name."""
-    for name, gift in GIFT_CATALOG.items():
-        if name.lower() == gift_name.lower():
-            return gift
-    return None
+    return GIFT_INDEX.get(gift_name, ignore_case=True)
 
 
 class BudgetManager:
@@ -102,7 +106,8 @@ class BudgetManager:
         self,
         creator_budget: Optional[int] = None,
         opponent_budget: Optional[int] = None,
-        budget_range: Tuple[int, int] = (50000, 500000)
+        budget_range: Tuple[int, int] = (50000, 500000),
+        rng: Optional[random.Random] = None
     ):
         """
         Initialize budgets for both teams.
@@ -111,8 +116,10 @@ class BudgetManager:
             creator_budget: Fixed budget for creator (or None for random)
             opponent_budget: Fixed budget for opponent (or None for random)
             budget_range: (min, max) range for random budgets
+            rng: Random source for budget rolls (default: global random module)
         """
         self.budget_range = budget_range
+        self.rng = rng or random
 
         # Starting budgets
         self.creator_starting = creator_budget or self._generate_random_budget()
@@ -144,16 +151,16 @@ class BudgetManager:
 
     def _generate_random_budget(self) -> int:
         """Generate a random budget with weighted distribution."""
-        roll = random.random()
+        roll = self.rng.random()
 
         if roll < 0.20:  # 20% - Low budget
-            return random.randint(50000, 150000)
+            return self.rng.randint(50000, 150000)
         elif roll < 0.55:  # 35% - Medium budget
-            return random.randint(150000, 350000)
+            return self.rng.randint(150000, 350000)
         elif roll < 0.85:  # 30% - High budget
-            return random.randint(350000, 500000)
+            return self.rng.randint(350000, 500000)
         else:  # 15% - Very high budget
-            return random.randint(500000, 750000)
+            return self.rng.randint(500000, 750000)
 
     def _get_budget_description(self, budget: int) -> str:
         """Get human-readable budget description."""
@@ -175,9 +182,9 @@ class BudgetManager:
         return budget >= cost
 
     def get_affordable_gifts(self, team: str) -> List[GiftCost]:
-        """Get list of gifts the team can afford."""
+        """Get list of gifts the team can afford, cheapest first."""
         budget = self.creator_budget if team == "creator" else self.opponent_budget
-        return [gift for gift in GIFT_CATALOG.values() if gift.cost <= budget]
+        return list(GIFT_INDEX.affordable(budget))
 
     def get_best_affordable_gift(self, team: str, max_spend_ratio: float = 0.5) -> Optional[GiftCost]:
         """Get the best gift within budget constraints.
@@ -189,12 +196,8 @@ class BudgetManager:
         budget = self.creator_budget if team == "creator" else self.opponent_budget
         max_spend = int(budget * max_spend_ratio)
 
-        affordable = [g for g in GIFT_CATALOG.values() if g.cost <= max_spend]
-        if not affordable:
-            return None
-
         # Return highest value affordable gift
-        return max(affordable, key=lambda g: g.points)
+        return GIFT_INDEX.max_points_affordable(max_spend)
 
     def spend(
         self,
@@ -391,37 +394,47 @@ class BudgetStrategy:
 
     @staticmethod
     def select_gift_for_budget(
-        affordable_gifts: List[GiftCost],
+        affordable_gifts: Union[GiftIndex, List[GiftCost]],
         allocation: Dict,
         current_budget: int
     ) -> Optional[GiftCost]:
-        """Select best gift based on allocation strategy."""
-        if not affordable_gifts:
-            return None
+        """
+        Select best gift based on allocation strategy.
+
+        Args:
+            affordable_gifts: Candidate gifts. Pass GIFT_INDEX (or another
+                GiftIndex) to avoid indexing a list on every call.
+            allocation: Output of get_recommended_allocation
+            current_budget: Coins available
+
+        Returns:
+            Selected gift or None if nothing is affordable
+        """
+        index = affordable_gifts
+        if not isinstance(index, GiftIndex):
+            index = GiftIndex(affordable_gifts, coins=attrgetter("cost"))
 
         # Filter by max tier
-        tier_order = ["small", "medium", "large", "whale"]
-        max_tier_idx = tier_order.index(allocation["max_tier"]) if allocation["max_tier"] in tier_order else 3
+        max_tier = allocation["max_tier"]
+        max_tier_idx = TIER_ORDER.index(max_tier) if max_tier in TIER_ORDER else 3
+        tiers = index.subset(TIER_ORDER[:max_tier_idx + 1])
+        spend_limit = current_budget * allocation["spend_ratio"]
 
-        valid_gifts = [
-            g for g in affordable_gifts
-            if g.tier in tier_order[:max_tier_idx + 1]
-            and g.cost <= current_budget * allocation["spend_ratio"]
-        ]
+        valid_gifts = tiers.affordable(spend_limit)
 
         if not valid_gifts:
             # Fall back to cheapest affordable gift
-            return min(affordable_gifts, key=lambda g: g.cost)
+            return index.cheapest(current_budget)
 
         # Pick based on aggression
         if allocation["aggression"] > 0.7:
-            return max(valid_gifts, key=lambda g: g.points)
+            return tiers.max_points_affordable(spend_limit)
         elif allocation["aggression"] > 0.4:
             # Middle ground - pick median value
             sorted_gifts = sorted(valid_gifts, key=lambda g: g.points)
             return sorted_gifts[len(sorted_gifts) // 2]
         else:
-            return min(valid_gifts, key=lambda g: g.cost)
+            return valid_gifts[0]
 
 
 class BudgetIntelligence:
@@ -645,20 +658,13 @@ class BudgetIntelligence:
 
     def select_gift(self, max_spend: int, tier: str) -> Optional[str]:
         """Select best gift within budget and tier constraints."""
-        tier_order = {"small": 0, "medium": 1, "large": 2, "whale": 3}
-        max_tier_idx = tier_order.get(tier, 3)
-
-        best_gift = None
-        best_value = 0
+        tier_rank = {name: rank for rank, name in enumerate(TIER_ORDER)}
+        max_tier_idx = tier_rank.get(tier, 3)
 
-        for name, gift in GIFT_CATALOG.items():
-            gift_tier_idx = tier_order.get(gift.tier, 0)
-            if gift.cost <= max_spend and gift_tier_idx <= max_tier_idx:
-                if gift.points > best_value:
-                    best_value = gift.points
-                    best_gift = name
+        tiers = [t for t in GIFT_INDEX.by_tier if tier_rank.get(t, 0) <= max_tier_idx]
+        gift = GIFT_INDEX.subset(tiers).max_points_affordable(max_spend)
 
-        return best_gift
+        return gift.name if gift is not None and gift.points > 0 else None
 
     def mark_boost2_complete(self):
         """Mark Boost #2 as completed to release reserved budget."""
@@ -0,0 +1,469 @@
+"""
+Catch-up Planner - budget allocation across boost windows by dynamic programming.
+
+Given a coin budget and the windows left in the battle (multiplier and
+duration), picks how many coins to spend in each window and which gifts to
+send there, maximizing expected points:
+
+- Time: a window of d seconds fits at most d * MAX_GIFTS_PER_MINUTE / 60
+  gifts, so every window is a bounded knapsack over the coin denominations.
+- Gloves: a glove sent in a boost (or the final 30s) can trigger x5 for 30s,
+  stacking additively like AdvancedPhaseManager._get_stacked_multiplier
+  (x3 boost + x5 glove = x8). The planner weighs the glove's expected bonus
+  (GLOVE_CHANCE * GLOVE_BONUS) against its cost and the gift slot it takes.
+- Budget: windows are combined with a max-plus knapsack over budget buckets
+  (at most PLAN_BUCKETS per plan), then the exact budget is replayed through
+  the chosen allocation, highest multiplier first.
+
+Within a window every coin earns the same multiplier, so the best gift
+multiset is the one that spends the most coins with the allowed number of
+gifts. ChangeTable answers that exactly: a min-gift-count table over the
+denominations (built once per catalog), which becomes periodic in the
+largest gift and so covers any budget.
+
+Solved allocations are memoized per (budget bucket, windows), so repeated
+calls from live agents are a dictionary hit plus the exact replay. The
+shared planner from get_catch_up_planner() builds its table up front
+(StrategicIntelligence fetches it at setup), so no battle tick pays for it.
+
+Usage:
+    planner = CatchUpPlanner()
+    plan = planner.plan(12000, [PlanWindow("boost_1", 3.0, 20, glove=True),
+                                PlanWindow("final_30s", 1.0, 30, glove=True)])
+    plan.windows[0].gifts  # {"Dragon Flame": 1, "Cap": 20, ...}
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.budget_system import GIFT_INDEX
+from core.gift_index import GiftIndex
+
+# Glove mechanics (AdvancedPhaseManager._handle_glove)
+GLOVE_BONUS = 5.0
+GLOVE_DURATION = 30
+GLOVE_CHANCE = 0.40
+
+# Sending rate (BattlePlatformConfig.max_gifts_per_minute)
+MAX_GIFTS_PER_MINUTE = 500
+
+# Budget resolution of the cross-window knapsack
+PLAN_BUCKETS = 64
+PLAN_CACHE_SIZE = 512
+
+
+# =============================================================================
+# MIN-GIFT TABLE
+# =============================================================================
+
+class ChangeTable:
+    """
+    Fewest gifts needed to spend exactly c coins, for every c.
+
+    counts[c] is exact below `size`. Past that the table is periodic in the
+    largest denomination L (counts[c] = counts[c - L] + 1), which the
+    constructor checks over a full period before trimming.
+    """
+
+    def __init__(self, coins: Sequence[int]):
+        """
+        Args:
+            coins: Gift denominations in coins (must include 1)
+        """
+        coins = sorted(set(int(c) for c in coins if c > 0))
+        if not coins or coins[0] != 1:
+            raise ValueError("Denominations must include a 1-coin gift")
+        self.coins: Tuple[int, ...] = tuple(coins)
+        self.largest = coins[-1]
+
+        size = 4 * self.largest
+        while True:
+            counts = self._min_counts(size)
+            periodic = counts[self.largest:] == counts[:-self.largest] + 1
+            bad = np.flatnonzero(~periodic)
+            needed = (int(bad[-1]) + 1 if len(bad) else 0) + 2 * self.largest
+            if needed <= size:
+                break
+            size *= 2
+
+        counts = counts[:needed]
+        self.size = needed
+        self.max_count = int(counts.max())
+        self.counts = counts.astype(np.min_scalar_type(self.max_count))
+
+        # Some denomination d with counts[c] == counts[c - d] + 1
+        choice = np.zeros(needed, dtype=np.int32)
+        for d in reversed(self.coins):
+            view = choice[d:]
+            view[(view == 0) & (counts[d:] == counts[:-d] + 1)] = d
+        self.choice = choice
+
+        self._reachable: Dict[int, np.ndarray] = {}
+
+    def _min_counts(self, size: int) -> np.ndarray:
+        """Unbounded min-coin DP, one vectorized pass per denomination."""
+        big = np.iinfo(np.int64).max // 4
+        counts = np.full(size, big, dtype=np.int64)
+        counts[0] = 0
+        for d in self.coins:
+            # Per residue class r: counts[r + k*d] = min_j (counts[r + j*d] + k - j)
+            rows = -(-size // d)
+            padded = np.full(rows * d, big, dtype=np.int64)
+            padded[:size] = counts
+            grid = padded.reshape(rows, d)
+            k = np.arange(rows, dtype=np.int64)[:, None]
+            stepped = (np.minimum.accumulate(grid - k, axis=0) + k).reshape(-1)[:size]
+            np.minimum(counts, stepped, out=counts)
+        return counts
+
+    def _last_reachable(self, amount: int, max_gifts: int) -> int:
+        """Largest c <= amount (< size) spendable with at most max_gifts gifts."""
+        if max_gifts >= self.max_count:
+            return amount
+        positions = self._reachable.get(max_gifts)
+        if positions is None:
+            positions = self._reachable[max_gifts] = np.flatnonzero(self.counts <= max_gifts)
+        return int(positions[np.searchsorted(positions, amount, side="right") - 1])
+
+    def split(self, budget: int, max_gifts: int) -> Tuple[int, int]:
+        """
+        Best spend within budget using at most max_gifts gifts.
+
+        Returns:
+            (largest-gift count, remainder) - the spend is
+            count * largest + remainder, with remainder < size
+        """
+        if budget <= 0 or max_gifts <= 0:
+            return 0, 0
+        L, last = self.largest, self.size - 1
+        most = min(max_gifts, budget // L)
+
+        best, best_spent = (0, 0), 0
+        start = 0
+        free = max_gifts - self.max_count
+        if free >= 0:
+            # With max_count gifts to spare every amount below size is reachable
+            u = min(free, most)
+            best = (u, min(budget - u * L, last))
+            best_spent = u * L + best[1]
+            start = u + 1
+
+        for u in range(start, most + 1):
+            rest = self._last_reachable(min(budget - u * L, last), max_gifts - u)
+            if u * L + rest > best_spent:
+                best, best_spent = (u, rest), u * L + rest
+        return best
+
+    def max_spend(self, budget: int, max_gifts: int) -> int:
+        """Most coins spendable within budget using at most max_gifts gifts."""
+        u, rest = self.split(budget, max_gifts)
+        return u * self.largest + rest
+
+    def max_spend_many(self, budgets: np.ndarray, max_gifts: int) -> np.ndarray:
+        """max_spend over an array of budgets."""
+        budgets = np.maximum(budgets, 0)
+        if max_gifts <= 0:
+            return np.zeros(len(budgets), dtype=np.int64)
+        if not len(budgets) or max_gifts - self.max_count >= budgets.max() // self.largest:
+            return budgets.astype(np.int64)
+        return np.array([self.max_spend(int(b), max_gifts) for b in budgets], dtype=np.int64)
+
+    def decompose(self, budget: int, max_gifts: int) -> Dict[int, int]:
+        """Gift multiset (denomination -> count) for max_spend(budget, max_gifts)."""
+        u, rest = self.split(budget, max_gifts)
+        counts: Dict[int, int] = {self.largest: u} if u else {}
+        while rest:
+            d = int(self.choice[rest])
+            counts[d] = counts.get(d, 0) + 1
+            rest -= d
+        return counts
+
+
+_TABLES: Dict[Tuple[int, ...], ChangeTable] = {}
+
+
+def change_table(coins: Sequence[int]) -> ChangeTable:
+    """Shared ChangeTable per denomination set (built on first use)."""
+    key = tuple(sorted(set(coins)))
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = ChangeTable(key)
+    return table
+
+
+# =============================================================================
+# PLANS
+# =============================================================================
+
+@dataclass(frozen=True)
+class PlanWindow:
+    """A stretch of battle time with a single base multiplier."""
+    name: str
+    multiplier: float
+    duration: int
+    glove: bool = False  # A glove sent here can trigger x5 (boosts, final 30s)
+
+
+@dataclass
+class WindowPlan:
+    """Spending planned for one window."""
+    name: str
+    multiplier: float
+    budget: int                 # Coins spent, glove included
+    expected_points: int
+    gifts: Dict[str, int] = field(default_factory=dict)
+    glove: bool = False
+
+
+@dataclass
+class CatchUpPlan:
+    """Planned spending across all windows."""
+    budget: int
+    windows: List[WindowPlan]
+
+    @property
+    def total_spent(self) -> int:
+        return sum(w.budget for w in self.windows)
+
+    @property
+    def total_expected(self) -> int:
+        return sum(w.expected_points for w in self.windows)
+
+    @property
+    def points_per_coin(self) -> float:
+        return self.total_expected / self.budget if self.budget > 0 else 0.0
+
+
+def _max_plus(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """c[k] = max_i a[i] + b[k - i], with the maximizing i."""
+    n = len(a)
+    i = np.arange(n)[:, None]
+    shift = np.arange(n)[None, :] - i
+    candidates = np.where(shift >= 0, a[:, None] + b[np.maximum(shift, 0)], -np.inf)
+    best = candidates.argmax(axis=0)
+    return candidates[best, np.arange(n)], best
+
+
+class CatchUpPlanner:
+    """
+    Optimal gift plans across the remaining battle windows.
+
+    Solved allocations are cached per (budget bucket, windows); the table
+    of gift counts is shared per catalog.
+    """
+
+    def __init__(
+        self,
+        gifts: GiftIndex = GIFT_INDEX,
+        max_gifts_per_minute: int = MAX_GIFTS_PER_MINUTE,
+        glove_chance: float = GLOVE_CHANCE,
+        buckets: int = PLAN_BUCKETS
+    ):
+        """
+        Args:
+            gifts: Gift index; tier "powerup" holds the glove, every other gift
+                is a denomination (points are taken to equal coins, as in
+                GIFT_CATALOG)
+            max_gifts_per_minute: Sending rate that caps gifts per window
+            glove_chance: Probability that a glove triggers x5
+            buckets: Budget buckets for the cross-window knapsack
+        """
+        regular = gifts.subset(t for t in gifts.by_tier if t != "powerup")
+        self._gifts: Dict[int, Any] = {}
+        for gift, coins in zip(regular.gifts, regular.coins):
+            self._gifts.setdefault(coins, gift)
+        self._names = {coins: gift.name for coins, gift in self._gifts.items()}
+
+        powerups = gifts.subset(["powerup"])
+        self._glove = powerups.gifts[0] if len(powerups) else None
+        self._glove_cost = powerups.coins[0] if len(powerups) else 0
+
+        self.max_gifts_per_minute = max_gifts_per_minute
+        self.glove_chance = glove_chance
+        self.buckets = buckets
+
+        self._table: Optional[ChangeTable] = None
+        self._layouts: Dict[Tuple, List[Tuple[int, int]]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def table(self) -> ChangeTable:
+        if self._table is None:
+            self._table = change_table(self._gifts)
+        return self._table
+
+    def warm(self) -> 'CatchUpPlanner':
+        """Build the min-gift table now rather than on the first plan()."""
+        self.table
+        return self
+
+    def capacity(self, seconds: float) -> int:
+        """Gifts that can be sent in `seconds`."""
+        return int(seconds * self.max_gifts_per_minute / 60)
+
+    def _bucket_size(self, budget: int) -> int:
+        """Power-of-two bucket giving at most self.buckets buckets."""
+        per_bucket = -(-budget // self.buckets)
+        return 1 << (per_bucket - 1).bit_length() if per_bucket > 1 else 1
+
+    def _parts(self, window: PlanWindow, glove: bool) -> List[Tuple[float, int]]:
+        """(multiplier, gift capacity) per part of a window."""
+        if not glove:
+            return [(window.multiplier, self.capacity(window.duration))]
+        boosted = min(window.duration, GLOVE_DURATION)
+        return [
+            (window.multiplier + GLOVE_BONUS * self.glove_chance, self.capacity(boosted) - 1),
+            (window.multiplier, self.capacity(window.duration - boosted)),
+        ]
+
+    def _can_glove(self, window: PlanWindow) -> bool:
+        return window.glove and self._glove is not None and self.glove_chance > 0
+
+    # =========================================================================
+    # SOLVER
+    # =========================================================================
+
+    def _window_values(self, window: PlanWindow, grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Best expected points per grid budget for one window.
+
+        Returns:
+            (values, glove_split) - glove_split[j] is the bucket count given to
+            the glove-boosted part, or -1 when no glove is sent
+        """
+        table = self.table
+        (multiplier, capacity), = self._parts(window, glove=False)
+        plain = multiplier * table.max_spend_many(grid, capacity)
+        split = np.full(len(grid), -1)
+        if not self._can_glove(window):
+            return plain, split
+
+        (boost_mult, boost_cap), (rest_mult, rest_cap) = self._parts(window, glove=True)
+        after_glove = grid - self._glove_cost
+        boosted = np.where(
+            after_glove >= 0,
+            boost_mult * table.max_spend_many(after_glove, boost_cap) + window.multiplier * self._glove.points,
+            -np.inf,
+        )
+        with_glove, boosted_buckets = _max_plus(boosted, rest_mult * table.max_spend_many(grid, rest_cap))
+
+        better = with_glove > plain
+        split[better] = boosted_buckets[better]
+        return np.where(better, with_glove, plain), split
+
+    def _solve(self, bucket: int, buckets: int, windows: Tuple[PlanWindow, ...]) -> List[Tuple[int, int]]:
+        """Per window (buckets allocated, glove split) maximizing expected points."""
+        grid = np.arange(buckets + 1, dtype=np.int64) * bucket
+        splits, prior = [], []
+        total = None
+        for window in windows:
+            values, split = self._window_values(window, grid)
+            splits.append(split)
+            if total is None:
+                total = values
+                prior.append(None)
+            else:
+                total, given = _max_plus(total, values)
+                prior.append(given)
+
+        layout = []
+        k = buckets
+        for w in range(len(windows) - 1, -1, -1):
+            start = int(prior[w][k]) if prior[w] is not None else 0
+            layout.append((k - start, int(splits[w][k - start])))
+            k = start
+        layout.reverse()
+        return layout
+
+    # =========================================================================
+    # PLANNING
+    # =========================================================================
+
+    def plan(self, budget: int, windows: Sequence[PlanWindow]) -> CatchUpPlan:
+        """
+        Plan spending of `budget` coins over `windows`.
+
+        Args:
+            budget: Coins available
+            windows: Remaining battle windows (any order)
+
+        Returns:
+            CatchUpPlan with one WindowPlan per window, in the given order
+        """
+        budget = max(0, int(budget))
+        windows = tuple(windows)
+        if not windows:
+            return CatchUpPlan(budget, [])
+
+        bucket = self._bucket_size(budget)
+        buckets = budget // bucket
+        key = (bucket, buckets, windows)
+        layout = self._layouts.get(key)
+        if layout is None:
+            self.cache_misses += 1
+            layout = self._solve(bucket, buckets, windows)
+            if len(self._layouts) >= PLAN_CACHE_SIZE:
+                self._layouts.pop(next(iter(self._layouts)))
+            self._layouts[key] = layout
+        else:
+            self.cache_hits += 1
+
+        return self._realize(budget, bucket, windows, layout)
+
+    def _realize(self, budget: int, bucket: int, windows: Tuple[PlanWindow, ...],
+                 layout: List[Tuple[int, int]]) -> CatchUpPlan:
+        """Replay the exact budget through a bucketed allocation."""
+        plans = [WindowPlan(w.name, w.multiplier, 0, 0) for w in windows]
+
+        # (window, multiplier, capacity, coins) per part
+        parts = []
+        for w, (window, (buckets, split)) in enumerate(zip(windows, layout)):
+            glove = split >= 0
+            coins = [buckets * bucket]
+            if glove:
+                coins = [split * bucket - self._glove_cost, (buckets - split) * bucket]
+                plan = plans[w]
+                plan.glove = True
+                plan.budget += self._glove_cost
+                plan.expected_points += int(window.multiplier * self._glove.points)
+                plan.gifts[self._glove.name] = 1
+            for (multiplier, capacity), amount in zip(self._parts(window, glove), coins):
+                parts.append((w, multiplier, capacity, amount))
+
+        # Unbucketed coins flow to the best parts first
+        carry = budget - sum(buckets for buckets, _ in layout) * bucket
+        for w, multiplier, capacity, amount in sorted(parts, key=lambda p: -p[1]):
+            available = amount + carry
+            counts = self.table.decompose(available, capacity)
+            spent = sum(d * n for d, n in counts.items())
+            carry = available - spent
+
+            plan = plans[w]
+            plan.budget += spent
+            plan.expected_points += int(multiplier * sum(self._gifts[d].points * n for d, n in counts.items()))
+            for d, n in counts.items():
+                plan.gifts[self._names[d]] = plan.gifts.get(self._names[d], 0) + n
+
+        return CatchUpPlan(budget, plans)
+
+    def get_stats(self) -> Dict:
+        """Plan cache statistics."""
+        return {
+            "cached_plans": len(self._layouts),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+
+# Singleton instance for easy access
+_planner_instance = None
+
+def get_catch_up_planner() -> CatchUpPlanner:
+    """Get the shared planner (plans are cached across callers), table built."""
+    global _planner_instance
+    if _planner_instance is None:
+        _planner_instance = CatchUpPlanner().warm()
+    return _planner_instance
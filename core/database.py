@@ -1,18 +1,87 @@
 """
 Database module for persisting battle history and statistics.
 Uses SQLite for simplicity and portability.
+
+Connections are pooled per thread and opened in WAL mode, so the web server
+can serve reads while a battle is writing.
 """
 
 import sqlite3
 import json
 import os
+import threading
+import functools
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from contextlib import contextmanager
 
 
 DATABASE_PATH = os.environ.get('DATABASE_PATH', 'data/battles.db')
 
+# Reuse one connection per thread (set DATABASE_POOL=0 to open one per call)
+POOL_CONNECTIONS = os.environ.get('DATABASE_POOL', '1') != '0'
+
+# Connection tuning
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',      # Readers don't block the writer (and vice versa)
+    'PRAGMA synchronous=NORMAL',    # Safe with WAL, far fewer fsyncs than FULL
+    'PRAGMA cache_size=-20000',     # ~20MB page cache per connection
+    'PRAGMA temp_store=MEMORY',
+)
+BUSY_TIMEOUT_SECONDS = 5.0
+STATEMENT_CACHE_SIZE = 256  # Prepared statements kept per connection
+
+# Seconds of battle time between replay keyframes
+KEYFRAME_INTERVAL = 10.0
+
+# Score histogram buckets: (upper bound, label); the last bucket is open-ended
+SCORE_BUCKETS = (
+    (50000, '0-50K'),
+    (100000, '50K-100K'),
+    (200000, '100K-200K'),
+    (300000, '200K-300K'),
+    (500000, '300K-500K'),
+    (None, '500K+'),
+)
+SCORE_BUCKET_LABELS = [label for _, label in SCORE_BUCKETS]
+
+_pool = threading.local()
+
+# Callbacks told which kind of data ("battles", "leaderboard", "tournaments") was written
+_change_listeners: List[Callable[[str], None]] = []
+
+
+def add_change_listener(callback: Callable[[str], None]):
+    """Register a callback(topic) run after committed writes (e.g. cache invalidation)."""
+    if callback not in _change_listeners:
+        _change_listeners.append(callback)
+
+
+def remove_change_listener(callback: Callable[[str], None]):
+    """Unregister a change listener."""
+    if callback in _change_listeners:
+        _change_listeners.remove(callback)
+
+
+def _notify_change(topic: str):
+    for callback in list(_change_listeners):
+        try:
+            callback(topic)
+        except Exception as e:
+            print(f"[Database] Change listener error: {e}")
+
+
+def _notifies(topic: str):
+    """Decorator: notify change listeners after the write committed."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            _notify_change(topic)
+            return result
+        return wrapper
+    return decorator
+
 
 def get_db_path() -> str:
     """Get database path, creating directory if needed."""
@@ -23,19 +92,69 @@ def get_db_path() -> str:
     return db_path
 
 
+def _open_connection(db_path: str) -> sqlite3.Connection:
+    """Open a tuned connection."""
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_SECONDS,
+                           cached_statements=STATEMENT_CACHE_SIZE)
+    conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _pooled_connection() -> sqlite3.Connection:
+    """
+    Get this thread's connection, opening it on first use.
+
+    Reopened if the database path changed or the process was forked.
+    """
+    db_path = get_db_path()
+    conn = getattr(_pool, 'conn', None)
+    if conn is not None and _pool.key == (db_path, os.getpid()):
+        return conn
+
+    if conn is not None and _pool.key[1] == os.getpid():
+        conn.close()
+    _pool.conn = _open_connection(db_path)
+    _pool.key = (db_path, os.getpid())
+    return _pool.conn
+
+
+def close_connection():
+    """Close the calling thread's pooled connection (reopened on next use)."""
+    conn = getattr(_pool, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _pool.conn = None
+
+
 @contextmanager
 def get_connection():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
+    """
+    Context manager for database connections.
+
+    Commits on success and rolls back on error. With pooling enabled the
+    connection stays open for the next call on the same thread.
+    """
+    if not POOL_CONNECTIONS:
+        conn = _open_connection(get_db_path())
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return
+
+    conn = _pooled_connection()
     try:
         yield conn
         conn.commit()
     except Exception:
         conn.rollback()
         raise
-    finally:
-        conn.close()
 
 
 def init_database():
@@ -71,6 +190,17 @@ def init_database():
             )
         ''')
 
+        # Replay keyframes (state snapshots for seeking)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS replay_keyframes (
+                battle_id TEXT,
+                timestamp REAL,
+                state TEXT,
+                PRIMARY KEY (battle_id, timestamp),
+                FOREIGN KEY (battle_id) REFERENCES battles(id)
+            )
+        ''')
+
         # Agent statistics table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS agent_stats (
@@ -154,18 +284,173 @@ def init_database():
             )
         ''')
 
+        # Statistics rollups (maintained by BattleRepository writes)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_totals (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                battles INTEGER DEFAULT 0,
+                sum_creator INTEGER DEFAULT 0,
+                sum_opponent INTEGER DEFAULT 0,
+                max_creator INTEGER DEFAULT 0,
+                max_opponent INTEGER DEFAULT 0,
+                sum_margin INTEGER DEFAULT 0,
+                close_battles INTEGER DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_winners (
+                winner TEXT PRIMARY KEY,
+                count INTEGER DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_battle_types (
+                battle_type TEXT PRIMARY KEY,
+                count INTEGER DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_score_buckets (
+                side TEXT,
+                bucket TEXT,
+                count INTEGER DEFAULT 0,
+                PRIMARY KEY (side, bucket)
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_daily (
+                date TEXT PRIMARY KEY,
+                count INTEGER DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_agents (
+                agent_name TEXT,
+                agent_type TEXT,
+                battles INTEGER DEFAULT 0,
+                total_points INTEGER DEFAULT 0,
+                total_gifts INTEGER DEFAULT 0,
+                total_spent INTEGER DEFAULT 0,
+                sum_efficiency REAL DEFAULT 0,
+                PRIMARY KEY (agent_name, agent_type)
+            )
+        ''')
+
         # Create indexes
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_battles_started ON battles(started_at)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_battle ON battle_events(battle_id)')
+        cursor.execute('DROP INDEX IF EXISTS idx_events_battle')  # Superseded by idx_events_battle_time
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_battle_time ON battle_events(battle_id, timestamp)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_stats_battle ON agent_stats(battle_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_leaderboard_agents_points ON leaderboard_agents(total_points DESC)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_leaderboard_gifters_coins ON leaderboard_gifters(total_coins DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_stats_agents_points ON stats_agents(total_points DESC)')
+
+        # Backfill rollups the first time they exist for this database
+        cursor.execute('SELECT 1 FROM stats_totals WHERE id = 1')
+        if cursor.fetchone() is None:
+            _rebuild_statistics(cursor)
+
+
+def score_bucket(score: int) -> str:
+    """Histogram bucket label for a final score."""
+    for upper, label in SCORE_BUCKETS:
+        if upper is None or score < upper:
+            return label
+    return SCORE_BUCKETS[-1][1]
+
+
+def _rollup_battle(cursor, battle_type: str, creator_score: int, opponent_score: int,
+                   winner: Optional[str]):
+    """Add one finished battle to the statistics rollups."""
+    margin = abs(creator_score - opponent_score)
+    close = 1 if margin < (creator_score + opponent_score) * 0.1 else 0
+    cursor.execute('''
+        UPDATE stats_totals
+        SET battles = battles + 1,
+            sum_creator = sum_creator + ?,
+            sum_opponent = sum_opponent + ?,
+            max_creator = MAX(max_creator, ?),
+            max_opponent = MAX(max_opponent, ?),
+            sum_margin = sum_margin + ?,
+            close_battles = close_battles + ?
+        WHERE id = 1
+    ''', (creator_score, opponent_score, creator_score, opponent_score, margin, close))
+
+    if winner is not None:
+        cursor.execute('''
+            INSERT INTO stats_winners (winner, count) VALUES (?, 1)
+            ON CONFLICT(winner) DO UPDATE SET count = count + 1
+        ''', (winner,))
+    cursor.execute('''
+        INSERT INTO stats_battle_types (battle_type, count) VALUES (?, 1)
+        ON CONFLICT(battle_type) DO UPDATE SET count = count + 1
+    ''', (battle_type,))
+    cursor.executemany('''
+        INSERT INTO stats_score_buckets (side, bucket, count) VALUES (?, ?, 1)
+        ON CONFLICT(side, bucket) DO UPDATE SET count = count + 1
+    ''', [('creator', score_bucket(creator_score)), ('opponent', score_bucket(opponent_score))])
+
+
+def _rollup_agent(cursor, agent_name: str, agent_type: str, total_points: int,
+                  total_gifts: int, total_spent: int, efficiency: float):
+    """Add one agent_stats row to the per-agent rollup."""
+    cursor.execute('''
+        INSERT INTO stats_agents
+        (agent_name, agent_type, battles, total_points, total_gifts, total_spent, sum_efficiency)
+        VALUES (?, ?, 1, ?, ?, ?, ?)
+        ON CONFLICT(agent_name, agent_type) DO UPDATE SET
+            battles = battles + 1,
+            total_points = total_points + excluded.total_points,
+            total_gifts = total_gifts + excluded.total_gifts,
+            total_spent = total_spent + excluded.total_spent,
+            sum_efficiency = sum_efficiency + excluded.sum_efficiency
+    ''', (agent_name, agent_type, total_points, total_gifts, total_spent, efficiency))
+
+
+def _rebuild_battle_rollups(cursor):
+    """Recompute the per-battle rollups from the battles table."""
+    for table in ('stats_totals', 'stats_winners', 'stats_battle_types', 'stats_score_buckets'):
+        cursor.execute(f'DELETE FROM {table}')
+    cursor.execute('INSERT INTO stats_totals (id) VALUES (1)')
+
+    cursor.execute('''
+        SELECT battle_type, creator_score, opponent_score, winner
+        FROM battles
+        WHERE ended_at IS NOT NULL
+    ''')
+    for row in cursor.fetchall():
+        _rollup_battle(cursor, row['battle_type'], row['creator_score'] or 0,
+                       row['opponent_score'] or 0, row['winner'])
+
+
+def _rebuild_statistics(cursor):
+    """Recompute every statistics rollup from battles and agent_stats."""
+    _rebuild_battle_rollups(cursor)
+
+    cursor.execute('DELETE FROM stats_daily')
+    cursor.execute('''
+        INSERT INTO stats_daily (date, count)
+        SELECT DATE(started_at), COUNT(*)
+        FROM battles
+        GROUP BY DATE(started_at)
+    ''')
+
+    cursor.execute('DELETE FROM stats_agents')
+    cursor.execute('''
+        INSERT INTO stats_agents
+        (agent_name, agent_type, battles, total_points, total_gifts, total_spent, sum_efficiency)
+        SELECT agent_name, agent_type, COUNT(*), SUM(total_points), SUM(total_gifts),
+               SUM(total_spent), SUM(efficiency)
+        FROM agent_stats
+        GROUP BY agent_name, agent_type
+    ''')
 
 
 class BattleRepository:
     """Repository for battle data operations."""
 
     @staticmethod
+    @_notifies('battles')
     def create_battle(battle_id: str, duration: int, battle_type: str = 'standard',
                       config: Optional[Dict] = None) -> str:
         """Create a new battle record."""
@@ -175,14 +460,23 @@ class BattleRepository:
                 INSERT INTO battles (id, duration, battle_type, config)
                 VALUES (?, ?, ?, ?)
             ''', (battle_id, duration, battle_type, json.dumps(config or {})))
+            cursor.execute('''
+                INSERT INTO stats_daily (date, count)
+                SELECT DATE(started_at), 1 FROM battles WHERE id = ?
+                ON CONFLICT(date) DO UPDATE SET count = count + 1
+            ''', (battle_id,))
         return battle_id
 
     @staticmethod
+    @_notifies('battles')
     def end_battle(battle_id: str, creator_score: int, opponent_score: int,
                    winner: str, analytics: Optional[Dict] = None):
-        """Update battle with final results."""
+        """Update battle with final results (and the statistics rollups)."""
         with get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute('SELECT ended_at, battle_type FROM battles WHERE id = ?', (battle_id,))
+            previous = cursor.fetchone()
+
             cursor.execute('''
                 UPDATE battles
                 SET ended_at = ?, creator_score = ?, opponent_score = ?,
@@ -191,6 +485,15 @@ class BattleRepository:
             ''', (datetime.now(), creator_score, opponent_score, winner,
                   json.dumps(analytics or {}), battle_id))
 
+            if previous is None:
+                return
+            if previous['ended_at'] is not None:
+                # Results changed for an already counted battle
+                _rebuild_battle_rollups(cursor)
+            else:
+                _rollup_battle(cursor, previous['battle_type'], creator_score or 0,
+                               opponent_score or 0, winner)
+
     @staticmethod
     def add_event(battle_id: str, timestamp: float, event_type: str, data: Dict):
         """Add an event to battle history."""
@@ -202,6 +505,7 @@ class BattleRepository:
             ''', (battle_id, timestamp, event_type, json.dumps(data)))
 
     @staticmethod
+    @_notifies('battles')
     def add_agent_stats(battle_id: str, agent_name: str, agent_type: str,
                         total_points: int, total_gifts: int, total_spent: int,
                         efficiency: float):
@@ -214,6 +518,8 @@ class BattleRepository:
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (battle_id, agent_name, agent_type, total_points, total_gifts,
                   total_spent, efficiency))
+            _rollup_agent(cursor, agent_name, agent_type, total_points, total_gifts,
+                          total_spent, efficiency)
 
     @staticmethod
     def get_battle(battle_id: str) -> Optional[Dict]:
@@ -264,42 +570,30 @@ class BattleRepository:
                 battles.append(battle)
             return battles
 
+    @staticmethod
+    def _read_rollups(cursor) -> tuple:
+        """(stats_totals row, winner counts) from the rollup tables."""
+        cursor.execute('SELECT * FROM stats_totals WHERE id = 1')
+        totals = cursor.fetchone()
+        cursor.execute('SELECT winner, count FROM stats_winners')
+        wins = {row['winner']: row['count'] for row in cursor.fetchall()}
+        return totals, wins
+
     @staticmethod
     def get_statistics() -> Dict:
         """Get overall battle statistics."""
         with get_connection() as conn:
             cursor = conn.cursor()
-
-            # Total battles
-            cursor.execute('SELECT COUNT(*) as total FROM battles WHERE ended_at IS NOT NULL')
-            total = cursor.fetchone()['total']
-
-            # Win rates
-            cursor.execute('''
-                SELECT winner, COUNT(*) as wins
-                FROM battles
-                WHERE ended_at IS NOT NULL AND winner IS NOT NULL
-                GROUP BY winner
-            ''')
-            wins = {row['winner']: row['wins'] for row in cursor.fetchall()}
-
-            # Average scores
-            cursor.execute('''
-                SELECT
-                    AVG(creator_score) as avg_creator,
-                    AVG(opponent_score) as avg_opponent
-                FROM battles
-                WHERE ended_at IS NOT NULL
-            ''')
-            avg = cursor.fetchone()
+            totals, wins = BattleRepository._read_rollups(cursor)
+            total = totals['battles']
 
             return {
                 'total_battles': total,
                 'creator_wins': wins.get('creator', 0),
                 'opponent_wins': wins.get('opponent', 0),
                 'creator_win_rate': wins.get('creator', 0) / total if total > 0 else 0,
-                'avg_creator_score': avg['avg_creator'] or 0,
-                'avg_opponent_score': avg['avg_opponent'] or 0
+                'avg_creator_score': totals['sum_creator'] / total if total > 0 else 0,
+                'avg_opponent_score': totals['sum_opponent'] / total if total > 0 else 0
             }
 
     @staticmethod
@@ -307,65 +601,26 @@ class BattleRepository:
         """Get comprehensive analytics data."""
         with get_connection() as conn:
             cursor = conn.cursor()
+            totals, wins = BattleRepository._read_rollups(cursor)
+            total = totals['battles']
 
-            # Basic stats
-            cursor.execute('SELECT COUNT(*) as total FROM battles WHERE ended_at IS NOT NULL')
-            total = cursor.fetchone()['total']
-
-            # Win distribution
-            cursor.execute('''
-                SELECT winner, COUNT(*) as wins
-                FROM battles
-                WHERE ended_at IS NOT NULL AND winner IS NOT NULL
-                GROUP BY winner
-            ''')
-            wins = {row['winner']: row['wins'] for row in cursor.fetchall()}
-
-            # Score statistics
-            cursor.execute('''
-                SELECT
-                    AVG(creator_score) as avg_creator,
-                    AVG(opponent_score) as avg_opponent,
-                    MAX(creator_score) as max_creator,
-                    MAX(opponent_score) as max_opponent,
-                    MIN(creator_score) as min_creator,
-                    MIN(opponent_score) as min_opponent,
-                    AVG(creator_score + opponent_score) as avg_total,
-                    AVG(ABS(creator_score - opponent_score)) as avg_margin
-                FROM battles
-                WHERE ended_at IS NOT NULL
-            ''')
-            scores = cursor.fetchone()
+            def avg(value):
+                return round(value / total) if total > 0 else 0
 
             # Battles per day (last 30 days)
             cursor.execute('''
-                SELECT DATE(started_at) as date, COUNT(*) as count
-                FROM battles
-                WHERE started_at >= DATE('now', '-30 days')
-                GROUP BY DATE(started_at)
+                SELECT date, count
+                FROM stats_daily
+                WHERE date >= DATE('now', '-30 days')
                 ORDER BY date
             ''')
             battles_per_day = [{'date': row['date'], 'count': row['count']}
                               for row in cursor.fetchall()]
 
-            # Battle type distribution
-            cursor.execute('''
-                SELECT battle_type, COUNT(*) as count
-                FROM battles
-                WHERE ended_at IS NOT NULL
-                GROUP BY battle_type
-            ''')
+            cursor.execute('SELECT battle_type, count FROM stats_battle_types WHERE count > 0')
             battle_types = {row['battle_type']: row['count'] for row in cursor.fetchall()}
 
-            # Close battles (margin < 10%)
-            cursor.execute('''
-                SELECT COUNT(*) as close_battles
-                FROM battles
-                WHERE ended_at IS NOT NULL
-                AND ABS(creator_score - opponent_score) <
-                    (creator_score + opponent_score) * 0.1
-            ''')
-            close_battles = cursor.fetchone()['close_battles']
+            close_battles = totals['close_battles']
 
             return {
                 'total_battles': total,
@@ -374,12 +629,12 @@ class BattleRepository:
                 'ties': wins.get('tie', 0),
                 'creator_win_rate': round(wins.get('creator', 0) / total * 100, 1) if total > 0 else 0,
                 'opponent_win_rate': round(wins.get('opponent', 0) / total * 100, 1) if total > 0 else 0,
-                'avg_creator_score': round(scores['avg_creator'] or 0),
-                'avg_opponent_score': round(scores['avg_opponent'] or 0),
-                'max_creator_score': scores['max_creator'] or 0,
-                'max_opponent_score': scores['max_opponent'] or 0,
-                'avg_total_score': round(scores['avg_total'] or 0),
-                'avg_margin': round(scores['avg_margin'] or 0),
+                'avg_creator_score': avg(totals['sum_creator']),
+                'avg_opponent_score': avg(totals['sum_opponent']),
+                'max_creator_score': totals['max_creator'] if total > 0 else 0,
+                'max_opponent_score': totals['max_opponent'] if total > 0 else 0,
+                'avg_total_score': avg(totals['sum_creator'] + totals['sum_opponent']),
+                'avg_margin': avg(totals['sum_margin']),
                 'close_battles': close_battles,
                 'close_battle_rate': round(close_battles / total * 100, 1) if total > 0 else 0,
                 'battles_per_day': battles_per_day,
@@ -395,15 +650,15 @@ class BattleRepository:
                 SELECT
                     agent_name,
                     agent_type,
-                    COUNT(*) as battles,
-                    SUM(total_points) as total_points,
-                    AVG(total_points) as avg_points,
-                    SUM(total_gifts) as total_gifts,
-                    AVG(total_gifts) as avg_gifts,
-                    SUM(total_spent) as total_spent,
-                    AVG(efficiency) as avg_efficiency
-                FROM agent_stats
-                GROUP BY agent_name, agent_type
+                    battles,
+                    total_points,
+                    CAST(total_points AS REAL) / battles as avg_points,
+                    total_gifts,
+                    CAST(total_gifts AS REAL) / battles as avg_gifts,
+                    total_spent,
+                    sum_efficiency / battles as avg_efficiency
+                FROM stats_agents
+                WHERE battles > 0
                 ORDER BY total_points DESC
             ''')
             return [dict(row) for row in cursor.fetchall()]
@@ -413,50 +668,26 @@ class BattleRepository:
         """Get score distribution for histogram."""
         with get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute('SELECT side, bucket, count FROM stats_score_buckets WHERE count > 0')
+            counts = {(row['side'], row['bucket']): row['count'] for row in cursor.fetchall()}
 
-            # Creator score distribution
-            cursor.execute('''
-                SELECT
-                    CASE
-                        WHEN creator_score < 50000 THEN '0-50K'
-                        WHEN creator_score < 100000 THEN '50K-100K'
-                        WHEN creator_score < 200000 THEN '100K-200K'
-                        WHEN creator_score < 300000 THEN '200K-300K'
-                        WHEN creator_score < 500000 THEN '300K-500K'
-                        ELSE '500K+'
-                    END as range,
-                    COUNT(*) as count
-                FROM battles
-                WHERE ended_at IS NOT NULL
-                GROUP BY range
-                ORDER BY creator_score
-            ''')
-            creator_dist = {row['range']: row['count'] for row in cursor.fetchall()}
-
-            # Opponent score distribution
-            cursor.execute('''
-                SELECT
-                    CASE
-                        WHEN opponent_score < 50000 THEN '0-50K'
-                        WHEN opponent_score < 100000 THEN '50K-100K'
-                        WHEN opponent_score < 200000 THEN '100K-200K'
-                        WHEN opponent_score < 300000 THEN '200K-300K'
-                        WHEN opponent_score < 500000 THEN '300K-500K'
-                        ELSE '500K+'
-                    END as range,
-                    COUNT(*) as count
-                FROM battles
-                WHERE ended_at IS NOT NULL
-                GROUP BY range
-            ''')
-            opponent_dist = {row['range']: row['count'] for row in cursor.fetchall()}
+            def side_dist(side):
+                return {label: counts[(side, label)] for label in SCORE_BUCKET_LABELS
+                        if (side, label) in counts}
 
             return {
-                'ranges': ['0-50K', '50K-100K', '100K-200K', '200K-300K', '300K-500K', '500K+'],
-                'creator': creator_dist,
-                'opponent': opponent_dist
+                'ranges': list(SCORE_BUCKET_LABELS),
+                'creator': side_dist('creator'),
+                'opponent': side_dist('opponent')
             }
 
+    @staticmethod
+    @_notifies('battles')
+    def rebuild_statistics():
+        """Recompute the statistics rollup tables from battles and agent_stats."""
+        with get_connection() as conn:
+            _rebuild_statistics(conn.cursor())
+
     @staticmethod
     def get_battle_timeline(battle_id: str) -> List[Dict]:
         """Get score progression over time for a battle."""
@@ -495,6 +726,7 @@ class TournamentRepository:
     """Repository for tournament data operations."""
 
     @staticmethod
+    @_notifies('tournaments')
     def create_tournament(tournament_id: str, format: str, battles_to_win: int,
                           config: Optional[Dict] = None) -> str:
         """Create a new tournament record."""
@@ -507,6 +739,7 @@ class TournamentRepository:
         return tournament_id
 
     @staticmethod
+    @_notifies('tournaments')
     def update_tournament(tournament_id: str, creator_wins: int, opponent_wins: int,
                           winner: Optional[str] = None):
         """Update tournament progress."""
@@ -526,6 +759,7 @@ class TournamentRepository:
                 ''', (creator_wins, opponent_wins, tournament_id))
 
     @staticmethod
+    @_notifies('tournaments')
     def link_battle(tournament_id: str, battle_id: str, battle_number: int):
         """Link a battle to a tournament."""
         with get_connection() as conn:
@@ -644,6 +878,26 @@ class ReplayRepository:
                 VALUES (?, ?, ?, ?)
             ''', (battle_id, timestamp, event_type, json.dumps(data)))
 
+    @staticmethod
+    def save_replay_events(rows: List[tuple], keyframes: Optional[List[tuple]] = None):
+        """
+        Save many replay events (and their keyframes) in one transaction.
+
+        Args:
+            rows: (battle_id, timestamp, event_type, data_json) tuples
+            keyframes: (battle_id, timestamp, state_json) tuples
+        """
+        with get_connection() as conn:
+            conn.executemany('''
+                INSERT INTO battle_events (battle_id, timestamp, event_type, data)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+            if keyframes:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO replay_keyframes (battle_id, timestamp, state)
+                    VALUES (?, ?, ?)
+                ''', keyframes)
+
     @staticmethod
     def get_replay_events_range(battle_id: str, start_time: float, end_time: float) -> List[Dict]:
         """Get events within a time range for seeking."""
@@ -667,57 +921,169 @@ class ReplayRepository:
             return events
 
     @staticmethod
-    def get_state_at_time(battle_id: str, target_time: float) -> Dict:
-        """Reconstruct battle state at a specific time for seeking."""
+    def save_keyframes(rows: List[tuple]):
+        """
+        Save replay keyframes.
+
+        Args:
+            rows: (battle_id, timestamp, state_json) tuples
+        """
         with get_connection() as conn:
-            cursor = conn.cursor()
+            conn.executemany('''
+                INSERT OR REPLACE INTO replay_keyframes (battle_id, timestamp, state)
+                VALUES (?, ?, ?)
+            ''', rows)
+
+    @staticmethod
+    def build_keyframes(battle_id: str, interval: float = KEYFRAME_INTERVAL) -> int:
+        """
+        (Re)build keyframes for a recorded battle from its events.
 
-            # Get all events up to target time
+        Used for battles recorded event-by-event (or before keyframes existed);
+        ReplayEventWriter writes keyframes while recording.
+
+        Returns:
+            Number of keyframes written
+        """
+        with get_connection() as conn:
+            cursor = conn.cursor()
             cursor.execute('''
                 SELECT timestamp, event_type, data
                 FROM battle_events
-                WHERE battle_id = ? AND timestamp <= ?
-                ORDER BY timestamp ASC
-            ''', (battle_id, target_time))
-
-            # Reconstruct state
-            state = {
-                'creator_score': 0,
-                'opponent_score': 0,
-                'current_phase': 'normal',
-                'multiplier': 1.0,
-                'gifts': [],
-                'power_ups_used': [],
-                'glove_active': False
-            }
+                WHERE battle_id = ?
+                ORDER BY timestamp ASC, id ASC
+            ''', (battle_id,))
 
+            builder = KeyframeBuilder(battle_id, interval)
+            rows = []
             for row in cursor.fetchall():
-                event_type = row['event_type']
                 data = json.loads(row['data']) if row['data'] else {}
+                rows.extend(builder.add(row['timestamp'], row['event_type'], data))
 
-                if event_type == 'gift_sent':
-                    if data.get('team') == 'creator':
-                        state['creator_score'] += data.get('points', 0)
-                    else:
-                        state['opponent_score'] += data.get('points', 0)
-                    state['gifts'].append(data)
+            conn.execute('DELETE FROM replay_keyframes WHERE battle_id = ?', (battle_id,))
+            conn.executemany('''
+                INSERT INTO replay_keyframes (battle_id, timestamp, state)
+                VALUES (?, ?, ?)
+            ''', rows)
+            return len(rows)
 
-                elif event_type == 'phase_change':
-                    state['current_phase'] = data.get('phase', 'normal')
-                    state['multiplier'] = data.get('multiplier', 1.0)
+    @staticmethod
+    def get_state_at_time(battle_id: str, target_time: float) -> Dict:
+        """
+        Reconstruct battle state at a specific time for seeking.
+
+        Starts from the nearest keyframe at or before target_time and applies
+        only the events after it. `gifts` lists the gifts since that keyframe;
+        `gift_count` is the total.
+        """
+        with get_connection() as conn:
+            cursor = conn.cursor()
 
-                elif event_type == 'power_up':
-                    state['power_ups_used'].append(data)
+            cursor.execute('''
+                SELECT timestamp, state
+                FROM replay_keyframes
+                WHERE battle_id = ? AND timestamp <= ?
+                ORDER BY timestamp DESC
+                LIMIT 1
+            ''', (battle_id, target_time))
+            keyframe = cursor.fetchone()
 
-                elif event_type == 'glove_activated':
-                    state['glove_active'] = True
+            if keyframe:
+                state = json.loads(keyframe['state'])
+                cursor.execute('''
+                    SELECT timestamp, event_type, data
+                    FROM battle_events
+                    WHERE battle_id = ? AND timestamp > ? AND timestamp <= ?
+                    ORDER BY timestamp ASC, id ASC
+                ''', (battle_id, keyframe['timestamp'], target_time))
+            else:
+                state = new_replay_state()
+                cursor.execute('''
+                    SELECT timestamp, event_type, data
+                    FROM battle_events
+                    WHERE battle_id = ? AND timestamp <= ?
+                    ORDER BY timestamp ASC, id ASC
+                ''', (battle_id, target_time))
 
-                elif event_type == 'glove_ended':
-                    state['glove_active'] = False
+            state['gifts'] = []
+            for row in cursor.fetchall():
+                data = json.loads(row['data']) if row['data'] else {}
+                apply_replay_event(state, row['event_type'], data)
+                if row['event_type'] == 'gift_sent':
+                    state['gifts'].append(data)
 
             return state
 
 
+def new_replay_state() -> Dict:
+    """Replay state at t=0 (without the per-seek `gifts` list)."""
+    return {
+        'creator_score': 0,
+        'opponent_score': 0,
+        'current_phase': 'normal',
+        'multiplier': 1.0,
+        'gift_count': 0,
+        'power_ups_used': [],
+        'glove_active': False
+    }
+
+
+def apply_replay_event(state: Dict, event_type: str, data: Dict):
+    """Apply one stored replay event to a replay state in place."""
+    if event_type == 'gift_sent':
+        if data.get('team') == 'creator':
+            state['creator_score'] += data.get('points', 0)
+        else:
+            state['opponent_score'] += data.get('points', 0)
+        state['gift_count'] += 1
+
+    elif event_type == 'phase_change':
+        state['current_phase'] = data.get('phase', 'normal')
+        state['multiplier'] = data.get('multiplier', 1.0)
+
+    elif event_type == 'power_up':
+        state['power_ups_used'].append(data)
+
+    elif event_type == 'glove_activated':
+        state['glove_active'] = True
+
+    elif event_type == 'glove_ended':
+        state['glove_active'] = False
+
+
+class KeyframeBuilder:
+    """
+    Folds time-ordered replay events into periodic keyframes.
+
+    A keyframe at time t holds the state after every event with
+    timestamp <= t. One is emitted before the first event that is at least
+    `interval` seconds after the previous keyframe.
+    """
+
+    def __init__(self, battle_id: str, interval: float = KEYFRAME_INTERVAL):
+        self.battle_id = battle_id
+        self.interval = interval
+        self.state = new_replay_state()
+        self.last_keyframe = 0.0
+        self.last_timestamp: Optional[float] = None
+
+    def add(self, timestamp: float, event_type: str, data: Dict) -> List[tuple]:
+        """
+        Apply one event.
+
+        Returns:
+            Keyframe rows (battle_id, timestamp, state_json) due before it
+        """
+        rows = []
+        if (self.last_timestamp is not None and timestamp > self.last_timestamp
+                and timestamp - self.last_keyframe >= self.interval):
+            rows.append((self.battle_id, self.last_timestamp, json.dumps(self.state)))
+            self.last_keyframe = self.last_timestamp
+        apply_replay_event(self.state, event_type, data)
+        self.last_timestamp = timestamp
+        return rows
+
+
 class LeaderboardRepository:
     """Repository for leaderboard data operations."""
 
@@ -756,6 +1122,7 @@ class LeaderboardRepository:
             return [dict(row) for row in cursor.fetchall()]
 
     @staticmethod
+    @_notifies('leaderboard')
     def update_agent_stats(agent_name: str, agent_type: str, points: int,
                            gifts: int, spent: int, won: bool):
         """Update agent leaderboard stats after a battle."""
@@ -795,6 +1162,7 @@ class LeaderboardRepository:
                       points, points, datetime.now()))
 
     @staticmethod
+    @_notifies('leaderboard')
     def update_gifter_stats(username: str, gift_name: str, coins: int):
         """Update gifter leaderboard stats after a gift."""
         with get_connection() as conn:
@@ -824,6 +1192,7 @@ class LeaderboardRepository:
                 ''', (username, coins, gift_name, datetime.now()))
 
     @staticmethod
+    @_notifies('leaderboard')
     def increment_gifter_battles(username: str):
         """Increment battle count for a gifter."""
         with get_connection() as conn:
@@ -918,3 +1287,19 @@ class LeaderboardRepository:
 
 # Initialize database on module import
 init_database()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Battle database maintenance")
+    parser.add_argument('--rebuild-stats', action='store_true',
+                        help="Recompute the analytics rollup tables from battle history")
+    args = parser.parse_args()
+
+    if args.rebuild_stats:
+        BattleRepository.rebuild_statistics()
+        print(f"📊 Rebuilt statistics for {BattleRepository.get_statistics()['total_battles']} battles "
+              f"in {get_db_path()}")
+    else:
+        parser.print_help()
@@ -5,9 +5,14 @@ This enables loose coupling between battle engine, agents, UI, analytics, etc.
 Components subscribe to events they care about without knowing about each other.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from enum import Enum, auto
+import asyncio
+import heapq
+import queue
+import sys
+import threading
 import time
 
 
@@ -46,26 +51,81 @@ class EventType(Enum):
     DEBUG_MESSAGE = auto()
 
 
-@dataclass
+# Field layouts for hot event types published with EventBus.publish_fields().
+# Their payload is kept as a tuple and only turned into a dict on first access.
+EVENT_SCHEMAS: Dict[EventType, Tuple[str, ...]] = {
+    EventType.BATTLE_TICK: ("time", "phase", "time_remaining"),
+    EventType.GIFT_SENT: ("agent", "gift", "points", "emotion"),
+}
+
+
 class BattleEvent:
     """
     Immutable event object containing all event data.
 
+    Slotted to keep per-event memory small; events built with from_fields()
+    materialize their `data` dict lazily.
+
     Attributes:
         event_type: The type of event
         timestamp: When the event occurred (battle time in seconds)
         data: Event-specific data dictionary
         source: Who/what generated this event
     """
-    event_type: EventType
-    timestamp: float
-    data: Dict[str, Any] = field(default_factory=dict)
-    source: str = "system"
+
+    __slots__ = ("event_type", "timestamp", "source", "_data", "_fields", "_values")
+
+    def __init__(self, event_type: EventType, timestamp: float,
+                 data: Optional[Dict[str, Any]] = None, source: str = "system"):
+        self.event_type = event_type
+        self.timestamp = timestamp
+        self.source = source
+        self._data = {} if data is None else data
+        self._fields: Optional[Tuple[str, ...]] = None
+        self._values: Optional[tuple] = None
+
+    @classmethod
+    def from_fields(cls, event_type: EventType, timestamp: float, fields: Tuple[str, ...],
+                    values: tuple, source: str = "system") -> 'BattleEvent':
+        """Create an event whose data dict is built from (fields, values) on first access."""
+        event = cls.__new__(cls)
+        event.event_type = event_type
+        event.timestamp = timestamp
+        event.source = source
+        event._data = None
+        event._fields = fields
+        event._values = values
+        return event
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = dict(zip(self._fields, self._values))
+            self._fields = self._values = None
+        return self._data
+
+    def __eq__(self, other):
+        if not isinstance(other, BattleEvent):
+            return NotImplemented
+        return (self.event_type == other.event_type and self.timestamp == other.timestamp
+                and self.source == other.source and self.data == other.data)
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return (self.event_type, self.timestamp, self.data, self.source)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
 
     def __repr__(self):
         return f"BattleEvent({self.event_type.name}, t={self.timestamp:.1f}s, source={self.source})"
 
 
+class _StopDispatch(Exception):
+    """Internal signal that stops the dispatch worker thread."""
+
+
 class EventBus:
     """
     Central event bus using the Observer pattern.
@@ -83,37 +143,115 @@ class EventBus:
 
         bus.subscribe(EventType.GIFT_SENT, on_gift)
         bus.publish(EventType.GIFT_SENT, {"amount": 100}, source="NovaWhale")
+
+    History retention is configurable: a global ring buffer (history_limit),
+    per-type caps (type_limits) or no history at all (keep_history=False).
+
+    Dispatch is synchronous by default. With dispatch="thread" (worker thread)
+    or dispatch="manual" (drained by flush() or the run_async() task), publish
+    only queues the event; subscribers registered with inline=True still run
+    inside publish. Subscribers registered with batch=True receive a list of
+    events per drain instead of one call per event.
     """
 
-    def __init__(self, debug=False):
+    DISPATCH_MODES = ("sync", "thread", "manual")
+
+    def __init__(self, debug=False, clock: Callable[[], float] = time.time,
+                 history_limit: Optional[int] = None,
+                 type_limits: Optional[Dict[EventType, int]] = None,
+                 keep_history: bool = True,
+                 dispatch: str = "sync",
+                 track_latency: Optional[bool] = None):
+        """
+        Args:
+            debug: Print subscribe/publish activity
+            clock: Source for timestamps of events published without one
+                   (wall clock by default; headless engines pass battle time)
+            history_limit: Keep at most this many events overall, dropping the
+                           oldest first (None = unbounded)
+            type_limits: Per-EventType caps, e.g. {EventType.BATTLE_TICK: 60}
+            keep_history: Set False to record no history at all (stats are
+                          still counted)
+            dispatch: "sync" (handlers run inside publish), "thread" (queued,
+                      drained by a worker thread) or "manual" (queued, drained
+                      by flush() / run_async())
+            track_latency: Record per-handler latency (default: on for queued
+                           dispatch, off for sync)
+        """
+        if dispatch not in self.DISPATCH_MODES:
+            raise ValueError(f"Unknown dispatch mode: {dispatch}")
+
         self._subscribers: Dict[EventType, List[Callable]] = {}
-        self._event_history: List[BattleEvent] = []
         self._debug = debug
-
-    def subscribe(self, event_type: EventType, handler: Callable[[BattleEvent], None]):
+        self.clock = clock
+
+        # Queued dispatch
+        self.dispatch = dispatch
+        self.track_latency = (dispatch != "sync") if track_latency is None else track_latency
+        self._deferred: Dict[EventType, List[Callable]] = {}
+        self._batched: set = set()
+        self._handler_stats: Dict[Callable, Dict[str, float]] = {}
+        self._queue: "queue.Queue[Optional[BattleEvent]]" = queue.Queue()
+        self._drain_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        if dispatch == "thread":
+            self._worker = threading.Thread(target=self._worker_loop, name="EventBusDispatch", daemon=True)
+            self._worker.start()
+
+        # Retention policy
+        self.history_limit = history_limit
+        self.type_limits: Dict[EventType, int] = dict(type_limits or {})
+        self.keep_history = keep_history
+
+        # History is stored as one append-only (seq, event) deque per type, so
+        # filtered queries only touch matching events. The unfiltered view is
+        # a merge on the publish sequence number.
+        self._seq = 0
+        self._type_index: Dict[EventType, Deque[Tuple[int, BattleEvent]]] = {}
+        self._history_size = 0
+        self._order: Deque[Tuple[int, EventType]] = deque()  # Only used with history_limit
+
+        # Incremental statistics (count every published event, even evicted ones)
+        self._stats: Dict[str, int] = {}
+        self._published = 0
+        self._evicted = 0
+
+    def subscribe(self, event_type: EventType, handler: Callable[[BattleEvent], None],
+                  inline: bool = False, batch: bool = False):
         """
         Subscribe to a specific event type.
 
         Args:
             event_type: The type of event to listen for
-            handler: Function to call when event occurs. Receives BattleEvent as argument.
+            handler: Function to call when event occurs. Receives BattleEvent as argument
+                     (or a list of BattleEvents when batch=True).
+            inline: Always run inside publish, even in queued dispatch modes
+                    (for handlers the publisher depends on, like score updates)
+            batch: Deliver a list of events per drain instead of one call per event
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(handler)
+        deferred = self.dispatch != "sync" and not inline
+        subscribers = self._deferred if deferred else self._subscribers
+
+        if event_type not in subscribers:
+            subscribers[event_type] = []
+        subscribers[event_type].append(handler)
+        if batch:
+            self._batched.add(handler)
 
         if self._debug:
             print(f"[EventBus] Subscribed {handler.__name__} to {event_type.name}")
 
     def unsubscribe(self, event_type: EventType, handler: Callable):
         """Unsubscribe a handler from an event type."""
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(handler)
-                if self._debug:
-                    print(f"[EventBus] Unsubscribed {handler.__name__} from {event_type.name}")
-            except ValueError:
-                pass
+        for subscribers in (self._subscribers, self._deferred):
+            if event_type in subscribers:
+                try:
+                    subscribers[event_type].remove(handler)
+                    if self._debug:
+                        print(f"[EventBus] Unsubscribed {handler.__name__} from {event_type.name}")
+                    return
+                except ValueError:
+                    pass
 
     def publish(self, event_type: EventType, data: Dict[str, Any] = None,
                 source: str = "system", timestamp: float = None):
@@ -127,44 +265,251 @@ class EventBus:
             timestamp: Event time (auto-generated if not provided)
         """
         if timestamp is None:
-            timestamp = time.time()
+            timestamp = self.clock()
+
+        event = BattleEvent(event_type, timestamp, data or {}, sys.intern(source))
+        self._dispatch(event)
+
+    def publish_fields(self, event_type: EventType, values: tuple,
+                       source: str = "system", timestamp: float = None):
+        """
+        Publish a hot-path event without building its data dict.
+
+        The values follow the field order in EVENT_SCHEMAS[event_type]; the
+        dict is only built if a subscriber or history reader touches `data`.
+
+        Args:
+            event_type: Type of event (must have an EVENT_SCHEMAS entry)
+            values: Payload values in schema order
+            source: Who generated this event
+            timestamp: Event time (auto-generated if not provided)
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+
+        event = BattleEvent.from_fields(event_type, timestamp, EVENT_SCHEMAS[event_type],
+                                        values, sys.intern(source))
+        self._dispatch(event)
 
-        event = BattleEvent(
-            event_type=event_type,
-            timestamp=timestamp,
-            data=data or {},
-            source=source
-        )
+    def _dispatch(self, event: BattleEvent):
+        """Record an event and hand it to subscribers."""
+        event_type = event.event_type
 
-        # Store in history
-        self._event_history.append(event)
+        self._published += 1
+        self._stats[event_type.name] = self._stats.get(event_type.name, 0) + 1
+        if self.keep_history:
+            self._record(event)
 
-        # Notify all subscribers
+        # Notify inline subscribers
         if event_type in self._subscribers:
             for handler in self._subscribers[event_type]:
-                try:
-                    handler(event)
-                except Exception as e:
-                    print(f"[EventBus] Error in handler {handler.__name__}: {e}")
+                if handler in self._batched:
+                    self._call(handler, [event], 1)
+                else:
+                    self._call(handler, event, 1)
+
+        # Queue for deferred subscribers
+        if self._deferred.get(event_type):
+            self._queue.put(event)
 
         if self._debug:
             print(f"[EventBus] Published: {event}")
 
+    def _call(self, handler: Callable, payload: Any, count: int):
+        """Invoke one handler, recording latency and errors."""
+        if not self.track_latency:
+            try:
+                handler(payload)
+            except Exception as e:
+                print(f"[EventBus] Error in handler {handler.__name__}: {e}")
+            return
+
+        stats = self._handler_stats.get(handler)
+        if stats is None:
+            stats = self._handler_stats[handler] = {
+                "calls": 0, "events": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0
+            }
+
+        start = time.perf_counter()
+        try:
+            handler(payload)
+        except Exception as e:
+            stats["errors"] += 1
+            print(f"[EventBus] Error in handler {handler.__name__}: {e}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        stats["calls"] += 1
+        stats["events"] += count
+        stats["total_ms"] += elapsed_ms
+        if elapsed_ms > stats["max_ms"]:
+            stats["max_ms"] = elapsed_ms
+
+    def _drain(self, block: bool = False) -> int:
+        """
+        Deliver queued events to deferred subscribers.
+
+        Events are drained in publish order by one caller at a time, so each
+        subscriber sees its events in order.
+
+        Returns:
+            Number of events delivered
+        """
+        with self._drain_lock:
+            events = []
+            try:
+                if block:
+                    events.append(self._queue.get())
+                while True:
+                    events.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            stop = None in events
+            events = [e for e in events if e is not None]
+
+            try:
+                if events:
+                    self._deliver(events)
+            finally:
+                for _ in range(len(events) + (1 if stop else 0)):
+                    self._queue.task_done()
+
+        if stop:
+            raise _StopDispatch
+        return len(events)
+
+    def _deliver(self, events: List[BattleEvent]):
+        """Fan a drained batch out to deferred subscribers."""
+        by_handler: Dict[Callable, List[BattleEvent]] = {}
+        for event in events:
+            for handler in self._deferred.get(event.event_type, ()):
+                by_handler.setdefault(handler, []).append(event)
+
+        for handler, handler_events in by_handler.items():
+            if handler in self._batched:
+                self._call(handler, handler_events, len(handler_events))
+            else:
+                for event in handler_events:
+                    self._call(handler, event, 1)
+
+    def _worker_loop(self):
+        """Worker thread body for dispatch="thread"."""
+        while True:
+            try:
+                self._drain(block=True)
+            except _StopDispatch:
+                return
+
+    def flush(self):
+        """
+        Block until every queued event has been delivered.
+
+        In manual mode the events are delivered on the calling thread; in
+        thread mode this waits for the worker. No-op for sync dispatch.
+        """
+        if self.dispatch == "manual":
+            self._drain()
+        elif self.dispatch == "thread":
+            self._queue.join()
+
+    async def run_async(self, interval: float = 0.05):
+        """
+        Drain queued events from an asyncio task (dispatch="manual").
+
+        Example:
+            task = asyncio.create_task(bus.run_async())
+        """
+        while True:
+            self._drain()
+            await asyncio.sleep(interval)
+
+    def close(self):
+        """Deliver pending events and stop the dispatch worker thread."""
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join()
+        self._worker = None
+        self._drain()
+
+    @property
+    def pending_events(self) -> int:
+        """Number of events waiting for queued dispatch."""
+        return self._queue.qsize()
+
+    def get_handler_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-handler latency statistics (requires track_latency).
+
+        Returns:
+            Dict of handler name -> calls, events, errors, avg_ms, max_ms
+        """
+        report = {}
+        for handler, stats in self._handler_stats.items():
+            name = getattr(handler, "__qualname__", None) or repr(handler)
+            report[name] = {
+                "calls": stats["calls"],
+                "events": stats["events"],
+                "errors": stats["errors"],
+                "avg_ms": stats["total_ms"] / stats["calls"] if stats["calls"] else 0.0,
+                "max_ms": stats["max_ms"],
+            }
+        return report
+
+    def _record(self, event: BattleEvent):
+        """Store an event in history, enforcing the retention policy."""
+        self._seq += 1
+        event_type = event.event_type
+
+        index = self._type_index.get(event_type)
+        if index is None:
+            index = self._type_index[event_type] = deque(maxlen=self.type_limits.get(event_type))
+
+        if index.maxlen is not None and len(index) == index.maxlen:
+            self._history_size -= 1
+            self._evicted += 1
+        index.append((self._seq, event))
+        self._history_size += 1
+
+        if self.history_limit is not None:
+            self._order.append((self._seq, event_type))
+            self._enforce_history_limit()
+
+    def _enforce_history_limit(self):
+        """Drop the oldest events until the history fits history_limit."""
+        order = self._order
+        while self._history_size > self.history_limit:
+            seq, event_type = order.popleft()
+            index = self._type_index[event_type]
+            # Entries already dropped by a per-type cap are stale; skip them
+            if index and index[0][0] == seq:
+                index.popleft()
+                self._history_size -= 1
+                self._evicted += 1
+
+        # Per-type caps leave stale entries behind; compact occasionally
+        if len(order) > 2 * self.history_limit + 64:
+            live = {seq for index in self._type_index.values() for seq, _ in index}
+            self._order = deque(entry for entry in order if entry[0] in live)
+
     def get_history(self, event_type: EventType = None, since: float = None) -> List[BattleEvent]:
         """
-        Get event history, optionally filtered.
+        Get retained event history, optionally filtered.
+
+        Filtering by type only touches events of that type.
 
         Args:
             event_type: Filter by specific event type
             since: Only return events after this timestamp
 
         Returns:
-            List of matching events
+            List of matching events in publish order
         """
-        events = self._event_history
-
         if event_type:
-            events = [e for e in events if e.event_type == event_type]
+            events = [e for _, e in self._type_index.get(event_type, ())]
+        elif len(self._type_index) == 1:
+            events = [e for _, e in next(iter(self._type_index.values()))]
+        else:
+            events = [e for _, e in heapq.merge(*self._type_index.values(), key=lambda entry: entry[0])]
 
         if since is not None:
             events = [e for e in events if e.timestamp >= since]
@@ -172,13 +517,29 @@ class EventBus:
         return events
 
     def clear_history(self):
-        """Clear all event history (useful between battles)."""
-        self._event_history.clear()
+        """Clear all event history and statistics (useful between battles)."""
+        self._type_index.clear()
+        self._order.clear()
+        self._history_size = 0
+        self._stats.clear()
+        self._published = 0
+        self._evicted = 0
+
+    @property
+    def published_count(self) -> int:
+        """Number of events published since the last clear (including evicted ones)."""
+        return self._published
+
+    def get_retention_stats(self) -> Dict[str, Any]:
+        """Get history size and eviction counters for the retention policy."""
+        return {
+            "retained": self._history_size,
+            "published": self._published,
+            "evicted": self._evicted,
+            "history_limit": self.history_limit,
+            "keep_history": self.keep_history,
+        }
 
     def get_stats(self) -> Dict[str, int]:
-        """Get statistics about events published."""
-        stats = {}
-        for event in self._event_history:
-            event_name = event.event_type.name
-            stats[event_name] = stats.get(event_name, 0) + 1
-        return stats
+        """Get statistics about events published (counts by event type)."""
+        return dict(self._stats)
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from core.gift_index import GiftIndex
+
 
 @dataclass
 class Gift:
@@ -45,6 +47,7 @@ class GiftCatalog:
         self.gifts_by_name: Dict[str, Gift] = {}
 
         self._load_catalog()
+        self.index: GiftIndex[Gift] = GiftIndex(self.gifts)
 
     def _load_catalog(self):
         """Load gifts from JSON file."""
@@ -85,7 +88,7 @@ class GiftCatalog:
 
     def get_gifts_in_budget(self, max_coins: int, min_coins: int = 0) -> List[Gift]:
         """Get all gifts within a budget range."""
-        return [g for g in self.gifts if min_coins <= g.coins <= max_coins]
+        return list(self.index.in_range(min_coins, max_coins))
 
     def get_budget_gifts(self) -> List[Gift]:
         """Get budget tier gifts (1-99 coins)."""
@@ -110,19 +113,17 @@ class GiftCatalog:
         Returns:
             Selected gift or None if no affordable gift
         """
-        affordable = self.get_gifts_in_budget(available_coins)
+        if strategy == "max":
+            return self.index.max_affordable(available_coins)
+
+        affordable = self.index.affordable(available_coins)
 
         if not affordable:
             return None
 
-        if strategy == "max":
-            return max(affordable, key=lambda g: g.coins)
-        elif strategy == "min":
-            return min(affordable, key=lambda g: g.coins)
-        elif strategy == "mid":
+        if strategy == "mid":
             # Get middle range gift
-            mid_idx = len(affordable) // 2
-            return affordable[mid_idx]
+            return affordable[len(affordable) // 2]
         else:
             return affordable[0]
 
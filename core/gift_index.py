@@ -0,0 +1,173 @@
+"""
+Gift Index - immutable, precomputed lookups over a gift catalog.
+
+Budget managers and strategy agents ask the same few questions several
+times per tick: which gifts can I afford, what is the biggest one, what is
+the cheapest gift worth N points. GiftIndex answers them with bisect over
+coin-sorted tuples that are built once per catalog (each catalog module
+keeps a module-level index):
+
+    affordable(max_coins)                 coin-sorted slice
+    in_range(min_coins, max_coins)        coin-sorted slice
+    max_affordable(max_coins)             most expensive affordable gift
+    max_points_affordable(max_coins)      highest-value affordable gift (prefix argmax)
+    cheapest_at_least(points, max_coins)  cheapest gift worth >= points (suffix argmin)
+    most_efficient(max_coins, min_points) best points-per-coin affordable gift
+
+The catalogs use different gift types (Gift, TikTokGift, GiftCost,
+GiftEfficiency, ...), so the index reads fields through accessor
+functions. Ties go to the cheaper gift, then to catalog order.
+
+Usage:
+    index = GiftIndex(GIFT_CATALOG.values(), coins=attrgetter("cost"))
+    gift = index.cheapest_at_least(5000, max_coins=budget)
+"""
+
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Generic, Iterable, Optional, Tuple, TypeVar
+
+G = TypeVar("G")
+
+
+class GiftIndex(Generic[G]):
+    """Immutable coin-sorted index over a gift catalog."""
+
+    def __init__(
+        self,
+        gifts: Iterable[G],
+        coins: Callable[[G], int] = attrgetter("coins"),
+        points: Callable[[G], int] = attrgetter("points"),
+        tier: Callable[[G], Any] = attrgetter("tier"),
+        name: Callable[[G], str] = attrgetter("name")
+    ):
+        """
+        Args:
+            gifts: Gift objects in catalog order
+            coins: Gift -> coin cost
+            points: Gift -> battle points
+            tier: Gift -> tier key (str or enum)
+            name: Gift -> display name
+        """
+        catalog = tuple(gifts)
+        self._catalog = catalog
+        self._accessors = (coins, points, tier, name)
+
+        # Coin-sorted (stable, so equal costs keep catalog order)
+        self.gifts: Tuple[G, ...] = tuple(sorted(catalog, key=coins))
+        self.coins: Tuple[int, ...] = tuple(coins(g) for g in self.gifts)
+        self.points: Tuple[int, ...] = tuple(points(g) for g in self.gifts)
+        n = len(self.gifts)
+
+        # Best points among gifts[:i + 1]
+        best = []
+        for i, value in enumerate(self.points):
+            if not best or value > self.points[best[-1]]:
+                best.append(i)
+            else:
+                best.append(best[-1])
+        self._best_points = tuple(best)
+
+        # Points-sorted positions with the cheapest gift at or after each one
+        by_points = sorted(range(n), key=self.points.__getitem__)
+        self._sorted_points = tuple(self.points[i] for i in by_points)
+        cheapest = [0] * n
+        for k in range(n - 1, -1, -1):
+            i = by_points[k]
+            cheapest[k] = i if k == n - 1 or i < cheapest[k + 1] else cheapest[k + 1]
+        self._cheapest_from = tuple(cheapest)
+
+        # Points per coin, descending (stable over catalog order)
+        self.by_efficiency: Tuple[G, ...] = tuple(
+            sorted(catalog, key=lambda g: -_efficiency(coins(g), points(g))))
+
+        tiers: Dict[Any, list] = {}
+        for gift in catalog:
+            tiers.setdefault(tier(gift), []).append(gift)
+        self.by_tier: Dict[Any, Tuple[G, ...]] = {key: tuple(members) for key, members in tiers.items()}
+
+        self.by_name: Dict[str, G] = {}
+        self._by_lower: Dict[str, G] = {}
+        for gift in catalog:
+            self.by_name.setdefault(name(gift), gift)
+            self._by_lower.setdefault(name(gift).lower(), gift)
+
+        self._subsets: Dict[FrozenSet[Any], "GiftIndex[G]"] = {}
+
+    def __len__(self) -> int:
+        return len(self.gifts)
+
+    def __iter__(self):
+        return iter(self.gifts)
+
+    # =========================================================================
+    # LOOKUPS
+    # =========================================================================
+
+    def get(self, name: str, ignore_case: bool = False) -> Optional[G]:
+        """Gift by name (first match in catalog order)."""
+        if ignore_case:
+            return self._by_lower.get(name.lower())
+        return self.by_name.get(name)
+
+    def tier(self, tier: Any) -> Tuple[G, ...]:
+        """Gifts in a tier, in catalog order."""
+        return self.by_tier.get(tier, ())
+
+    def subset(self, tiers: Iterable[Any]) -> "GiftIndex[G]":
+        """Index over the gifts in the given tiers (cached per tier set)."""
+        key = frozenset(tiers)
+        index = self._subsets.get(key)
+        if index is None:
+            coins, points, tier, name = self._accessors
+            members = [g for g in self._catalog if tier(g) in key]
+            index = self._subsets[key] = GiftIndex(members, coins, points, tier, name)
+        return index
+
+    # =========================================================================
+    # BUDGET QUERIES
+    # =========================================================================
+
+    def affordable(self, max_coins: float) -> Tuple[G, ...]:
+        """Gifts costing at most max_coins, cheapest first."""
+        return self.gifts[:bisect_right(self.coins, max_coins)]
+
+    def in_range(self, min_coins: float, max_coins: float) -> Tuple[G, ...]:
+        """Gifts costing between min_coins and max_coins (inclusive), cheapest first."""
+        return self.gifts[bisect_left(self.coins, min_coins):bisect_right(self.coins, max_coins)]
+
+    def cheapest(self, max_coins: float = float("inf")) -> Optional[G]:
+        """Cheapest gift, if it costs at most max_coins."""
+        return self.gifts[0] if self.gifts and self.coins[0] <= max_coins else None
+
+    def max_affordable(self, max_coins: float) -> Optional[G]:
+        """Most expensive gift costing at most max_coins."""
+        end = bisect_right(self.coins, max_coins)
+        if not end:
+            return None
+        return self.gifts[bisect_left(self.coins, self.coins[end - 1])]
+
+    def max_points_affordable(self, max_coins: float) -> Optional[G]:
+        """Highest-value gift costing at most max_coins."""
+        end = bisect_right(self.coins, max_coins)
+        return self.gifts[self._best_points[end - 1]] if end else None
+
+    def cheapest_at_least(self, points: float, max_coins: float = float("inf")) -> Optional[G]:
+        """Cheapest gift worth at least `points`, if it costs at most max_coins."""
+        start = bisect_left(self._sorted_points, points)
+        if start == len(self._sorted_points):
+            return None
+        i = self._cheapest_from[start]
+        return self.gifts[i] if self.coins[i] <= max_coins else None
+
+    def most_efficient(self, max_coins: float, min_points: float = 0) -> Optional[G]:
+        """Best points-per-coin gift within budget that is worth at least min_points."""
+        coins, points, _, _ = self._accessors
+        for gift in self.by_efficiency:
+            if coins(gift) <= max_coins and points(gift) >= min_points:
+                return gift
+        return None
+
+
+def _efficiency(coins: int, points: int) -> float:
+    return points / coins if coins > 0 else 0.0
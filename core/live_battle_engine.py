@@ -38,6 +38,9 @@ from core.advanced_phase_system import AdvancedPhaseManager, PowerUpType
 from core.event_bus import EventBus, EventType
 from core.tiktok_gifts_catalog import TIKTOK_GIFTS_CATALOG
 
+# Events kept in a live engine's history before the oldest are dropped
+LIVE_EVENT_HISTORY_LIMIT = 5000
+
 # Import leaderboard (optional - won't fail if not available)
 try:
     from core.database import LeaderboardRepository
@@ -129,8 +132,8 @@ class LiveBattleEngine:
         # Phase manager
         self.phase_manager = AdvancedPhaseManager(battle_duration=battle_duration)
 
-        # Event bus for dashboard integration
-        self.event_bus = EventBus()
+        # Event bus for dashboard integration (bounded: live sessions never clear it)
+        self.event_bus = EventBus(history_limit=LIVE_EVENT_HISTORY_LIMIT)
 
         # Callbacks
         self._gift_callbacks: List[Callable] = []
@@ -439,7 +442,7 @@ class LiveBattleEngine:
                 logger.error(f"End callback error: {e}")
 
         # Publish event
-        self.event_bus.publish(EventType.BATTLE_END, result)
+        self.event_bus.publish(EventType.BATTLE_ENDED, result)
 
         # Update gifter leaderboard
         if LEADERBOARD_AVAILABLE:
@@ -0,0 +1,154 @@
+"""
+Match Executor - Real-engine tournament matches across a process pool.
+
+Tournament runners hand every independent match of a round (or matchday)
+to a MatchExecutor as one batch. BattleMatchExecutor plays each side of
+each match as a seeded headless BattleEngine battle on a BattleFarm and
+returns the scores in match order, so results are recorded in the same
+order no matter which worker finishes first.
+
+A side's score is its lineup's creator score over one battle. Both sides
+of a match play a battle with the same seed (derived from the match ID)
+against the same opponent, so only the lineups differ, and a tournament
+replays exactly for the same base seed, whatever the worker count.
+
+Example:
+    lineups = {team.name: ["NovaWhale", "PixelPixie"] for team in teams}
+    with BattleMatchExecutor(lineups, base_seed=42, max_workers=8) as executor:
+        runner = DoubleEliminationRunner(tournament, executor=executor)
+        runner.run_tournament(verbose=False)
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .battle_farm import BattleFarm, BattleSpec
+
+if TYPE_CHECKING:
+    from .tournament_bracket import TournamentTeam
+
+
+@dataclass
+class MatchPairing:
+    """One match handed to an executor."""
+    match_id: int
+    team1: 'TournamentTeam'
+    team2: 'TournamentTeam'
+
+
+class MatchExecutor:
+    """
+    Plays a batch of independent tournament matches.
+
+    Subclasses override play(). Executors are context managers so that
+    pooled implementations can keep their workers across rounds.
+    """
+
+    def play(self, pairings: List[MatchPairing],
+             allow_draws: bool = False) -> List[Tuple[int, int]]:
+        """
+        Play all pairings.
+
+        Args:
+            pairings: Matches whose teams are both known
+            allow_draws: Whether equal scores may be returned
+
+        Returns:
+            (team1_score, team2_score) per pairing, in pairing order
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held across batches."""
+
+    def __enter__(self) -> 'MatchExecutor':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class BattleMatchExecutor(MatchExecutor):
+    """
+    Plays matches as headless BattleEngine battles on a BattleFarm.
+
+    Both sides of a match play the same seeded battle against the same
+    opponent spec, each fielding its team's lineup. Without draws, equal
+    scores go to the better-seeded team by one point.
+    """
+
+    def __init__(self, lineups: Dict[str, List[str]],
+                 base_seed: int = 0,
+                 opponent: Optional[Dict] = None,
+                 battle_duration: int = 300,
+                 opponent_budget: Optional[int] = None,
+                 max_workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None):
+        """
+        Args:
+            lineups: Team name -> agent names (see battle_farm.register_agent);
+                every team in the tournament needs one
+            base_seed: Seed all battle seeds are derived from
+            opponent: OpponentBuilder.to_dict() output, or None for scripted spikes
+            battle_duration: Battle length in seconds
+            opponent_budget: Opponent coin budget (None = unlimited)
+            max_workers: Worker processes (default: CPU count; 0 runs inline)
+            chunk_size: Battles per task (default: BattleFarm's)
+        """
+        self.base_seed = base_seed
+        self.lineups = lineups
+        self.opponent = opponent
+        self.battle_duration = battle_duration
+        self.opponent_budget = opponent_budget
+        self.farm = BattleFarm(max_workers=max_workers, chunk_size=chunk_size)
+
+    def __enter__(self) -> 'BattleMatchExecutor':
+        self.farm.__enter__()
+        return self
+
+    def close(self):
+        self.farm.close()
+
+    def battle_seed(self, match_id: int) -> int:
+        """Seed of both sides' battles in a match."""
+        return self.base_seed + match_id
+
+    def lineup(self, team: 'TournamentTeam') -> List[str]:
+        """Agent names fielded by a team."""
+        lineup = self.lineups.get(team.name)
+        if not lineup:
+            raise ValueError(f"No lineup for team: {team.name}")
+        return list(lineup)
+
+    def make_specs(self, pairings: List[MatchPairing]) -> List[BattleSpec]:
+        """Two specs per pairing (side 0 = team1, 1 = team2); battle_index 2*i + side."""
+        specs = []
+        for i, pairing in enumerate(pairings):
+            for side, team in enumerate((pairing.team1, pairing.team2)):
+                specs.append(BattleSpec(
+                    seed=self.battle_seed(pairing.match_id),
+                    battle_index=2 * i + side,
+                    team=self.lineup(team),
+                    opponent=self.opponent,
+                    battle_duration=self.battle_duration,
+                    opponent_budget=self.opponent_budget,
+                ))
+        return specs
+
+    def play(self, pairings: List[MatchPairing],
+             allow_draws: bool = False) -> List[Tuple[int, int]]:
+        scores = [0] * (2 * len(pairings))
+        for result in self.farm.stream(self.make_specs(pairings)):
+            final_scores = result["summary"]["battle"]["final_scores"]
+            scores[result["battle_index"]] = int(final_scores.get("creator", 0))
+
+        results = []
+        for i, pairing in enumerate(pairings):
+            t1_score, t2_score = scores[2 * i], scores[2 * i + 1]
+            if t1_score == t2_score and not allow_draws:
+                if pairing.team1.seed <= pairing.team2.seed:
+                    t1_score += 1
+                else:
+                    t2_score += 1
+            results.append((t1_score, t2_score))
+        return results
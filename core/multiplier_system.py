@@ -12,6 +12,8 @@ from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 import random
 
+from .sliding_window import SlidingWindow
+
 
 class MultiplierType(Enum):
     """Types of multipliers available."""
@@ -49,37 +51,28 @@ class ThresholdTracker:
     Monitors:
     - Rose count in sliding 15s window
     - Total points in sliding 15s window
+
+    Counts are kept incrementally in a SlidingWindow, so recording a gift and
+    checking the window are O(1) amortized (query times must not go backwards).
     """
 
     def __init__(self):
-        self.activity_log: List[Dict[str, Any]] = []
         self.window_duration = 15  # 15 second window
+        self.window = SlidingWindow(self.window_duration)
 
     def record_gift(self, time: int, gift_name: str, points: int):
         """Record a gift for threshold tracking."""
-        self.activity_log.append({
-            "time": time,
-            "gift": gift_name,
-            "points": points,
-            "is_rose": gift_name.lower() == "rose"
-        })
+        self.window.add(time, points, flagged=gift_name.lower() == "rose")
 
     def get_activity_in_window(self, current_time: int) -> Dict[str, Any]:
         """Get activity within the last 15 seconds."""
         window_start = max(0, current_time - self.window_duration)
-
-        recent_activity = [
-            act for act in self.activity_log
-            if window_start <= act["time"] <= current_time
-        ]
-
-        rose_count = sum(1 for act in recent_activity if act["is_rose"])
-        total_points = sum(act["points"] for act in recent_activity)
+        self.window.evict(current_time)
 
         return {
-            "rose_count": rose_count,
-            "total_points": total_points,
-            "gift_count": len(recent_activity),
+            "rose_count": self.window.flagged_count,
+            "total_points": self.window.total,
+            "gift_count": self.window.count,
             "window_start": window_start,
             "window_end": current_time,
         }
@@ -93,10 +86,10 @@ class ThresholdTracker:
         - 5+ roses in last 15s, OR
         - 1000+ points in last 15s
         """
-        activity = self.get_activity_in_window(current_time)
+        self.window.evict(current_time)
 
-        rose_threshold_met = activity["rose_count"] >= rose_threshold
-        point_threshold_met = activity["total_points"] >= point_threshold
+        rose_threshold_met = self.window.flagged_count >= rose_threshold
+        point_threshold_met = self.window.total >= point_threshold
 
         return rose_threshold_met or point_threshold_met
 
@@ -112,16 +105,18 @@ class MultiplierManager:
     - Hammer counters (x5 neutralization)
     """
 
-    def __init__(self, battle_duration: int = 60, analytics=None):
+    def __init__(self, battle_duration: int = 60, analytics=None, rng=None):
         """
         Initialize multiplier manager.
 
         Args:
             battle_duration: Total battle length (60s or 180s)
             analytics: Optional BattleAnalytics instance for data collection
+            rng: Optional per-battle random.Random (defaults to the global RNG)
         """
         self.battle_duration = battle_duration
         self.analytics = analytics
+        self.rng = rng or random
         self.current_multiplier = MultiplierType.NONE
         self.active_sessions: List[MultiplierSession] = []
         self.session_history: List[MultiplierSession] = []
@@ -166,10 +161,10 @@ class MultiplierManager:
         """
         # Random time within auto session window
         window_start, window_end = self.auto_session_window
-        self.auto_session_time = random.randint(window_start, window_start + 5)
+        self.auto_session_time = self.rng.randint(window_start, window_start + 5)
 
         # Random multiplier (x2 or x3)
-        self.auto_session_multiplier = random.choice([MultiplierType.X2, MultiplierType.X3])
+        self.auto_session_multiplier = self.rng.choice([MultiplierType.X2, MultiplierType.X3])
 
         print(f"\n🎲 Auto-session planned: x{self.auto_session_multiplier.value} at {self.auto_session_time}s")
 
@@ -196,7 +191,7 @@ class MultiplierManager:
 
     def _trigger_auto_session(self, current_time: int):
         """Trigger the automatic x2/x3 session."""
-        duration = random.randint(20, 30)
+        duration = self.rng.randint(20, 30)
 
         session = MultiplierSession(
             multiplier=self.auto_session_multiplier,
@@ -278,8 +273,8 @@ class MultiplierManager:
     def _trigger_bonus_session(self, current_time: int):
         """Trigger the threshold-based bonus session."""
         # Random x2 or x3
-        multiplier = random.choice([MultiplierType.X2, MultiplierType.X3])
-        duration = random.randint(20, 30)
+        multiplier = self.rng.choice([MultiplierType.X2, MultiplierType.X3])
+        duration = self.rng.randint(20, 30)
 
         session = MultiplierSession(
             multiplier=multiplier,
@@ -312,7 +307,7 @@ class MultiplierManager:
         Returns True if x5 triggered, False otherwise.
         """
         # Probabilistic x5 trigger (can be used anytime)
-        if random.random() < self.x5_success_probability:
+        if self.rng.random() < self.x5_success_probability:
             self._trigger_x5_strike(current_time, agent_name)
             return True
 
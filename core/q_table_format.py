@@ -0,0 +1,168 @@
+"""
+Q-Table Format - versioned binary encoding for array-backed Q-tables.
+
+A Q-table is an index map (state key per row), a visited flag per row and
+a rows x actions float64 array. Values are stored as raw little-endian
+bytes so loading is a buffer copy, not a parse.
+
+Keys are discretized State tuples (small ints/bools) and are stored as an
+int64 matrix; tables with other keys (strings, mixed tuples) fall back
+to a JSON list for the key section only.
+
+The battle history database stores tables in fixed-size row chunks
+(see BattleHistoryDB.save_q_table) so a checkpoint rewrites only chunks
+with rows changed since the last save. Whole tables can also be written
+to a single `.qtbl` file:
+
+    magic "QTBL" | version u16 | flags u8 | pad | header length u32 |
+    header JSON | keys | visited | pad to 8 | values
+
+Usage:
+    write_q_table("data/q/sniper.qtbl", snapshot)
+    with open_q_table("data/q/sniper.qtbl") as snapshot:   # mmap
+        table = QTable.from_snapshot(snapshot)
+"""
+
+import json
+import mmap
+import struct
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Sequence, Union
+
+
+MAGIC = b"QTBL"
+FORMAT_VERSION = 1
+Q_TABLE_FILE_EXTENSION = ".qtbl"
+DEFAULT_CHUNK_ROWS = 256
+
+_PREAMBLE = struct.Struct("<4sHBxI")  # magic, version, flags, header length
+_KEYS_HEADER = struct.Struct("<cxxxII")  # kind, count, width
+
+_KEYS_INT = b"I"
+_KEYS_JSON = b"J"
+
+
+@dataclass
+class QTableSnapshot:
+    """Raw Q-table contents: per-row keys, visited flags and float64 values."""
+    actions: List[str]
+    keys: List[Any]
+    visited: Union[bytes, memoryview]  # one byte per row
+    values: Union[bytes, memoryview]   # rows x len(actions) little-endian float64
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def rows(self) -> int:
+        return len(self.keys)
+
+
+# =============================================================================
+# KEYS
+# =============================================================================
+
+def _is_int_key(key: Any, width: int) -> bool:
+    return (type(key) is tuple and len(key) == width
+            and all(type(v) is int or type(v) is bool for v in key))
+
+
+def _tupleize(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_tupleize(v) for v in value)
+    return value
+
+
+def encode_keys(keys: Sequence[Any]) -> bytes:
+    """Encode row keys (int64 matrix when every key is an equal-width int tuple)."""
+    width = len(keys[0]) if keys and type(keys[0]) is tuple else 0
+    if keys and width and all(_is_int_key(k, width) for k in keys):
+        flat = [int(v) for key in keys for v in key]
+        payload = struct.pack(f"<{len(flat)}q", *flat)
+        return _KEYS_HEADER.pack(_KEYS_INT, len(keys), width) + payload
+
+    payload = json.dumps(list(keys), separators=(",", ":")).encode()
+    return _KEYS_HEADER.pack(_KEYS_JSON, len(keys), 0) + payload
+
+
+def decode_keys(data: Union[bytes, memoryview]) -> List[Any]:
+    """Inverse of encode_keys (tuples come back as tuples of ints)."""
+    kind, count, width = _KEYS_HEADER.unpack_from(data, 0)
+    payload = data[_KEYS_HEADER.size:]
+    if kind == _KEYS_INT:
+        flat = struct.unpack_from(f"<{count * width}q", payload)
+        return [flat[i:i + width] for i in range(0, count * width, width)]
+    if kind == _KEYS_JSON:
+        return [_tupleize(k) for k in json.loads(bytes(payload))]
+    raise ValueError(f"Unknown Q-table key encoding: {kind!r}")
+
+
+# =============================================================================
+# WHOLE-TABLE FILES
+# =============================================================================
+
+def encode_q_table(snapshot: QTableSnapshot) -> bytes:
+    """Encode a full snapshot as a single .qtbl buffer."""
+    keys = encode_keys(snapshot.keys)
+    header = json.dumps({
+        "actions": snapshot.actions,
+        "rows": snapshot.rows,
+        "keys_length": len(keys),
+        "meta": snapshot.meta,
+    }, separators=(",", ":")).encode()
+
+    body = bytearray(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header)))
+    body += header
+    body += keys
+    body += snapshot.visited
+    body += b"\0" * (-len(body) % 8)  # align values for zero-copy views
+    body += snapshot.values
+    return bytes(body)
+
+
+def decode_q_table(buffer: Union[bytes, memoryview, mmap.mmap]) -> QTableSnapshot:
+    """
+    Decode a .qtbl buffer without copying the value array.
+
+    Raises:
+        ValueError: If the buffer isn't a Q-table or has a newer version
+    """
+    view = memoryview(buffer)
+    magic, version, _, header_length = _PREAMBLE.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a binary Q-table")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported Q-table format version {version}")
+
+    offset = _PREAMBLE.size
+    header = json.loads(bytes(view[offset:offset + header_length]))
+    offset += header_length
+
+    keys = decode_keys(view[offset:offset + header["keys_length"]])
+    offset += header["keys_length"]
+    rows = header["rows"]
+    visited = view[offset:offset + rows]
+    offset += rows + (-(offset + rows) % 8)
+    values = view[offset:offset + rows * len(header["actions"]) * 8]
+
+    return QTableSnapshot(header["actions"], keys, visited, values, header.get("meta", {}))
+
+
+def write_q_table(path: str, snapshot: QTableSnapshot):
+    """Write a snapshot to a .qtbl file."""
+    with open(path, "wb") as f:
+        f.write(encode_q_table(snapshot))
+
+
+@contextmanager
+def open_q_table(path: str) -> Iterator[QTableSnapshot]:
+    """Memory-map a .qtbl file; the snapshot's buffers are valid inside the block."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    snapshot = decode_q_table(mapped)
+    try:
+        yield snapshot
+    finally:
+        snapshot.visited = bytes(snapshot.visited)
+        snapshot.values = bytes(snapshot.values)
+        mapped.close()
+
@@ -0,0 +1,438 @@
+"""
+Compact Replay Format - columnar, seekable encoding for BattleRecorder replays.
+
+A replay is stored as a small JSON header followed by independent sections:
+- time / creator_score / opponent_score: delta-encoded int64 columns
+- phase runs: (start tick, phase, multiplier) run-length column
+- events: per-tick event lists, grouped into blocks of `block_ticks` ticks
+
+Every section is compressed on its own (codec "none", "zlib" or "lzma"), so
+opening a replay only parses the header and seeking to a tick decodes the
+score columns and a single event block. Files are opened with mmap.
+
+Layout:
+    magic "BRPL" | version u16 | codec u8 | pad | header length u32 |
+    header JSON | section bytes...
+
+Usage:
+    write_replay(recorder.get_replay_data(), "data/replays/battle.bbr")
+    with CompactReplay.open("data/replays/battle.bbr") as replay:
+        tick = replay.tick_at(150)
+
+Convert existing JSON replays:
+    python -m core.replay_format data/replays/battle.json
+    python -m core.replay_format --db data/battle_history.db
+"""
+
+import json
+import lzma
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from .battle_history import ReplayData, ReplayTick
+
+
+MAGIC = b"BRPL"
+FORMAT_VERSION = 1
+REPLAY_FILE_EXTENSION = ".bbr"
+
+_PREAMBLE = struct.Struct("<4sHBxI")  # magic, version, codec, header length
+
+CODECS = {"none": 0, "zlib": 1, "lzma": 2}
+_CODEC_NAMES = {v: k for k, v in CODECS.items()}
+
+DEFAULT_CODEC = "zlib"
+DEFAULT_BLOCK_TICKS = 64
+
+_COLUMNS = ("time", "creator_score", "opponent_score")
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(data, 6)
+    if codec == "lzma":
+        return lzma.compress(data)
+    return data
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "lzma":
+        return lzma.decompress(data)
+    return bytes(data)
+
+
+def _delta_encode(values: List[int]) -> bytes:
+    deltas = array("q", (b - a for a, b in zip([0] + values[:-1], values)))
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    return deltas.tobytes()
+
+
+def _delta_decode(data: bytes) -> array:
+    deltas = array("q")
+    deltas.frombytes(data)
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    return array("q", accumulate(deltas))
+
+
+def is_compact_replay(data: Union[bytes, memoryview]) -> bool:
+    """True if the buffer starts with the compact replay magic."""
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def encode_replay(replay: ReplayData, codec: str = DEFAULT_CODEC,
+                  block_ticks: int = DEFAULT_BLOCK_TICKS) -> bytes:
+    """
+    Encode a replay in the compact format.
+
+    Args:
+        replay: Replay to encode
+        codec: "none", "zlib" or "lzma"
+        block_ticks: Ticks per independently decodable event block
+
+    Returns:
+        Encoded replay
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown replay codec: {codec}")
+
+    ticks = list(replay.ticks)
+    body = bytearray()
+    sections = {}
+
+    def add_section(raw: bytes) -> List[int]:
+        packed = _compress(raw, codec)
+        entry = [len(body), len(packed)]
+        body.extend(packed)
+        return entry
+
+    sections["time"] = add_section(_delta_encode([int(t.time) for t in ticks]))
+    sections["creator_score"] = add_section(_delta_encode([int(t.creator_score) for t in ticks]))
+    sections["opponent_score"] = add_section(_delta_encode([int(t.opponent_score) for t in ticks]))
+
+    phase_runs = []
+    for index, tick in enumerate(ticks):
+        if not phase_runs or (phase_runs[-1][1], phase_runs[-1][2]) != (tick.phase, tick.multiplier):
+            phase_runs.append([index, tick.phase, tick.multiplier])
+
+    event_blocks = []
+    for start in range(0, len(ticks), block_ticks):
+        block = [t.events for t in ticks[start:start + block_ticks]]
+        event_blocks.append(add_section(json.dumps(block, separators=(",", ":")).encode()))
+
+    header = {
+        "meta": {
+            "replay_id": replay.replay_id,
+            "battle_id": replay.battle_id,
+            "recorded_at": replay.recorded_at,
+            "duration": replay.duration,
+            "winner": replay.winner,
+            "final_creator_score": replay.final_creator_score,
+            "final_opponent_score": replay.final_opponent_score,
+            "agent_config": replay.agent_config,
+        },
+        "tick_count": len(ticks),
+        "block_ticks": block_ticks,
+        "phase_runs": phase_runs,
+        "sections": sections,
+        "event_blocks": event_blocks,
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode()
+
+    return (_PREAMBLE.pack(MAGIC, FORMAT_VERSION, CODECS[codec], len(header_bytes))
+            + header_bytes + bytes(body))
+
+
+def write_replay(replay: ReplayData, filepath: str, codec: str = DEFAULT_CODEC) -> int:
+    """Write a replay file in the compact format. Returns bytes written."""
+    data = encode_replay(replay, codec)
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    with open(filepath, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+# =============================================================================
+# DECODING
+# =============================================================================
+
+class CompactReplay(Sequence):
+    """
+    Read-only view over a compact replay.
+
+    Behaves as a sequence of ReplayTick, so it can stand in for
+    ReplayData.ticks. Columns and event blocks are decoded on first access.
+    """
+
+    MAX_CACHED_BLOCKS = 8
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap], owner: Optional[mmap.mmap] = None):
+        """
+        Args:
+            buffer: Encoded replay (bytes or an mmap)
+            owner: mmap to close with this replay
+        """
+        self._buffer = buffer
+        self._owner = owner
+
+        magic, version, codec_id, header_len = _PREAMBLE.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a compact replay")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Unsupported compact replay version: {version}")
+        if codec_id not in _CODEC_NAMES:
+            raise ValueError(f"Unknown replay codec id: {codec_id}")
+
+        self.version = version
+        self.codec = _CODEC_NAMES[codec_id]
+        header_start = _PREAMBLE.size
+        header = json.loads(bytes(buffer[header_start:header_start + header_len]))
+        self._body_start = header_start + header_len
+
+        self.meta: Dict[str, Any] = header["meta"]
+        self.tick_count: int = header["tick_count"]
+        self.block_ticks: int = header["block_ticks"]
+        self._phase_runs = header["phase_runs"]
+        self._phase_starts = [run[0] for run in self._phase_runs]
+        self._sections = header["sections"]
+        self._event_blocks = header["event_blocks"]
+
+        self._columns: Dict[str, array] = {}
+        self._blocks: Dict[int, List[List[Dict]]] = {}
+
+    @classmethod
+    def open(cls, filepath: str) -> "CompactReplay":
+        """Memory-map a compact replay file."""
+        with open(filepath, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm, owner=mm)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CompactReplay":
+        """Wrap an in-memory compact replay (e.g. a database blob)."""
+        return cls(bytes(data))
+
+    def close(self):
+        """Release the underlying mmap."""
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    def _section(self, entry: List[int]) -> bytes:
+        offset, length = entry
+        start = self._body_start + offset
+        return _decompress(self._buffer[start:start + length], self.codec)
+
+    def column(self, name: str) -> array:
+        """Decoded time / creator_score / opponent_score column."""
+        if name not in self._columns:
+            if name not in _COLUMNS:
+                raise KeyError(name)
+            self._columns[name] = _delta_decode(self._section(self._sections[name]))
+        return self._columns[name]
+
+    @property
+    def times(self) -> array:
+        return self.column("time")
+
+    @property
+    def creator_scores(self) -> array:
+        return self.column("creator_score")
+
+    @property
+    def opponent_scores(self) -> array:
+        return self.column("opponent_score")
+
+    def _block(self, block_index: int) -> List[List[Dict]]:
+        block = self._blocks.get(block_index)
+        if block is None:
+            block = json.loads(self._section(self._event_blocks[block_index]))
+            if len(self._blocks) >= self.MAX_CACHED_BLOCKS:
+                self._blocks.pop(next(iter(self._blocks)))
+            self._blocks[block_index] = block
+        return block
+
+    def events_at(self, index: int) -> List[Dict]:
+        """Events of the tick at `index`."""
+        return self._block(index // self.block_ticks)[index % self.block_ticks]
+
+    def phase_at(self, index: int) -> tuple:
+        """(phase, multiplier) of the tick at `index`."""
+        run = self._phase_runs[bisect_right(self._phase_starts, index) - 1]
+        return run[1], run[2]
+
+    # ------------------------------------------------------------------
+    # Sequence of ReplayTick
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.tick_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.tick_count))]
+        if index < 0:
+            index += self.tick_count
+        if not 0 <= index < self.tick_count:
+            raise IndexError("replay tick index out of range")
+        phase, multiplier = self.phase_at(index)
+        return ReplayTick(
+            time=self.times[index],
+            creator_score=self.creator_scores[index],
+            opponent_score=self.opponent_scores[index],
+            phase=phase,
+            multiplier=multiplier,
+            events=self.events_at(index)
+        )
+
+    def __iter__(self) -> Iterator[ReplayTick]:
+        # Walk blocks and phase runs sequentially instead of seeking per tick
+        times, creator, opponent = self.times, self.creator_scores, self.opponent_scores
+        run_ends = self._phase_starts[1:] + [self.tick_count]
+        run = 0
+        for block_index in range(len(self._event_blocks)):
+            start = block_index * self.block_ticks
+            for index, events in enumerate(self._block(block_index), start):
+                while index >= run_ends[run]:
+                    run += 1
+                _, phase, multiplier = self._phase_runs[run]
+                yield ReplayTick(times[index], creator[index], opponent[index],
+                                 phase, multiplier, events)
+
+    def index_at_time(self, time: float) -> int:
+        """Index of the last tick at or before `time` (0 if none)."""
+        return max(0, bisect_right(self.times, time) - 1)
+
+    def tick_at(self, time: float) -> Optional[ReplayTick]:
+        """Last tick at or before `time`."""
+        if not self.tick_count:
+            return None
+        return self[self.index_at_time(time)]
+
+    def to_replay_data(self, lazy: bool = True) -> ReplayData:
+        """
+        Build a ReplayData.
+
+        Args:
+            lazy: Use this replay as the tick sequence instead of decoding
+                every tick up front (keep the replay open while in use)
+        """
+        return ReplayData(
+            replay_id=self.meta["replay_id"],
+            battle_id=self.meta["battle_id"],
+            recorded_at=self.meta["recorded_at"],
+            duration=self.meta["duration"],
+            winner=self.meta["winner"],
+            final_creator_score=self.meta["final_creator_score"],
+            final_opponent_score=self.meta["final_opponent_score"],
+            ticks=self if lazy else list(self),
+            agent_config=self.meta.get("agent_config", {})
+        )
+
+
+# =============================================================================
+# CONVERSION
+# =============================================================================
+
+def convert_json_replay(src_path: str, dst_path: Optional[str] = None,
+                        codec: str = DEFAULT_CODEC) -> str:
+    """
+    Convert a JSON replay file (BattleRecorder.save_to_file) to the compact format.
+
+    Returns:
+        Path of the compact replay
+    """
+    with open(src_path, "r") as f:
+        replay = ReplayData.from_dict(json.load(f))
+
+    dst_path = dst_path or os.path.splitext(src_path)[0] + REPLAY_FILE_EXTENSION
+    write_replay(replay, dst_path, codec)
+    return dst_path
+
+
+def convert_db_replays(db, codec: str = DEFAULT_CODEC) -> int:
+    """
+    Re-encode JSON tick_data rows of battle_replays in the compact format.
+
+    Args:
+        db: BattleHistoryDB
+
+    Returns:
+        Number of replays converted
+    """
+    cursor = db.conn.cursor()
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='battle_replays'
+    """)
+    if not cursor.fetchone():
+        return 0
+
+    cursor.execute("SELECT * FROM battle_replays WHERE typeof(tick_data) = 'text'")
+    converted = 0
+    for row in cursor.fetchall():
+        replay = ReplayData.from_dict({
+            **dict(row),
+            "ticks": json.loads(row["tick_data"]),
+            "agent_config": json.loads(row["agent_config"] or "{}"),
+        })
+        db.conn.execute(
+            "UPDATE battle_replays SET tick_data = ? WHERE replay_id = ?",
+            (sqlite3.Binary(encode_replay(replay, codec)), row["replay_id"])
+        )
+        converted += 1
+
+    db.conn.commit()
+    return converted
+
+
+def main():
+    import argparse
+    from .battle_history import BattleHistoryDB
+
+    parser = argparse.ArgumentParser(description="Convert JSON battle replays to the compact format")
+    parser.add_argument("files", nargs="*", help="JSON replay files to convert")
+    parser.add_argument("--db", help="Convert replays stored in this battle history database")
+    parser.add_argument("--codec", choices=sorted(CODECS), default=DEFAULT_CODEC)
+    args = parser.parse_args()
+
+    for path in args.files:
+        dst = convert_json_replay(path, codec=args.codec)
+        print(f"💾 {path} ({os.path.getsize(path):,} B) -> {dst} ({os.path.getsize(dst):,} B)")
+
+    if args.db:
+        db = BattleHistoryDB(args.db)
+        print(f"💾 Converted {convert_db_replays(db, args.codec)} replays in {args.db}")
+        db.close()
+
+    if not args.files and not args.db:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
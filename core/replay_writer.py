@@ -0,0 +1,258 @@
+"""
+Replay Writer - Buffered, batched persistence of battle events.
+
+Subscribes to an EventBus and writes events to the `battle_events` table
+with one executemany() per batch instead of one INSERT + commit per event.
+
+Batches are flushed when the buffer reaches `batch_size`, when
+`flush_interval` seconds have passed, and when the battle ends. If the
+database falls behind and `max_pending` events are waiting, publishers
+block until the writer catches up (back-pressure).
+
+State keyframes for ReplayRepository.get_state_at_time are built from the
+same events and written with each batch.
+
+Example:
+    BattleRepository.create_battle(battle_id, duration=300)
+    writer = ReplayEventWriter(battle_id)
+    writer.attach(engine.event_bus)
+    engine.run()      # BATTLE_ENDED flushes the tail
+    writer.close()
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .database import KEYFRAME_INTERVAL, KeyframeBuilder, ReplayRepository, close_connection
+from .event_bus import BattleEvent, EventBus, EventType
+
+
+def _event_data(event: BattleEvent) -> Dict[str, Any]:
+    data = dict(event.data)
+    data.setdefault("source", event.source)
+    if event.event_type == EventType.GIFT_SENT:
+        # Engine gift events come from the creator's agents
+        data.setdefault("team", "creator")
+    return data
+
+
+class ReplayEventWriter:
+    """
+    Buffers battle events and writes them in batches.
+
+    With background=True a writer thread does the I/O, so the battle loop
+    only appends to a list; with background=False flushes run inline on the
+    publishing thread (handy for headless runs and tests).
+    """
+
+    def __init__(self, battle_id: str, batch_size: int = 500, flush_interval: float = 1.0,
+                 max_pending: int = 10000, background: bool = True,
+                 event_types: Optional[Iterable[EventType]] = None,
+                 keyframe_interval: Optional[float] = KEYFRAME_INTERVAL):
+        """
+        Args:
+            battle_id: Battle the events belong to
+            batch_size: Flush once this many events are buffered
+            flush_interval: Flush buffered events at least this often (seconds)
+            max_pending: Block publishers while this many events are unwritten
+            background: Write from a dedicated thread instead of inline
+            event_types: Event types to record (default: all)
+            keyframe_interval: Battle seconds between keyframes (None to skip)
+        """
+        self.battle_id = battle_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.background = background
+        self.event_types = list(event_types) if event_types is not None else list(EventType)
+
+        self._buffer: List[BattleEvent] = []
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self._bus: Optional[EventBus] = None
+        self._keyframes = KeyframeBuilder(battle_id, keyframe_interval) if keyframe_interval else None
+
+        # Stats
+        self.events_written = 0
+        self.events_failed = 0
+        self.keyframes_written = 0
+        self.flushes = 0
+        self.largest_batch = 0
+        self.blocked_count = 0
+        self.blocked_seconds = 0.0
+
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(target=self._run, name=f"ReplayWriter-{battle_id}",
+                                            daemon=True)
+            self._thread.start()
+
+    # ------------------------------------------------------------------
+    # EventBus integration
+    # ------------------------------------------------------------------
+
+    def attach(self, event_bus: EventBus):
+        """Subscribe to every recorded event type on the bus."""
+        self._bus = event_bus
+        for event_type in self.event_types:
+            event_bus.subscribe(event_type, self.record, inline=True)
+
+    def detach(self):
+        """Unsubscribe from the bus."""
+        if self._bus is None:
+            return
+        for event_type in self.event_types:
+            self._bus.unsubscribe(event_type, self.record)
+        self._bus = None
+
+    def record(self, event: BattleEvent):
+        """Buffer one event (EventBus handler)."""
+        with self._cond:
+            if self._closed:
+                return
+
+            # Back-pressure: wait for the writer to drain
+            if self._pending() >= self.max_pending:
+                self.blocked_count += 1
+                start = time.perf_counter()
+                if self.background:
+                    while self._pending() >= self.max_pending and not self._closed:
+                        self._last_flush = 0.0  # Make the buffer due immediately
+                        self._cond.notify_all()
+                        self._cond.wait(0.05)
+                else:
+                    self._flush_locked()
+                self.blocked_seconds += time.perf_counter() - start
+
+            self._buffer.append(event)
+
+            due = (len(self._buffer) >= self.batch_size
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+            if self.background:
+                if due:
+                    self._cond.notify_all()
+            elif due:
+                self._flush_locked()
+
+        if event.event_type == EventType.BATTLE_ENDED:
+            self.flush()
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def _pending(self) -> int:
+        return len(self._buffer) + self._in_flight
+
+    def _take_batch(self) -> List[BattleEvent]:
+        batch, self._buffer = self._buffer, []
+        self._in_flight += len(batch)
+        self._last_flush = time.monotonic()
+        return batch
+
+    def _write(self, batch: List[BattleEvent]):
+        # Only one batch is written at a time, so the keyframe builder sees events in order
+        rows = []
+        keyframes = []
+        for event in batch:
+            data = _event_data(event)
+            event_type = event.event_type.name.lower()
+            rows.append((self.battle_id, event.timestamp, event_type, json.dumps(data)))
+            if self._keyframes is not None:
+                keyframes.extend(self._keyframes.add(event.timestamp, event_type, data))
+        ReplayRepository.save_replay_events(rows, keyframes)
+        self.keyframes_written += len(keyframes)
+
+    def _finish_batch(self, size: int, ok: bool = True):
+        self._in_flight -= size
+        if ok:
+            self.events_written += size
+        else:
+            self.events_failed += size
+        self.flushes += 1
+        self.largest_batch = max(self.largest_batch, size)
+        self._cond.notify_all()
+
+    def _flush_locked(self):
+        """Write the buffer on the calling thread (lock held)."""
+        batch = self._take_batch()
+        if not batch:
+            return
+        try:
+            self._write(batch)
+        except Exception:
+            self._finish_batch(len(batch), ok=False)
+            raise
+        self._finish_batch(len(batch))
+
+    def _run(self):
+        """Writer thread: flush on size, interval or explicit request."""
+        try:
+            while True:
+                with self._cond:
+                    while not self._buffer and not self._closed:
+                        self._cond.wait(self.flush_interval)
+                    while (not self._closed and len(self._buffer) < self.batch_size
+                           and time.monotonic() - self._last_flush < self.flush_interval):
+                        self._cond.wait(max(0.0, self.flush_interval - (time.monotonic() - self._last_flush)))
+                    if self._closed and not self._buffer:
+                        return
+                    batch = self._take_batch()
+
+                ok = True
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    ok = False
+                    print(f"[ReplayWriter] Failed to write {len(batch)} events: {e}")
+                with self._cond:
+                    self._finish_batch(len(batch), ok)
+        finally:
+            close_connection()
+
+    def flush(self, timeout: Optional[float] = None):
+        """Write everything buffered so far and wait until it is stored."""
+        with self._cond:
+            if not self.background:
+                self._flush_locked()
+                return
+
+            self._last_flush = 0.0  # Make the buffer due immediately
+            self._cond.notify_all()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._pending() and self._thread and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(0.05 if remaining is None else min(0.05, remaining))
+
+    def close(self):
+        """Flush, stop the writer thread and detach from the bus."""
+        self.detach()
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer statistics."""
+        with self._cond:
+            pending = self._pending()
+        return {
+            "events_written": self.events_written,
+            "events_failed": self.events_failed,
+            "keyframes_written": self.keyframes_written,
+            "pending": pending,
+            "flushes": self.flushes,
+            "largest_batch": self.largest_batch,
+            "avg_batch": self.events_written / self.flushes if self.flushes else 0,
+            "blocked_count": self.blocked_count,
+            "blocked_seconds": self.blocked_seconds,
+        }
@@ -0,0 +1,122 @@
+"""
+Sliding Window - time-windowed gift counters with O(1) updates.
+
+Keeps a deque of (timestamp, value, key, flagged) entries plus running
+totals, so adding a gift and reading the window sums are constant-time.
+Expired entries are evicted from the left as time advances.
+
+Used by ThresholdTracker (multiplier_system) and the live burst / Live Fest
+detectors (ai_vs_live_engine).
+
+Example:
+    window = SlidingWindow(duration=15)
+    window.add(3, value=1, flagged=True)   # A rose worth 1 point
+    window.evict(18)                       # Keeps entries with t >= 3
+    print(window.total, window.flagged_count)
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class SlidingWindow:
+    """
+    Rolling counters over the last `duration` seconds.
+
+    Tracks entry count, value sum, flagged-entry count and optional
+    per-key value sums/counts. Timestamps are expected to be non-decreasing.
+    With duration=None nothing expires and entries are not stored, so the
+    counters are cumulative and memory stays constant.
+    """
+
+    def __init__(self, duration: Optional[float]):
+        """
+        Args:
+            duration: Window length in seconds (None = never expire)
+        """
+        self.duration = duration
+        self._entries: Deque[Tuple[float, float, Optional[Hashable], bool]] = deque()
+
+        self.count = 0
+        self.total = 0
+        self.flagged_count = 0
+        self.key_totals: Dict[Hashable, float] = {}
+        self.key_counts: Dict[Hashable, int] = {}
+
+    def add(self, timestamp: float, value: float = 0, key: Optional[Hashable] = None,
+            flagged: bool = False):
+        """
+        Add an entry to the window.
+
+        Args:
+            timestamp: When the entry happened
+            value: Amount added to `total` (e.g. points)
+            key: Optional grouping key (e.g. username) for key_totals/key_counts
+            flagged: Counted in `flagged_count` (e.g. is a rose)
+        """
+        if self.duration is not None:
+            self._entries.append((timestamp, value, key, flagged))
+
+        self.count += 1
+        self.total += value
+        if flagged:
+            self.flagged_count += 1
+        if key is not None:
+            self.key_totals[key] = self.key_totals.get(key, 0) + value
+            self.key_counts[key] = self.key_counts.get(key, 0) + 1
+
+    def evict(self, now: float):
+        """Drop entries older than `now - duration`."""
+        if self.duration is None:
+            return
+
+        cutoff = now - self.duration
+        entries = self._entries
+        while entries and entries[0][0] < cutoff:
+            _, value, key, flagged = entries.popleft()
+            self.count -= 1
+            self.total -= value
+            if flagged:
+                self.flagged_count -= 1
+            if key is not None:
+                remaining = self.key_counts[key] - 1
+                if remaining:
+                    self.key_counts[key] = remaining
+                    self.key_totals[key] -= value
+                else:
+                    del self.key_counts[key]
+                    del self.key_totals[key]
+
+    @property
+    def oldest(self) -> Optional[float]:
+        """Timestamp of the oldest entry still in the window."""
+        return self._entries[0][0] if self._entries else None
+
+    @property
+    def newest(self) -> Optional[float]:
+        """Timestamp of the newest entry in the window."""
+        return self._entries[-1][0] if self._entries else None
+
+    def entries(self) -> Iterator[Tuple[float, float, Optional[Hashable], bool]]:
+        """Iterate (timestamp, value, key, flagged) entries, oldest first."""
+        return iter(self._entries)
+
+    def clear(self):
+        """Empty the window and reset all counters."""
+        self._entries.clear()
+        self.count = 0
+        self.total = 0
+        self.flagged_count = 0
+        self.key_totals.clear()
+        self.key_counts.clear()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters as a dict."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "flagged_count": self.flagged_count,
+        }
@@ -19,7 +19,20 @@ from dataclasses import dataclass, field
 from enum import Enum
 import random
 
-from core.budget_system import BudgetManager, BudgetTier, GIFT_CATALOG, get_gift_cost
+from core.budget_system import BudgetManager, BudgetTier, GIFT_INDEX, get_gift_cost
+from core.catch_up_planner import PlanWindow, get_catch_up_planner
+
+# Recovery analysis cache resolution
+RECOVERY_VALUE_BITS = 6      # Deficit/budget buckets keep their top 6 bits (~3%)
+RECOVERY_TIME_STEP = 5       # Seconds of time remaining per bucket
+RECOVERY_CACHE_SIZE = 256
+
+
+def _bucket(value: float, bits: int = RECOVERY_VALUE_BITS) -> Tuple[int, int]:
+    """Log-scale bucket of a non-negative value: (dropped bits, top bits)."""
+    value = max(0, int(value))
+    shift = max(0, value.bit_length() - bits)
+    return shift, value >> shift
 
 
 class StrategyMode(Enum):
@@ -70,11 +83,13 @@ class StrategicIntelligence:
         self,
         budget_manager: BudgetManager,
         team: str = "creator",
-        battle_duration: int = 300
+        battle_duration: int = 300,
+        rng: Optional[random.Random] = None
     ):
         self.budget_manager = budget_manager
         self.team = team
         self.battle_duration = battle_duration
+        self.rng = rng or random
 
         # Current strategy state
         self.current_mode = StrategyMode.BALANCED
@@ -102,6 +117,14 @@ class StrategicIntelligence:
         # Strategy history for learning
         self.strategy_changes: List[Dict] = []
 
+        # Recovery analyses by material state (see _recovery_key)
+        self._recovery_cache: Dict[Tuple, RecoveryAnalysis] = {}
+        self.recovery_cache_hits = 0
+        self.recovery_cache_misses = 0
+
+        # Build the shared catch-up planner's table during setup, not in a battle tick
+        get_catch_up_planner()
+
     def update_scores(self, our_score: int, opponent_score: int, current_time: int):
         """Update score tracking."""
         self.our_score = our_score
@@ -153,6 +176,7 @@ class StrategicIntelligence:
             potential_points=potential_points,
             budget_needed=int(spendable)
         ))
+        self.clear_recovery_cache()
 
     def analyze_recovery(self, time_remaining: int) -> RecoveryAnalysis:
         """
@@ -160,6 +184,11 @@ class StrategicIntelligence:
 
         This is the core surrender logic - determines if continuing to
         gift is mathematically futile.
+
+        Analyses are cached per (deficit bucket, time bucket, budget bucket,
+        upcoming boosts, opponent rate), so per-tick calls only recompute
+        when something material has changed. A cache hit returns the
+        analysis computed for the first state seen in that bucket.
         """
         deficit = self.opponent_score - self.our_score
 
@@ -177,6 +206,41 @@ class StrategicIntelligence:
 
         budget = self._get_current_budget()
 
+        key = self._recovery_key(deficit, budget, time_remaining)
+        cached = self._recovery_cache.get(key)
+        if cached is not None:
+            self.recovery_cache_hits += 1
+            return cached
+
+        self.recovery_cache_misses += 1
+        analysis = self._analyze_recovery(deficit, budget, time_remaining)
+        if len(self._recovery_cache) >= RECOVERY_CACHE_SIZE:
+            self._recovery_cache.pop(next(iter(self._recovery_cache)))
+        self._recovery_cache[key] = analysis
+        return analysis
+
+    def _recovery_key(self, deficit: int, budget: int, time_remaining: int) -> Tuple:
+        """Material state a recovery analysis depends on."""
+        boosts = tuple(
+            (b.phase_name, b.multiplier, b.time_until < time_remaining, b.duration, b.budget_needed)
+            for b in self.upcoming_boosts
+        )
+        return (
+            _bucket(deficit),
+            time_remaining // RECOVERY_TIME_STEP,
+            _bucket(budget),
+            boosts,
+            self.opponent_is_active,
+            _bucket(self.opponent_avg_rate),
+            self.minimum_recovery_ratio,
+        )
+
+    def clear_recovery_cache(self):
+        """Drop cached recovery analyses (boost schedule or battle changed)."""
+        self._recovery_cache.clear()
+
+    def _analyze_recovery(self, deficit: int, budget: int, time_remaining: int) -> RecoveryAnalysis:
+        """Recovery analysis for a positive deficit."""
         # Calculate maximum possible points from remaining budget
         # Consider upcoming boosts for maximum efficiency
         max_points = self._calculate_max_possible_points(budget, time_remaining)
@@ -518,7 +582,7 @@ class StrategicIntelligence:
                 'reasoning': f"BALANCED: x{multiplier:.0f} boost. Moderate spending: {max_spend:,}"
             }
         return {
-            'should_gift': random.random() < 0.3,  # 30% chance in normal phase
+            'should_gift': self.rng.random() < 0.3,  # 30% chance in normal phase
             'max_spend': min(budget * 0.1, 3000),
             'gift_tier': 'medium',
             'reasoning': "BALANCED: Normal phase, light spending"
@@ -529,20 +593,20 @@ class StrategicIntelligence:
         tier_order = {'small': 0, 'medium': 1, 'large': 2, 'whale': 3}
         max_tier_idx = tier_order.get(tier, 3)
 
+        tiers = [t for t in GIFT_INDEX.by_tier
+                 if t != 'powerup' and tier_order.get(t, 0) <= max_tier_idx]
+
         best_gift = None
         best_efficiency = 0  # Points per coin
 
-        for name, gift in GIFT_CATALOG.items():
-            if gift.tier == 'powerup':
-                continue
+        for gift in GIFT_INDEX.subset(tiers).affordable(max_spend):
             gift_tier_idx = tier_order.get(gift.tier, 0)
-            if gift.cost <= max_spend and gift_tier_idx <= max_tier_idx:
-                efficiency = gift.points / gift.cost
-                # Prefer larger gifts for their impact (slight bonus)
-                adjusted_efficiency = efficiency * (1 + gift_tier_idx * 0.1)
-                if adjusted_efficiency > best_efficiency:
-                    best_efficiency = adjusted_efficiency
-                    best_gift = name
+            efficiency = gift.points / gift.cost
+            # Prefer larger gifts for their impact (slight bonus)
+            adjusted_efficiency = efficiency * (1 + gift_tier_idx * 0.1)
+            if adjusted_efficiency > best_efficiency:
+                best_efficiency = adjusted_efficiency
+                best_gift = gift.name
 
         return best_gift
 
@@ -567,7 +631,13 @@ class StrategicIntelligence:
             'peak_lead': self.peak_lead,
             'max_deficit': self.max_deficit,
             'opponent_was_active': self.opponent_is_active,
-            'opponent_avg_rate': self.opponent_avg_rate
+            'opponent_avg_rate': self.opponent_avg_rate,
+            'recovery_cache': {
+                'hits': self.recovery_cache_hits,
+                'misses': self.recovery_cache_misses,
+                'hit_rate': self.recovery_cache_hits / max(1, self.recovery_cache_hits + self.recovery_cache_misses),
+                'cached': len(self._recovery_cache)
+            }
         }
 
 
@@ -589,54 +659,47 @@ class CatchUpOptimizer:
         """
         Calculate optimal plan to catch up.
 
+        Spending per window (and the gifts to send) comes from the catch-up
+        planner, under the gift rate limit of each window and with gloves
+        where they can trigger x5.
+
         Returns:
             Dict with spending allocation per phase
         """
-        if not upcoming_boosts:
-            # No boosts - spend evenly
-            return {
-                'strategy': 'even_distribution',
-                'allocations': [{'phase': 'normal', 'budget': budget, 'expected_points': budget}],
-                'total_expected': budget,
-                'can_catch_up': budget >= deficit
+        windows = []
+        boost_time = 0
+        for boost in upcoming_boosts:
+            if boost.time_until >= time_remaining:
+                continue
+            duration = min(boost.duration, time_remaining - boost.time_until)
+            windows.append(PlanWindow(boost.phase_name, boost.multiplier, duration, glove=True))
+            boost_time += duration
+
+        # Time outside boosts is x1; gloves can still trigger in the final 30s
+        normal_time = max(0, time_remaining - boost_time)
+        final_time = min(30, normal_time)
+        if normal_time > final_time:
+            windows.append(PlanWindow('normal', 1.0, normal_time - final_time))
+        if final_time > 0:
+            windows.append(PlanWindow('final_30s', 1.0, final_time, glove=True))
+
+        plan = get_catch_up_planner().plan(budget, windows)
+
+        allocations = [
+            {
+                'phase': window.name,
+                'multiplier': window.multiplier,
+                'budget': window.budget,
+                'expected_points': window.expected_points,
+                'gifts': window.gifts,
+                'glove': window.glove
             }
-
-        # Sort boosts by multiplier (highest first)
-        sorted_boosts = sorted(upcoming_boosts, key=lambda x: -x.multiplier)
-
-        allocations = []
-        remaining_budget = budget
-        total_expected = 0
-
-        for boost in sorted_boosts:
-            # Calculate optimal spend for this boost
-            # Higher multiplier = allocate more budget
-            multiplier_weight = boost.multiplier / sum(b.multiplier for b in sorted_boosts)
-            allocation = int(remaining_budget * min(multiplier_weight * 1.5, 0.7))
-
-            if allocation > 0:
-                expected = int(allocation * boost.multiplier)
-                allocations.append({
-                    'phase': boost.phase_name,
-                    'multiplier': boost.multiplier,
-                    'budget': allocation,
-                    'expected_points': expected
-                })
-                remaining_budget -= allocation
-                total_expected += expected
-
-        # Any remaining budget goes to normal phase
-        if remaining_budget > 0:
-            allocations.append({
-                'phase': 'normal',
-                'multiplier': 1.0,
-                'budget': remaining_budget,
-                'expected_points': remaining_budget
-            })
-            total_expected += remaining_budget
+            for window in plan.windows if window.budget > 0
+        ]
+        total_expected = plan.total_expected
 
         return {
-            'strategy': 'boost_focused',
+            'strategy': 'boost_focused' if upcoming_boosts else 'even_distribution',
             'allocations': allocations,
             'total_expected': total_expected,
             'can_catch_up': total_expected >= deficit,
@@ -667,43 +730,41 @@ class BudgetMaximizer:
         windows = []
 
         # Always save some for final 30 seconds
-        final_reserve = min(budget * 0.3, 30000)
+        final_reserve = int(min(budget * 0.3, 30000))
         available = budget - final_reserve
 
-        # Allocate to boosts by expected value
-        for boost in boost_schedule:
-            multiplier = boost.get('multiplier', 1.0)
-            duration = boost.get('duration', 20)
+        # Plan the rest over the boosts (and the final window, glove x5 included)
+        plan_windows = [
+            PlanWindow(boost.get('name', f"boost_{i + 1}"), boost.get('multiplier', 1.0),
+                       boost.get('duration', 20), glove=True)
+            for i, boost in enumerate(boost_schedule)
+        ]
+        plan_windows.append(PlanWindow('final_30s', 1.0, 30, glove=True))
+        plan = get_catch_up_planner().plan(available, plan_windows)
+
+        for boost, window in zip(boost_schedule, plan.windows):
+            if window.budget <= 0:
+                continue
             start_time = boost.get('start_time', 0)
-
-            # Higher multiplier = more allocation
-            if multiplier >= 5.0:
-                allocation = available * 0.5
-            elif multiplier >= 3.0:
-                allocation = available * 0.3
-            elif multiplier >= 2.0:
-                allocation = available * 0.2
-            else:
-                allocation = 0
-
-            if allocation > 0:
-                windows.append({
-                    'start_time': start_time,
-                    'end_time': start_time + duration,
-                    'multiplier': multiplier,
-                    'recommended_spend': int(allocation),
-                    'expected_points': int(allocation * multiplier),
-                    'priority': 'HIGH' if multiplier >= 3.0 else 'MEDIUM'
-                })
-                available -= allocation
+            windows.append({
+                'start_time': start_time,
+                'end_time': start_time + boost.get('duration', 20),
+                'multiplier': window.multiplier,
+                'recommended_spend': window.budget,
+                'expected_points': window.expected_points,
+                'gifts': window.gifts,
+                'priority': 'HIGH' if window.multiplier >= 3.0 else 'MEDIUM'
+            })
 
         # Final 30 seconds window
+        final = plan.windows[-1]
         windows.append({
             'start_time': battle_duration - 30,
             'end_time': battle_duration,
             'multiplier': 1.0,  # Base, may have glove x5
-            'recommended_spend': int(final_reserve),
-            'expected_points': int(final_reserve),  # Minimum, could be x5
+            'recommended_spend': final_reserve + final.budget,
+            'expected_points': final_reserve + final.expected_points,  # Minimum, could be x5
+            'gifts': final.gifts,  # Planned part only; the reserve stays flexible
             'priority': 'CRITICAL'
         })
 
@@ -807,8 +868,9 @@ class BattleDetectionIntelligence:
     # Points moyens par seconde dans une battle typique
     TYPICAL_POINTS_PER_SECOND = 100
 
-    def __init__(self, battle_duration: int = 300):
+    def __init__(self, battle_duration: int = 300, rng: Optional[random.Random] = None):
         self.battle_duration = battle_duration
+        self.rng = rng or random
         self.joined_at = None
         self.battle_detected_at = None
 
@@ -1052,7 +1114,7 @@ class BattleDetectionIntelligence:
             else:
                 self.next_multiplier_probability = 0.2
 
-            self.predicted_multiplier_type = 2.0 if random.random() < pattern.X2_PROBABILITY else 3.0
+            self.predicted_multiplier_type = 2.0 if self.rng.random() < pattern.X2_PROBABILITY else 3.0
         else:
             self.next_multiplier_probability = 0.1
             self.estimated_next_multiplier_in = None
@@ -12,6 +12,8 @@ from typing import Dict, Any, List
 from dataclasses import dataclass
 from enum import Enum
 
+from core.gift_index import GiftIndex
+
 
 class GiftTier(Enum):
     """Gift price tiers."""
@@ -531,6 +533,10 @@ TIKTOK_GIFTS_CATALOG: Dict[str, TikTokGift] = {
 }
 
 
+# Precomputed lookups over the catalog (cheapest first)
+TIKTOK_GIFT_INDEX: GiftIndex[TikTokGift] = GiftIndex(TIKTOK_GIFTS_CATALOG.values())
+
+
 def get_gift(gift_key: str) -> TikTokGift:
     """Get a gift by key."""
     return TIKTOK_GIFTS_CATALOG.get(gift_key)
@@ -538,12 +544,12 @@ def get_gift(gift_key: str) -> TikTokGift:
 
 def get_gifts_by_tier(tier: GiftTier) -> List[TikTokGift]:
     """Get all gifts in a specific tier."""
-    return [gift for gift in TIKTOK_GIFTS_CATALOG.values() if gift.tier == tier]
+    return list(TIKTOK_GIFT_INDEX.tier(tier))
 
 
 def get_affordable_gifts(max_coins: int) -> List[TikTokGift]:
-    """Get all gifts affordable with given coins."""
-    return [gift for gift in TIKTOK_GIFTS_CATALOG.values() if gift.coins <= max_coins]
+    """Get all gifts affordable with given coins, cheapest first."""
+    return list(TIKTOK_GIFT_INDEX.affordable(max_coins))
 
 
 def calculate_total_cost(gifts: Dict[str, int], coin_rate: float = 0.0133) -> Dict[str, float]:
@@ -13,6 +13,7 @@ from .visual_utils import (
     Colors, ProgressBar, ASCIIFrames, DramaticAnnouncements,
     BracketVisualizer as VisualBracket, print_separator
 )
+from .match_executor import MatchExecutor, MatchPairing
 
 
 @dataclass
@@ -418,7 +419,7 @@ class EliminationTournament:
         self.championship_best_of = championship_best_of
 
         # Validate team count (must be power of 2)
-        valid_sizes = [2, 4, 8, 16, 32]
+        valid_sizes = [2, 4, 8, 16, 32, 64]
         if len(teams) not in valid_sizes:
             # Pad with byes if needed
             target_size = min(s for s in valid_sizes if s >= len(teams))
@@ -860,10 +861,15 @@ class EliminationTournament:
 class TournamentRunner:
     """
     Runs a complete tournament with simulated battles.
+
+    With a MatchExecutor, each round is played as one batch of real battles
+    instead of simulate_match().
     """
 
-    def __init__(self, tournament: EliminationTournament):
+    def __init__(self, tournament: EliminationTournament,
+                 executor: Optional[MatchExecutor] = None):
         self.tournament = tournament
+        self.executor = executor
         self.battle_history: List[Dict] = []
 
     def simulate_match(self, match: TournamentMatch) -> tuple:
@@ -889,6 +895,14 @@ class TournamentRunner:
 
         return t1_score, t2_score
 
+    def play_matches(self, matches: List[TournamentMatch]) -> List[tuple]:
+        """Scores for independent matches, via the executor if one is set."""
+        if self.executor is None:
+            return [self.simulate_match(match) for match in matches]
+        return self.executor.play(
+            [MatchPairing(m.match_id, m.team1, m.team2) for m in matches]
+        )
+
     def run_round(self, verbose: bool = True):
         """Run all matches in the current round with enhanced visuals."""
         matches = self.tournament.get_current_matches()
@@ -907,8 +921,7 @@ class TournamentRunner:
             print(DramaticAnnouncements.round_start(round_name))
             print()
 
-        for match in matches:
-            t1_score, t2_score = self.simulate_match(match)
+        for match, (t1_score, t2_score) in zip(matches, self.play_matches(matches)):
             t1 = match.team1
             t2 = match.team2
             winner = t1 if t1_score > t2_score else t2
@@ -1380,8 +1393,10 @@ class RoundRobinTournament:
 class RoundRobinRunner:
     """Runs a complete round robin tournament with simulated battles."""
 
-    def __init__(self, tournament: RoundRobinTournament):
+    def __init__(self, tournament: RoundRobinTournament,
+                 executor: Optional[MatchExecutor] = None):
         self.tournament = tournament
+        self.executor = executor
         self.match_history: List[Dict] = []
 
     def simulate_match(self, match: RoundRobinMatch) -> tuple:
@@ -1408,6 +1423,15 @@ class RoundRobinRunner:
 
         return h_score, a_score
 
+    def play_matches(self, matches: List[RoundRobinMatch]) -> List[tuple]:
+        """Scores for a matchday's fixtures, via the executor if one is set."""
+        if self.executor is None:
+            return [self.simulate_match(match) for match in matches]
+        return self.executor.play(
+            [MatchPairing(m.match_id, m.home_team, m.away_team) for m in matches],
+            allow_draws=self.tournament.allow_draws
+        )
+
     def run_matchday(self, matchday: int, verbose: bool = True):
         """Run all matches in a matchday."""
         matches = self.tournament.get_matchday_fixtures(matchday)
@@ -1419,8 +1443,7 @@ class RoundRobinRunner:
         if verbose:
             self.tournament.print_matchday_header(matchday)
 
-        for match in unplayed:
-            h_score, a_score = self.simulate_match(match)
+        for match, (h_score, a_score) in zip(unplayed, self.play_matches(unplayed)):
             self.tournament.record_match_result(match.match_id, h_score, a_score)
 
             self.match_history.append({
@@ -1573,7 +1596,7 @@ class DoubleEliminationTournament:
         self.grand_finals_best_of = grand_finals_best_of
 
         # Validate and pad to power of 2
-        valid_sizes = [2, 4, 8, 16, 32]
+        valid_sizes = [2, 4, 8, 16, 32, 64]
         if len(teams) not in valid_sizes:
             target_size = min(s for s in valid_sizes if s >= len(teams))
             while len(teams) < target_size:
@@ -2166,8 +2189,10 @@ class DoubleEliminationTournament:
 class DoubleEliminationRunner:
     """Runs a complete double elimination tournament with simulated battles."""
 
-    def __init__(self, tournament: DoubleEliminationTournament):
+    def __init__(self, tournament: DoubleEliminationTournament,
+                 executor: Optional[MatchExecutor] = None):
         self.tournament = tournament
+        self.executor = executor
         self.match_history: List[Dict] = []
 
     def simulate_match(self, match: DoubleElimMatch) -> tuple:
@@ -2199,9 +2224,18 @@ class DoubleEliminationRunner:
 
         return t1_score, t2_score
 
-    def run_match(self, match: DoubleElimMatch, verbose: bool = True):
-        """Run a single match."""
-        t1_score, t2_score = self.simulate_match(match)
+    def play_matches(self, matches: List[DoubleElimMatch]) -> List[tuple]:
+        """Scores for independent matches, via the executor if one is set."""
+        if self.executor is None:
+            return [self.simulate_match(match) for match in matches]
+        return self.executor.play(
+            [MatchPairing(m.match_id, m.team1, m.team2) for m in matches]
+        )
+
+    def run_match(self, match: DoubleElimMatch, verbose: bool = True,
+                  scores: Optional[tuple] = None):
+        """Run a single match (scores: already-played result, if any)."""
+        t1_score, t2_score = scores or self.play_matches([match])[0]
 
         self.tournament.record_match_result(match.match_id, t1_score, t2_score, verbose)
 
@@ -2247,8 +2281,8 @@ class DoubleEliminationRunner:
                 if not matches:
                     break
 
-            for match in matches:
-                self.run_match(match, verbose)
+            for match, scores in zip(matches, self.play_matches(matches)):
+                self.run_match(match, verbose, scores)
 
         if verbose:
             self.tournament.print_bracket()
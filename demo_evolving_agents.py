@@ -51,7 +51,7 @@ def run_training_session(
     print(f"   Battles: {num_battles}")
     print(f"   Database: {db_path}")
     print(f"   Battle Duration: 180s each")
-    print(f"   Mode: Accelerated (0.01s ticks)")
+    print(f"   Mode: Headless (virtual clock)")
 
     # Initialize database
     print("\n📊 Initializing Battle History Database...")
@@ -99,7 +99,7 @@ def run_training_session(
         # Create battle engine
         engine = BattleEngine(
             battle_duration=180,
-            tick_speed=0.01,  # Very fast for training
+            headless=True,  # Virtual clock: no sleeping, no console output
             enable_multipliers=False,
             enable_analytics=True
         )
@@ -336,7 +336,7 @@ def run_comparison_test(
 
         engine = BattleEngine(
             battle_duration=180,
-            tick_speed=0.01,
+            headless=True,
             enable_multipliers=False,
             enable_analytics=True
         )
@@ -384,7 +384,7 @@ def run_comparison_test(
 
         engine = BattleEngine(
             battle_duration=180,
-            tick_speed=0.01,
+            headless=True,
             enable_multipliers=False,
             enable_analytics=True
         )
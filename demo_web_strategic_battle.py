@@ -612,6 +612,9 @@ def run_web_strategic_battle():
                 }
             )
 
+            # Keyframes for replay seeking (events were recorded one by one)
+            ReplayRepository.build_keyframes(battle_id)
+
             # Save agent stats
             agent_performance = engine.analytics.get_agent_performance() if hasattr(engine, 'analytics') else {}
             for agent in team:
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Battle Farm Runner
+==================
+
+Runs N seeded headless battles across a process pool and prints aggregate
+win-rate and score-distribution statistics.
+
+Usage:
+    python run_battle_farm.py -n 1000
+    python run_battle_farm.py -n 5000 --workers 8 --seed 42 --duration 60
+    python run_battle_farm.py -n 1000 --opponent-preset all_in_snipe --opponent-budget 200000
+    python run_battle_farm.py -n 1000 --opponent-file my_opponent.json --json results.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.battle_farm import BattleFarm, DEFAULT_TEAM, make_battle_specs
+from agents.opponent_ai import OpponentBuilder
+
+
+def print_report(report: dict, elapsed: float):
+    """Print the aggregate farm report."""
+    battles = report["battles"]
+
+    print("\n" + "=" * 60)
+    print("🚜 BATTLE FARM RESULTS")
+    print("=" * 60)
+    print(f"   Battles: {battles:,} in {elapsed:.1f}s ({battles / elapsed:,.1f} battles/sec)")
+    print(f"\n   Creator wins:  {report['wins']['creator']:,} ({report['win_rate']['creator']:.1%})")
+    print(f"   Opponent wins: {report['wins']['opponent']:,} ({report['win_rate']['opponent']:.1%})")
+    print(f"   Ties:          {report['wins']['tie']:,}")
+
+    for label, key in (("Creator score", "creator_score"),
+                       ("Opponent score", "opponent_score"),
+                       ("Margin", "margin")):
+        dist = report[key]
+        print(f"\n   {label}:")
+        print(f"      mean {dist['mean']:,.0f} ± {dist['stdev']:,.0f} | "
+              f"min {dist['min']:,.0f} | max {dist['max']:,.0f}")
+        print(f"      p10 {dist['p10']:,.0f} | p50 {dist['p50']:,.0f} | p90 {dist['p90']:,.0f}")
+
+    print("\n   Agents (avg per battle):")
+    for name, stats in sorted(report["agents"].items(), key=lambda x: -x[1]["avg_donated"]):
+        print(f"      {name:<16} {stats['avg_donated']:>10,.0f} pts  {stats['avg_gifts']:>6.1f} gifts")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel Monte Carlo battle farm")
+    parser.add_argument("-n", "--battles", type=int, default=1000, help="Number of battles")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count, 0 = inline)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first battle")
+    parser.add_argument("--duration", type=int, default=300, help="Battle duration in seconds")
+    parser.add_argument("--team", nargs="+", default=DEFAULT_TEAM, help="Agent names")
+    parser.add_argument("--opponent-preset", default=None,
+                        help="OpponentBuilder preset (default: scripted opponent spikes)")
+    parser.add_argument("--opponent-file", default=None,
+                        help="OpponentBuilder JSON config (see OpponentBuilder.save_to_file)")
+    parser.add_argument("--opponent-budget", type=int, default=None, help="Opponent coin budget")
+    parser.add_argument("--json", default=None, help="Write the aggregate report to this file")
+    args = parser.parse_args()
+
+    opponent = None
+    if args.opponent_file:
+        opponent = OpponentBuilder.load_from_file(args.opponent_file).to_dict()
+    elif args.opponent_preset:
+        opponent = OpponentBuilder(args.opponent_preset).from_preset(args.opponent_preset).to_dict()
+
+    specs = make_battle_specs(
+        args.battles,
+        base_seed=args.seed,
+        team=args.team,
+        opponent=opponent,
+        battle_duration=args.duration,
+        opponent_budget=args.opponent_budget
+    )
+
+    farm = BattleFarm(max_workers=args.workers)
+    print(f"🚜 Running {args.battles:,} battles on {farm.max_workers or 'inline'} worker(s)...")
+
+    start = time.perf_counter()
+    report = farm.run(specs)
+    elapsed = time.perf_counter() - start
+
+    print_report(report, elapsed)
+
+    if args.json:
+        report.pop("results")
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,10 +32,9 @@ class BattleRecorder:
         """Record a complete battle."""
 
         # Extract key events
-        all_events = event_bus.get_history()
-        gifts = [e for e in all_events if e.event_type == EventType.GIFT_SENT]
-        messages = [e for e in all_events if e.event_type == EventType.AGENT_DIALOGUE]
-        emotions = [e for e in all_events if e.event_type == EventType.EMOTION_CHANGED]
+        gifts = event_bus.get_history(EventType.GIFT_SENT)
+        messages = event_bus.get_history(EventType.AGENT_DIALOGUE)
+        emotions = event_bus.get_history(EventType.EMOTION_CHANGED)
 
         battle_record = {
             "battle_id": battle_id,
@@ -46,7 +45,7 @@ class BattleRecorder:
                 "total_gifts": len(gifts),
                 "total_messages": len(messages),
                 "emotion_changes": len(emotions),
-                "total_events": len(all_events),
+                "total_events": event_bus.published_count,
             },
             "timeline": {
                 "gifts": [
@@ -0,0 +1,49 @@
+"""
+Shared pytest fixtures.
+
+Fixtures:
+- clock: manually advanced time source for rate/TTL tests
+- db: core.database pointed at a fresh SQLite file
+- history_db: fresh BattleHistoryDB
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import database
+from core.battle_history import BattleHistoryDB
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point the database module at a fresh file for one test."""
+    monkeypatch.setattr(database, "DATABASE_PATH", str(tmp_path / "battles.db"))
+    database.init_database()
+    yield tmp_path / "battles.db"
+    database.close_connection()
+
+
+@pytest.fixture
+def history_db(tmp_path):
+    """A BattleHistoryDB on a fresh file."""
+    history = BattleHistoryDB(str(tmp_path / "history.db"))
+    yield history
+    history.close()
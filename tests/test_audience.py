@@ -0,0 +1,168 @@
+"""
+Tests for the sharded audience tracker.
+
+Tests for:
+- Viewer presence keyed on socket ids
+- One vote per viewer across reconnects, only from joined sockets
+- Concurrent vote bursts
+- Power-up cooldowns and throttled snapshots
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.backend.audience import AudienceTracker
+
+
+# ============================================================================
+# TEST: PRESENCE
+# ============================================================================
+
+class TestPresence:
+    """Tests for joins and disconnects."""
+
+    def test_join_and_disconnect(self):
+        """Counts should follow sockets, not join calls."""
+        audience = AudienceTracker(shards=4)
+        assert audience.join("sid-1", "alice") is True
+        assert audience.join("sid-2", "bob") is True
+        assert audience.viewer_count() == 2
+
+        assert audience.disconnect("sid-1") is True
+        assert audience.viewer_count() == 1
+        assert audience.disconnect("sid-1") is False
+        assert audience.disconnect("unknown") is False
+
+    def test_multiple_tabs(self):
+        """A viewer stays connected until their last socket closes."""
+        audience = AudienceTracker()
+        audience.join("tab-1", "alice")
+        assert audience.join("tab-2", "alice") is False
+        assert audience.viewer_count() == 1
+
+        assert audience.disconnect("tab-1") is False
+        assert audience.viewer_count() == 1
+        assert audience.disconnect("tab-2") is True
+        assert audience.viewer_count() == 0
+
+    def test_non_voters_are_forgotten(self):
+        """Disconnected viewers without votes should not accumulate."""
+        audience = AudienceTracker()
+        for i in range(100):
+            audience.join(f"sid-{i}", f"viewer-{i}")
+        audience.vote("sid-0", "creator")
+        for i in range(100):
+            audience.disconnect(f"sid-{i}")
+
+        stats = audience.get_stats()
+        assert stats["connected"] == 0
+        assert stats["tracked_viewers"] == 1
+        assert stats["sockets"] == 0
+
+
+# ============================================================================
+# TEST: VOTES
+# ============================================================================
+
+class TestVotes:
+    """Tests for vote tallies."""
+
+    def test_one_vote_per_viewer(self):
+        """A viewer can't vote twice, even after reconnecting."""
+        audience = AudienceTracker()
+        audience.join("sid-1", "alice")
+        assert audience.vote("sid-1", "creator") is True
+        audience.disconnect("sid-1")
+        audience.join("sid-2", "alice")
+
+        assert audience.vote("sid-2", "opponent") is False
+        assert audience.vote("sid-2", "nobody") is False
+        assert audience.votes() == {"creator": 1, "opponent": 0}
+
+    def test_unjoined_sockets_cannot_vote(self):
+        """Votes from sockets that never joined are rejected and not tracked."""
+        audience = AudienceTracker()
+        for i in range(50):
+            assert audience.vote(f"sid-{i}", "creator") is False
+
+        stats = audience.get_stats()
+        assert audience.votes() == {"creator": 0, "opponent": 0}
+        assert (stats["tracked_viewers"], stats["votes_rejected"]) == (0, 50)
+
+    def test_non_string_viewer_ids(self):
+        """Numeric viewer ids from the socket payload should be accepted."""
+        audience = AudienceTracker()
+        assert audience.join("sid-1", 42) is True
+        assert audience.vote("sid-1", "creator") is True
+        assert audience.join("sid-2", "42") is False
+        assert audience.disconnect("sid-1") is False
+        assert audience.disconnect("sid-2") is True
+        assert audience.try_powerup(42, "freeze") == 0
+
+    def test_reset(self):
+        """reset_votes should clear tallies and let viewers vote again."""
+        audience = AudienceTracker()
+        audience.join("sid-1", "alice")
+        audience.vote("sid-1", "creator")
+        audience.reset_votes()
+        assert audience.votes() == {"creator": 0, "opponent": 0}
+        assert audience.vote("sid-1", "opponent") is True
+
+    def test_concurrent_burst(self):
+        """Votes from many threads should all be counted exactly once."""
+        audience = AudienceTracker(shards=8)
+        for i in range(4000):
+            audience.join(f"sid-{i}", f"viewer-{i}")
+
+        def voter(offset):
+            for i in range(500):
+                audience.vote(f"sid-{offset + i}", "creator" if i % 3 else "opponent")
+                audience.vote(f"sid-{offset + i}", "creator")  # duplicate
+
+        threads = [threading.Thread(target=voter, args=(n * 500,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        votes = audience.votes()
+        assert sum(votes.values()) == 4000
+        assert votes["opponent"] == 8 * 167
+
+
+# ============================================================================
+# TEST: COOLDOWNS AND SNAPSHOTS
+# ============================================================================
+
+class TestCooldownsAndSnapshots:
+    """Tests for power-up cooldowns and published snapshots."""
+
+    def test_powerup_cooldown(self):
+        """A power-up should be blocked for the cooldown period."""
+        now = [100.0]
+        audience = AudienceTracker(clock=lambda: now[0])
+        assert audience.try_powerup("alice", "freeze") == 0
+        now[0] += 10
+        assert audience.try_powerup("alice", "freeze") == 20
+        assert audience.try_powerup("bob", "freeze") == 0
+        now[0] += 20
+        assert audience.try_powerup("alice", "freeze") == 0
+
+    def test_publishes_snapshots(self):
+        """Joins and votes should publish the latest totals."""
+        published = []
+        audience = AudienceTracker(publish=lambda event, payload: published.append((event, payload)))
+        audience.join("sid-1", "alice")
+        audience.vote("sid-1", "opponent")
+        audience.disconnect("sid-1")
+
+        assert published == [
+            ("viewer_count", {"count": 1}),
+            ("vote_update", {"creator": 0, "opponent": 1}),
+            ("viewer_count", {"count": 0}),
+        ]
+        assert audience.snapshot() == {"votes": {"creator": 0, "opponent": 1}, "total_viewers": 0}
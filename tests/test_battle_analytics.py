@@ -0,0 +1,179 @@
+"""
+Tests for the columnar BattleAnalytics store.
+
+Tests for:
+- Column stores (interning, row materialization, memory footprint)
+- Group-by helpers
+- Report aggregates (agent totals, gift ROI, phase stats)
+- Compatibility views (score_timeline / action_timeline / agent_stats)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.analytics_store import (
+    ActionColumns, ScoreColumns, group_count, group_first_argmax, group_min_max, group_sum,
+)
+from core.battle_analytics import ActionEvent, BattleAnalytics, ScoreSnapshot
+
+
+def play(analytics: BattleAnalytics):
+    analytics.record_battle_start(180, 2)
+    analytics.register_agent("Sniper", "🎯")
+    analytics.register_agent("Whale", "🐋")
+    analytics.register_agent("Idle", "😴")
+    analytics.record_action(10, "Whale", "gift", "Rose", 1, 1.0, False, cost=1)
+    analytics.record_action(50, "Whale", "gift", "Lion", 29999, 1.0, False, cost=29999)
+    analytics.record_action(100, "Sniper", "wait", None, 0, 1.0, False)
+    analytics.record_action(130, "Sniper", "gift", "Rose", 5, 5.0, True, cost=1, combo="x5")
+    analytics.record_action(175, "Sniper", "gift", "Lion", 149995, 5.0, False, cost=29999)
+    analytics.record_score_snapshot(60, 30000, 20000, "NORMAL")
+    analytics.record_score_snapshot(176, 180000, 200000, "FINAL")
+    analytics.record_combo(130, "rose_train", "Sniper", ["Whale"], 5)
+    analytics.record_tactic(175, "Sniper", "snipe", True)
+    analytics.record_battle_end("creator", 180000, 200000)
+
+
+# ============================================================================
+# TEST: STORES
+# ============================================================================
+
+class TestColumnStores:
+    """Tests for the typed column stores."""
+
+    def test_action_rows_materialize(self):
+        store = ActionColumns(ActionEvent)
+        store.append(5, "A", "gift", "Rose", 1, 1.0, False, 1, 0, {"note": 1})
+        store.append(6, "A", "wait", None, 0, 2.0, True, 0, 0)
+
+        assert len(store) == 2 and len(store.agents) == 1
+        assert store[0] == ActionEvent(5, "A", "gift", "Rose", 1, 1.0, False, {"note": 1})
+        assert store[-1].gift_name is None and store[-1].coordinated is True
+        assert [event.time for event in store[0:2]] == [5, 6]
+        with pytest.raises(IndexError):
+            store[2]
+
+    def test_numeric_fields_coerced(self):
+        analytics = BattleAnalytics()
+        analytics.record_action(10.0, "x", "gift", "Rose", points=5.5, cost=1.0)
+        analytics.record_action(11, "y", "gift", "Lion", points=100, cost=29999)
+
+        assert analytics.action_timeline[0] == ActionEvent(10, "x", "gift", "Rose", 5, 1.0, False, {})
+        assert analytics.action_timeline[1] == ActionEvent(11, "y", "gift", "Lion", 100, 1.0, False, {})
+
+    def test_rejected_row_keeps_columns_aligned(self):
+        store = ActionColumns(ActionEvent)
+        with pytest.raises(OverflowError):
+            store.append(10, "x", "gift", "Rose", 2 ** 31, 1.0, False, 1, 0, {"note": 1})
+        store.append(11, "y", "gift", "Lion", 100, 1.0, False, 29999, 0)
+
+        assert len(store) == 1 and store.metadata == {}
+        assert store[0] == ActionEvent(11, "y", "gift", "Lion", 100, 1.0, False, {})
+        assert {len(column) for column in store._columns} == {1}
+
+        scores = ScoreColumns(ScoreSnapshot)
+        with pytest.raises(OverflowError):
+            scores.append(2 ** 31, 1, 2, "NORMAL")
+        scores.append(12, 3, 4.0, "NORMAL")
+        assert len(scores) == 1 and scores[0].opponent_score == 4
+
+    def test_memory_per_action(self):
+        store = ActionColumns(ActionEvent)
+        for i in range(1000):
+            store.append(i, "A", "gift", "Rose", 1, 1.0, False, 1, 0)
+        assert store.nbytes / len(store) == 22
+        assert store[0].multiplier == 1.0 and len(store.multipliers) == 1
+
+
+# ============================================================================
+# TEST: GROUP-BY
+# ============================================================================
+
+class TestGroupBy:
+    """Tests for the group-by helpers."""
+
+    def test_helpers(self):
+        keys = np.array([2, 0, 2, 2])
+        values = np.array([5, 7, 9, 9])
+        rows = np.array([10, 11, 12, 13])
+
+        assert group_count(keys, 4) == [1, 0, 3, 0]
+        assert group_sum(keys, values, 4) == [7, 0, 23, 0]
+        assert group_min_max(keys, values, 4) == ([7, 0, 5, 0], [7, 0, 9, 0])
+        assert group_first_argmax(keys, values, rows, 4) == [11, -1, 12, -1]
+
+
+# ============================================================================
+# TEST: REPORTS
+# ============================================================================
+
+class TestReports:
+    """Tests for reports computed from the columns."""
+
+    def test_agent_stats(self):
+        analytics = BattleAnalytics()
+        play(analytics)
+        stats = analytics.agent_stats
+
+        assert list(stats) == ["Sniper", "Whale", "Idle"]
+        sniper = stats["Sniper"]
+        assert sniper["total_donated"] == 150000 and sniper["gifts_sent"] == 2
+        assert sniper["best_gift"] == {"name": "Lion", "value": 149995}
+        assert sniper["timing"] == {"early": 0, "mid": 0, "late": 1, "final": 1}
+        assert sniper["combos_participated"] == 1 and sniper["tactics_used"] == {"snipe": 1}
+        assert list(stats["Whale"]["gifts_by_type"]) == ["Rose", "Lion"]
+        assert stats["Idle"]["gifts_sent"] == 0
+
+    def test_gift_and_phase_reports(self):
+        analytics = BattleAnalytics()
+        play(analytics)
+
+        gifts = analytics.get_gift_efficiency_report()
+        assert list(gifts["by_gift"]) == ["Rose", "Lion"]
+        assert gifts["by_gift"]["Lion"]["total_points"] == 179994
+        assert gifts["total_gifts"] == 4 and gifts["total_cost"] == 60000
+
+        phases = analytics.phase_stats
+        assert phases["early"]["gifts"] == 2 and phases["final"]["points"] == 149995
+        assert phases["x5"] == {"gifts": 2, "points": 150000, "cost": 30000, "duration": 0}
+
+        assert analytics.gift_timing["Lion"] == [50, 175]
+
+    def test_full_report_is_cached_until_next_action(self):
+        analytics = BattleAnalytics()
+        play(analytics)
+        first = analytics.get_full_report()
+        assert analytics.get_full_report() == first
+
+        analytics.record_action(178, "Idle", "gift", "Rose", 1, 1.0, False, cost=1)
+        assert analytics.agent_stats["Idle"]["gifts_sent"] == 1
+
+
+# ============================================================================
+# TEST: COMPATIBILITY VIEWS
+# ============================================================================
+
+class TestTimelines:
+    """Tests for the sequence views over the stores."""
+
+    def test_timelines(self):
+        analytics = BattleAnalytics()
+        play(analytics)
+
+        assert len(analytics.action_timeline) == 5
+        assert analytics.action_timeline[3].metadata == {"combo": "x5"}
+        assert analytics.score_timeline[-1] == ScoreSnapshot(176, 180000, 200000, -20000, "opponent", "FINAL")
+        assert [p["time"] for p in analytics.get_score_progression()] == [60, 176]
+
+        performance = analytics.get_agent_performance(include_actions=True)
+        assert [a.time for a in performance["Whale"]["actions"]] == [10, 50]
+
+        events = analytics.get_timeline()
+        assert [e["time"] for e in events if e["type"] == "gift"] == [10, 50, 100, 130, 175]
+        assert events[-2]["multiplier"] == 5.0 and events[-1]["type"] == "tactic"
@@ -0,0 +1,199 @@
+"""
+Tests for BattleEngine run modes.
+
+Tests for:
+- Headless mode (virtual clock, no sleeping, per-thread console silence)
+- Per-battle seeded RNG (reproducibility, isolation from the global RNG)
+- Phase multipliers applied to creator gifts
+"""
+
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.advanced_phase_system import AdvancedPhaseManager
+from core.battle_engine import BattleEngine, quiet_output
+from core.event_bus import EventType
+from agents.personas import NovaWhale, PixelPixie, GlitchMancer, ShadowPatron, Dramatron
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def headless_engine():
+    """Create a headless engine with the default persona team."""
+    engine = BattleEngine(battle_duration=300, headless=True)
+    for agent_class in [NovaWhale, PixelPixie, GlitchMancer, ShadowPatron, Dramatron]:
+        engine.add_agent(agent_class())
+    return engine
+
+
+# ============================================================================
+# TEST: HEADLESS MODE
+# ============================================================================
+
+class TestHeadlessMode:
+    """Tests for the virtual-clock headless engine."""
+
+    def test_headless_does_not_sleep(self, headless_engine):
+        """A 300s headless battle should finish far faster than tick_speed allows."""
+        start = time.perf_counter()
+        headless_engine.run()
+        elapsed = time.perf_counter() - start
+
+        # 300 ticks at the default 0.25s tick_speed would take 75s
+        assert elapsed < 5.0
+        assert headless_engine.time_manager.current_time == 300
+
+    def test_headless_produces_no_output(self, headless_engine, capsys):
+        """Headless battles should not write to the console."""
+        headless_engine.run()
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+
+    def test_quiet_output_is_per_thread(self, capsys):
+        """Overlapping quiet sections must not hide or break other threads' output."""
+        steps = [threading.Event() for _ in range(4)]
+
+        def battle(entered, leave):
+            with quiet_output():
+                print("hidden")
+                entered.set()
+                leave.wait()
+
+        first = threading.Thread(target=battle, args=(steps[0], steps[1]))
+        second = threading.Thread(target=battle, args=(steps[2], steps[3]))
+        first.start()
+        steps[0].wait()
+        second.start()
+        steps[2].wait()
+        print("during")
+        steps[1].set()  # first leaves while second is still quiet
+        first.join()
+        print("between")
+        steps[3].set()
+        second.join()
+        print("after")
+
+        assert capsys.readouterr().out == "during\nbetween\nafter\n"
+
+    def test_headless_events_use_battle_time(self, headless_engine):
+        """Events published without a timestamp should carry battle time."""
+        headless_engine.run()
+
+        ended = headless_engine.event_bus.get_history(EventType.BATTLE_ENDED)
+        assert len(ended) == 1
+        assert ended[0].timestamp == 300.0
+
+        for event in headless_engine.event_bus.get_history():
+            assert 0 <= event.timestamp <= 300
+
+    def test_headless_keeps_score_semantics(self, headless_engine):
+        """Final event payload should match the score tracker."""
+        headless_engine.run()
+
+        creator, opponent = headless_engine.score_tracker.get_scores()
+        ended = headless_engine.event_bus.get_history(EventType.BATTLE_ENDED)[0]
+        assert ended.data["creator_score"] == creator
+        assert ended.data["opponent_score"] == opponent
+        assert headless_engine.analytics.final_scores["creator"] == creator
+
+    def test_headless_skips_leaderboard_by_default(self):
+        """Headless engines should not persist leaderboard stats unless asked."""
+        assert BattleEngine(headless=True).record_leaderboard is False
+        assert BattleEngine(headless=True, record_leaderboard=True).record_leaderboard is True
+        assert BattleEngine().record_leaderboard is True
+
+
+# ============================================================================
+# TEST: SEEDED RNG
+# ============================================================================
+
+def _run_seeded(seed):
+    """Run a seeded headless battle and return its scores and event trace."""
+    engine = BattleEngine(battle_duration=120, headless=True, seed=seed)
+    for agent_class in [NovaWhale, PixelPixie, GlitchMancer, ShadowPatron, Dramatron]:
+        engine.add_agent(agent_class())
+    engine.run()
+
+    trace = [(e.event_type, e.timestamp, e.source) for e in engine.event_bus.get_history()]
+    return engine.score_tracker.get_scores(), trace
+
+
+class TestSeededRng:
+    """Tests for the per-battle random source."""
+
+    def test_same_seed_same_battle(self):
+        """Two engines with the same seed should replay identically."""
+        assert _run_seeded(42) == _run_seeded(42)
+
+    def test_seed_independent_of_global_rng(self):
+        """Seeded battles should not depend on the global RNG state."""
+        random.seed(1)
+        first = _run_seeded(42)
+        random.seed(2)
+        second = _run_seeded(42)
+
+        assert first == second
+
+    def test_seeded_battle_leaves_global_rng_alone(self):
+        """Running a seeded battle should not consume global random draws."""
+        agents = [agent_class() for agent_class in [NovaWhale, PixelPixie, GlitchMancer]]
+        state = random.getstate()
+
+        engine = BattleEngine(battle_duration=120, headless=True, seed=9)
+        for agent in agents:
+            engine.add_agent(agent)
+        engine.run()
+
+        assert random.getstate() == state
+
+    def test_different_seeds_differ(self):
+        """Different seeds should produce different battles."""
+        traces = {str(_run_seeded(seed)) for seed in range(3)}
+        assert len(traces) > 1
+
+    def test_agents_share_engine_rng(self):
+        """Agents added to a seeded engine should draw from the battle RNG."""
+        engine = BattleEngine(headless=True, seed=5)
+        agent = PixelPixie()
+        engine.add_agent(agent)
+
+        assert agent.rng is engine.rng
+        assert agent.emotion_system.rng is engine.rng
+        assert engine.multiplier_manager.rng is engine.rng
+
+    def test_unseeded_engine_uses_global_rng(self):
+        """Without a seed, the engine keeps the legacy global RNG behavior."""
+        engine = BattleEngine(headless=True)
+        assert engine.rng is random
+
+
+# ============================================================================
+# TEST: PHASE MULTIPLIERS
+# ============================================================================
+
+class TestPhaseMultiplier:
+    """Tests for creator gifts scored through the phase manager."""
+
+    def test_creator_gifts_use_boost_multiplier(self):
+        """A creator gift during a boost should be multiplied like opponent gifts."""
+        phase_manager = AdvancedPhaseManager(battle_duration=300, rng=random.Random(1))
+        engine = BattleEngine(headless=True, seed=1, phase_manager=phase_manager)
+        phase_manager.boost1_active = True
+        phase_manager.boost1_multiplier = 3.0
+
+        engine.event_bus.publish(EventType.GIFT_SENT, {"gift": "Rose", "points": 100},
+                                 source="NovaWhale", timestamp=10)
+
+        assert engine.score_tracker.get_scores() == (300, 0)
@@ -0,0 +1,92 @@
+"""
+Tests for the parallel battle farm.
+
+Tests for:
+- Seeded reproducibility (inline and across worker processes)
+- Aggregation of analytics summaries
+- OpponentBuilder specs
+- Registered agents in spawned workers
+"""
+
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.battle_farm as battle_farm
+from core.battle_farm import BattleFarm, BattleSpec, aggregate_summaries, make_battle_specs, run_battle
+from agents.opponent_ai import OpponentBuilder
+from agents.personas import NovaWhale
+
+
+def _final_scores(report):
+    return [r["summary"]["battle"]["final_scores"] for r in report["results"]]
+
+
+class TestBattleFarm:
+    """Tests for BattleFarm and run_battle."""
+
+    def test_same_seed_same_battle(self):
+        """Running the same spec twice should give identical results."""
+        spec = BattleSpec(seed=7, battle_duration=60)
+        first = run_battle(spec)
+        second = run_battle(spec)
+
+        assert first["summary"]["battle"] == second["summary"]["battle"]
+
+    def test_process_pool_matches_inline(self):
+        """Results should not depend on which worker runs a battle."""
+        specs = make_battle_specs(6, base_seed=100, battle_duration=60)
+
+        inline = BattleFarm(max_workers=0).run(specs)
+        pooled = BattleFarm(max_workers=2, chunk_size=1).run(specs)
+
+        assert _final_scores(inline) == _final_scores(pooled)
+        assert [r["battle_index"] for r in pooled["results"]] == list(range(6))
+
+    def test_opponent_spec(self):
+        """Opponent specs from OpponentBuilder.to_dict should drive the opponent."""
+        opponent = OpponentBuilder("Sniper").from_preset("all_in_snipe").to_dict()
+        specs = make_battle_specs(2, base_seed=3, opponent=opponent,
+                                  battle_duration=60, opponent_budget=100000)
+
+        report = BattleFarm(max_workers=0).run(specs)
+
+        assert report["battles"] == 2
+        assert _final_scores(report) == _final_scores(BattleFarm(max_workers=0).run(specs))
+
+    def test_unknown_agent_rejected(self):
+        """Team specs must name known agents."""
+        with pytest.raises(ValueError):
+            run_battle(BattleSpec(seed=1, team=["NoSuchAgent"], battle_duration=10))
+
+    def test_registered_agents_reach_spawned_workers(self, monkeypatch):
+        """Workers started with spawn should see agents registered in the parent."""
+        monkeypatch.setitem(battle_farm.AGENT_FACTORIES, "Whale", NovaWhale)
+        specs = make_battle_specs(2, base_seed=5, team=["Whale", "PixelPixie"], battle_duration=30)
+
+        with BattleFarm(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as farm:
+            pooled = farm.run(specs)
+
+        assert _final_scores(pooled) == _final_scores(BattleFarm(max_workers=0).run(specs))
+
+    def test_aggregate_summaries(self):
+        """Win rates and score distributions should be merged correctly."""
+        summaries = [
+            {"battle": {"winner": "creator", "final_scores": {"creator": 300, "opponent": 100}},
+             "agents": {"A": {"total_donated": 300, "gifts_sent": 3}}},
+            {"battle": {"winner": "opponent", "final_scores": {"creator": 100, "opponent": 200}},
+             "agents": {"A": {"total_donated": 100, "gifts_sent": 1}}},
+        ]
+
+        report = aggregate_summaries(summaries)
+
+        assert report["battles"] == 2
+        assert report["win_rate"]["creator"] == 0.5
+        assert report["creator_score"]["mean"] == 200
+        assert report["margin"]["min"] == -100
+        assert report["agents"]["A"]["avg_donated"] == 200
@@ -0,0 +1,152 @@
+"""
+Tests for the Socket.IO broadcast aggregator.
+
+Tests for:
+- Latest-value-wins and batched channels
+- Per-event frame rates
+- Ordering of immediate messages
+- Pass-through when disabled
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.backend import broadcast
+from web.backend.broadcast import BATCH, BroadcastAggregator
+
+
+@pytest.fixture
+def sent():
+    return []
+
+
+@pytest.fixture
+def broadcaster(clock, sent):
+    def emit(event, payload, to=None):
+        sent.append((event, payload, to))
+    # No flusher task: tests drive flush() directly
+    return BroadcastAggregator(emit, rate_hz=10, start_task=lambda fn: None, clock=clock)
+
+
+# ============================================================================
+# TEST: CHANNEL MODES
+# ============================================================================
+
+class TestChannels:
+    """Tests for latest / batch coalescing."""
+
+    def test_latest_value_wins(self, broadcaster, sent):
+        """Only the newest score update in a frame should be sent."""
+        for score in range(5):
+            broadcaster.emit("live_score_update", {"creator_score": score})
+        broadcaster.flush()
+
+        assert sent == [("live_score_update", {"creator_score": 4}, None)]
+        assert broadcaster.get_stats()["coalesced"] == 4
+
+    def test_batch_collects_payloads(self, broadcaster, sent):
+        """Batched events should arrive as one <event>_batch message in order."""
+        for i in range(3):
+            broadcaster.emit("live_gift", {"n": i}, mode=BATCH)
+        broadcaster.flush()
+
+        assert sent == [("live_gift_batch", {"events": [{"n": 0}, {"n": 1}, {"n": 2}]}, None)]
+
+    def test_rooms_and_keys_are_separate_channels(self, broadcaster, sent):
+        """Different rooms/keys should not overwrite each other."""
+        broadcaster.emit("battle_tick", {"t": 1}, key="a")
+        broadcaster.emit("battle_tick", {"t": 2}, key="b")
+        broadcaster.emit("battle_tick", {"t": 3}, room="r1")
+        broadcaster.flush()
+
+        assert len(sent) == 3
+        assert sent[2] == ("battle_tick", {"t": 3}, "r1")
+
+    def test_full_batch_flushes_early(self, clock, sent):
+        """A batch reaching max_batch should be sent without waiting for the frame."""
+        broadcaster = BroadcastAggregator(lambda e, p, to=None: sent.append(e), max_batch=3,
+                                          start_task=lambda fn: None, clock=clock)
+        for i in range(3):
+            broadcaster.emit("live_gift", {"n": i}, mode=BATCH)
+        assert sent == ["live_gift_batch"]
+
+
+# ============================================================================
+# TEST: RATES AND ORDERING
+# ============================================================================
+
+class TestRates:
+    """Tests for frame pacing and immediate sends."""
+
+    def test_event_rate_limit(self, broadcaster, sent, clock):
+        """An event should not be flushed faster than its rate."""
+        broadcaster.event_rates["viewer_count"] = 2
+        broadcaster.emit("viewer_count", {"count": 1})
+        broadcaster.flush()
+
+        clock.now = 0.2
+        broadcaster.emit("viewer_count", {"count": 2})
+        broadcaster.flush()
+        assert len(sent) == 1
+
+        clock.now = 0.5
+        broadcaster.flush()
+        assert sent[-1] == ("viewer_count", {"count": 2}, None)
+
+    def test_emit_now_flushes_pending_first(self, broadcaster, sent):
+        """Immediate messages should follow the updates queued before them."""
+        broadcaster.emit("live_gift", {"n": 1}, mode=BATCH)
+        broadcaster.emit_now("live_battle_ended", {"winner": "creator"})
+
+        assert [event for event, _, _ in sent] == ["live_gift_batch", "live_battle_ended"]
+
+    def test_disabled_passes_through(self, clock, sent):
+        """rate_hz=0 should emit every message directly."""
+        broadcaster = BroadcastAggregator(lambda e, p, to=None: sent.append(p), rate_hz=0, clock=clock)
+        for i in range(3):
+            broadcaster.emit("live_gift", {"n": i}, mode=BATCH)
+        assert sent == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+    def test_stats_report_reduction(self, clock):
+        """Stats should compare inbound and outbound traffic."""
+        broadcaster = BroadcastAggregator(lambda e, p, to=None: None, rate_hz=10,
+                                          start_task=lambda fn: None, clock=clock, measure_bytes=True)
+        for i in range(100):
+            broadcaster.emit("live_gift", {"n": i}, mode=BATCH)
+            broadcaster.emit("live_score_update", {"creator_score": i})
+        broadcaster.flush()
+        clock.now = 1.0
+
+        stats = broadcaster.get_stats()
+        assert stats["messages_in"] == 200
+        assert stats["messages_out"] == 2
+        assert stats["messages_out_per_sec"] == 2.0
+        assert stats["bytes_out"] < stats["bytes_in"]
+
+    def test_bytes_not_measured_by_default(self, broadcaster, monkeypatch):
+        """Payloads should only be serialized for byte counts when asked."""
+        monkeypatch.setattr(broadcast, "_payload_size", lambda payload: pytest.fail("measured"))
+        broadcaster.emit("live_gift", {"n": 1}, mode=BATCH)
+        broadcaster.emit_now("live_battle_ended", {"winner": "creator"})
+
+        assert "bytes_in" not in broadcaster.get_stats()
+
+
+class TestBackgroundFlusher:
+    """Tests for the flusher thread."""
+
+    def test_thread_flushes(self, sent):
+        """Without start_task a daemon thread should deliver frames."""
+        import time
+        broadcaster = BroadcastAggregator(lambda e, p, to=None: sent.append(e), rate_hz=50)
+        broadcaster.emit("viewer_count", {"count": 1})
+
+        deadline = time.time() + 2
+        while not sent and time.time() < deadline:
+            time.sleep(0.01)
+        assert sent == ["viewer_count"]
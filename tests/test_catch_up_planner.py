@@ -0,0 +1,189 @@
+"""
+Tests for the catch-up planner.
+
+Tests for:
+- ChangeTable min-gift counts and count-bounded spends (against brute force)
+- Cross-window allocation (exact for small budgets), glove and time limits
+- Plan cache per budget bucket, shared planner warmed at setup
+- CatchUpOptimizer / BudgetMaximizer plans
+"""
+
+import itertools
+import sys
+from operator import attrgetter
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.catch_up_planner as catch_up_planner
+from core.budget_system import GIFT_CATALOG, BudgetManager, GiftCost
+from core.catch_up_planner import ChangeTable, CatchUpPlanner, PlanWindow
+from core.gift_index import GiftIndex
+from core.strategic_intelligence import (
+    BudgetMaximizer, CatchUpOptimizer, PhaseOpportunity, StrategicIntelligence,
+)
+
+COINS = (1, 5, 30, 99)
+
+
+def brute_max_spend(coins, budget, max_gifts):
+    reachable = {0}
+    for _ in range(max_gifts):
+        reachable |= {r + c for r in reachable for c in coins if r + c <= budget}
+    return max(reachable)
+
+
+def small_index(with_glove: bool = False) -> GiftIndex:
+    gifts = [GiftCost(f"g{c}", c, c, tier="small") for c in COINS]
+    if with_glove:
+        gifts.append(GiftCost("GLOVE", 10, 10, tier="powerup"))
+    return GiftIndex(gifts, coins=attrgetter("cost"))
+
+
+# ============================================================================
+# TEST: CHANGE TABLE
+# ============================================================================
+
+class TestChangeTable:
+    """Tests for min-gift counts and bounded spends."""
+
+    def test_counts_match_brute_force(self):
+        table = ChangeTable(COINS)
+        best = [0] + [None] * (table.size - 1)
+        for c in range(1, table.size):
+            best[c] = min(best[c - d] for d in COINS if d <= c) + 1
+        assert table.counts.tolist() == best
+
+    @pytest.mark.parametrize("max_gifts", [0, 1, 2, 3, 5, 8])
+    def test_max_spend_matches_brute_force(self, max_gifts):
+        table = ChangeTable(COINS)
+        for budget in [0, 1, 4, 29, 98, 100, 197, 250, 400, 1000]:
+            expected = brute_max_spend(COINS, budget, max_gifts)
+            assert table.max_spend(budget, max_gifts) == expected
+
+            counts = table.decompose(budget, max_gifts)
+            assert sum(d * n for d, n in counts.items()) == expected
+            assert sum(counts.values()) <= max_gifts
+
+    def test_periodic_extension(self):
+        table = ChangeTable(COINS)
+        budget = table.size * 3 + 17
+        fewest = [0] * (budget + 1)
+        for c in range(1, budget + 1):
+            fewest[c] = min(fewest[c - d] for d in COINS if d <= c) + 1
+
+        assert table.max_spend(budget, 10 ** 6) == budget
+        counts = table.decompose(budget, fewest[budget])
+        assert sum(d * n for d, n in counts.items()) == budget
+        assert sum(counts.values()) == fewest[budget]
+        assert table.max_spend(budget, fewest[budget] - 1) < budget
+
+    def test_sparse_denominations(self):
+        table = ChangeTable([1, 1000])
+        assert table.max_count == 1000 and table.counts.min() == 0
+
+        assert table.max_spend(1500, 10) == 1009
+        assert table.decompose(1500, 10) == {1000: 1, 1: 9}
+        assert table.max_spend(1500, 1000) == 1500
+
+    def test_needs_unit_gift(self):
+        with pytest.raises(ValueError):
+            ChangeTable([5, 30])
+
+
+# ============================================================================
+# TEST: PLANNER
+# ============================================================================
+
+class TestPlanner:
+    """Tests for cross-window plans."""
+
+    def test_small_budgets_are_exact(self):
+        planner = CatchUpPlanner(small_index(), max_gifts_per_minute=60)
+        windows = [PlanWindow("boost", 3.0, 1), PlanWindow("weak", 2.0, 2), PlanWindow("normal", 1.0, 3)]
+        table = planner.table
+
+        for budget in range(0, 60, 7):
+            best = max(
+                sum(w.multiplier * table.max_spend(b, planner.capacity(w.duration))
+                    for w, b in zip(windows, split))
+                for split in itertools.product(range(budget + 1), repeat=3) if sum(split) == budget
+            )
+            plan = planner.plan(budget, windows)
+            assert plan.total_expected == int(best)
+            assert plan.total_spent <= budget
+
+    def test_time_limit_caps_window(self):
+        planner = CatchUpPlanner(small_index(), max_gifts_per_minute=60)
+        plan = planner.plan(1000, [PlanWindow("boost", 5.0, 2), PlanWindow("normal", 1.0, 60)])
+
+        boost, normal = plan.windows
+        assert boost.budget == 2 * 99 and boost.gifts == {"g99": 2}
+        assert normal.budget == 1000 - 198 and plan.total_spent == 1000
+
+    def test_glove_when_worth_it(self):
+        planner = CatchUpPlanner(small_index(with_glove=True))
+        boosted = planner.plan(5000, [PlanWindow("boost", 3.0, 20, glove=True)]).windows[0]
+        assert boosted.glove and boosted.gifts["GLOVE"] == 1
+        assert boosted.expected_points > 3.0 * 5000
+
+        no_glove = planner.plan(5000, [PlanWindow("normal", 3.0, 20)]).windows[0]
+        assert not no_glove.glove and no_glove.expected_points == 3 * 5000
+
+    def test_plan_cache(self):
+        planner = CatchUpPlanner()
+        windows = [PlanWindow("boost_1", 3.0, 20, glove=True), PlanWindow("final_30s", 1.0, 30, glove=True)]
+        first = planner.plan(100000, windows)
+        again = planner.plan(100000, windows)
+
+        assert planner.get_stats() == {"cached_plans": 1, "cache_hits": 1, "cache_misses": 1}
+        assert first == again and first.total_spent == 100000
+
+    def test_shared_planner_is_warm(self, monkeypatch):
+        """Battle setup should build the table so the first plan() doesn't."""
+        monkeypatch.setattr(catch_up_planner, "_planner_instance", None)
+        StrategicIntelligence(BudgetManager())
+
+        assert catch_up_planner._planner_instance._table is not None
+
+    def test_catalog_gifts(self):
+        plan = CatchUpPlanner().plan(60000, [PlanWindow("boost_1", 2.0, 20)])
+        gifts = plan.windows[0].gifts
+        assert sum(GIFT_CATALOG[name].cost * n for name, n in gifts.items()) == 60000
+        assert gifts["TikTok Universe"] == 1
+
+
+# ============================================================================
+# TEST: OPTIMIZERS
+# ============================================================================
+
+class TestOptimizers:
+    """Tests for CatchUpOptimizer and BudgetMaximizer on the planner."""
+
+    def test_catch_up_plan_prefers_boosts(self):
+        boosts = [PhaseOpportunity("boost_1", 3.0, 10, 20, 0, 0), PhaseOpportunity("boost_2", 2.0, 100, 30, 0, 0)]
+        plan = CatchUpOptimizer.calculate_catch_up_plan(50000, 40000, boosts, 200)
+
+        assert plan["strategy"] == "boost_focused"
+        assert plan["allocations"][0]["phase"] == "boost_1"
+        assert sum(a["budget"] for a in plan["allocations"]) == 40000
+        assert plan["total_expected"] >= 3 * 40000 and plan["can_catch_up"]
+
+    def test_catch_up_plan_without_boosts(self):
+        plan = CatchUpOptimizer.calculate_catch_up_plan(500, 300, [], 120)
+        assert plan["strategy"] == "even_distribution"
+        assert sum(a["budget"] for a in plan["allocations"]) == 300
+        assert plan["total_expected"] >= 300
+
+    def test_spending_windows_keep_final_reserve(self):
+        schedule = [{"start_time": 60, "duration": 20, "multiplier": 3.0},
+                    {"start_time": 180, "duration": 30, "multiplier": 2.0}]
+        windows = BudgetMaximizer.get_optimal_spending_windows(10000, 300, schedule)
+
+        final = windows[-1]
+        assert final["priority"] == "CRITICAL" and final["recommended_spend"] >= 3000
+        assert sum(w["recommended_spend"] for w in windows) == 10000
+        assert windows[0]["start_time"] == 60 and windows[0]["recommended_spend"] == 7000
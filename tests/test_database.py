@@ -0,0 +1,292 @@
+"""
+Tests for the SQLite persistence layer.
+
+Tests for:
+- Per-thread pooled connections (reuse, WAL, reopen on path change)
+- Transactions (commit / rollback)
+- Concurrent reads while a writer holds a transaction
+- Keyframe-based replay seeking
+- Statistics rollups (incremental updates match full aggregates)
+"""
+
+import json
+import random
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import database
+from core.database import BattleRepository, ReplayRepository, get_connection
+
+
+# ============================================================================
+# TEST: CONNECTION POOL
+# ============================================================================
+
+class TestConnectionPool:
+    """Tests for pooled connections."""
+
+    def test_connection_reused_within_thread(self, db):
+        """Repeated calls on one thread should share a connection."""
+        with get_connection() as first:
+            pass
+        with get_connection() as second:
+            pass
+        assert first is second
+
+    def test_threads_get_their_own_connection(self, db):
+        """Each thread should get a separate connection."""
+        connections = []
+
+        def grab():
+            with get_connection() as conn:
+                connections.append(conn)
+            database.close_connection()
+
+        thread = threading.Thread(target=grab)
+        thread.start()
+        thread.join()
+
+        with get_connection() as main_conn:
+            assert connections[0] is not main_conn
+
+    def test_wal_mode_enabled(self, db):
+        """Connections should use the WAL journal."""
+        with get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_path_change_reopens(self, db, tmp_path, monkeypatch):
+        """Changing DATABASE_PATH should open a connection to the new file."""
+        with get_connection() as first:
+            pass
+
+        monkeypatch.setattr(database, "DATABASE_PATH", str(tmp_path / "other.db"))
+        with get_connection() as second:
+            assert second is not first
+            assert second.execute("PRAGMA database_list").fetchone()["file"].endswith("other.db")
+
+    def test_close_connection_reopens(self, db):
+        """close_connection should force a fresh connection next time."""
+        with get_connection() as first:
+            pass
+        database.close_connection()
+        with get_connection() as second:
+            pass
+        assert first is not second
+
+    def test_pooling_can_be_disabled(self, db, monkeypatch):
+        """With pooling off every call should get a new connection."""
+        monkeypatch.setattr(database, "POOL_CONNECTIONS", False)
+        BattleRepository.create_battle("b1", 60)
+
+        assert BattleRepository.get_battle("b1")["duration"] == 60
+
+
+# ============================================================================
+# TEST: TRANSACTIONS
+# ============================================================================
+
+class TestTransactions:
+    """Tests for commit/rollback behavior."""
+
+    def test_commit_on_success(self, db):
+        """Writes should be visible after the block."""
+        BattleRepository.create_battle("b1", 60)
+        ReplayRepository.save_replay_event("b1", 1.0, "gift_sent", {"team": "creator", "points": 5})
+
+        assert len(BattleRepository.get_battle_events("b1")) == 1
+
+    def test_rollback_on_error(self, db):
+        """A failing block should not leave partial writes behind."""
+        with pytest.raises(RuntimeError):
+            with get_connection() as conn:
+                conn.execute("INSERT INTO battles (id, duration) VALUES ('b2', 60)")
+                raise RuntimeError("boom")
+
+        assert BattleRepository.get_battle("b2") is None
+
+    def test_reads_during_open_write_transaction(self, db):
+        """WAL readers on other threads should not block on an open writer."""
+        BattleRepository.create_battle("b1", 60)
+        results = []
+
+        def reader():
+            results.append(BattleRepository.get_battle("b1"))
+            database.close_connection()
+
+        with get_connection() as conn:
+            conn.execute("UPDATE battles SET duration = 120 WHERE id = 'b1'")
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=2)
+
+        assert results and results[0]["duration"] == 60
+        assert BattleRepository.get_battle("b1")["duration"] == 120
+
+
+# ============================================================================
+# TEST: REPLAY SEEKING
+# ============================================================================
+
+def _record_random_battle(battle_id, seed=0, events=400):
+    rng = random.Random(seed)
+    BattleRepository.create_battle(battle_id, 300)
+    rows = []
+    t = 0.0
+    for _ in range(events):
+        t += rng.choice([0.0, 0.5, 1.0])
+        event_type = rng.choice(["gift_sent", "gift_sent", "phase_change", "power_up",
+                                 "glove_activated", "glove_ended"])
+        data = {"team": rng.choice(["creator", "opponent"]), "points": rng.randint(1, 100),
+                "phase": rng.choice(["normal", "boost"]), "multiplier": rng.choice([1.0, 2.0, 3.0])}
+        rows.append((battle_id, t, event_type, json.dumps(data)))
+    ReplayRepository.save_replay_events(rows)
+    return rows
+
+
+def _scan_state(rows, target_time):
+    state = database.new_replay_state()
+    for _, timestamp, event_type, data in rows:
+        if timestamp <= target_time:
+            database.apply_replay_event(state, event_type, json.loads(data))
+    return state
+
+
+class TestReplaySeeking:
+    """Tests for keyframe-based get_state_at_time."""
+
+    def test_keyframe_seek_matches_full_scan(self, db):
+        """Seeking from keyframes should match replaying every event."""
+        rows = _record_random_battle("b1")
+        assert ReplayRepository.build_keyframes("b1", interval=10.0) > 5
+
+        for target in [0, 0.5, 9.5, 10, 37.25, 100, rows[-1][1], 9999]:
+            state = ReplayRepository.get_state_at_time("b1", target)
+            gifts = state.pop("gifts")
+            assert state == _scan_state(rows, target)
+            assert all(g in [json.loads(r[3]) for r in rows] for g in gifts)
+
+    def test_seek_without_keyframes(self, db):
+        """Battles without keyframes should still be reconstructed from t=0."""
+        rows = _record_random_battle("b1", events=50)
+        state = ReplayRepository.get_state_at_time("b1", 20)
+
+        assert len(state.pop("gifts")) == state["gift_count"]
+        assert state == _scan_state(rows, 20)
+
+    def test_range_query_uses_composite_index(self, db):
+        """Range reads should be served by the (battle_id, timestamp) index."""
+        with get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT timestamp, event_type, data FROM battle_events "
+                "WHERE battle_id = ? AND timestamp >= ? AND timestamp <= ? ORDER BY timestamp ASC",
+                ("b1", 0, 10)).fetchall()
+        detail = " ".join(row["detail"] for row in plan)
+        assert "idx_events_battle_time" in detail
+        assert "TEMP B-TREE" not in detail
+
+
+# ============================================================================
+# TEST: STATISTICS ROLLUPS
+# ============================================================================
+
+def _play_battles(count, seed=0):
+    """Create finished battles with agent stats; returns (battles, agent rows)."""
+    rng = random.Random(seed)
+    battles, agents = [], []
+    for i in range(count):
+        battle_id = f"b{i}"
+        battle_type = rng.choice(["standard", "tournament"])
+        creator, opponent = rng.randint(0, 600000), rng.randint(0, 600000)
+        winner = "creator" if creator > opponent else "opponent" if opponent > creator else "tie"
+        BattleRepository.create_battle(battle_id, 300, battle_type)
+        BattleRepository.end_battle(battle_id, creator, opponent, winner)
+        battles.append((battle_type, creator, opponent, winner))
+        for name in rng.sample(["NovaWhale", "PixelPixie", "GlitchMancer"], 2):
+            row = (name, "persona", rng.randint(0, 50000), rng.randint(0, 90),
+                   rng.randint(0, 50000), rng.random())
+            BattleRepository.add_agent_stats(battle_id, *row)
+            agents.append(row)
+    return battles, agents
+
+
+def _expected_statistics(battles):
+    total = len(battles)
+    creator = [b[1] for b in battles]
+    opponent = [b[2] for b in battles]
+    close = sum(1 for _, c, o, _ in battles if abs(c - o) < (c + o) * 0.1)
+    return {
+        'total_battles': total,
+        'creator_wins': sum(1 for b in battles if b[3] == "creator"),
+        'ties': sum(1 for b in battles if b[3] == "tie"),
+        'avg_creator_score': round(sum(creator) / total),
+        'max_opponent_score': max(opponent),
+        'avg_total_score': round((sum(creator) + sum(opponent)) / total),
+        'avg_margin': round(sum(abs(c - o) for c, o in zip(creator, opponent)) / total),
+        'close_battles': close,
+        'battle_types': {t: sum(1 for b in battles if b[0] == t) for t in {b[0] for b in battles}},
+    }
+
+
+class TestStatisticsRollups:
+    """Tests for the materialized analytics tables."""
+
+    def test_rollups_match_history(self, db):
+        """Incrementally maintained stats should equal aggregates over history."""
+        battles, agents = _play_battles(40)
+        stats = BattleRepository.get_advanced_statistics()
+
+        for key, value in _expected_statistics(battles).items():
+            assert stats[key] == value, key
+        assert stats['battles_per_day'][-1]['count'] == 40
+
+        distribution = BattleRepository.get_score_distribution()
+        assert sum(distribution['creator'].values()) == 40
+        assert list(distribution['creator']) == [r for r in distribution['ranges'] if r in distribution['creator']]
+        assert distribution['creator'].get('500K+', 0) == sum(1 for b in battles if b[1] >= 500000)
+
+        agent_stats = {a['agent_name']: a for a in BattleRepository.get_agent_statistics()}
+        nova = [a for a in agents if a[0] == "NovaWhale"]
+        assert agent_stats["NovaWhale"]['battles'] == len(nova)
+        assert agent_stats["NovaWhale"]['total_points'] == sum(a[2] for a in nova)
+        assert agent_stats["NovaWhale"]['avg_efficiency'] == pytest.approx(sum(a[5] for a in nova) / len(nova))
+
+    def test_unfinished_battles_not_counted(self, db):
+        """Only ended battles should count towards results."""
+        BattleRepository.create_battle("live", 300)
+
+        assert BattleRepository.get_statistics()['total_battles'] == 0
+        assert BattleRepository.get_advanced_statistics()['battles_per_day'][-1]['count'] == 1
+
+    def test_re_ending_battle_replaces_result(self, db):
+        """Ending a battle twice should not double count it."""
+        BattleRepository.create_battle("b1", 60)
+        BattleRepository.end_battle("b1", 900000, 10, "creator")
+        BattleRepository.end_battle("b1", 10, 20, "opponent")
+
+        stats = BattleRepository.get_advanced_statistics()
+        assert (stats['total_battles'], stats['creator_wins'], stats['opponent_wins']) == (1, 0, 1)
+        assert stats['max_creator_score'] == 10
+
+    def test_rebuild_backfills_existing_database(self, db):
+        """Databases created before the rollups should be backfilled."""
+        battles, _ = _play_battles(10)
+        expected = BattleRepository.get_advanced_statistics()
+        expected_agents = BattleRepository.get_agent_statistics()
+
+        with get_connection() as conn:
+            for table in ("stats_totals", "stats_winners", "stats_battle_types",
+                          "stats_score_buckets", "stats_daily", "stats_agents"):
+                conn.execute(f"DROP TABLE {table}")
+        database.init_database()
+
+        assert BattleRepository.get_advanced_statistics() == expected
+        assert BattleRepository.get_agent_statistics() == expected_agents
+
+        BattleRepository.rebuild_statistics()
+        assert BattleRepository.get_advanced_statistics() == expected
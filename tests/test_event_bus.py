@@ -0,0 +1,337 @@
+"""
+Tests for the EventBus.
+
+Tests for:
+- History queries (per-type indexes, publish order, since filter)
+- Retention policy (ring buffer, per-type caps, history off)
+- Incremental statistics
+- Queued dispatch (worker thread, manual/asyncio drain, batched subscribers)
+- Compact BattleEvent (slots, lazy payloads)
+"""
+
+import asyncio
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.battle_engine import BattleEngine
+from core.event_bus import BattleEvent, EventBus, EventType
+from agents.personas import NovaWhale, PixelPixie, GlitchMancer
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def _publish_battle(bus, ticks=10):
+    """Publish a tick, a gift on even ticks and a score change on odd ticks."""
+    for t in range(ticks):
+        bus.publish(EventType.BATTLE_TICK, {"time": t}, timestamp=t)
+        if t % 2 == 0:
+            bus.publish(EventType.GIFT_SENT, {"points": t}, source="NovaWhale", timestamp=t)
+        else:
+            bus.publish(EventType.SCORE_CHANGED, {"score": t}, timestamp=t)
+
+
+@pytest.fixture
+def bus():
+    """Unbounded bus with a short battle published."""
+    bus = EventBus()
+    _publish_battle(bus)
+    return bus
+
+
+# ============================================================================
+# TEST: HISTORY QUERIES
+# ============================================================================
+
+class TestHistory:
+    """Tests for get_history."""
+
+    def test_unfiltered_history_in_publish_order(self, bus):
+        """All events should come back in the order they were published."""
+        history = bus.get_history()
+
+        assert len(history) == 20
+        assert [e.timestamp for e in history] == sorted(e.timestamp for e in history)
+        assert history[0].event_type == EventType.BATTLE_TICK
+        assert history[1].event_type == EventType.GIFT_SENT
+
+    def test_filter_by_type(self, bus):
+        """Filtered queries should return only that type, in order."""
+        gifts = bus.get_history(EventType.GIFT_SENT)
+
+        assert [e.data["points"] for e in gifts] == [0, 2, 4, 6, 8]
+        assert bus.get_history(EventType.MESSAGE_SENT) == []
+
+    def test_since_filter(self, bus):
+        """Events before `since` should be excluded."""
+        assert [e.timestamp for e in bus.get_history(EventType.BATTLE_TICK, since=7)] == [7, 8, 9]
+        assert len(bus.get_history(since=8)) == 4
+
+    def test_clear_history(self, bus):
+        """Clearing should drop history and statistics."""
+        bus.clear_history()
+
+        assert bus.get_history() == []
+        assert bus.get_stats() == {}
+        assert bus.published_count == 0
+
+
+# ============================================================================
+# TEST: RETENTION POLICY
+# ============================================================================
+
+class TestRetention:
+    """Tests for history_limit, type_limits and keep_history."""
+
+    def test_ring_buffer_drops_oldest(self):
+        """A global limit should keep only the most recent events."""
+        bus = EventBus(history_limit=5)
+        _publish_battle(bus)
+
+        history = bus.get_history()
+        assert len(history) == 5
+        assert [e.timestamp for e in history] == [7, 8, 8, 9, 9]
+        assert [e.timestamp for e in bus.get_history(EventType.GIFT_SENT)] == [8]
+        assert bus.get_retention_stats()["evicted"] == 15
+
+    def test_type_limits(self):
+        """Per-type caps should only trim that type."""
+        bus = EventBus(type_limits={EventType.BATTLE_TICK: 2})
+        _publish_battle(bus)
+
+        assert [e.timestamp for e in bus.get_history(EventType.BATTLE_TICK)] == [8, 9]
+        assert len(bus.get_history(EventType.GIFT_SENT)) == 5
+        assert len(bus.get_history()) == 12
+
+    def test_type_limits_with_ring_buffer(self):
+        """Per-type caps and a global limit should compose."""
+        bus = EventBus(history_limit=4, type_limits={EventType.BATTLE_TICK: 1})
+        _publish_battle(bus, ticks=200)
+
+        history = bus.get_history()
+        assert len(history) == 4
+        assert [e.event_type for e in history].count(EventType.BATTLE_TICK) == 1
+        assert history[-1].timestamp == 199
+        assert len(bus._order) <= 2 * bus.history_limit + 64
+
+    def test_history_off(self):
+        """keep_history=False should store nothing but still count events."""
+        bus = EventBus(keep_history=False)
+        _publish_battle(bus)
+
+        assert bus.get_history() == []
+        assert bus.published_count == 20
+
+    def test_subscribers_unaffected_by_retention(self):
+        """Handlers should see every event regardless of retention."""
+        received = []
+        bus = EventBus(history_limit=1)
+        bus.subscribe(EventType.GIFT_SENT, received.append)
+        _publish_battle(bus)
+
+        assert len(received) == 5
+
+
+# ============================================================================
+# TEST: STATISTICS
+# ============================================================================
+
+class TestStats:
+    """Tests for get_stats."""
+
+    def test_stats_by_type(self, bus):
+        """Stats should count events by type name."""
+        assert bus.get_stats() == {"BATTLE_TICK": 10, "GIFT_SENT": 5, "SCORE_CHANGED": 5}
+
+    def test_stats_include_evicted_events(self):
+        """Stats should count every published event, not just retained ones."""
+        bus = EventBus(history_limit=3)
+        _publish_battle(bus)
+
+        assert bus.get_stats()["BATTLE_TICK"] == 10
+        assert bus.published_count == 20
+
+    def test_stats_are_a_copy(self, bus):
+        """Mutating the returned stats should not affect the bus."""
+        bus.get_stats()["BATTLE_TICK"] = 0
+        assert bus.get_stats()["BATTLE_TICK"] == 10
+
+
+# ============================================================================
+# TEST: QUEUED DISPATCH
+# ============================================================================
+
+class TestQueuedDispatch:
+    """Tests for dispatch="thread" / "manual" and batched subscribers."""
+
+    def test_unknown_dispatch_mode(self):
+        """Invalid dispatch modes should be rejected."""
+        with pytest.raises(ValueError):
+            EventBus(dispatch="eventually")
+
+    def test_manual_dispatch_waits_for_flush(self):
+        """Queued events should only reach subscribers on flush."""
+        received = []
+        bus = EventBus(dispatch="manual")
+        bus.subscribe(EventType.GIFT_SENT, received.append)
+        _publish_battle(bus)
+
+        assert received == []
+        assert bus.pending_events == 5
+
+        bus.flush()
+        assert [e.data["points"] for e in received] == [0, 2, 4, 6, 8]
+        assert bus.pending_events == 0
+
+    def test_inline_subscribers_run_in_publish(self):
+        """inline=True handlers should still run synchronously."""
+        inline, deferred = [], []
+        bus = EventBus(dispatch="manual")
+        bus.subscribe(EventType.GIFT_SENT, inline.append, inline=True)
+        bus.subscribe(EventType.GIFT_SENT, deferred.append)
+        _publish_battle(bus)
+
+        assert len(inline) == 5
+        assert deferred == []
+
+    def test_batched_subscriber(self):
+        """batch=True handlers should get one list per drain."""
+        batches = []
+        bus = EventBus(dispatch="manual")
+        bus.subscribe(EventType.BATTLE_TICK, batches.append, batch=True)
+        _publish_battle(bus)
+        bus.flush()
+
+        assert len(batches) == 1
+        assert [e.timestamp for e in batches[0]] == list(range(10))
+
+    def test_thread_dispatch_preserves_order(self):
+        """The worker thread should deliver every event in publish order."""
+        received = []
+        bus = EventBus(dispatch="thread")
+        bus.subscribe(EventType.BATTLE_TICK, received.append)
+        _publish_battle(bus, ticks=500)
+        bus.flush()
+
+        assert [e.timestamp for e in received] == list(range(500))
+        bus.close()
+
+    def test_slow_subscriber_does_not_block_publish(self):
+        """publish should return without waiting for deferred handlers."""
+        bus = EventBus(dispatch="thread")
+        bus.subscribe(EventType.GIFT_SENT, lambda event: time.sleep(0.02))
+
+        start = time.perf_counter()
+        _publish_battle(bus)
+        elapsed = time.perf_counter() - start
+        bus.close()
+
+        assert elapsed < 0.05
+        assert bus.pending_events == 0
+
+    def test_handler_latency_stats(self):
+        """Queued dispatch should record per-handler latency and errors."""
+        def failing(event):
+            raise RuntimeError("boom")
+
+        bus = EventBus(dispatch="manual")
+        bus.subscribe(EventType.GIFT_SENT, failing)
+        _publish_battle(bus)
+        bus.flush()
+
+        stats = bus.get_handler_stats()
+        name = next(key for key in stats if key.endswith("failing"))
+        assert stats[name]["calls"] == 5
+        assert stats[name]["errors"] == 5
+        assert stats[name]["max_ms"] >= stats[name]["avg_ms"] >= 0
+
+    def test_run_async_drains_queue(self):
+        """run_async should deliver queued events from an asyncio task."""
+        received = []
+        bus = EventBus(dispatch="manual")
+        bus.subscribe(EventType.GIFT_SENT, received.append)
+
+        async def scenario():
+            task = asyncio.create_task(bus.run_async(interval=0.001))
+            _publish_battle(bus)
+            await asyncio.sleep(0.01)
+            task.cancel()
+
+        asyncio.run(scenario())
+        assert len(received) == 5
+
+    def test_engine_scores_match_sync_dispatch(self):
+        """A battle on a threaded bus should score exactly like a sync one."""
+        def run(bus):
+            engine = BattleEngine(battle_duration=60, headless=True, seed=3, event_bus=bus)
+            for agent_class in [NovaWhale, PixelPixie, GlitchMancer]:
+                engine.add_agent(agent_class())
+            engine.run()
+            return engine.score_tracker.get_scores()
+
+        threaded = EventBus(dispatch="thread")
+        gifts = []
+        threaded.subscribe(EventType.GIFT_SENT, gifts.extend, batch=True)
+
+        assert run(threaded) == run(EventBus())
+        assert len(gifts) == threaded.get_stats()["GIFT_SENT"]
+        threaded.close()
+
+
+# ============================================================================
+# TEST: COMPACT EVENTS
+# ============================================================================
+
+class TestCompactEvents:
+    """Tests for the slotted BattleEvent and publish_fields."""
+
+    def test_events_have_no_instance_dict(self):
+        """Events should be slotted."""
+        event = BattleEvent(EventType.GIFT_SENT, 1.0, {"points": 5}, "NovaWhale")
+        assert not hasattr(event, "__dict__")
+
+    def test_publish_fields_builds_data_lazily(self):
+        """publish_fields payloads should read like regular dicts."""
+        received = []
+        bus = EventBus()
+        bus.subscribe(EventType.GIFT_SENT, received.append)
+        bus.publish_fields(EventType.GIFT_SENT, ("NovaWhale", "Rose", 1, "CALM"),
+                           source="NovaWhale", timestamp=3)
+
+        event = received[0]
+        assert event._data is None
+        assert event.data == {"agent": "NovaWhale", "gift": "Rose", "points": 1, "emotion": "CALM"}
+        assert event.data is event.data
+
+    def test_lazy_and_dict_events_compare_equal(self):
+        """Lazy events should equal the same event built from a dict."""
+        bus = EventBus()
+        bus.publish_fields(EventType.BATTLE_TICK, (5, "EARLY", 55), timestamp=5)
+        bus.publish(EventType.BATTLE_TICK, {"time": 5, "phase": "EARLY", "time_remaining": 55},
+                    timestamp=5)
+
+        lazy, eager = bus.get_history()
+        assert lazy == eager
+
+    def test_events_pickle(self):
+        """Events should survive pickling (e.g. across worker processes)."""
+        event = BattleEvent.from_fields(EventType.GIFT_SENT, 2.0, ("agent", "points"),
+                                        ("NovaWhale", 10), "NovaWhale")
+        assert pickle.loads(pickle.dumps(event)) == event
+
+    def test_sources_are_interned(self):
+        """Equal source strings should share one object."""
+        bus = EventBus()
+        bus.publish(EventType.GIFT_SENT, source="".join(["Nova", "Whale"]), timestamp=1)
+        bus.publish(EventType.GIFT_SENT, source="".join(["Nova", "Whale"]), timestamp=2)
+
+        first, second = bus.get_history()
+        assert first.source is second.source
@@ -0,0 +1,170 @@
+"""
+Tests for the immutable GiftIndex and the catalogs built on it.
+
+Tests for:
+- Budget queries against brute-force scans (random catalogs with ties)
+- Tier subsets, name lookups and efficiency ordering
+- Call sites: GiftCatalog, TikTok catalog, BudgetManager, budget_system
+"""
+
+import random
+import sys
+from dataclasses import dataclass
+from operator import attrgetter
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import budget_system
+from core.budget_manager import DEFAULT_GIFT_INDEX, BattlePhase, BudgetManager
+from core.budget_system import GIFT_CATALOG, GIFT_INDEX, BudgetStrategy
+from core.gift_catalog import GiftCatalog
+from core.gift_index import GiftIndex
+from core.tiktok_gifts_catalog import TIKTOK_GIFTS_CATALOG, get_affordable_gifts, get_gifts_by_tier
+
+
+@dataclass(frozen=True)
+class FakeGift:
+    name: str
+    coins: int
+    points: int
+    tier: str
+
+
+def random_catalog(n: int, seed: int):
+    rng = random.Random(seed)
+    return [FakeGift(f"g{i}", rng.choice([0, 1, 5, 5, 30, 100, 100, 999]),
+                     rng.choice([0, 1, 10, 50, 100, 500]), rng.choice(["a", "b", "c"]))
+            for i in range(n)]
+
+
+def first_best(gifts, key):
+    """Gift with the best key; ties go to the cheaper gift, then catalog order."""
+    best = None
+    for gift in sorted(gifts, key=lambda g: g.coins):
+        if best is None or key(gift) > key(best):
+            best = gift
+    return best
+
+
+# ============================================================================
+# TEST: QUERIES
+# ============================================================================
+
+class TestQueries:
+    """Tests for GiftIndex budget queries."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_queries_match_brute_force(self, seed):
+        gifts = random_catalog(40, seed)
+        index = GiftIndex(gifts)
+
+        for budget in [-1, 0, 1, 4, 5, 50, 100, 500, 999, 10 ** 6]:
+            affordable = [g for g in gifts if g.coins <= budget]
+            assert list(index.affordable(budget)) == sorted(affordable, key=lambda g: g.coins)
+            assert index.max_affordable(budget) == first_best(affordable, lambda g: g.coins)
+            assert index.max_points_affordable(budget) == first_best(affordable, lambda g: g.points)
+            assert index.cheapest(budget) == (min(affordable, key=lambda g: g.coins) if affordable else None)
+
+            for target in [0, 1, 50, 101, 500, 501]:
+                worth = [g for g in affordable if g.points >= target]
+                expected = min(worth, key=lambda g: g.coins) if worth else None
+                assert index.cheapest_at_least(target, budget) == expected
+
+    def test_in_range_inclusive(self):
+        index = GiftIndex(random_catalog(30, 7))
+        assert all(5 <= g.coins <= 100 for g in index.in_range(5, 100))
+        assert len(index.in_range(5, 100)) == sum(5 <= g.coins <= 100 for g in index)
+        assert index.in_range(101, 100) == ()
+
+    def test_most_efficient(self):
+        gifts = [FakeGift("free", 0, 10, "a"), FakeGift("ok", 10, 20, "a"),
+                 FakeGift("great", 10, 50, "b"), FakeGift("big", 100, 150, "b")]
+        index = GiftIndex(gifts)
+
+        assert index.most_efficient(100).name == "great"
+        assert index.most_efficient(5).name == "free"  # zero-cost gifts rate 0 but still qualify
+        assert index.most_efficient(100, min_points=100).name == "big"
+        assert index.most_efficient(100, min_points=1000) is None
+
+    def test_empty_index(self):
+        index = GiftIndex([])
+        assert len(index) == 0 and index.affordable(100) == ()
+        assert index.max_affordable(100) is None and index.cheapest_at_least(1) is None
+
+
+# ============================================================================
+# TEST: LOOKUPS
+# ============================================================================
+
+class TestLookups:
+    """Tests for names, tiers and subsets."""
+
+    def test_names(self):
+        index = GiftIndex(GIFT_CATALOG.values(), coins=attrgetter("cost"))
+        assert index.get("Lion") is GIFT_CATALOG["Lion"] and index.get("lion") is None
+        assert index.get("lion", ignore_case=True) is GIFT_CATALOG["Lion"]
+        assert index.get("nope", ignore_case=True) is None
+
+    def test_subset_is_cached_and_filtered(self):
+        gifts = random_catalog(30, 3)
+        index = GiftIndex(gifts)
+        subset = index.subset(["a", "b"])
+
+        assert subset is index.subset(("b", "a"))
+        assert list(subset) == sorted([g for g in gifts if g.tier in ("a", "b")], key=lambda g: g.coins)
+        assert index.tier("c") == tuple(g for g in gifts if g.tier == "c")
+
+
+# ============================================================================
+# TEST: CALL SITES
+# ============================================================================
+
+class TestCallSites:
+    """Tests for the catalogs and managers that query the index."""
+
+    def test_gift_catalog_selection(self):
+        catalog = GiftCatalog()
+        assert catalog.select_gift_for_budget(2000, "max").coins == max(
+            g.coins for g in catalog.gifts if g.coins <= 2000)
+        assert catalog.select_gift_for_budget(0, "min") is None
+        assert all(10 <= g.coins <= 100 for g in catalog.get_gifts_in_budget(100, 10))
+
+    def test_tiktok_catalog(self):
+        affordable = get_affordable_gifts(100)
+        assert {g.name for g in affordable} == {
+            g.name for g in TIKTOK_GIFTS_CATALOG.values() if g.coins <= 100}
+        assert [g.coins for g in affordable] == sorted(g.coins for g in affordable)
+        tier = next(iter(TIKTOK_GIFTS_CATALOG.values())).tier
+        assert get_gifts_by_tier(tier) == [g for g in TIKTOK_GIFTS_CATALOG.values() if g.tier == tier]
+
+    def test_budget_manager_gifts(self):
+        manager = BudgetManager(total_coins=5000)
+        manager.allocate_for_battle()
+        phase = BattlePhase.BOOST_1
+        budget = manager.get_phase_budget(phase)
+        gifts = DEFAULT_GIFT_INDEX.affordable(budget)
+
+        assert manager.get_optimal_gift(phase).name == "Rose"
+        assert manager.get_optimal_gift(phase, prefer_efficiency=False) == first_best(
+            gifts, lambda g: g.points)
+        assert manager.get_optimal_gift(phase, min_impact=budget + 1, prefer_efficiency=False) is None
+        assert manager.get_gift_for_target_points(1500, phase, allow_overspend=True).name == "Star of Red Carpet"
+        assert manager.get_gift_for_target_points(10 ** 6, phase, allow_overspend=True).name == "Yacht"
+
+    def test_budget_system_helpers(self):
+        assert budget_system.get_gift_cost("lion") == GIFT_CATALOG["Lion"].cost
+        assert budget_system.get_gift_cost("unknown") == 100
+        assert budget_system.get_gift_info("Rose") is GIFT_CATALOG["Rose"]
+
+    def test_budget_strategy_accepts_index_or_list(self):
+        allocation = {"max_tier": "medium", "spend_ratio": 0.5, "aggression": 0.9}
+        from_index = BudgetStrategy.select_gift_for_budget(GIFT_INDEX, allocation, 10000)
+        from_list = BudgetStrategy.select_gift_for_budget(list(GIFT_CATALOG.values()), allocation, 10000)
+
+        assert from_index is from_list
+        assert from_index.tier in ("small", "medium") and from_index.cost <= 5000
+        assert BudgetStrategy.select_gift_for_budget([], allocation, 10000) is None
@@ -0,0 +1,185 @@
+"""
+Tests for real-engine tournament match execution.
+
+Tests for:
+- Battle seeds (shared by both sides), required lineups and match-order results
+- Tie-breaking and draws
+- Process pool vs inline determinism
+- BattleFarm worker reuse across batches
+- Elimination, round robin and double elimination runners on an executor
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.battle_farm as battle_farm
+from core.battle_farm import BattleFarm, make_battle_specs, run_battle
+from core.match_executor import BattleMatchExecutor, MatchPairing
+from core.tournament_bracket import (
+    DoubleEliminationRunner, DoubleEliminationTournament, EliminationTournament,
+    RoundRobinRunner, RoundRobinTournament, TournamentRunner, TournamentTeam
+)
+
+DURATION = 20
+
+
+def make_teams(n: int):
+    return [TournamentTeam(name=f"Team {i + 1}", seed=i + 1) for i in range(n)]
+
+
+def make_lineups(n: int):
+    """One persona per team, cycling through the default team."""
+    return {f"Team {i + 1}": [battle_farm.DEFAULT_TEAM[i % len(battle_farm.DEFAULT_TEAM)]]
+            for i in range(n)}
+
+
+def named_lineups(n: int):
+    """Lineups naming the team itself (for fake battles keyed on the lineup)."""
+    return {f"Team {i + 1}": [f"Team {i + 1}"] for i in range(n)}
+
+
+def scores(history):
+    return [(h.get("team1_score", h.get("home_score")), h.get("team2_score", h.get("away_score")))
+            for h in history]
+
+
+def fixed_scores(monkeypatch, score):
+    """Replace run_battle with score(team_name, battle_seed) as the creator score."""
+    def fake_run_battle(spec):
+        creator = score(spec.team[0], spec.seed)
+        summary = {"battle": {"final_scores": {"creator": creator, "opponent": 0}}}
+        return {"battle_index": spec.battle_index, "seed": spec.seed, "summary": summary}
+    monkeypatch.setattr(battle_farm, "run_battle", fake_run_battle)
+
+
+# ============================================================================
+# TEST: EXECUTOR
+# ============================================================================
+
+class TestBattleMatchExecutor:
+    """Tests for BattleMatchExecutor."""
+
+    def test_specs_per_side(self):
+        lineups = {"Team 1": battle_farm.DEFAULT_TEAM, "Team 2": ["NovaWhale"]}
+        executor = BattleMatchExecutor(lineups, base_seed=100, battle_duration=DURATION)
+        t1, t2 = make_teams(2)
+        specs = executor.make_specs([MatchPairing(7, t1, t2)])
+
+        # Same battle for both sides; only the lineup differs
+        assert [s.seed for s in specs] == [107, 107]
+        assert [s.battle_index for s in specs] == [0, 1]
+        assert specs[0].team == battle_farm.DEFAULT_TEAM and specs[1].team == ["NovaWhale"]
+
+    def test_missing_lineup_rejected(self):
+        executor = BattleMatchExecutor({"Team 1": ["NovaWhale"]}, max_workers=0)
+        with pytest.raises(ValueError, match="Team 2"):
+            executor.play([MatchPairing(1, *make_teams(2))])
+
+    def test_scores_are_creator_scores(self):
+        executor = BattleMatchExecutor(make_lineups(4), base_seed=5, battle_duration=DURATION,
+                                       max_workers=0)
+        t1, t2, t3, t4 = make_teams(4)
+        pairings = [MatchPairing(1, t1, t4), MatchPairing(2, t2, t3)]
+
+        results = executor.play(pairings)
+
+        for spec, score in zip(executor.make_specs(pairings), [s for pair in results for s in pair]):
+            creator = run_battle(spec)["summary"]["battle"]["final_scores"]["creator"]
+            assert abs(score - creator) <= 1  # +1 only on a tie-break
+
+    def test_pool_matches_inline(self):
+        pairings = [MatchPairing(i, *make_teams(2)) for i in range(1, 5)]
+        inline = BattleMatchExecutor(make_lineups(2), base_seed=9, battle_duration=DURATION,
+                                     max_workers=0)
+        with BattleMatchExecutor(make_lineups(2), base_seed=9, battle_duration=DURATION,
+                                 max_workers=2, chunk_size=1) as pooled:
+            assert pooled.play(pairings) == inline.play(pairings)
+
+    @pytest.mark.parametrize("allow_draws, expected", [(False, (500, 501)), (True, (500, 500))])
+    def test_ties(self, monkeypatch, allow_draws, expected):
+        fixed_scores(monkeypatch, lambda team, seed: 500)
+        strong, weak = make_teams(2)
+        executor = BattleMatchExecutor(named_lineups(2), max_workers=0)
+
+        assert executor.play([MatchPairing(1, weak, strong)], allow_draws) == [expected]
+
+
+class TestFarmPoolReuse:
+    """Tests for BattleFarm as a context manager."""
+
+    def test_pool_kept_across_runs(self):
+        specs = make_battle_specs(2, base_seed=1, battle_duration=DURATION)
+        with BattleFarm(max_workers=2) as farm:
+            pool = farm._pool
+            first = farm.run(specs)
+            second = farm.run(specs)
+            assert farm._pool is pool
+        assert farm._pool is None
+        assert first["results"] == second["results"]
+
+
+# ============================================================================
+# TEST: RUNNERS
+# ============================================================================
+
+class TestRunnersWithExecutor:
+    """Tests for tournament runners driven by an executor."""
+
+    def test_elimination(self, monkeypatch):
+        # The higher-numbered team always wins
+        fixed_scores(monkeypatch, lambda team, seed: 1000 + int(team.split()[1]))
+        tournament = EliminationTournament(make_teams(8))
+        executor = BattleMatchExecutor(named_lineups(8), max_workers=0)
+        TournamentRunner(tournament, executor=executor).run_tournament(verbose=False)
+
+        assert tournament.is_complete()
+        assert tournament.champion.name == "Team 8"
+
+    def test_round_robin_records_in_fixture_order(self):
+        tournament = RoundRobinTournament(make_teams(4))
+        runner = RoundRobinRunner(tournament, executor=BattleMatchExecutor(
+            make_lineups(4), base_seed=3, battle_duration=DURATION, max_workers=0))
+        runner.run_tournament(verbose=False)
+
+        assert tournament.is_complete
+        assert [(h["home"], h["away"]) for h in runner.match_history] == \
+            [(m.home_team.name, m.away_team.name) for m in tournament.fixtures]
+
+    def test_double_elimination_is_reproducible(self, capsys):
+        def run(max_workers):
+            tournament = DoubleEliminationTournament(make_teams(8))
+            with BattleMatchExecutor(make_lineups(8), base_seed=11, battle_duration=DURATION,
+                                     max_workers=max_workers) as executor:
+                runner = DoubleEliminationRunner(tournament, executor=executor)
+                runner.run_tournament(verbose=False)
+            return tournament.champion.name, scores(runner.match_history)
+
+        champion, history = run(0)
+        assert len(history) in (14, 15)
+        assert run(2) == (champion, history)
+
+    def test_64_team_double_elimination(self, monkeypatch, capsys):
+        fixed_scores(monkeypatch, lambda team, seed: (31 * int(team.split()[1]) + 17 * seed) % 997)
+        teams = make_teams(64)
+        tournament = DoubleEliminationTournament(teams)
+        runner = DoubleEliminationRunner(tournament, executor=BattleMatchExecutor(
+            named_lineups(64), max_workers=0))
+        runner.run_tournament(verbose=False)
+
+        assert tournament.is_complete() and tournament.champion.losses <= 1
+        assert len(runner.match_history) in (126, 127)
+        assert sum(t.losses for t in teams) == len(runner.match_history)
+
+    def test_simulate_match_without_executor(self):
+        class FixedRunner(TournamentRunner):
+            def simulate_match(self, match):
+                return (2, 1)
+
+        tournament = EliminationTournament(make_teams(4))
+        FixedRunner(tournament).run_tournament(verbose=False)
+        assert tournament.champion.seed == 1
@@ -0,0 +1,198 @@
+"""
+Tests for the array-backed Q-learning agent.
+
+Tests for:
+- Dense Q-table rows and the dict-compatible mapping view
+- Sequential updates matching the tabular Q-learning rule
+- Ring-buffer replay memory
+- Vectorized experience replay
+- JSON save/load round trip
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.learning_system import (
+    ACTIONS, ActionType, Experience, QLearningAgent, QTable, ReplayBuffer, State
+)
+
+
+def make_state(time_remaining=120, score_diff=0, multiplier=1.0, gloves=1) -> State:
+    return State(
+        time_remaining=time_remaining,
+        score_diff=score_diff,
+        multiplier=multiplier,
+        in_boost=multiplier > 1,
+        boost2_triggered=False,
+        phase="NORMAL",
+        gloves_available=gloves,
+        power_ups_available=[]
+    )
+
+
+def random_experiences(rng: random.Random, count: int):
+    for _ in range(count):
+        yield Experience(
+            state=make_state(rng.randrange(0, 300), rng.randrange(-150000, 150000), rng.choice([1, 2, 3, 5])),
+            action=rng.choice(ACTIONS),
+            reward=rng.uniform(-50, 100),
+            next_state=make_state(rng.randrange(0, 300), rng.randrange(-150000, 150000)),
+            done=rng.random() < 0.1
+        )
+
+
+# ============================================================================
+# TEST: Q-TABLE
+# ============================================================================
+
+class TestQTable:
+    """Tests for the dense Q-table."""
+
+    def test_mapping_view_writes_through(self):
+        """q_table[key][action] should read and write the array."""
+        table = QTable()
+        table[("hammer_use", 3)] = {a: 0.0 for a in ActionType}
+        table[("hammer_use", 3)][ActionType.USE_HAMMER] = 12.5
+
+        assert ("hammer_use", 3) in table
+        assert table[("hammer_use", 3)].get(ActionType.USE_HAMMER) == 12.5
+        assert table.values[table.row(("hammer_use", 3)), ACTIONS.index(ActionType.USE_HAMMER)] == 12.5
+        assert len(table) == 1
+
+    def test_allocated_rows_are_not_entries(self):
+        """Rows allocated as bootstrap targets shouldn't count as visited states."""
+        table = QTable()
+        row = table.row(("next",), create=True)
+        assert ("next",) not in table
+        assert len(table) == 0
+        assert table.row_max(row) == 0.0
+        with pytest.raises(KeyError):
+            table[("next",)]
+
+        assert table.visit(("next",)) == row
+        assert len(table) == 1
+
+    def test_grows_past_capacity(self):
+        """Rows beyond the initial capacity keep earlier values."""
+        table = QTable(capacity=2)
+        for i in range(100):
+            table.set(table.visit(i), ActionType.WAIT, float(i))
+        assert len(table) == 100
+        assert [table.get(table.row(i), ActionType.WAIT) for i in range(100)] == list(map(float, range(100)))
+
+    def test_best_action_ties_pick_first(self):
+        """Ties should resolve to the first action, like max() over the old dict."""
+        table = QTable()
+        row = table.visit("s")
+        assert table.best_action(row) == ACTIONS[0]
+        table.set(row, ActionType.WAIT, 1.0)
+        table.set(row, ActionType.USE_FOG, 1.0)
+        assert table.best_action(row) == ActionType.USE_FOG
+        assert table.best_action(row, [ActionType.WAIT, ActionType.SEND_ROSE]) == ActionType.WAIT
+
+
+class TestReplayBuffer:
+    """Tests for the ring buffer."""
+
+    def test_overwrites_oldest(self):
+        """Appends past capacity should replace the oldest entries."""
+        buffer = ReplayBuffer(3)
+        for i in range(5):
+            buffer.append(i, 0, float(i), -1, True)
+        assert len(buffer) == 3
+        assert sorted(int(s) for s in buffer.states) == [2, 3, 4]
+
+
+# ============================================================================
+# TEST: LEARNING
+# ============================================================================
+
+class TestQLearningAgent:
+    """Tests for QLearningAgent on the array Q-table."""
+
+    def test_update_matches_tabular_rule(self):
+        """Sequential updates should equal the dict-based Q-learning rule."""
+        agent = QLearningAgent("test", rng=random.Random(1))
+        reference = {}
+        for exp in random_experiences(random.Random(7), 500):
+            key = exp.state.to_tuple()
+            row = reference.setdefault(key, {a: 0.0 for a in ActionType})
+            if exp.done:
+                target = exp.reward
+            else:
+                next_row = reference.get(exp.next_state.to_tuple())
+                target = exp.reward + agent.discount_factor * (max(next_row.values()) if next_row else 0.0)
+            row[exp.action] += agent.learning_rate * (target - row[exp.action])
+            agent.update(exp)
+
+        assert len(agent.q_table) == len(reference)
+        for key, actions in reference.items():
+            for action, value in actions.items():
+                assert agent.q_table[key][action] == pytest.approx(value)
+
+    def test_choose_action_unvisited_state_is_random(self):
+        """Unseen states should fall back to a random available action."""
+        agent = QLearningAgent("test", epsilon=0.0, rng=random.Random(3))
+        choices = {agent.choose_action(make_state(time_remaining=t * 30)) for t in range(40)}
+        assert len(choices) > 1
+
+    def test_choose_action_exploits(self):
+        """With epsilon 0 the best available action should be chosen."""
+        agent = QLearningAgent("test", epsilon=0.0, rng=random.Random(3))
+        state = make_state()
+        agent.q_table[state.to_tuple()] = {ActionType.SEND_WHALE_GIFT: 5.0, ActionType.WAIT: 3.0}
+
+        assert agent.choose_action(state) == ActionType.SEND_WHALE_GIFT
+        assert agent.get_best_action(state) == ActionType.SEND_WHALE_GIFT
+        assert agent.choose_action(state, [ActionType.WAIT, ActionType.SEND_ROSE]) == ActionType.WAIT
+
+    def test_vectorized_replay(self):
+        """A replay batch should apply every sampled update against pre-batch values."""
+        agent = QLearningAgent("test", rng=random.Random(5))
+        for exp in random_experiences(random.Random(11), 200):
+            agent.update(exp)
+
+        before = agent.q_table.values.copy()
+        buffer = agent.replay_buffer
+        batch = random.Random(5).sample(range(len(buffer)), 32)
+        agent.rng = random.Random(5)
+        agent.experience_replay(batch_size=32)
+
+        expected = before.copy()
+        for i in batch:
+            s, a = buffer.states[i], buffer.actions[i]
+            target = buffer.rewards[i]
+            if not buffer.dones[i]:
+                target += agent.discount_factor * before[buffer.next_states[i]].max()
+            expected[s, a] += agent.learning_rate * (target - before[s, a])
+        assert agent.q_table.values == pytest.approx(expected)
+        assert len(buffer) == 200  # replayed experiences aren't re-added
+
+    def test_replay_needs_full_batch(self):
+        """Replay should be skipped until the buffer holds a batch."""
+        agent = QLearningAgent("test", rng=random.Random(5))
+        for exp in random_experiences(random.Random(11), 10):
+            agent.update(exp)
+        before = agent.q_table.values.copy()
+        agent.experience_replay(batch_size=32)
+        assert (agent.q_table.values == before).all()
+
+    def test_json_round_trip(self, tmp_path):
+        """save()/load() should restore the same table."""
+        agent = QLearningAgent("test", rng=random.Random(2))
+        for exp in random_experiences(random.Random(4), 100):
+            agent.update(exp)
+        path = tmp_path / "q.json"
+        agent.save(str(path))
+
+        restored = QLearningAgent("test")
+        restored.load(str(path))
+        assert len(restored.q_table) == len(agent.q_table)
+        for key in agent.q_table:
+            assert dict(restored.q_table[key]) == pytest.approx(dict(agent.q_table[key]))
@@ -0,0 +1,187 @@
+"""
+Tests for binary Q-table persistence.
+
+Tests for:
+- Key encoding (int matrix and JSON fallback)
+- .qtbl file round trip (memory-mapped load)
+- Incremental chunk checkpoints in BattleHistoryDB (and full rewrites
+  when the stored row belongs to another table)
+- Migration from the legacy JSON row
+- Loading tables saved with a different action list
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.learning_system import ACTIONS, ActionType, Experience, QLearningAgent, QTable, State
+from core.q_table_format import (
+    QTableSnapshot, decode_keys, decode_q_table, encode_keys, encode_q_table,
+)
+
+
+def random_state(rng: random.Random) -> State:
+    return State(
+        time_remaining=rng.randrange(0, 300),
+        score_diff=rng.randrange(-150000, 150000),
+        multiplier=rng.choice([1.0, 2.0, 5.0]),
+        in_boost=False,
+        boost2_triggered=rng.random() < 0.5,
+        phase="NORMAL",
+        gloves_available=rng.randrange(0, 3),
+        power_ups_available=[]
+    )
+
+
+def trained_agent(episodes: int = 5, seed: int = 3) -> QLearningAgent:
+    rng = random.Random(seed)
+    agent = QLearningAgent("sniper", rng=rng)
+    for _ in range(episodes):
+        for _ in range(60):
+            agent.update(Experience(random_state(rng), rng.choice(ACTIONS), rng.uniform(-50, 100),
+                                    random_state(rng), rng.random() < 0.1))
+        agent.end_episode(rng.random() < 0.5, rng.uniform(0, 100))
+    return agent
+
+
+def table_dict(table: QTable) -> dict:
+    return {key: dict(row) for key, row in table.items()}
+
+
+# ============================================================================
+# TEST: ENCODING
+# ============================================================================
+
+class TestEncoding:
+    """Tests for the key and file encodings."""
+
+    def test_int_keys_round_trip(self):
+        keys = [(1, 2, True, 0), (-5, 0, False, 3)]
+        data = encode_keys(keys)
+        assert data[:1] == b"I"
+        assert decode_keys(data) == keys
+
+    def test_mixed_keys_fall_back_to_json(self):
+        keys = [("hammer_use", 3), (1, 2), "plain"]
+        data = encode_keys(keys)
+        assert data[:1] == b"J"
+        assert decode_keys(data) == keys
+
+    def test_snapshot_round_trip(self):
+        table = trained_agent().q_table
+        decoded = decode_q_table(encode_q_table(table.snapshot({"epsilon": 0.2})))
+        assert decoded.meta == {"epsilon": 0.2}
+        assert table_dict(QTable.from_snapshot(decoded)) == table_dict(table)
+
+    def test_rejects_other_data(self):
+        with pytest.raises(ValueError):
+            decode_q_table(b"BRPL" + bytes(16))
+
+
+# ============================================================================
+# TEST: PERSISTENCE
+# ============================================================================
+
+class TestPersistence:
+    """Tests for agent save/load through files and the database."""
+
+    def test_qtbl_file_round_trip(self, tmp_path):
+        agent = trained_agent()
+        path = str(tmp_path / "sniper.qtbl")
+        agent.save(path)
+
+        loaded = QLearningAgent("sniper")
+        loaded.load(path)
+        assert table_dict(loaded.q_table) == table_dict(agent.q_table)
+        assert loaded.episodes == agent.episodes
+        assert loaded.epsilon == agent.epsilon
+
+    def test_db_round_trip(self, history_db):
+        agent = trained_agent()
+        agent.save_to_db(history_db)
+
+        loaded = QLearningAgent("sniper")
+        assert loaded.load_from_db(history_db)
+        assert table_dict(loaded.q_table) == table_dict(agent.q_table)
+        assert loaded.wins == agent.wins
+        assert loaded.q_table.dirty_chunks == []
+
+    def test_checkpoint_writes_only_dirty_chunks(self, history_db):
+        table = QTable(chunk_rows=4)
+        for i in range(10):
+            table[(i, 0)] = {ActionType.WAIT: float(i)}
+        assert history_db.save_q_table("sniper", table, 1, 0.0, 0, 0.3) == 3
+        table.clear_dirty()
+
+        assert history_db.save_q_table("sniper", table, 1, 0.0, 0, 0.3) == 0
+        table[(5, 0)][ActionType.WAIT] = 50.0
+        table[(10, 0)] = {ActionType.WAIT: 10.0}
+        assert history_db.save_q_table("sniper", table, 2, 0.0, 0, 0.3) == 2
+
+        data = history_db.load_q_table("sniper")
+        restored = QTable.from_snapshot(data["snapshot"], chunk_rows=data["chunk_rows"])
+        assert table_dict(restored) == table_dict(table)
+        assert data["episodes"] == 2
+
+    def test_fresh_table_replaces_stored_row(self, history_db):
+        stored = QTable(chunk_rows=4)
+        for i in range(10):
+            stored[(i, 0)] = {ActionType.WAIT: float(i)}
+        history_db.save_q_table("sniper", stored, 1, 0.0, 0, 0.3)
+
+        fresh = QTable(chunk_rows=4)
+        for i in range(3):
+            fresh[(100 + i, 0)] = {ActionType.WAIT: -1.0}
+        history_db.save_q_table("sniper", fresh, 1, 0.0, 0, 0.3)
+
+        data = history_db.load_q_table("sniper")
+        restored = QTable.from_snapshot(data["snapshot"], chunk_rows=data["chunk_rows"])
+        assert table_dict(restored) == table_dict(fresh)
+
+    def test_loaded_table_saves_incrementally(self, history_db):
+        agent = trained_agent()
+        agent.q_table.chunk_rows = 4
+        agent.save_to_db(history_db, full=True)
+
+        loaded = QLearningAgent("sniper")
+        assert loaded.load_from_db(history_db)
+        key = next(iter(loaded.q_table))
+        loaded.q_table[key][ActionType.WAIT] = 99.0
+        assert history_db.save_q_table("sniper", loaded.q_table, 6, 0.0, 0, 0.3) == 1
+
+    def test_legacy_json_row_migrates(self, history_db):
+        legacy = {(1, 2): {ActionType.WAIT: 1.5}, ("hammer_use", 2): {ActionType.USE_HAMMER: 3.0}}
+        history_db.save_q_table("sniper", legacy, 4, 10.0, 2, 0.2)
+        assert "q_table" in history_db.load_q_table("sniper")
+
+        agent = QLearningAgent("sniper")
+        assert agent.load_from_db(history_db)
+        assert agent.q_table[(1, 2)][ActionType.WAIT] == 1.5
+        assert agent.episodes == 4
+
+        agent.save_to_db(history_db)
+        data = history_db.load_q_table("sniper")
+        assert "snapshot" in data
+        assert table_dict(QTable.from_snapshot(data["snapshot"])) == table_dict(agent.q_table)
+
+    def test_columns_matched_by_action_name(self):
+        names = [a.value for a in ACTIONS]
+        stored = ["retired_action"] + list(reversed(names[1:]))
+        values = [float(i) for i in range(len(stored))]
+        snapshot = QTableSnapshot(stored, [(0, 0)], b"\x01", np.asarray([values], dtype="<f8").tobytes())
+
+        row = QTable.from_snapshot(snapshot)[(0, 0)]
+        assert row[ACTIONS[0]] == 0.0  # not in the stored table
+        assert row[ACTIONS[-1]] == values[1]
+        assert row[ACTIONS[1]] == values[-1]
+
+    def test_unknown_version_is_not_loaded(self, history_db):
+        trained_agent(episodes=1).save_to_db(history_db)
+        history_db.conn.execute("UPDATE q_table_meta SET version = 99")
+        assert not QLearningAgent("sniper").load_from_db(history_db)
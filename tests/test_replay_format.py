@@ -0,0 +1,196 @@
+"""
+Tests for the compact replay format.
+
+Tests for:
+- Round-trip encoding for every codec
+- Seeking (tick_at, lazy event blocks)
+- BattleRecorder / ReplayPlayer integration (files and database)
+- Converting JSON replays
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.battle_history import BattleHistoryDB, BattleRecorder, ReplayPlayer
+from core.replay_format import (
+    CODECS, CompactReplay, convert_db_replays, convert_json_replay, encode_replay, write_replay
+)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def _record(duration=300, seed=0):
+    """Record a synthetic battle."""
+    rng = random.Random(seed)
+    recorder = BattleRecorder("battle_test", duration=duration)
+    recorder.start_recording({"agents": ["NovaWhale", "PixelPixie"]})
+
+    creator = opponent = 0
+    for t in range(duration):
+        phase, multiplier = ("BOOST", 3.0) if 120 <= t < 150 else ("NORMAL", 1.0)
+        for _ in range(rng.randint(0, 2)):
+            points = rng.choice([1, 5, 99, 29999])
+            creator += points
+            recorder.record_event(t, "gift", {"agent": "NovaWhale", "gift": "Rose", "points": points})
+        opponent += rng.randint(0, 200)
+        recorder.record_tick(t, creator, opponent, phase, multiplier)
+
+    recorder.finish_recording("creator", creator, opponent)
+    return recorder
+
+
+@pytest.fixture
+def recorder():
+    return _record()
+
+
+def _assert_same_ticks(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a == e
+
+
+# ============================================================================
+# TEST: ENCODING
+# ============================================================================
+
+class TestEncoding:
+    """Tests for encode/decode."""
+
+    @pytest.mark.parametrize("codec", sorted(CODECS))
+    def test_round_trip(self, recorder, codec):
+        """Decoding should reproduce every tick and the metadata."""
+        replay = recorder.get_replay_data()
+        compact = CompactReplay.from_bytes(encode_replay(replay, codec))
+
+        decoded = compact.to_replay_data(lazy=False)
+        _assert_same_ticks(decoded.ticks, replay.ticks)
+        assert decoded.winner == "creator"
+        assert decoded.final_creator_score == replay.final_creator_score
+        assert decoded.agent_config == {"agents": ["NovaWhale", "PixelPixie"]}
+
+    def test_smaller_than_json(self, recorder, tmp_path):
+        """The compact file should be much smaller than the JSON replay."""
+        recorder.save_to_file(str(tmp_path / "r.json"))
+        recorder.save_to_file(str(tmp_path / "r.bbr"))
+
+        assert (tmp_path / "r.bbr").stat().st_size * 5 < (tmp_path / "r.json").stat().st_size
+
+    def test_phase_runs(self, recorder):
+        """Phases should be stored as runs."""
+        compact = CompactReplay.from_bytes(encode_replay(recorder.get_replay_data()))
+
+        assert len(compact._phase_runs) == 3
+        assert compact.phase_at(130) == ("BOOST", 3.0)
+        assert compact.phase_at(299) == ("NORMAL", 1.0)
+
+    def test_empty_replay(self):
+        """A replay without ticks should still encode."""
+        recorder = BattleRecorder("empty")
+        recorder.start_recording()
+        recorder.finish_recording("draw", 0, 0)
+
+        compact = CompactReplay.from_bytes(encode_replay(recorder.get_replay_data()))
+        assert len(compact) == 0
+        assert compact.tick_at(10) is None
+
+    def test_rejects_other_data(self):
+        """Non-replay buffers should be rejected."""
+        with pytest.raises(ValueError):
+            CompactReplay.from_bytes(b"{\"ticks\": []}" + b"\0" * 16)
+
+
+# ============================================================================
+# TEST: SEEKING
+# ============================================================================
+
+class TestSeeking:
+    """Tests for random access."""
+
+    def test_tick_at_decodes_one_block(self, recorder, tmp_path):
+        """Seeking should decode only the event block it needs."""
+        path = tmp_path / "r.bbr"
+        write_replay(recorder.get_replay_data(), str(path))
+
+        with CompactReplay.open(str(path)) as compact:
+            tick = compact.tick_at(200)
+            assert tick == recorder.ticks[200]
+            assert list(compact._blocks) == [200 // compact.block_ticks]
+
+    def test_tick_at_between_ticks(self):
+        """tick_at should return the last tick at or before the time."""
+        recorder = BattleRecorder("sparse")
+        recorder.start_recording()
+        for t in (0, 10, 20):
+            recorder.record_tick(t, t, 0, "NORMAL", 1.0)
+        compact = CompactReplay.from_bytes(encode_replay(recorder.get_replay_data()))
+
+        assert compact.tick_at(15).time == 10
+        assert compact.tick_at(99).time == 20
+        assert compact[-1].time == 20
+
+
+# ============================================================================
+# TEST: RECORDER / PLAYER INTEGRATION
+# ============================================================================
+
+class TestIntegration:
+    """Tests for BattleRecorder and ReplayPlayer with compact replays."""
+
+    def test_player_loads_compact_file(self, recorder, tmp_path):
+        """ReplayPlayer should detect and load .bbr files."""
+        path = str(tmp_path / "r.bbr")
+        recorder.save_to_file(path)
+
+        player = ReplayPlayer()
+        assert player.load_from_file(path)
+        _assert_same_ticks(player.replay_data.ticks, recorder.get_replay_data().ticks)
+
+    def test_db_round_trip(self, recorder, tmp_path):
+        """save_to_db should store a compact blob that load_from_db reads."""
+        db = BattleHistoryDB(str(tmp_path / "history.db"))
+        replay_id = recorder.save_to_db(db)
+
+        row = db.conn.execute("SELECT typeof(tick_data) FROM battle_replays").fetchone()
+        assert row[0] == "blob"
+
+        player = ReplayPlayer(speed=1000)
+        assert player.load_from_db(db, replay_id)
+        _assert_same_ticks(player.replay_data.ticks, recorder.get_replay_data().ticks)
+
+        scores = []
+        player.play(verbose=False, step_callback=lambda t, c, o: scores.append(c))
+        assert scores[-1] == recorder.final_creator_score
+        db.close()
+
+    def test_convert_json_file(self, recorder, tmp_path):
+        """JSON replay files should convert to an equivalent compact file."""
+        src = str(tmp_path / "r.json")
+        recorder.save_to_file(src)
+
+        dst = convert_json_replay(src)
+        assert dst.endswith("r.bbr")
+        with CompactReplay.open(dst) as compact:
+            _assert_same_ticks(list(compact), recorder.get_replay_data().ticks)
+
+    def test_convert_db_replays(self, recorder, tmp_path):
+        """JSON rows in battle_replays should be re-encoded in place."""
+        db = BattleHistoryDB(str(tmp_path / "history.db"))
+        replay_id = recorder.save_to_db(db, compact=False)
+
+        assert convert_db_replays(db) == 1
+        assert convert_db_replays(db) == 0
+
+        player = ReplayPlayer()
+        assert player.load_from_db(db, replay_id)
+        assert isinstance(player.replay_data.ticks, CompactReplay)
+        _assert_same_ticks(player.replay_data.ticks, recorder.get_replay_data().ticks)
+        db.close()
@@ -0,0 +1,198 @@
+"""
+Tests for the buffered replay event writer.
+
+Tests for:
+- Size / time / BATTLE_ENDED flush triggers
+- Background writer thread
+- Back-pressure
+- Recording a full BattleEngine run
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import database
+from core.battle_engine import BattleEngine
+from core.database import BattleRepository, ReplayRepository
+from core.event_bus import EventBus, EventType
+from core.replay_writer import ReplayEventWriter
+from agents.personas import NovaWhale, PixelPixie, GlitchMancer
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def db(db):
+    """Fresh database with battle "b1" created."""
+    BattleRepository.create_battle("b1", 60)
+    return db
+
+
+def _stored_events(battle_id="b1"):
+    return BattleRepository.get_battle_events(battle_id)
+
+
+def _publish_gifts(bus, count, start=0):
+    for t in range(start, start + count):
+        bus.publish(EventType.GIFT_SENT, {"gift": "Rose", "points": 1}, source="NovaWhale", timestamp=t)
+
+
+# ============================================================================
+# TEST: FLUSH TRIGGERS
+# ============================================================================
+
+class TestFlushTriggers:
+    """Tests for when buffered events hit the database."""
+
+    def test_flush_on_batch_size(self, db):
+        """A full buffer should be written in one batch."""
+        bus = EventBus()
+        writer = ReplayEventWriter("b1", batch_size=10, flush_interval=3600, background=False)
+        writer.attach(bus)
+
+        _publish_gifts(bus, 9)
+        assert _stored_events() == []
+
+        _publish_gifts(bus, 1, start=9)
+        assert len(_stored_events()) == 10
+        assert writer.get_stats()["largest_batch"] == 10
+
+    def test_flush_on_interval(self, db):
+        """Events older than flush_interval should be written with the next event."""
+        bus = EventBus()
+        writer = ReplayEventWriter("b1", batch_size=1000, flush_interval=0.01, background=False)
+        writer.attach(bus)
+
+        _publish_gifts(bus, 1)
+        time.sleep(0.02)
+        _publish_gifts(bus, 1, start=1)
+
+        assert len(_stored_events()) == 2
+
+    def test_flush_on_battle_end(self, db):
+        """BATTLE_ENDED should flush everything buffered."""
+        bus = EventBus()
+        writer = ReplayEventWriter("b1", batch_size=1000, flush_interval=3600, background=False)
+        writer.attach(bus)
+
+        _publish_gifts(bus, 5)
+        bus.publish(EventType.BATTLE_ENDED, {"winner": "creator"}, timestamp=60)
+
+        events = _stored_events()
+        assert [e["event_type"] for e in events][-1] == "battle_ended"
+        assert len(events) == 6
+
+    def test_event_filter_and_serialization(self, db):
+        """Only selected types are stored; gifts default to the creator team."""
+        bus = EventBus()
+        writer = ReplayEventWriter("b1", background=False, event_types=[EventType.GIFT_SENT])
+        writer.attach(bus)
+
+        _publish_gifts(bus, 3)
+        bus.publish(EventType.MESSAGE_SENT, {"message": "hi"}, timestamp=1)
+        writer.close()
+
+        events = _stored_events()
+        assert len(events) == 3
+        assert events[0]["data"] == {"gift": "Rose", "points": 1, "source": "NovaWhale", "team": "creator"}
+        assert ReplayRepository.get_state_at_time("b1", 10)["creator_score"] == 3
+
+
+# ============================================================================
+# TEST: BACKGROUND WRITER AND BACK-PRESSURE
+# ============================================================================
+
+class TestBackgroundWriter:
+    """Tests for the writer thread."""
+
+    def test_background_flush_writes_everything(self, db):
+        """flush() should wait for the writer thread to store all events."""
+        bus = EventBus()
+        writer = ReplayEventWriter("b1", batch_size=50, flush_interval=3600)
+        writer.attach(bus)
+
+        _publish_gifts(bus, 120)
+        writer.flush()
+
+        assert len(_stored_events()) == 120
+        stats = writer.get_stats()
+        assert stats["pending"] == 0
+        assert stats["events_written"] == 120
+        writer.close()
+
+    def test_back_pressure(self, db):
+        """Publishers should be held back once max_pending events are unwritten."""
+        bus = EventBus()
+        writer = ReplayEventWriter("b1", batch_size=1000, flush_interval=3600,
+                                   max_pending=10, background=False)
+        writer.attach(bus)
+
+        _publish_gifts(bus, 25)
+
+        assert writer.get_stats()["blocked_count"] == 2
+        assert writer.get_stats()["pending"] <= 10
+        writer.close()
+        assert len(_stored_events()) == 25
+
+    def test_close_detaches(self, db):
+        """Events after close should not be recorded."""
+        bus = EventBus()
+        writer = ReplayEventWriter("b1")
+        writer.attach(bus)
+        writer.close()
+
+        _publish_gifts(bus, 3)
+        assert _stored_events() == []
+
+
+# ============================================================================
+# TEST: ENGINE RECORDING
+# ============================================================================
+
+class TestEngineRecording:
+    """Tests for recording a real battle."""
+
+    def test_records_full_battle(self, db):
+        """Every published event of a headless battle should be stored."""
+        engine = BattleEngine(battle_duration=60, headless=True, seed=1)
+        for agent_class in [NovaWhale, PixelPixie, GlitchMancer]:
+            engine.add_agent(agent_class())
+
+        writer = ReplayEventWriter("b1", batch_size=200)
+        writer.attach(engine.event_bus)
+        engine.run()
+        writer.close()
+
+        stored = _stored_events()
+        assert len(stored) == engine.event_bus.published_count
+        assert writer.get_stats()["flushes"] < len(stored)
+
+    def test_keyframes_written_while_recording(self, db):
+        """The writer should store keyframes that reproduce the full-scan state."""
+        engine = BattleEngine(battle_duration=60, headless=True, seed=2)
+        for agent_class in [NovaWhale, PixelPixie, GlitchMancer]:
+            engine.add_agent(agent_class())
+
+        writer = ReplayEventWriter("b1", batch_size=100, keyframe_interval=5.0)
+        writer.attach(engine.event_bus)
+        engine.run()
+        writer.close()
+        assert writer.get_stats()["keyframes_written"] >= 5
+
+        events = _stored_events()
+        for target in [7.5, 30, 59]:
+            expected = database.new_replay_state()
+            for event in events:
+                if event["timestamp"] <= target:
+                    database.apply_replay_event(expected, event["event_type"], event["data"])
+            state = ReplayRepository.get_state_at_time("b1", target)
+            state.pop("gifts")
+            assert state == expected
@@ -0,0 +1,144 @@
+"""
+Tests for the web API response cache.
+
+Tests for:
+- TTL expiry and LRU eviction
+- Tag invalidation (database change listeners, BATTLE_ENDED)
+- Flask view decorator
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import database
+from core.database import BattleRepository, LeaderboardRepository
+from core.event_bus import EventBus, EventType
+from web.backend.response_cache import ResponseCache
+
+
+# ============================================================================
+# TEST: TTL / LRU
+# ============================================================================
+
+class TestCacheBounds:
+    """Tests for expiry and eviction."""
+
+    def test_hit_and_miss_counters(self, clock):
+        """Lookups should be counted."""
+        cache = ResponseCache(clock=clock)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_ttl_expiry(self, clock):
+        """Entries should expire after their TTL."""
+        cache = ResponseCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=30)
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_lru_eviction(self, clock):
+        """The least recently used entry should go first."""
+        cache = ResponseCache(max_entries=2, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get_stats()["evictions"] == 1
+        assert len(cache) == 2
+
+
+# ============================================================================
+# TEST: INVALIDATION
+# ============================================================================
+
+class TestInvalidation:
+    """Tests for tag-based invalidation."""
+
+    def test_invalidate_by_tag(self, clock):
+        """Only entries with a matching tag should be dropped."""
+        cache = ResponseCache(clock=clock)
+        cache.set("stats", 1, tags=["battles"])
+        cache.set("top", 2, tags=["leaderboard"])
+
+        assert cache.invalidate("battles") == 1
+        assert cache.get("stats") is None
+        assert cache.get("top") == 2
+
+    def test_battle_ended_invalidates(self, clock):
+        """BATTLE_ENDED should drop battle and leaderboard entries."""
+        cache = ResponseCache(clock=clock)
+        bus = EventBus()
+        cache.attach(bus)
+        cache.set("stats", 1, tags=["battles"])
+        cache.set("top", 2, tags=["leaderboard"])
+        cache.set("cups", 3, tags=["tournaments"])
+
+        bus.publish(EventType.BATTLE_ENDED, {"winner": "creator"})
+
+        assert cache.get("stats") is None
+        assert cache.get("top") is None
+        assert cache.get("cups") == 3
+
+    def test_database_writes_invalidate(self, clock, db):
+        """Committed repository writes should notify the cache."""
+        cache = ResponseCache(clock=clock)
+        database.add_change_listener(cache.on_data_changed)
+        try:
+            cache.set("top", 1, tags=["leaderboard"])
+            cache.set("stats", 2, tags=["battles"])
+
+            LeaderboardRepository.update_gifter_stats("fan", "Rose", 1)
+            assert cache.get("top") is None
+            assert cache.get("stats") == 2
+
+            BattleRepository.create_battle("b1", 60)
+            assert cache.get("stats") is None
+        finally:
+            database.remove_change_listener(cache.on_data_changed)
+
+
+# ============================================================================
+# TEST: FLASK DECORATOR
+# ============================================================================
+
+class TestFlaskDecorator:
+    """Tests for ResponseCache.cached on a Flask view."""
+
+    def test_cached_view(self, clock):
+        """Repeated requests should be served from the cache per query string."""
+        flask = pytest.importorskip("flask")
+        app = flask.Flask(__name__)
+        cache = ResponseCache(clock=clock)
+        calls = []
+
+        @app.route("/api/leaderboard/agents")
+        @cache.cached("leaderboard")
+        def agents():
+            calls.append(flask.request.args.get("limit"))
+            return flask.jsonify({"limit": flask.request.args.get("limit")})
+
+        client = app.test_client()
+        assert client.get("/api/leaderboard/agents?limit=5").get_json() == {"limit": "5"}
+        assert client.get("/api/leaderboard/agents?limit=5").get_json() == {"limit": "5"}
+        client.get("/api/leaderboard/agents?limit=10")
+        assert calls == ["5", "10"]
+
+        cache.invalidate("leaderboard")
+        client.get("/api/leaderboard/agents?limit=5")
+        assert calls == ["5", "10", "5"]
@@ -0,0 +1,193 @@
+"""
+Tests for the multi-session battle host.
+
+Tests for:
+- Concurrent sessions sharing a small loop pool
+- Stopping sessions (async and sync stop hooks)
+- Session lookup (ids, membership, owner-only control)
+- Idle / finished session garbage collection
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.backend.session_host import SessionHost, session_room
+
+
+class FakeEngine:
+    """Minimal engine: runs until stopped or `duration` elapses."""
+
+    def __init__(self, duration: float = 10.0):
+        self.duration = duration
+        self.running = False
+        self.thread = None
+        self._stop = False
+
+    async def start(self):
+        self.running = True
+        self.thread = threading.current_thread().name
+        waited = 0.0
+        while not self._stop and waited < self.duration:
+            await asyncio.sleep(0.01)
+            waited += 0.01
+        self.running = False
+
+    async def stop(self):
+        self._stop = True
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def host():
+    host = SessionHost(loop_count=2, gc_interval=0)
+    yield host
+    host.shutdown()
+
+
+# ============================================================================
+# TEST: RUNNING SESSIONS
+# ============================================================================
+
+class TestSessions:
+    """Tests for starting, stopping and finding sessions."""
+
+    def test_many_sessions_share_the_loop_pool(self, host):
+        """Ten sessions should run concurrently on two loop threads."""
+        engines = [FakeEngine() for _ in range(10)]
+        sessions = [host.start('live', e, e.start, stop=e.stop) for e in engines]
+
+        assert wait_for(lambda: all(e.running for e in engines))
+        assert {e.thread for e in engines} == {'SessionLoop-0', 'SessionLoop-1'}
+        assert host.get_stats()['active'] == 10
+        assert len({s.room for s in sessions}) == 10
+        assert sessions[0].room == session_room(sessions[0].session_id)
+
+    def test_stop_session(self, host):
+        """stop() should run the async stop hook and mark the session finished."""
+        engine = FakeEngine()
+        session = host.start('tournament', engine, engine.start, stop=engine.stop)
+        assert wait_for(lambda: engine.running)
+
+        assert host.stop(session.session_id) is True
+        assert session.status == 'finished'
+        assert not engine.running
+        assert host.stop(session.session_id) is False
+
+    def test_sync_stop_hook(self, host):
+        """A plain function stop hook should also work."""
+        engine = FakeEngine()
+        session = host.start('platform', engine, engine.start,
+                             stop=lambda: setattr(engine, '_stop', True))
+        assert wait_for(lambda: engine.running)
+        host.stop(session.session_id)
+        assert session.status == 'finished'
+
+    def test_failed_session(self, host):
+        """Engine errors should be recorded and reported to on_session_end."""
+        ended = []
+        host.on_session_end = ended.append
+
+        async def boom():
+            raise RuntimeError("stream offline")
+
+        session = host.start('live', None, boom)
+        assert wait_for(lambda: ended)
+        assert session.status == 'failed'
+        assert session.error == "stream offline"
+        assert host.get_stats()['failed'] == 1
+
+    def test_duplicate_id_rejected(self, host):
+        """An active session id cannot be reused."""
+        engine = FakeEngine()
+        host.start('live', engine, engine.start, stop=engine.stop, session_id='abc')
+        with pytest.raises(ValueError):
+            host.start('live', engine, engine.start, session_id='abc')
+
+    def test_max_sessions(self):
+        """max_sessions should cap active sessions."""
+        host = SessionHost(max_sessions=1, gc_interval=0)
+        try:
+            engine = FakeEngine()
+            host.start('live', engine, engine.start, stop=engine.stop)
+            with pytest.raises(ValueError):
+                host.start('live', FakeEngine(), FakeEngine().start)
+        finally:
+            host.shutdown()
+
+    def test_resolve(self, host):
+        """Lookups should prefer explicit ids, then membership, then a lone session."""
+        a, b = FakeEngine(), FakeEngine()
+        first = host.start('live', a, a.start, stop=a.stop, owner='sid-1')
+        assert host.resolve('live') is first
+        assert host.resolve('tournament') is None
+
+        second = host.start('live', b, b.start, stop=b.stop, owner='sid-2')
+        assert host.resolve('live') is None  # ambiguous
+        assert host.resolve('live', member='sid-2') is second
+        assert host.resolve('live', session_id=first.session_id) is first
+
+        host.join(second.session_id, 'sid-3')
+        assert host.resolve('live', member='sid-3') is second
+        host.leave('sid-3')
+        assert host.resolve('live', member='sid-3') is None
+
+    def test_resolve_checks_the_caller(self, host):
+        """Clients only reach sessions they joined; control needs the owner."""
+        a = FakeEngine()
+        session = host.start('live', a, a.start, stop=a.stop, owner='sid-1')
+
+        # No fallback to the lone session, and no lookup by id, for outsiders
+        assert host.resolve('live', member='sid-2') is None
+        assert host.resolve('live', session.session_id, member='sid-2') is None
+        assert host.resolve('live', session.session_id, owner='sid-2') is None
+
+        host.join(session.session_id, 'sid-2')
+        assert host.resolve('live', session.session_id, member='sid-2') is session
+        assert host.resolve('live', owner='sid-2') is None  # spectators can't stop it
+        assert host.resolve('live', owner='sid-1') is session
+        assert host.resolve('live', session.session_id, owner='sid-1') is session
+
+
+# ============================================================================
+# TEST: GARBAGE COLLECTION
+# ============================================================================
+
+class TestGarbageCollection:
+    """Tests for idle and finished session cleanup."""
+
+    def test_collects_finished_and_idle(self):
+        """Finished sessions expire after finished_ttl, idle ones after idle_timeout."""
+        now = [1000.0]
+        host = SessionHost(idle_timeout=60, finished_ttl=30, gc_interval=0, clock=lambda: now[0])
+        try:
+            short, idle, busy = FakeEngine(duration=0), FakeEngine(), FakeEngine()
+            done = host.start('live', short, short.start)
+            stale = host.start('live', idle, idle.start, stop=idle.stop)
+            active = host.start('live', busy, busy.start, stop=busy.stop)
+            assert wait_for(lambda: done.status == 'finished' and busy.running)
+
+            now[0] += 31
+            host.touch(active.session_id)
+            assert host.collect_garbage() == [done.session_id]
+
+            now[0] += 30
+            assert host.collect_garbage() == [stale.session_id]
+            assert wait_for(lambda: stale.status == 'finished')
+            assert host.get(active.session_id) is active
+            assert host.get_stats()['collected'] == 2
+        finally:
+            host.shutdown()
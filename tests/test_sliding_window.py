@@ -0,0 +1,185 @@
+"""
+Tests for sliding-window gift counters.
+
+Tests for:
+- SlidingWindow counters and eviction
+- ThresholdTracker on top of the window (matches a brute-force scan)
+- LiveBurstDetector / LiveFestDetector
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.sliding_window import SlidingWindow
+from core.multiplier_system import ThresholdTracker
+from core.ai_vs_live_engine import LiveBurstDetector, LiveFestDetector
+
+
+# ============================================================================
+# TEST: SLIDING WINDOW
+# ============================================================================
+
+class TestSlidingWindow:
+    """Tests for SlidingWindow."""
+
+    def test_counters(self):
+        """Adding entries should update every counter."""
+        window = SlidingWindow(10)
+        window.add(1, 5, key="a", flagged=True)
+        window.add(2, 7, key="b")
+        window.add(3, 1, key="a")
+
+        assert window.count == 3
+        assert window.total == 13
+        assert window.flagged_count == 1
+        assert window.key_totals == {"a": 6, "b": 7}
+        assert window.key_counts == {"a": 2, "b": 1}
+
+    def test_eviction(self):
+        """Entries older than now - duration should be dropped."""
+        window = SlidingWindow(10)
+        window.add(1, 5, key="a", flagged=True)
+        window.add(5, 7, key="b")
+        window.add(12, 1, key="a")
+
+        window.evict(12)
+        assert (window.count, window.total, window.flagged_count) == (2, 8, 0)
+        assert window.key_totals == {"a": 1, "b": 7}
+
+        window.evict(20)
+        assert (window.count, window.total) == (1, 1)
+        assert window.key_counts == {"a": 1}
+        assert window.oldest == window.newest == 12
+
+    def test_entry_on_window_edge_is_kept(self):
+        """An entry exactly `duration` old is still inside the window."""
+        window = SlidingWindow(15)
+        window.add(0, 1)
+        window.evict(15)
+        assert window.count == 1
+
+    def test_unbounded_window_stores_nothing(self):
+        """duration=None should keep cumulative counters only."""
+        window = SlidingWindow(None)
+        for t in range(1000):
+            window.add(t, 1, flagged=t % 2 == 0)
+        window.evict(10_000)
+
+        assert window.count == 1000
+        assert window.flagged_count == 500
+        assert list(window.entries()) == []
+
+    def test_clear(self):
+        """clear() should reset everything."""
+        window = SlidingWindow(10)
+        window.add(1, 5, key="a", flagged=True)
+        window.clear()
+
+        assert window.snapshot() == {"count": 0, "total": 0, "flagged_count": 0}
+        assert window.key_totals == {}
+
+
+# ============================================================================
+# TEST: THRESHOLD TRACKER
+# ============================================================================
+
+class TestThresholdTracker:
+    """Tests for ThresholdTracker."""
+
+    def test_matches_brute_force_scan(self):
+        """Windowed counts should match a full scan of the gift log."""
+        rng = random.Random(0)
+        tracker = ThresholdTracker()
+        log = []
+
+        for t in range(300):
+            for _ in range(rng.randint(0, 3)):
+                gift, points = rng.choice([("Rose", 1), ("GG", 1000), ("Heart", 5)])
+                tracker.record_gift(t, gift, points)
+                log.append((t, gift == "Rose", points))
+
+            activity = tracker.get_activity_in_window(t)
+            recent = [entry for entry in log if max(0, t - 15) <= entry[0] <= t]
+            assert activity["rose_count"] == sum(1 for entry in recent if entry[1])
+            assert activity["total_points"] == sum(entry[2] for entry in recent)
+            assert activity["gift_count"] == len(recent)
+
+    @pytest.mark.parametrize("gifts,expected", [
+        ([("Rose", 1)] * 5, True),
+        ([("Rose", 1)] * 4, False),
+        ([("GG", 1000)], True),
+        ([("Heart", 5)] * 3, False),
+    ])
+    def test_check_threshold(self, gifts, expected):
+        """5 roses OR 1000 points within 15s should meet the threshold."""
+        tracker = ThresholdTracker()
+        for gift, points in gifts:
+            tracker.record_gift(10, gift, points)
+        assert tracker.check_threshold(12) is expected
+
+    def test_expired_gifts_do_not_count(self):
+        """Gifts older than 15s should fall out of the window."""
+        tracker = ThresholdTracker()
+        for _ in range(5):
+            tracker.record_gift(10, "Rose", 1)
+
+        assert tracker.check_threshold(25)
+        assert not tracker.check_threshold(26)
+
+
+# ============================================================================
+# TEST: LIVE DETECTORS
+# ============================================================================
+
+class TestLiveDetectors:
+    """Tests for the windowed live-stream detectors."""
+
+    def test_burst_detected_for_top_user(self):
+        """A large gift run within the window should report the top gifter."""
+        detector = LiveBurstDetector(burst_threshold=3000, window_seconds=10, critical_threshold=10000)
+        detector.record_gift("small", 100, timestamp=100.0)
+        burst = detector.record_gift("whale", 12000, timestamp=102.0)
+
+        assert burst is not None
+        assert burst.username == "whale"
+        assert burst.gift_count == 2
+        assert burst.total_points == 12100
+        assert burst.threat_level == "high"
+        assert burst.duration_seconds == 2.0
+
+    def test_burst_window_expires(self):
+        """Gifts outside the window should not add up to a burst."""
+        detector = LiveBurstDetector(burst_threshold=3000, window_seconds=10)
+        detector.record_gift("a", 5000, timestamp=0.0)
+        assert detector.record_gift("b", 2000, timestamp=20.0) is None
+        assert detector.window.count == 1
+
+    def test_user_velocity(self):
+        """Velocity should use only that user's gifts in the window."""
+        detector = LiveBurstDetector()
+        detector.record_gift("a", 100, timestamp=0.0)
+        detector.record_gift("b", 999, timestamp=1.0)
+        detector.record_gift("a", 100, timestamp=2.0)
+
+        assert detector.get_user_velocity("a") == 100.0
+
+    def test_live_fest_detection(self):
+        """A high share of Live Fest gifts should activate detection."""
+        detector = LiveFestDetector(detection_threshold=0.15, min_gifts_for_detection=20)
+        for _ in range(16):
+            status = detector.record_gift("Rose")
+        assert not status.is_active
+
+        for _ in range(4):
+            status = detector.record_gift("Fest Pop")
+
+        assert status.total_gifts_count == 20
+        assert status.fest_gifts_count == 4
+        assert status.is_active
+        assert status.detected_fest_gifts == ["Fest Pop"]
@@ -0,0 +1,108 @@
+"""
+Tests for the StrategicIntelligence recovery cache.
+
+Tests for:
+- Cached analyses match fresh ones within a state bucket
+- Misses when deficit, time, budget, boosts or opponent rate move
+- Invalidation on boost registration
+- Hit/miss statistics in get_analytics()
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.budget_system import BudgetManager
+from core.strategic_intelligence import StrategicIntelligence
+
+
+@pytest.fixture
+def intel(capsys) -> StrategicIntelligence:
+    budget = BudgetManager(creator_budget=100000, opponent_budget=100000)
+    return StrategicIntelligence(budget, team="creator", rng=random.Random(0))
+
+
+def fresh_analysis(intel: StrategicIntelligence, time_remaining: int):
+    intel.clear_recovery_cache()
+    return intel.analyze_recovery(time_remaining)
+
+
+# ============================================================================
+# TEST: CACHE
+# ============================================================================
+
+class TestRecoveryCache:
+    """Tests for memoized recovery analysis."""
+
+    def test_leading_is_not_cached(self, intel):
+        intel.update_scores(5000, 1000, 10)
+        assert intel.analyze_recovery(200).recommended_action == "MAINTAIN_LEAD"
+        assert intel.recovery_cache_misses == 0 and intel.recovery_cache_hits == 0
+
+    def test_hit_within_bucket(self, intel):
+        intel.update_scores(1000, 60000, 10)
+        first = intel.analyze_recovery(204)
+        intel.update_scores(1000, 60200, 11)
+        second = intel.analyze_recovery(200)  # same 5s time bucket
+
+        assert (intel.recovery_cache_misses, intel.recovery_cache_hits) == (1, 1)
+        assert second is first
+
+    def test_cached_matches_fresh_at_key_state(self, intel):
+        intel.register_upcoming_boost("Boost #2", 3.0, time_until=40, duration=30)
+        intel.update_scores(0, 250000, 10)
+        cached = intel.analyze_recovery(150)
+        intel.analyze_recovery(150)
+
+        assert intel.recovery_cache_hits == 1
+        assert fresh_analysis(intel, 150) == cached
+
+    @pytest.mark.parametrize("change", ["deficit", "time", "budget", "rate"])
+    def test_material_change_misses(self, intel, change):
+        intel.update_scores(1000, 60000, 10)
+        intel.analyze_recovery(200)
+
+        if change == "deficit":
+            intel.update_scores(1000, 120000, 11)
+        elif change == "time":
+            intel.analyze_recovery(100)
+        elif change == "budget":
+            intel.budget_manager.creator_budget = 40000
+        else:
+            intel.update_opponent_spending(0, 0)
+            intel.update_opponent_spending(10, 50000)
+        intel.analyze_recovery(200 if change != "time" else 100)
+
+        assert intel.recovery_cache_misses == 2
+
+    def test_boost_registration_invalidates(self, intel):
+        intel.update_scores(1000, 60000, 10)
+        before = intel.analyze_recovery(200)
+        intel.register_upcoming_boost("Boost #1", 3.0, time_until=20, duration=20)
+        after = intel.analyze_recovery(200)
+
+        assert intel.recovery_cache_misses == 2 and intel.recovery_cache_hits == 0
+        assert after.max_possible_points > before.max_possible_points
+
+    def test_boost_eligibility_is_part_of_key(self, intel):
+        intel.register_upcoming_boost("Boost #2", 3.0, time_until=197, duration=30)
+        intel.update_scores(0, 90000, 10)
+        eligible = intel.analyze_recovery(199)
+        missed = intel.analyze_recovery(196)  # same time bucket, boost already past
+
+        assert eligible.max_possible_points > missed.max_possible_points
+        assert missed == fresh_analysis(intel, 196)
+
+    def test_recommendations_reuse_analysis(self, intel):
+        intel.update_scores(1000, 60000, 10)
+        for t in range(11, 16):
+            intel.get_recommended_strategy(t, 300 - t, {'multiplier': 1.0})
+
+        cache = intel.get_analytics()['recovery_cache']
+        assert cache['misses'] == 1 and cache['hits'] == 4
+        assert cache['hit_rate'] == pytest.approx(0.8) and cache['cached'] == 1
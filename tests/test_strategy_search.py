@@ -0,0 +1,155 @@
+"""
+Tests for the batch StrategyOptimizer.
+
+Tests for:
+- Parameter space clipping and rounding
+- Diagonal evolution strategy convergence
+- Reward-weighted kernel fitness
+- Columnar history queries
+- StrategyOptimizer cycles (defaults, reproducibility, simulator re-scoring)
+"""
+
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.learning_system import StrategyOptimizer
+from agents.strategy_search import (
+    SNIPER_SPACE, ParamSpace, evolve, kernel_fitness, sniper_fitness, to_columns,
+)
+from core.battle_history import AgentBattleRecord, BattleHistoryDB, BattleRecord, GiftTimingRecord
+
+
+def seed_history(db: BattleHistoryDB, battles: int, seed: int = 1):
+    rng = random.Random(seed)
+    for i in range(battles):
+        won = rng.random() < 0.6
+        battle_id = f"battle_{i:05d}"
+        db.record_battle(BattleRecord(
+            battle_id=battle_id, timestamp=f"2026-01-01T00:00:{i:05d}", duration=180,
+            winner="creator" if won else "opponent", creator_score=0, opponent_score=0,
+            margin=rng.randrange(10000, 300000), boost2_triggered=rng.random() < 0.5,
+            gloves_activated=0, power_ups_used=0, total_gifts_sent=0
+        ))
+        for agent_type in ("sniper", "glove_expert"):
+            db.record_agent_performance(AgentBattleRecord(
+                battle_id=battle_id, agent_name=agent_type, agent_type=agent_type,
+                points_donated=1000, gifts_sent=5, avg_gift_value=200.0, best_gift_value=500,
+                early_phase_gifts=1, mid_phase_gifts=1, late_phase_gifts=1,
+                final_phase_gifts=2 if won else 0, gloves_sent=3 if won else 7,
+                gloves_activated=1, power_ups_used=0, won=won
+            ))
+        db.record_gift_timing(GiftTimingRecord(
+            battle_id=battle_id, agent_name="glove_expert", gift_type="GLOVE", gift_value=30,
+            timestamp=100, phase=rng.choice(["BOOST", "FINAL"]), multiplier=1.0,
+            effective_value=30, score_diff_before=0, activated_x5=rng.random() < 0.5
+        ))
+
+
+# ============================================================================
+# TEST: SEARCH
+# ============================================================================
+
+class TestSearch:
+    """Tests for the parameter space and evolution strategy."""
+
+    def test_clip_rounds_integer_params(self):
+        space = ParamSpace(("a", "b"), low=(0.0, 0.0), high=(1.0, 10.0), integer=("b",))
+        clipped = space.clip(np.array([[2.0, 3.6], [-1.0, 11.0]]))
+        assert clipped.tolist() == [[1.0, 4.0], [0.0, 10.0]]
+        assert space.to_params([0.5, 4.0]) == {"a": 0.5, "b": 4}
+
+    def test_evolve_finds_optimum(self):
+        space = ParamSpace(("x", "y"), low=(-10.0, -10.0), high=(10.0, 10.0))
+        target = np.array([3.0, -2.0])
+
+        def fitness(population):
+            return -((population - target) ** 2).sum(axis=1)
+
+        result = evolve(fitness, space, [0.0, 0.0], population_size=16, generations=60,
+                        rng=np.random.default_rng(0))
+        assert np.allclose(result.best, target, atol=0.1)
+        assert result.evaluations == 1 + 16 * 60
+
+    def test_flat_fitness_keeps_initial(self):
+        space = ParamSpace(("x",), low=(0.0,), high=(1.0,))
+        result = evolve(lambda p: np.zeros(len(p)), space, [0.3], rng=np.random.default_rng(0))
+        assert result.best.tolist() == [0.3]
+
+    def test_kernel_fitness_prefers_winning_values(self):
+        targets = np.array([[1.0], [1.0], [5.0]])
+        fitness = kernel_fitness(targets, np.array([1.0, 1.0, -0.5]), np.array([1.0]), chunk=2)
+        scores = fitness(np.array([[1.0], [5.0]]))
+        assert scores[0] > 0 > scores[1]
+
+
+# ============================================================================
+# TEST: OPTIMIZER
+# ============================================================================
+
+class TestStrategyOptimizer:
+    """Tests for StrategyOptimizer over recorded history."""
+
+    def test_history_columns(self, history_db):
+        seed_history(history_db, 20)
+        columns = history_db.get_history_columns("sniper")
+        assert len(columns["won"]) == 20
+        assert set(columns) >= {"won", "margin", "final_phase_gifts", "gloves_sent"}
+        assert history_db.get_history_columns("unknown")["won"] == []
+        assert len(history_db.get_gift_timing_columns("GLOVE")["phase"]) == 20
+
+    def test_defaults_without_history(self, history_db):
+        optimized = StrategyOptimizer(history_db, seed=0).run_optimization_cycle()
+        assert optimized["sniper"]["snipe_window"] == 5.0
+        assert optimized["glove_expert"]["max_gloves_per_battle"] == 5
+        assert optimized["phase_tracker"]["start_trigger_at"] == 60
+
+    def test_cycle_is_reproducible_and_in_bounds(self, history_db):
+        seed_history(history_db, 300)
+        first = StrategyOptimizer(history_db, seed=7).run_optimization_cycle()
+        second = StrategyOptimizer(history_db, seed=7).run_optimization_cycle()
+        assert first == second
+
+        sniper = first["sniper"]
+        assert 3 <= sniper["snipe_window"] <= 10
+        assert isinstance(sniper["min_deficit_for_lion"], int)
+        gloves = first["glove_expert"]
+        # Wins used 3 gloves, losses 7: the window should include 3 and exclude 7
+        assert gloves["min_gloves_per_battle"] <= 3 <= gloves["max_gloves_per_battle"] < 7
+
+    def test_sniper_search_beats_heuristic(self, history_db):
+        seed_history(history_db, 300)
+        optimizer = StrategyOptimizer(history_db, seed=3)
+        history = to_columns(history_db.get_history_columns("sniper"))
+        fitness = sniper_fitness(history)
+        tuned = SNIPER_SPACE.to_vector(optimizer.optimize_sniper_params())
+
+        won = history["won"] > 0
+        margin = history["margin"][won].mean()
+        heuristic = SNIPER_SPACE.to_vector({
+            "snipe_window": 7.0, "min_deficit_for_universe": margin * 1.2,
+            "min_deficit_for_lion": margin * 0.6, "min_deficit_for_phoenix": margin * 0.1,
+        })
+        assert fitness(tuned[None])[0] >= fitness(heuristic[None])[0]
+
+    def test_simulator_rescores_elite(self, history_db):
+        seed_history(history_db, 50)
+        calls = []
+
+        def simulator(agent_type, params):
+            calls.append((agent_type, params))
+            return -params["snipe_window"]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            optimizer = StrategyOptimizer(history_db, generations=5, simulator=simulator,
+                                          executor=executor, seed=0)
+            params = optimizer.optimize_sniper_params()
+
+        assert len(calls) > 1 and {agent_type for agent_type, _ in calls} == {"sniper"}
+        assert params == max((p for _, p in calls), key=lambda p: -p["snipe_window"])
@@ -0,0 +1,155 @@
+"""
+Tests for the array-backed SwarmCoordinator.
+
+Tests for:
+- Agent sync into swarm arrays and the AgentPosition view
+- Vectorized Boids forces (against a per-pair reference, across row blocks)
+- Position/velocity updates and swarm metrics
+- Collective decisions
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.swarm import swarm_coordinator
+from agents.swarm.swarm_coordinator import (
+    AgentPosition, BattleRole, SwarmConfig, SwarmCoordinator, SwarmState,
+)
+
+
+class FakeAgent:
+    def __init__(self, name: str, agent_type: str = "", donated: int = 0, gifts: int = 0):
+        self.name = name
+        self.agent_type = agent_type
+        self.total_donated = donated
+        self.gifts_sent = gifts
+
+
+def random_swarm(n: int, seed: int = 0, radius: float = 0.3) -> SwarmCoordinator:
+    rng = random.Random(seed)
+    coordinator = SwarmCoordinator(SwarmConfig(neighbor_radius=radius))
+    coordinator._arrays.store([
+        AgentPosition(f"a{i}", f"a{i}", x=rng.random(), y=rng.random(), z=rng.random(),
+                      vx=rng.uniform(-0.05, 0.05), vy=rng.uniform(-0.05, 0.05))
+        for i in range(n)
+    ])
+    return coordinator
+
+
+def reference_forces(coordinator: SwarmCoordinator) -> np.ndarray:
+    """Per-agent, per-neighbor Boids forces (the original loop formulation)."""
+    cfg = coordinator._config
+    pos, vel = coordinator._arrays.pos.tolist(), coordinator._arrays.vel.tolist()
+    forces = []
+    for i, p in enumerate(pos):
+        neighbors = [j for j, q in enumerate(pos) if j != i and math.dist(p, q) < cfg.neighbor_radius]
+        if not neighbors:
+            forces.append((0.0, 0.0, 0.0))
+            continue
+        force = []
+        for axis in range(3):
+            cohesion = sum(pos[j][axis] for j in neighbors) / len(neighbors) - p[axis]
+            alignment = sum(vel[j][axis] for j in neighbors) / len(neighbors) - vel[i][axis]
+            separation = sum((p[axis] - pos[j][axis]) / (math.dist(p, pos[j]) + 0.001) ** 2
+                             for j in neighbors)
+            force.append(cfg.cohesion_weight * cohesion + cfg.alignment_weight * alignment
+                         + cfg.separation_weight * separation)
+        forces.append(tuple(force))
+    return np.array(forces)
+
+
+# ============================================================================
+# TEST: SYNC AND VIEW
+# ============================================================================
+
+class TestPositionView:
+    """Tests for agent sync and the AgentPosition view."""
+
+    def test_sync_builds_rows(self):
+        coordinator = SwarmCoordinator()
+        synced = coordinator.sync_agents([
+            FakeAgent("Kinetik", "sniper", donated=500, gifts=3),
+            FakeAgent("PhaseTracker", "phase_tracker"),
+        ])
+
+        assert synced == 2 and list(coordinator._positions) == ["Kinetik", "PhaseTracker"]
+        kinetik = coordinator._positions["Kinetik"]
+        assert isinstance(kinetik, AgentPosition)
+        assert (kinetik.x, kinetik.y, kinetik.role) == (0.8, 0.9, BattleRole.SNIPER)
+        assert kinetik.points_contributed == 500 and kinetik.gifts_sent == 3
+        assert coordinator.get_positions()[1]["role"] == "scout"
+
+    def test_resync_overwrites_row(self):
+        coordinator = SwarmCoordinator()
+        coordinator.sync_agents([FakeAgent("A"), FakeAgent("B")])
+        coordinator.sync_agents([FakeAgent("B", "sniper", donated=10)])
+
+        assert len(coordinator._positions) == 2
+        assert coordinator._positions["B"].points_contributed == 10
+        assert coordinator.get_metrics()["performance"]["collective_points"] == 0  # until update
+        coordinator.update({"time_remaining": 100})
+        assert coordinator.get_metrics()["performance"]["collective_points"] == 10
+
+
+# ============================================================================
+# TEST: FORCES
+# ============================================================================
+
+class TestBoids:
+    """Tests for the vectorized Boids step."""
+
+    @pytest.mark.parametrize("n, radius", [(2, 0.3), (7, 0.3), (60, 0.3), (60, 1.0)])
+    def test_forces_match_reference(self, n, radius):
+        coordinator = random_swarm(n, seed=n, radius=radius)
+        assert np.allclose(coordinator._calculate_swarm_forces(), reference_forces(coordinator))
+
+    def test_blocks_match_single_pass(self, monkeypatch):
+        coordinator = random_swarm(50, seed=3, radius=0.5)
+        whole = coordinator._calculate_swarm_forces()
+        monkeypatch.setattr(swarm_coordinator, "NEIGHBOR_BLOCK", 7)
+        assert np.allclose(coordinator._calculate_swarm_forces(), whole)
+
+    def test_isolated_agent_has_no_force(self):
+        coordinator = SwarmCoordinator(SwarmConfig(neighbor_radius=0.1))
+        coordinator._arrays.store([AgentPosition("a", "a", x=0.0, y=0.0, z=0.0, vx=0.2),
+                                   AgentPosition("b", "b", x=1.0, y=1.0, z=1.0)])
+        assert not coordinator._calculate_swarm_forces().any()
+
+    def test_update_moves_and_clamps(self):
+        coordinator = random_swarm(30, seed=1, radius=0.5)
+        before = coordinator._arrays.pos.copy()
+        coordinator.update({"time_remaining": 120})
+
+        after = coordinator._arrays.pos
+        assert not np.array_equal(before, after)
+        assert after.min() >= 0.0 and after.max() <= 1.0
+        assert len(set(coordinator._arrays.updated_at.tolist())) == 1
+
+
+# ============================================================================
+# TEST: DECISIONS
+# ============================================================================
+
+class TestDecisions:
+    """Tests for swarm state and collective decisions."""
+
+    def test_empty_swarm_waits(self):
+        decision = SwarmCoordinator().get_collective_decision()
+        assert decision["action"] == "wait" and decision["agents"] == 0
+
+    def test_aggressive_swarm_snipes(self):
+        coordinator = SwarmCoordinator()
+        coordinator.sync_agents([FakeAgent(f"s{i}", "sniper") for i in range(5)])
+
+        assert coordinator.update({"time_remaining": 3}) == SwarmState.SNIPING
+        decision = coordinator.get_collective_decision()
+        assert decision["action"] == "attack" and decision["direction"] == 1.0
+        assert decision["recommended_gift"] == "Lion"
@@ -5,13 +5,12 @@ Flask + SocketIO server for real-time battle visualization.
 """
 
 from flask import Flask, render_template, jsonify, send_from_directory, request, session, redirect, url_for, Blueprint
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room, leave_room
 from flask_cors import CORS
 import os
 import sys
 import json
 import asyncio
-import threading
 import yaml
 from typing import Dict, Any, List, Optional
 
@@ -56,6 +55,10 @@ from web.backend.auth import (
     login_required, admin_required, authenticate_user,
     create_user, init_default_admin, get_user_count
 )
+from web.backend.response_cache import ResponseCache
+from web.backend.broadcast import BroadcastAggregator, BATCH
+from web.backend.session_host import SessionHost, new_session_id, session_room
+from web.backend.audience import AudienceTracker
 
 app = Flask(__name__,
             static_folder='../static',
@@ -68,6 +71,22 @@ CORS(app, resources={r"/*": {"origins": "*"}})
 # Initialize SocketIO
 socketio = SocketIO(app, cors_allowed_origins="*")
 
+# Coalesced Socket.IO fan-out: scores/counters at BROADCAST_RATE_HZ, gifts batched per frame
+broadcaster = BroadcastAggregator(
+    socketio.emit,
+    rate_hz=float(os.environ.get('BROADCAST_RATE_HZ', 10)),
+    event_rates={'viewer_count': 2, 'vote_update': 4},
+    start_task=socketio.start_background_task,
+    sleep=socketio.sleep,
+    measure_bytes=os.environ.get('BROADCAST_MEASURE_BYTES') == '1'
+)
+
+# Cache for polled read endpoints (invalidated on battle/leaderboard/tournament writes)
+response_cache = ResponseCache(
+    max_entries=int(os.environ.get('RESPONSE_CACHE_SIZE', 512)),
+    ttl=float(os.environ.get('RESPONSE_CACHE_TTL', 10))
+)
+
 # Store active battles
 active_battles: Dict[str, Dict[str, Any]] = {}
 battle_history: List[Dict[str, Any]] = []
@@ -78,20 +97,15 @@ tournament_history: List[Dict[str, Any]] = []
 
 # Store active live battles
 active_live_battles: Dict[str, Any] = {}
-live_battle_engine: Optional[Any] = None
-live_battle_loop: Optional[asyncio.AbstractEventLoop] = None
-
-# Store active tournament
-active_tournament_engine: Optional[Any] = None
-tournament_loop: Optional[asyncio.AbstractEventLoop] = None
 
-# Store active AI vs Live battle
-ai_vs_live_engine: Optional[Any] = None
-ai_vs_live_loop: Optional[asyncio.AbstractEventLoop] = None
-
-# Store active Battle Platform
-battle_platform: Optional[Any] = None
-battle_platform_loop: Optional[asyncio.AbstractEventLoop] = None
+# Live battles, tournaments, AI vs Live, Battle Platform and demo battles run as
+# sessions on a shared event loop pool, each broadcasting to its own room
+session_host = SessionHost(
+    loop_count=int(os.environ.get('SESSION_LOOPS', 2)),
+    idle_timeout=float(os.environ.get('SESSION_IDLE_TIMEOUT', 900)),
+    finished_ttl=float(os.environ.get('SESSION_FINISHED_TTL', 300)),
+    max_sessions=int(os.environ.get('MAX_SESSIONS', 0))
+)
 
 # Import Battle Platform
 try:
@@ -194,41 +208,82 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'service': 'TikTok Battle Simulator',
-        'version': '2.0.0'
+        'version': '2.0.0',
+        'response_cache': response_cache.get_stats(),
+        'broadcast': broadcaster.get_stats(),
+        'sessions': session_host.get_stats(),
+        'audience': audience.get_stats()
     })
 
 
+def _session_status(kind: str) -> Dict[str, Any]:
+    """Session picked by ?session_id= (or the only active one) plus all sessions of `kind`."""
+    session = session_host.resolve(kind, request.args.get('session_id'))
+    return {
+        'session': session if session is not None and session.active else None,
+        'sessions': [s.to_dict() for s in session_host.sessions(kind)]
+    }
+
+
 @app.route('/api/live/status')
 def get_live_status():
     """Get live battle system status."""
+    status = _session_status('live')
+    session = status['session']
     return jsonify({
         'tiktok_live_available': TIKTOK_LIVE_AVAILABLE,
-        'active_battle': live_battle_engine is not None,
-        'battle_state': live_battle_engine.get_state() if live_battle_engine else None
+        'active_battle': session_host.active_count('live') > 0,
+        'battle_state': session.engine.get_state() if session else None,
+        'sessions': status['sessions']
     })
 
 
 @app.route('/api/ai-vs-live/status')
 def get_ai_vs_live_status():
     """Get AI vs Live battle system status."""
+    status = _session_status('ai_vs_live')
+    session = status['session']
     return jsonify({
         'ai_vs_live_available': AI_VS_LIVE_AVAILABLE,
         'tiktok_live_available': TIKTOK_LIVE_AVAILABLE,
-        'active_battle': ai_vs_live_engine is not None,
-        'battle_state': ai_vs_live_engine.get_stats() if ai_vs_live_engine else None
+        'active_battle': session_host.active_count('ai_vs_live') > 0,
+        'battle_state': session.engine.get_stats() if session else None,
+        'sessions': status['sessions']
     })
 
 
 @app.route('/api/battle-platform/status')
 def get_battle_platform_status():
     """Get Battle Platform status."""
+    status = _session_status('platform')
+    session = status['session']
     return jsonify({
         'battle_platform_available': BATTLE_PLATFORM_AVAILABLE,
-        'active': battle_platform is not None,
-        'stats': battle_platform.get_stats() if battle_platform else None
+        'active': session_host.active_count('platform') > 0,
+        'stats': session.engine.get_stats() if session else None,
+        'sessions': status['sessions']
+    })
+
+
+@app.route('/api/sessions')
+def get_sessions():
+    """List hosted battle/tournament sessions (optionally ?kind=live)."""
+    sessions = session_host.sessions(request.args.get('kind'))
+    return jsonify({
+        'sessions': [s.to_dict() for s in sessions],
+        'stats': session_host.get_stats()
     })
 
 
+@app.route('/api/sessions/<session_id>')
+def get_session(session_id):
+    """Get one hosted session."""
+    session = session_host.get(session_id)
+    if session is None:
+        return jsonify({'error': 'Session not found'}), 404
+    return jsonify(session.to_dict())
+
+
 @app.route('/api/battles/active')
 def get_active_battles():
     """Get list of currently active battles."""
@@ -352,6 +407,8 @@ def handle_connect():
 def handle_disconnect():
     """Handle client disconnection."""
     print(f'Client disconnected')
+    session_host.leave(request.sid)
+    audience.disconnect(request.sid)
 
 
 @socketio.on('request_battle_update')
@@ -362,40 +419,96 @@ def handle_battle_update_request(data):
         emit('battle_update', active_battles[battle_id])
 
 
+# Battle Sessions
+
+def _host_session(kind: str, engine: Any, runner, stop, session_id: str,
+                  error_event: str):
+    """Start a hosted session for the requesting client and join it to the session room."""
+    try:
+        session = session_host.start(kind, engine, runner, stop=stop,
+                                     owner=request.sid, session_id=session_id)
+    except ValueError as e:
+        emit(error_event, {'error': str(e)})
+        return None
+    join_room(session.room)
+    return session
+
+
+def _resolve_session(kind: str, data: Optional[Dict[str, Any]] = None, control: bool = False):
+    """
+    Session a client request refers to (explicit session_id or newest joined session).
+
+    Clients only see sessions they joined; control requests (control=True)
+    only sessions they started.
+    """
+    session_id = data.get('session_id') if isinstance(data, dict) else None
+    if control:
+        session = session_host.resolve(kind, session_id, owner=request.sid)
+    else:
+        session = session_host.resolve(kind, session_id, member=request.sid)
+    if session is not None:
+        session_host.touch(session.session_id)
+    return session
+
+
+@socketio.on('join_session')
+def handle_join_session(data):
+    """Subscribe this client to a session's room (spectators, reconnects)."""
+    session = session_host.join(data.get('session_id'), request.sid)
+    if session is None:
+        emit('session_error', {'error': 'Session not found'})
+        return
+    join_room(session.room)
+    emit('session_joined', session.to_dict())
+
+
+@socketio.on('leave_session')
+def handle_leave_session(data):
+    """Unsubscribe this client from a session's room."""
+    session = session_host.get(data.get('session_id'))
+    if session is not None:
+        session.members.discard(request.sid)
+        leave_room(session.room)
+    emit('session_left', {'session_id': data.get('session_id')})
+
+
 # Demo Battle System (works without TikTokLive)
-demo_battle_active = False
 
 @socketio.on('start_demo_battle')
 def handle_start_demo_battle(data):
     """Start a demo battle simulation for video recording."""
-    global demo_battle_active
-
-    if demo_battle_active:
-        emit('demo_error', {'error': 'Demo battle already running'})
-        return
-
     creator = data.get('creator', 'QuantumEdge_AI')
     opponent = data.get('opponent', 'NeonStrike_Bot')
     duration = int(data.get('duration', 120))
+    session_id = data.get('session_id') or new_session_id()
 
     print(f"\n{'='*60}")
-    print(f"🎮 DEMO BATTLE STARTING")
+    print(f"🎮 DEMO BATTLE STARTING [{session_id}]")
     print(f"   {creator} vs {opponent}")
     print(f"   Duration: {duration}s")
     print(f"{'='*60}\n")
 
-    demo_battle_active = True
-    socketio.start_background_task(run_demo_battle, creator, opponent, duration)
-    emit('demo_battle_started', {'creator': creator, 'opponent': opponent, 'duration': duration})
+    demo = {'active': True}
+    session = _host_session(
+        'demo', demo,
+        lambda: run_demo_battle(creator, opponent, duration, demo, session_room(session_id)),
+        lambda: demo.update(active=False),
+        session_id, 'demo_error'
+    )
+    if session is None:
+        return
+    emit('demo_battle_started', {'session_id': session_id, 'creator': creator,
+                                 'opponent': opponent, 'duration': duration})
 
 
-def run_demo_battle(creator: str, opponent: str, duration: int):
-    """Run a demo battle with simulated gifts."""
-    global demo_battle_active
+async def run_demo_battle(creator: str, opponent: str, duration: int,
+                          demo: Optional[Dict[str, Any]] = None, room: Optional[str] = None):
+    """Run a demo battle with simulated gifts (stops when demo['active'] is cleared)."""
     import random
     import time
     import uuid
 
+    demo = demo if demo is not None else {'active': True}
     battle_id = f"demo_{uuid.uuid4().hex[:8]}"
 
     # Gift catalog for demo
@@ -416,7 +529,7 @@ def run_demo_battle(creator: str, opponent: str, duration: int):
     opponent_score = 0
 
     # Emit battle start
-    socketio.emit('demo_battle_update', {
+    broadcaster.emit_now('demo_battle_update', {
         'type': 'start',
         'battle_id': battle_id,
         'creator': creator,
@@ -424,13 +537,13 @@ def run_demo_battle(creator: str, opponent: str, duration: int):
         'creator_score': 0,
         'opponent_score': 0,
         'time_remaining': duration
-    })
+    }, room=room)
 
     start_time = time.time()
     last_boost = 0
     multiplier = 1.0
 
-    while demo_battle_active and (time.time() - start_time) < duration:
+    while demo['active'] and (time.time() - start_time) < duration:
         elapsed = int(time.time() - start_time)
         time_remaining = duration - elapsed
 
@@ -439,11 +552,11 @@ def run_demo_battle(creator: str, opponent: str, duration: int):
             last_boost = elapsed
             multiplier = random.choice([1.0, 2.0, 3.0, 5.0])
             phase_name = {1.0: 'Normal', 2.0: 'Boost x2', 3.0: 'Boost x3', 5.0: 'MEGA x5'}[multiplier]
-            socketio.emit('demo_battle_update', {
+            broadcaster.emit_now('demo_battle_update', {
                 'type': 'phase',
                 'phase': phase_name,
                 'multiplier': multiplier
-            })
+            }, room=room)
 
         # Generate random gifts
         for _ in range(random.randint(1, 3)):
@@ -457,7 +570,7 @@ def run_demo_battle(creator: str, opponent: str, duration: int):
             else:
                 opponent_score += points
 
-            socketio.emit('demo_battle_update', {
+            broadcaster.emit('demo_battle_update', {
                 'type': 'gift',
                 'team': team,
                 'agent': agent,
@@ -469,31 +582,34 @@ def run_demo_battle(creator: str, opponent: str, duration: int):
                 'creator_score': creator_score,
                 'opponent_score': opponent_score,
                 'time_remaining': time_remaining
-            })
+            }, room=room, mode=BATCH)
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
 
     # Battle ended
     winner = 'creator' if creator_score > opponent_score else 'opponent'
-    socketio.emit('demo_battle_update', {
+    broadcaster.emit_now('demo_battle_update', {
         'type': 'end',
         'winner': winner,
         'creator': creator,
         'opponent': opponent,
         'creator_score': creator_score,
         'opponent_score': opponent_score
-    })
+    }, room=room)
 
-    demo_battle_active = False
+    demo['active'] = False
     print(f"🏆 Demo battle ended: {creator if winner == 'creator' else opponent} wins!")
 
 
 @socketio.on('stop_demo_battle')
-def handle_stop_demo_battle():
+def handle_stop_demo_battle(data=None):
     """Stop the current demo battle."""
-    global demo_battle_active
-    demo_battle_active = False
-    emit('demo_battle_stopped', {})
+    session = _resolve_session('demo', data, control=True)
+    if session is not None and session.active:
+        session.engine['active'] = False
+        emit('demo_battle_stopped', {'session_id': session.session_id})
+    else:
+        emit('demo_battle_stopped', {})
 
 
 # Battle Event Handlers (called by battle engine)
@@ -503,7 +619,7 @@ def broadcast_battle_start(battle_data: Dict[str, Any]):
     battle_id = battle_data['id']
     active_battles[battle_id] = battle_data
     print(f"🔊 Broadcasting battle_start: {battle_id}")
-    socketio.emit('battle_start', battle_data)
+    broadcaster.emit_now('battle_start', battle_data)
     print(f"   Emitted to all clients")
 
 
@@ -512,18 +628,18 @@ def broadcast_battle_tick(battle_id: str, tick_data: Dict[str, Any]):
     if battle_id in active_battles:
         active_battles[battle_id]['current_time'] = tick_data['time']
         active_battles[battle_id]['scores'] = tick_data['scores']
-        socketio.emit('battle_tick', {
+        broadcaster.emit('battle_tick', {
             'battle_id': battle_id,
             **tick_data
-        })
+        }, key=battle_id)
 
 
 def broadcast_agent_action(battle_id: str, action_data: Dict[str, Any]):
     """Broadcast agent action."""
-    socketio.emit('agent_action', {
+    broadcaster.emit('agent_action', {
         'battle_id': battle_id,
         **action_data
-    })
+    }, mode=BATCH, key=battle_id)
 
 
 def broadcast_battle_end(battle_id: str, result_data: Dict[str, Any]):
@@ -536,8 +652,9 @@ def broadcast_battle_end(battle_id: str, result_data: Dict[str, Any]):
         # Move to history
         battle_history.append(battle_data)
         del active_battles[battle_id]
+        response_cache.on_data_changed('battles')
 
-        socketio.emit('battle_end', {
+        broadcaster.emit_now('battle_end', {
             'battle_id': battle_id,
             **result_data
         })
@@ -581,6 +698,7 @@ def broadcast_tournament_end(tournament_id: str, result_data: Dict[str, Any]):
         # Move to history
         tournament_history.append(active_tournament)
         active_tournament = None
+        response_cache.on_data_changed('tournaments')
 
         socketio.emit('tournament_end', {
             'tournament_id': tournament_id,
@@ -629,7 +747,8 @@ def broadcast_gpt_commentary(commentary: str):
 def broadcast_strategic_battle_end(result_data: Dict[str, Any]):
     """Broadcast strategic battle end with summary."""
     print(f"🔊 Strategic battle end: {result_data.get('winner')}")
-    socketio.emit('battle_end', result_data)
+    response_cache.on_data_changed('battles')
+    broadcaster.emit_now('battle_end', result_data)
 
 
 # === NEW FEATURE BROADCAST FUNCTIONS ===
@@ -701,6 +820,7 @@ def broadcast_tournament_champion(team_name: str, emoji: str = '🏆',
                                   record: str = '', point_diff: int = 0):
     """Broadcast tournament champion announcement."""
     print(f"👑 CHAMPION: {emoji} {team_name}")
+    response_cache.on_data_changed('tournaments')
     socketio.emit('tournament_champion', {
         'team_name': team_name,
         'emoji': emoji,
@@ -716,16 +836,10 @@ def broadcast_tournament_champion(team_name: str, emoji: str = '🏆',
 @socketio.on('start_live_battle')
 def handle_start_live_battle(data):
     """Handle request to start a live TikTok battle."""
-    global live_battle_engine, live_battle_loop
-
     if not TIKTOK_LIVE_AVAILABLE:
         emit('live_error', {'error': 'TikTokLive library not installed. Run: pip install TikTokLive'})
         return
 
-    if live_battle_engine is not None:
-        emit('live_error', {'error': 'A live battle is already running'})
-        return
-
     creator = data.get('creator', '').lstrip('@')
     opponent = data.get('opponent', '').lstrip('@')
     duration = int(data.get('duration', 300))
@@ -734,23 +848,27 @@ def handle_start_live_battle(data):
         emit('live_error', {'error': 'Both creator and opponent usernames are required'})
         return
 
+    session_id = data.get('session_id') or new_session_id()
+    room = session_room(session_id)
+
     print(f"\n{'='*60}")
-    print(f"🔴 LIVE BATTLE STARTING")
+    print(f"🔴 LIVE BATTLE STARTING [{session_id}]")
     print(f"   @{creator} vs @{opponent}")
     print(f"   Duration: {duration}s")
     print(f"{'='*60}\n")
 
     # Create engine
-    live_battle_engine = LiveBattleEngine(
+    engine = LiveBattleEngine(
         creator_username=creator,
         opponent_username=opponent,
         battle_duration=duration,
         mode=BattleMode.LIVE
     )
 
-    # Register callbacks for Socket.IO broadcasting
+    # Register callbacks for Socket.IO broadcasting to this session's room
     def on_gift(event, creator_score, opponent_score):
-        socketio.emit('live_gift', {
+        session_host.touch(session_id)
+        broadcaster.emit('live_gift', {
             'team': event.team,
             'username': event.username,
             'gift_name': event.gift_name,
@@ -760,27 +878,27 @@ def handle_start_live_battle(data):
             'total_points': event.total_points,
             'creator_score': creator_score,
             'opponent_score': opponent_score
-        })
+        }, room=room, mode=BATCH)
 
     def on_phase_change(phase, multiplier):
-        socketio.emit('live_phase_change', {
+        broadcaster.emit_now('live_phase_change', {
             'phase': phase,
             'multiplier': multiplier
-        })
+        }, room=room)
 
     def on_score_update(creator_score, opponent_score):
-        state = live_battle_engine.get_state()
-        socketio.emit('live_score_update', {
+        session_host.touch(session_id)
+        state = engine.get_state()
+        broadcaster.emit('live_score_update', {
             'creator_score': creator_score,
             'opponent_score': opponent_score,
             'time_remaining': state['time_remaining'],
             'current_phase': state['current_phase'],
             'current_multiplier': state['current_multiplier']
-        })
+        }, room=room)
 
     def on_battle_end(winner, result):
-        global live_battle_engine
-        socketio.emit('live_battle_ended', {
+        broadcaster.emit_now('live_battle_ended', {
             'winner': winner,
             'creator_score': result['creator_score'],
             'opponent_score': result['opponent_score'],
@@ -788,111 +906,86 @@ def handle_start_live_battle(data):
             'opponent_username': result['opponent_username'],
             'top_creator_gifters': result['top_creator_gifters'],
             'top_opponent_gifters': result['top_opponent_gifters']
-        })
-        live_battle_engine = None
+        }, room=room)
 
     # Add connection status callback
     def on_connection_change():
-        state = live_battle_engine.get_state()
+        session_host.touch(session_id)
+        state = engine.get_state()
         socketio.emit('live_connection_status', {
             'team': 'creator',
             'username': creator,
             'connected': state['creator_connected']
-        })
+        }, to=room)
         socketio.emit('live_connection_status', {
             'team': 'opponent',
             'username': opponent,
             'connected': state['opponent_connected']
-        })
+        }, to=room)
         # Also update top gifters periodically
         socketio.emit('live_top_gifters', {
             'creator': dict(sorted(
-                live_battle_engine.state.top_creator_gifters.items(),
+                engine.state.top_creator_gifters.items(),
                 key=lambda x: x[1], reverse=True
-            )[:5]) if live_battle_engine.state.top_creator_gifters else {},
+            )[:5]) if engine.state.top_creator_gifters else {},
             'opponent': dict(sorted(
-                live_battle_engine.state.top_opponent_gifters.items(),
+                engine.state.top_opponent_gifters.items(),
                 key=lambda x: x[1], reverse=True
-            )[:5]) if live_battle_engine.state.top_opponent_gifters else {}
-        })
+            )[:5]) if engine.state.top_opponent_gifters else {}
+        }, to=room)
 
-    live_battle_engine.on_gift(on_gift)
-    live_battle_engine.on_phase_change(on_phase_change)
-    live_battle_engine.on_score_update(on_score_update)
-    live_battle_engine.on_battle_end(on_battle_end)
+    engine.on_gift(on_gift)
+    engine.on_phase_change(on_phase_change)
+    engine.on_score_update(on_score_update)
+    engine.on_battle_end(on_battle_end)
+    response_cache.attach(engine.event_bus)
 
     # Monkey-patch connection handlers to broadcast status
-    original_on_connect = live_battle_engine._on_connect
+    original_on_connect = engine._on_connect
     def patched_on_connect(team, unique_id):
         original_on_connect(team, unique_id)
         on_connection_change()
-    live_battle_engine._on_connect = patched_on_connect
+    engine._on_connect = patched_on_connect
 
-    original_on_disconnect = live_battle_engine._on_disconnect
+    original_on_disconnect = engine._on_disconnect
     def patched_on_disconnect(team, unique_id):
         original_on_disconnect(team, unique_id)
         on_connection_change()
-    live_battle_engine._on_disconnect = patched_on_disconnect
+    engine._on_disconnect = patched_on_disconnect
+
+    session = _host_session('live', engine, engine.start_live_battle, engine.stop_battle,
+                            session_id, 'live_error')
+    if session is None:
+        return
 
     # Emit battle started confirmation
     emit('live_battle_started', {
+        'session_id': session_id,
         'creator': creator,
         'opponent': opponent,
         'duration': duration
     })
 
-    # Start the battle in a background thread
-    def run_live_battle():
-        global live_battle_engine, live_battle_loop
-        live_battle_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(live_battle_loop)
-
-        try:
-            live_battle_loop.run_until_complete(live_battle_engine.start_live_battle())
-        except Exception as e:
-            print(f"Live battle error: {e}")
-            socketio.emit('live_error', {'error': str(e)})
-        finally:
-            live_battle_loop.close()
-            live_battle_loop = None
-
-    # Start in background thread
-    battle_thread = threading.Thread(target=run_live_battle, daemon=True)
-    battle_thread.start()
-
 
 @socketio.on('stop_live_battle')
-def handle_stop_live_battle():
+def handle_stop_live_battle(data=None):
     """Handle request to stop a live battle."""
-    global live_battle_engine, live_battle_loop
-
-    if live_battle_engine is None:
+    session = _resolve_session('live', data, control=True)
+    if session is None or not session.active:
         emit('live_error', {'error': 'No live battle is running'})
         return
 
-    print(f"\n⏹️  Stopping live battle...")
-
-    # Stop the battle
-    if live_battle_loop and live_battle_loop.is_running():
-        future = asyncio.run_coroutine_threadsafe(
-            live_battle_engine.stop_battle(),
-            live_battle_loop
-        )
-        try:
-            future.result(timeout=5)
-        except Exception as e:
-            print(f"Error stopping battle: {e}")
-
-    live_battle_engine = None
-    emit('live_battle_stopped', {'status': 'stopped'})
+    print(f"\n⏹️  Stopping live battle [{session.session_id}]...")
+    session_host.stop(session.session_id)
+    emit('live_battle_stopped', {'status': 'stopped', 'session_id': session.session_id})
 
 
 @socketio.on('get_live_state')
-def handle_get_live_state():
+def handle_get_live_state(data=None):
     """Get current live battle state."""
-    if live_battle_engine:
-        state = live_battle_engine.get_state()
-        emit('live_state', state)
+    session = _resolve_session('live', data)
+    if session:
+        emit('live_state', session.engine.get_state())
     else:
         emit('live_state', None)
 
@@ -904,8 +997,6 @@ def handle_get_live_state():
 @socketio.on('start_tournament')
 def handle_start_tournament(data):
     """Handle request to start a live TikTok tournament."""
-    global active_tournament_engine, tournament_loop
-
     if not TIKTOK_LIVE_AVAILABLE:
         emit('tournament_error', {'error': 'TikTokLive library not installed. Run: pip install TikTokLive'})
         return
@@ -914,10 +1005,6 @@ def handle_start_tournament(data):
         emit('tournament_error', {'error': 'Tournament engine not available'})
         return
 
-    if active_tournament_engine is not None:
-        emit('tournament_error', {'error': 'A tournament is already running'})
-        return
-
     creator = data.get('creator', '').lstrip('@')
     opponent = data.get('opponent', '').lstrip('@')
     format_str = data.get('format', 'bo3').lower()
@@ -936,14 +1023,17 @@ def handle_start_tournament(data):
     }
     tournament_format = format_map.get(format_str, TournamentFormat.BEST_OF_3)
 
+    session_id = data.get('session_id') or new_session_id()
+    room = session_room(session_id)
+
     print(f"\n{'='*60}")
-    print(f"🏆 LIVE TOURNAMENT STARTING - Best of {tournament_format.value}")
+    print(f"🏆 LIVE TOURNAMENT STARTING - Best of {tournament_format.value} [{session_id}]")
     print(f"   @{creator} vs @{opponent}")
     print(f"   Round Duration: {round_duration}s | Break: {break_duration}s")
     print(f"{'='*60}\n")
 
     # Create tournament engine
-    active_tournament_engine = LiveTournamentEngine(
+    engine = LiveTournamentEngine(
         creator_username=creator,
         opponent_username=opponent,
         format=tournament_format,
@@ -951,18 +1041,20 @@ def handle_start_tournament(data):
         break_duration=break_duration
     )
 
-    # Register callbacks for Socket.IO broadcasting
+    # Register callbacks for Socket.IO broadcasting to this session's room
     def on_round_start(round_num, stats):
-        socketio.emit('tournament_round_start', {
+        session_host.touch(session_id)
+        broadcaster.emit_now('tournament_round_start', {
             'round': round_num,
             'series_score': stats['series_score'],
             'creator_wins': stats['creator_wins'],
             'opponent_wins': stats['opponent_wins'],
             'wins_needed': stats['wins_needed']
-        })
+        }, room=room)
 
     def on_gift(event, round_num, creator_score, opponent_score):
-        socketio.emit('tournament_gift', {
+        session_host.touch(session_id)
+        broadcaster.emit('tournament_gift', {
             'round': round_num,
             'team': event.team,
             'username': event.username,
@@ -973,18 +1065,19 @@ def handle_start_tournament(data):
             'total_points': event.total_points,
             'creator_score': creator_score,
             'opponent_score': opponent_score
-        })
+        }, room=room, mode=BATCH)
 
     def on_score_update(round_num, creator_score, opponent_score, time_remaining):
-        socketio.emit('tournament_score_update', {
+        session_host.touch(session_id)
+        broadcaster.emit('tournament_score_update', {
             'round': round_num,
             'creator_score': creator_score,
             'opponent_score': opponent_score,
             'time_remaining': time_remaining
-        })
+        }, room=room)
 
     def on_round_end(result, stats):
-        socketio.emit('tournament_round_end', {
+        broadcaster.emit_now('tournament_round_end', {
             'round': result.round_number,
             'winner': result.winner,
             'creator_score': result.creator_score,
@@ -995,17 +1088,17 @@ def handle_start_tournament(data):
             'series_score': stats['series_score'],
             'creator_wins': stats['creator_wins'],
             'opponent_wins': stats['opponent_wins']
-        })
+        }, room=room)
 
     def on_break_start(next_round, break_seconds):
-        socketio.emit('tournament_break_start', {
+        session_host.touch(session_id)
+        broadcaster.emit_now('tournament_break_start', {
             'next_round': next_round,
             'break_seconds': break_seconds
-        })
+        }, room=room)
 
     def on_tournament_end(winner, stats):
-        global active_tournament_engine
-        socketio.emit('tournament_ended', {
+        broadcaster.emit_now('tournament_ended', {
             'winner': winner,
             'series_score': stats['series_score'],
             'rounds_played': stats['rounds_played'],
@@ -1014,18 +1107,23 @@ def handle_start_tournament(data):
             'total_gifts': stats['total_gifts'],
             'total_coins': stats['total_coins'],
             'rounds': stats['rounds']
-        })
-        active_tournament_engine = None
-
-    active_tournament_engine.on_round_start(on_round_start)
-    active_tournament_engine.on_gift(on_gift)
-    active_tournament_engine.on_score_update(on_score_update)
-    active_tournament_engine.on_round_end(on_round_end)
-    active_tournament_engine.on_break_start(on_break_start)
-    active_tournament_engine.on_tournament_end(on_tournament_end)
+        }, room=room)
+
+    engine.on_round_start(on_round_start)
+    engine.on_gift(on_gift)
+    engine.on_score_update(on_score_update)
+    engine.on_round_end(on_round_end)
+    engine.on_break_start(on_break_start)
+    engine.on_tournament_end(on_tournament_end)
+
+    session = _host_session('tournament', engine, engine.start, engine.stop,
+                            session_id, 'tournament_error')
+    if session is None:
+        return
 
     # Emit tournament started confirmation
     emit('tournament_started', {
+        'session_id': session_id,
         'creator': creator,
         'opponent': opponent,
         'format': format_str,
@@ -1035,58 +1133,26 @@ def handle_start_tournament(data):
         'wins_needed': (tournament_format.value // 2) + 1
     })
 
-    # Start the tournament in a background thread
-    def run_tournament():
-        global active_tournament_engine, tournament_loop
-        tournament_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(tournament_loop)
-
-        try:
-            tournament_loop.run_until_complete(active_tournament_engine.start())
-        except Exception as e:
-            print(f"Tournament error: {e}")
-            socketio.emit('tournament_error', {'error': str(e)})
-        finally:
-            tournament_loop.close()
-            tournament_loop = None
-
-    # Start in background thread
-    tournament_thread = threading.Thread(target=run_tournament, daemon=True)
-    tournament_thread.start()
-
 
 @socketio.on('stop_tournament')
-def handle_stop_tournament():
+def handle_stop_tournament(data=None):
     """Handle request to stop a live tournament."""
-    global active_tournament_engine, tournament_loop
-
-    if active_tournament_engine is None:
+    session = _resolve_session('tournament', data, control=True)
+    if session is None or not session.active:
         emit('tournament_error', {'error': 'No tournament is running'})
         return
 
-    print(f"\n⏹️  Stopping tournament...")
-
-    # Stop the tournament
-    if tournament_loop and tournament_loop.is_running():
-        future = asyncio.run_coroutine_threadsafe(
-            active_tournament_engine.stop(),
-            tournament_loop
-        )
-        try:
-            future.result(timeout=5)
-        except Exception as e:
-            print(f"Error stopping tournament: {e}")
-
-    active_tournament_engine = None
-    emit('tournament_stopped', {'status': 'stopped'})
+    print(f"\n⏹️  Stopping tournament [{session.session_id}]...")
+    session_host.stop(session.session_id)
+    emit('tournament_stopped', {'status': 'stopped', 'session_id': session.session_id})
 
 
 @socketio.on('get_tournament_state')
-def handle_get_tournament_state():
+def handle_get_tournament_state(data=None):
     """Get current tournament state."""
-    if active_tournament_engine:
-        stats = active_tournament_engine.get_stats()
-        emit('tournament_state', stats)
+    session = _resolve_session('tournament', data)
+    if session:
+        emit('tournament_state', session.engine.get_stats())
     else:
         emit('tournament_state', None)
 
@@ -1098,16 +1164,10 @@ def handle_get_tournament_state():
 @socketio.on('start_ai_vs_live')
 def handle_start_ai_vs_live(data):
     """Handle request to start an AI vs Live battle."""
-    global ai_vs_live_engine, ai_vs_live_loop
-
     if not AI_VS_LIVE_AVAILABLE:
         emit('ai_vs_live_error', {'error': 'AI vs Live engine not available'})
         return
 
-    if ai_vs_live_engine is not None:
-        emit('ai_vs_live_error', {'error': 'An AI vs Live battle is already running'})
-        return
-
     target = data.get('target', '').lstrip('@')
     mode = data.get('mode', 'simulation')  # 'simulation' or 'live'
     format_str = data.get('format', 'bo1').lower()
@@ -1131,8 +1191,11 @@ def handle_start_ai_vs_live(data):
     # Parse mode
     battle_mode = AIBattleMode.SIMULATION if mode == 'simulation' else AIBattleMode.TOURNAMENT
 
+    session_id = data.get('session_id') or new_session_id()
+    room = session_room(session_id)
+
     print(f"\n{'='*60}")
-    print(f"🤖 AI vs LIVE BATTLE STARTING")
+    print(f"🤖 AI vs LIVE BATTLE STARTING [{session_id}]")
     print(f"   Target: @{target}")
     print(f"   Mode: {battle_mode.value}")
     print(f"   Format: Best of {tournament_format.value}")
@@ -1141,7 +1204,7 @@ def handle_start_ai_vs_live(data):
     print(f"{'='*60}\n")
 
     # Create engine
-    ai_vs_live_engine = AIvsLiveEngine(
+    engine = AIvsLiveEngine(
         target_streamer=target,
         ai_team=team.split(',') if team else None,
         mode=battle_mode,
@@ -1150,9 +1213,10 @@ def handle_start_ai_vs_live(data):
         ai_budget_per_round=budget
     )
 
-    # Register callbacks for Socket.IO broadcasting
+    # Register callbacks for Socket.IO broadcasting to this session's room
     def on_ai_gift(gift_data, ai_score, live_score):
-        socketio.emit('ai_vs_live_ai_gift', {
+        session_host.touch(session_id)
+        broadcaster.emit('ai_vs_live_ai_gift', {
             'agent': gift_data['agent'],
             'emoji': gift_data['emoji'],
             'gift_name': gift_data['gift_name'],
@@ -1160,10 +1224,11 @@ def handle_start_ai_vs_live(data):
             'multiplier': gift_data.get('multiplier', 1.0),
             'ai_score': ai_score,
             'live_score': live_score
-        })
+        }, room=room, mode=BATCH)
 
     def on_live_gift(event, live_score, ai_score):
-        socketio.emit('ai_vs_live_live_gift', {
+        session_host.touch(session_id)
+        broadcaster.emit('ai_vs_live_live_gift', {
             'username': event.username,
             'gift_name': event.gift_name,
             'repeat_count': event.repeat_count,
@@ -1171,18 +1236,19 @@ def handle_start_ai_vs_live(data):
             'total_points': event.total_points,
             'ai_score': ai_score,
             'live_score': live_score
-        })
+        }, room=room, mode=BATCH)
 
     def on_score_update(ai_score, live_score, time_remaining, round_num):
-        socketio.emit('ai_vs_live_score_update', {
+        session_host.touch(session_id)
+        broadcaster.emit('ai_vs_live_score_update', {
             'ai_score': ai_score,
             'live_score': live_score,
             'time_remaining': time_remaining,
             'round': round_num
-        })
+        }, room=room)
 
     def on_round_end(result, stats):
-        socketio.emit('ai_vs_live_round_end', {
+        broadcaster.emit_now('ai_vs_live_round_end', {
             'round': result.round_number,
             'winner': result.winner,
             'ai_score': result.ai_score,
@@ -1193,11 +1259,10 @@ def handle_start_ai_vs_live(data):
             'top_live_gifter': result.top_live_gifter,
             'ai_wins': stats['ai_wins'],
             'live_wins': stats['live_wins']
-        })
+        }, room=room)
 
     def on_battle_end(winner, stats):
-        global ai_vs_live_engine
-        socketio.emit('ai_vs_live_battle_end', {
+        broadcaster.emit_now('ai_vs_live_battle_end', {
             'winner': winner,
             'series_score': stats['series_score'],
             'total_ai_score': stats['total_ai_score'],
@@ -1205,24 +1270,30 @@ def handle_start_ai_vs_live(data):
             'ai_team': stats['ai_team'],
             'rounds': stats['rounds'],
             'target_streamer': stats['target_streamer']
-        })
-        ai_vs_live_engine = None
+        }, room=room)
 
     def on_connection(connected, username):
+        session_host.touch(session_id)
         socketio.emit('ai_vs_live_connection', {
             'connected': connected,
             'username': username
-        })
-
-    ai_vs_live_engine.on_ai_gift(on_ai_gift)
-    ai_vs_live_engine.on_live_gift(on_live_gift)
-    ai_vs_live_engine.on_score_update(on_score_update)
-    ai_vs_live_engine.on_round_end(on_round_end)
-    ai_vs_live_engine.on_battle_end(on_battle_end)
-    ai_vs_live_engine.on_connection(on_connection)
+        }, to=room)
+
+    engine.on_ai_gift(on_ai_gift)
+    engine.on_live_gift(on_live_gift)
+    engine.on_score_update(on_score_update)
+    engine.on_round_end(on_round_end)
+    engine.on_battle_end(on_battle_end)
+    engine.on_connection(on_connection)
+
+    session = _host_session('ai_vs_live', engine, engine.start_battle, engine.stop,
+                            session_id, 'ai_vs_live_error')
+    if session is None:
+        return
 
     # Emit battle started confirmation
     emit('ai_vs_live_started', {
+        'session_id': session_id,
         'target': target,
         'mode': battle_mode.value,
         'format': format_str,
@@ -1232,58 +1303,26 @@ def handle_start_ai_vs_live(data):
         'wins_needed': (tournament_format.value // 2) + 1
     })
 
-    # Start the battle in a background thread
-    def run_ai_vs_live():
-        global ai_vs_live_engine, ai_vs_live_loop
-        ai_vs_live_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(ai_vs_live_loop)
-
-        try:
-            ai_vs_live_loop.run_until_complete(ai_vs_live_engine.start_battle())
-        except Exception as e:
-            print(f"AI vs Live battle error: {e}")
-            socketio.emit('ai_vs_live_error', {'error': str(e)})
-        finally:
-            ai_vs_live_loop.close()
-            ai_vs_live_loop = None
-
-    # Start in background thread
-    battle_thread = threading.Thread(target=run_ai_vs_live, daemon=True)
-    battle_thread.start()
-
 
 @socketio.on('stop_ai_vs_live')
-def handle_stop_ai_vs_live():
+def handle_stop_ai_vs_live(data=None):
     """Handle request to stop an AI vs Live battle."""
-    global ai_vs_live_engine, ai_vs_live_loop
-
-    if ai_vs_live_engine is None:
+    session = _resolve_session('ai_vs_live', data, control=True)
+    if session is None or not session.active:
         emit('ai_vs_live_error', {'error': 'No AI vs Live battle is running'})
         return
 
-    print(f"\n⏹️  Stopping AI vs Live battle...")
-
-    # Stop the battle
-    if ai_vs_live_loop and ai_vs_live_loop.is_running():
-        future = asyncio.run_coroutine_threadsafe(
-            ai_vs_live_engine.stop(),
-            ai_vs_live_loop
-        )
-        try:
-            future.result(timeout=5)
-        except Exception as e:
-            print(f"Error stopping AI vs Live battle: {e}")
-
-    ai_vs_live_engine = None
-    emit('ai_vs_live_stopped', {'status': 'stopped'})
+    print(f"\n⏹️  Stopping AI vs Live battle [{session.session_id}]...")
+    session_host.stop(session.session_id)
+    emit('ai_vs_live_stopped', {'status': 'stopped', 'session_id': session.session_id})
 
 
 @socketio.on('get_ai_vs_live_state')
-def handle_get_ai_vs_live_state():
+def handle_get_ai_vs_live_state(data=None):
     """Get current AI vs Live battle state."""
-    if ai_vs_live_engine:
-        stats = ai_vs_live_engine.get_stats()
-        emit('ai_vs_live_state', stats)
+    session = _resolve_session('ai_vs_live', data)
+    if session:
+        emit('ai_vs_live_state', session.engine.get_stats())
     else:
         emit('ai_vs_live_state', None)
 
@@ -1295,16 +1334,10 @@ def handle_get_ai_vs_live_state():
 @socketio.on('start_battle_platform')
 def handle_start_battle_platform(data):
     """Handle request to start Battle Platform AI support."""
-    global battle_platform, battle_platform_loop
-
     if not BATTLE_PLATFORM_AVAILABLE:
         emit('platform_error', {'error': 'Battle Platform not available'})
         return
 
-    if battle_platform is not None:
-        emit('platform_error', {'error': 'Battle Platform is already running'})
-        return
-
     target = data.get('target', '').lstrip('@')
     strategy = data.get('strategy', 'smart')
     mode = data.get('mode', 'supporter')
@@ -1331,8 +1364,11 @@ def handle_start_battle_platform(data):
     }
     platform_mode = mode_map.get(mode.lower(), PlatformMode.SUPPORTER)
 
+    session_id = data.get('session_id') or new_session_id()
+    room = session_room(session_id)
+
     print(f"\n{'='*60}")
-    print(f"🤖 BATTLE PLATFORM STARTING")
+    print(f"🤖 BATTLE PLATFORM STARTING [{session_id}]")
     print(f"   Target: @{target}")
     print(f"   Strategy: {ai_strategy.value}")
     print(f"   Mode: {platform_mode.value}")
@@ -1350,18 +1386,19 @@ def handle_start_battle_platform(data):
     )
 
     # Create platform
-    battle_platform = TikTokBattlePlatform(config)
+    platform = TikTokBattlePlatform(config)
 
-    # Register callbacks for Socket.IO broadcasting
+    # Register callbacks for Socket.IO broadcasting to this session's room
     def on_score_update(score):
-        socketio.emit('platform_score', {
+        session_host.touch(session_id)
+        broadcaster.emit('platform_score', {
             'our_score': score.our_score,
             'opponent_score': score.opponent_score,
             'gap': score.gap,
             'gap_percentage': score.gap_percentage,
             'time_remaining': score.time_remaining,
             'battle_active': score.battle_active
-        })
+        }, room=room)
 
     def on_decision(decision, score):
         socketio.emit('platform_decision', {
@@ -1376,27 +1413,43 @@ def handle_start_battle_platform(data):
                 'opponent_score': score.opponent_score,
                 'gap': score.gap
             }
-        })
+        }, to=room)
 
     def on_gift_sent(result):
-        socketio.emit('platform_gift_sent', {
+        session_host.touch(session_id)
+        broadcaster.emit('platform_gift_sent', {
             'success': result.success,
             'sent': result.sent,
             'failed': result.failed,
             'gift_name': result.gift_name,
             'message': result.message
-        })
+        }, room=room, mode=BATCH)
 
     def on_battle_end(result):
-        socketio.emit('platform_battle_end', result)
+        broadcaster.emit_now('platform_battle_end', result, room=room)
+
+    platform.on_score_update(on_score_update)
+    platform.on_decision(on_decision)
+    platform.on_gift_sent(on_gift_sent)
+    platform.on_battle_end(on_battle_end)
 
-    battle_platform.on_score_update(on_score_update)
-    battle_platform.on_decision(on_decision)
-    battle_platform.on_gift_sent(on_gift_sent)
-    battle_platform.on_battle_end(on_battle_end)
+    async def run_platform():
+        try:
+            await platform.connect()
+            await platform.go_to_stream(target)
+            await platform.run_ai_battle(duration)
+        finally:
+            await platform.disconnect()
+            socketio.emit('platform_stopped', {'status': 'completed', 'session_id': session_id}, to=room)
+
+    session = _host_session('platform', platform, run_platform, platform.stop,
+                            session_id, 'platform_error')
+    if session is None:
+        return
 
     # Emit started confirmation
     emit('platform_started', {
+        'session_id': session_id,
         'target': target,
         'strategy': ai_strategy.value,
         'mode': platform_mode.value,
@@ -1404,82 +1457,61 @@ def handle_start_battle_platform(data):
         'gift': gift
     })
 
-    # Start in background thread
-    def run_platform():
-        global battle_platform, battle_platform_loop
-        battle_platform_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(battle_platform_loop)
-
-        try:
-            battle_platform_loop.run_until_complete(battle_platform.connect())
-            battle_platform_loop.run_until_complete(battle_platform.go_to_stream(target))
-            battle_platform_loop.run_until_complete(battle_platform.run_ai_battle(duration))
-        except Exception as e:
-            print(f"Battle Platform error: {e}")
-            socketio.emit('platform_error', {'error': str(e)})
-        finally:
-            if battle_platform:
-                battle_platform_loop.run_until_complete(battle_platform.disconnect())
-            battle_platform_loop.close()
-            battle_platform_loop = None
-            battle_platform = None
-            socketio.emit('platform_stopped', {'status': 'completed'})
-
-    platform_thread = threading.Thread(target=run_platform, daemon=True)
-    platform_thread.start()
-
 
 @socketio.on('stop_battle_platform')
-def handle_stop_battle_platform():
+def handle_stop_battle_platform(data=None):
     """Handle request to stop Battle Platform."""
-    global battle_platform
-
-    if battle_platform is None:
+    session = _resolve_session('platform', data, control=True)
+    if session is None or not session.active:
         emit('platform_error', {'error': 'No Battle Platform is running'})
         return
 
-    print(f"\n⏹️  Stopping Battle Platform...")
-    battle_platform.stop()
-    emit('platform_stopped', {'status': 'stopped'})
+    print(f"\n⏹️  Stopping Battle Platform [{session.session_id}]...")
+    session.engine.stop()
+    emit('platform_stopped', {'status': 'stopped', 'session_id': session.session_id})
 
 
 @socketio.on('platform_set_strategy')
 def handle_platform_set_strategy(data):
     """Change Battle Platform strategy."""
-    if battle_platform is None:
+    session = _resolve_session('platform', data, control=True)
+    if session is None or not session.active:
         emit('platform_error', {'error': 'No Battle Platform is running'})
         return
 
     strategy = data.get('strategy', 'smart')
     try:
         ai_strategy = AIStrategy(strategy.lower())
-        battle_platform.set_strategy(ai_strategy)
+        session.engine.set_strategy(ai_strategy)
         emit('platform_strategy_changed', {'strategy': ai_strategy.value})
     except:
         emit('platform_error', {'error': f'Invalid strategy: {strategy}'})
 
 
 @socketio.on('platform_pause')
-def handle_platform_pause():
+def handle_platform_pause(data=None):
     """Pause Battle Platform."""
-    if battle_platform:
-        battle_platform.pause()
+    session = _resolve_session('platform', data, control=True)
+    if session and session.active:
+        session.engine.pause()
         emit('platform_paused', {'status': 'paused'})
 
 
 @socketio.on('platform_resume')
-def handle_platform_resume():
+def handle_platform_resume(data=None):
     """Resume Battle Platform."""
-    if battle_platform:
-        battle_platform.resume()
+    session = _resolve_session('platform', data, control=True)
+    if session and session.active:
+        session.engine.resume()
         emit('platform_resumed', {'status': 'resumed'})
 
 
 @socketio.on('get_platform_state')
-def handle_get_platform_state():
+def handle_get_platform_state(data=None):
     """Get current Battle Platform state."""
-    if battle_platform:
-        emit('platform_state', battle_platform.get_stats())
+    session = _resolve_session('platform', data)
+    if session and session.active:
+        emit('platform_state', session.engine.get_stats())
     else:
         emit('platform_state', None)
 
@@ -1508,13 +1540,12 @@ def broadcast_live_top_gifters(creator_gifters: Dict[str, int], opponent_gifters
 # AUDIENCE VOTING & INTERACTION
 # =============================================================================
 
-# Audience state
-audience_state = {
-    'viewers': {},  # viewer_id -> {vote, connected}
-    'votes': {'creator': 0, 'opponent': 0},
-    'powerup_cooldowns': {},  # powerup -> timestamp
-    'total_viewers': 0
-}
+# Audience state: sharded viewers/votes, snapshots published through the
+# broadcaster's latest-wins channels (vote_update 4 Hz, viewer_count 2 Hz)
+audience = AudienceTracker(
+    shards=int(os.environ.get('AUDIENCE_SHARDS', 16)),
+    publish=broadcaster.emit
+)
 
 
 @app.route('/audience')
@@ -1536,49 +1567,28 @@ def handle_viewer_join(data):
     """Handle viewer joining the audience."""
     viewer_id = data.get('viewer_id')
     if viewer_id:
-        audience_state['viewers'][viewer_id] = {'vote': None, 'connected': True}
-        audience_state['total_viewers'] = len([v for v in audience_state['viewers'].values() if v['connected']])
+        audience.join(request.sid, viewer_id)
 
         # Send current state to new viewer
-        emit('vote_update', audience_state['votes'])
-        emit('viewer_count', {'count': audience_state['total_viewers']})
-
-        # Broadcast updated viewer count
-        socketio.emit('viewer_count', {'count': audience_state['total_viewers']})
+        emit('vote_update', audience.votes())
+        emit('viewer_count', {'count': audience.viewer_count()})
 
 
 @socketio.on('audience_vote')
 def handle_audience_vote(data):
-    """Handle audience vote for a team."""
-    viewer_id = data.get('viewer_id')
+    """Handle audience vote for a team (counted for the viewer this socket joined as)."""
     vote = data.get('vote')
 
-    if not viewer_id or vote not in ['creator', 'opponent']:
-        return
-
-    # Check if already voted
-    if viewer_id in audience_state['viewers'] and audience_state['viewers'][viewer_id]['vote']:
-        emit('vote_error', {'error': 'Already voted'})
+    if vote not in ['creator', 'opponent']:
         return
 
-    # Record vote
-    if viewer_id not in audience_state['viewers']:
-        audience_state['viewers'][viewer_id] = {'vote': None, 'connected': True}
-
-    audience_state['viewers'][viewer_id]['vote'] = vote
-    audience_state['votes'][vote] += 1
-
-    # Broadcast updated votes
-    socketio.emit('vote_update', audience_state['votes'])
-
-    print(f"🗳️ Vote: {vote.upper()} (Creator: {audience_state['votes']['creator']}, Opponent: {audience_state['votes']['opponent']})")
+    if not audience.vote(request.sid, vote):
+        emit('vote_error', {'error': 'Already voted or not joined'})
 
 
 @socketio.on('audience_powerup')
 def handle_audience_powerup(data):
     """Handle audience-triggered power-up."""
-    import time
-
     viewer_id = data.get('viewer_id')
     powerup = data.get('powerup')
 
@@ -1587,17 +1597,10 @@ def handle_audience_powerup(data):
         return
 
     # Check cooldown (30 seconds)
-    cooldown_key = f"{viewer_id}_{powerup}"
-    current_time = time.time()
-
-    if cooldown_key in audience_state['powerup_cooldowns']:
-        if current_time - audience_state['powerup_cooldowns'][cooldown_key] < 30:
-            remaining = 30 - (current_time - audience_state['powerup_cooldowns'][cooldown_key])
-            emit('powerup_cooldown', {'powerup': powerup, 'seconds': int(remaining)})
-            return
-
-    # Record cooldown
-    audience_state['powerup_cooldowns'][cooldown_key] = current_time
+    remaining = audience.try_powerup(viewer_id, powerup, cooldown=30)
+    if remaining:
+        emit('powerup_cooldown', {'powerup': powerup, 'seconds': int(remaining)})
+        return
 
     # Broadcast power-up event
     powerup_names = {
@@ -1628,20 +1631,13 @@ def handle_audience_powerup(data):
 @app.route('/api/audience/votes')
 def get_audience_votes():
     """Get current audience vote counts."""
-    return jsonify({
-        'votes': audience_state['votes'],
-        'total_viewers': audience_state['total_viewers']
-    })
+    return jsonify(audience.snapshot())
 
 
 @app.route('/api/audience/reset', methods=['POST'])
 def reset_audience_votes():
     """Reset audience votes (for new battle)."""
-    audience_state['votes'] = {'creator': 0, 'opponent': 0}
-    for viewer_id in audience_state['viewers']:
-        audience_state['viewers'][viewer_id]['vote'] = None
-
-    socketio.emit('vote_update', audience_state['votes'])
+    audience.reset_votes()
     return jsonify({'status': 'reset'})
 
 
@@ -1650,9 +1646,13 @@ def reset_audience_votes():
 # =============================================================================
 
 try:
-    from core.database import BattleRepository, TournamentRepository, ReplayRepository, LeaderboardRepository, init_database
+    from core.database import (
+        BattleRepository, TournamentRepository, ReplayRepository, LeaderboardRepository,
+        init_database, add_change_listener
+    )
     DATABASE_AVAILABLE = True
     init_database()
+    add_change_listener(response_cache.on_data_changed)
 except ImportError:
     DATABASE_AVAILABLE = False
     ReplayRepository = None
@@ -1660,6 +1660,7 @@ except ImportError:
 
 
 @app.route('/api/db/battles')
+@response_cache.cached('battles')
 def get_db_battles():
     """Get battle history from database."""
     if not DATABASE_AVAILABLE:
@@ -1685,6 +1686,7 @@ def get_db_battle(battle_id):
 
 
 @app.route('/api/db/statistics')
+@response_cache.cached('battles')
 def get_db_statistics():
     """Get overall battle statistics."""
     if not DATABASE_AVAILABLE:
@@ -1695,6 +1697,7 @@ def get_db_statistics():
 
 
 @app.route('/api/db/tournaments')
+@response_cache.cached('tournaments')
 def get_db_tournaments():
     """Get tournament history from database."""
     if not DATABASE_AVAILABLE:
@@ -1706,6 +1709,7 @@ def get_db_tournaments():
 
 
 @app.route('/api/db/tournaments/<tournament_id>')
+@response_cache.cached('tournaments')
 def get_db_tournament(tournament_id):
     """Get specific tournament from database."""
     if not DATABASE_AVAILABLE:
@@ -1729,6 +1733,7 @@ def analytics_dashboard():
 
 
 @app.route('/api/analytics/overview')
+@response_cache.cached('battles')
 def get_analytics_overview():
     """Get comprehensive analytics overview."""
     if not DATABASE_AVAILABLE:
@@ -1739,6 +1744,7 @@ def get_analytics_overview():
 
 
 @app.route('/api/analytics/agents')
+@response_cache.cached('battles')
 def get_analytics_agents():
     """Get agent performance statistics."""
     if not DATABASE_AVAILABLE:
@@ -1749,6 +1755,7 @@ def get_analytics_agents():
 
 
 @app.route('/api/analytics/distribution')
+@response_cache.cached('battles')
 def get_analytics_distribution():
     """Get score distribution data."""
     if not DATABASE_AVAILABLE:
@@ -1819,6 +1826,7 @@ def obs_setup():
 
 
 @app.route('/api/replay/list')
+@response_cache.cached('battles')
 def get_replay_list():
     """Get list of battles available for replay."""
     if not DATABASE_AVAILABLE or not ReplayRepository:
@@ -1830,6 +1838,7 @@ def get_replay_list():
 
 
 @app.route('/api/replay/<battle_id>')
+@response_cache.cached('battles')
 def get_replay_data(battle_id):
     """Get full replay data for a battle."""
     if not DATABASE_AVAILABLE or not ReplayRepository:
@@ -1876,6 +1885,7 @@ def leaderboard_page():
 
 
 @app.route('/api/leaderboard/agents')
+@response_cache.cached('leaderboard')
 def get_leaderboard_agents():
     """Get top agents leaderboard."""
     if not DATABASE_AVAILABLE or not LeaderboardRepository:
@@ -1888,6 +1898,7 @@ def get_leaderboard_agents():
 
 
 @app.route('/api/leaderboard/gifters')
+@response_cache.cached('leaderboard')
 def get_leaderboard_gifters():
     """Get top gifters leaderboard."""
     if not DATABASE_AVAILABLE or not LeaderboardRepository:
@@ -1900,6 +1911,7 @@ def get_leaderboard_gifters():
 
 
 @app.route('/api/leaderboard/summary')
+@response_cache.cached('leaderboard')
 def get_leaderboard_summary():
     """Get leaderboard summary stats."""
     if not DATABASE_AVAILABLE or not LeaderboardRepository:
@@ -1910,6 +1922,7 @@ def get_leaderboard_summary():
 
 
 @app.route('/api/leaderboard/agent/<agent_name>')
+@response_cache.cached('leaderboard')
 def get_agent_rank(agent_name):
     """Get specific agent's rank and stats."""
     if not DATABASE_AVAILABLE or not LeaderboardRepository:
@@ -1922,6 +1935,7 @@ def get_agent_rank(agent_name):
 
 
 @app.route('/api/leaderboard/gifter/<username>')
+@response_cache.cached('leaderboard')
 def get_gifter_rank(username):
     """Get specific gifter's rank and stats."""
     if not DATABASE_AVAILABLE or not LeaderboardRepository:
@@ -2227,14 +2241,18 @@ def api_v1_battle_details(battle_id):
 @api_v1.route('/live/status')
 def api_v1_live_status():
     """API v1: Get live battle status."""
+    status = _session_status('live')
+    session = status['session']
     return jsonify({
         'tiktok_live_available': TIKTOK_LIVE_AVAILABLE,
-        'active_battle': live_battle_engine is not None,
-        'battle_state': live_battle_engine.get_state() if live_battle_engine else None
+        'active_battle': session_host.active_count('live') > 0,
+        'battle_state': session.engine.get_state() if session else None,
+        'sessions': status['sessions']
     })
 
 
 @api_v1.route('/analytics/overview')
+@response_cache.cached('battles')
 def api_v1_analytics_overview():
     """API v1: Get analytics overview."""
     if DATABASE_AVAILABLE:
@@ -2243,6 +2261,7 @@ def api_v1_analytics_overview():
 
 
 @api_v1.route('/analytics/agents')
+@response_cache.cached('battles')
 def api_v1_analytics_agents():
     """API v1: Get agent statistics."""
     if DATABASE_AVAILABLE:
@@ -2251,6 +2270,7 @@ def api_v1_analytics_agents():
 
 
 @api_v1.route('/analytics/distribution')
+@response_cache.cached('battles')
 def api_v1_analytics_distribution():
     """API v1: Get score distribution."""
     if DATABASE_AVAILABLE:
@@ -2259,6 +2279,7 @@ def api_v1_analytics_distribution():
 
 
 @api_v1.route('/leaderboard/agents')
+@response_cache.cached('leaderboard')
 def api_v1_leaderboard_agents():
     """API v1: Get top agents."""
     if DATABASE_AVAILABLE and LeaderboardRepository:
@@ -2269,6 +2290,7 @@ def api_v1_leaderboard_agents():
 
 
 @api_v1.route('/leaderboard/gifters')
+@response_cache.cached('leaderboard')
 def api_v1_leaderboard_gifters():
     """API v1: Get top gifters."""
     if DATABASE_AVAILABLE and LeaderboardRepository:
@@ -2279,6 +2301,7 @@ def api_v1_leaderboard_gifters():
 
 
 @api_v1.route('/leaderboard/summary')
+@response_cache.cached('leaderboard')
 def api_v1_leaderboard_summary():
     """API v1: Get leaderboard summary."""
     if DATABASE_AVAILABLE and LeaderboardRepository:
@@ -2287,6 +2310,7 @@ def api_v1_leaderboard_summary():
 
 
 @api_v1.route('/replay/list')
+@response_cache.cached('battles')
 def api_v1_replay_list():
     """API v1: Get replay list."""
     if DATABASE_AVAILABLE and ReplayRepository:
@@ -2296,6 +2320,7 @@ def api_v1_replay_list():
 
 
 @api_v1.route('/replay/<battle_id>')
+@response_cache.cached('battles')
 def api_v1_replay_data(battle_id):
     """API v1: Get replay data."""
     if DATABASE_AVAILABLE and ReplayRepository:
@@ -2309,10 +2334,7 @@ def api_v1_replay_data(battle_id):
 @api_v1.route('/audience/votes')
 def api_v1_audience_votes():
     """API v1: Get audience votes."""
-    return jsonify({
-        'votes': audience_state['votes'],
-        'total_viewers': audience_state['total_viewers']
-    })
+    return jsonify(audience.snapshot())
 
 
 # Register API v1 blueprint
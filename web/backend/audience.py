@@ -0,0 +1,246 @@
+"""
+Audience Tracker - viewer presence, vote tallies and power-up cooldowns.
+
+Built for large audiences (thousands of viewers, vote bursts of thousands
+per second):
+- viewers, votes and cooldowns live in N shards (by viewer id), each with
+  its own lock, so concurrent handlers rarely contend
+- connected-viewer and vote counters are maintained incrementally; totals
+  are a sum over the shards, never a scan over viewers
+- presence is keyed on Socket.IO session ids: disconnect(sid) marks the
+  viewer gone (a viewer with several tabs stays connected until the last
+  one closes) and forgets viewers that never voted
+- votes are cast by socket, for the viewer it joined as; sockets that
+  never joined can't vote, so made-up viewer ids are never tracked
+- snapshots go out through a throttled publisher (the BroadcastAggregator's
+  latest-wins channels) instead of one message per join/vote
+
+Usage:
+    audience = AudienceTracker(publish=broadcaster.emit)
+    audience.join(request.sid, viewer_id)
+    ok = audience.vote(request.sid, 'creator')
+    audience.disconnect(request.sid)
+"""
+
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional, Set
+
+
+VOTE_OPTIONS = ("creator", "opponent")
+
+
+class _Viewer:
+    __slots__ = ("vote", "sids")
+
+    def __init__(self):
+        self.vote: Optional[str] = None
+        self.sids: Set[str] = set()
+
+
+class _Shard:
+    """One slice of the audience with its own lock and counters."""
+
+    __slots__ = ("lock", "viewers", "votes", "connected", "cooldowns")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.viewers: Dict[str, _Viewer] = {}
+        self.votes: Dict[str, int] = {option: 0 for option in VOTE_OPTIONS}
+        self.connected = 0
+        self.cooldowns: Dict[str, float] = {}  # "<viewer>_<powerup>" -> expires_at
+
+
+class AudienceTracker:
+    """Sharded audience state with O(1) joins, leaves and votes."""
+
+    def __init__(self, shards: int = 16,
+                 publish: Optional[Callable[..., Any]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            shards: Number of independently locked shards
+            publish: Throttled emit(event, payload) for vote_update /
+                viewer_count snapshots (None = don't publish)
+            clock: Time source (injectable for tests)
+        """
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._sids: Dict[str, str] = {}  # socket sid -> viewer id
+        self._publish = publish
+        self.clock = clock
+
+        # Stats
+        self.joins = 0
+        self.leaves = 0
+        self.votes_cast = 0
+        self.votes_rejected = 0
+
+    def _shard(self, viewer_id: str) -> _Shard:
+        return self._shards[zlib.crc32(viewer_id.encode()) % len(self._shards)]
+
+    # ------------------------------------------------------------------
+    # Presence
+    # ------------------------------------------------------------------
+
+    def join(self, sid: str, viewer_id: str) -> bool:
+        """
+        Register a viewer's socket.
+
+        Args:
+            sid: Socket.IO session id
+            viewer_id: Client-chosen viewer id (coerced to str)
+
+        Returns:
+            True if the viewer just became connected (first open socket)
+        """
+        viewer_id = str(viewer_id)
+        previous = self._sids.get(sid)
+        if previous is not None and previous != viewer_id:
+            self.disconnect(sid)
+
+        shard = self._shard(viewer_id)
+        with shard.lock:
+            viewer = shard.viewers.get(viewer_id)
+            if viewer is None:
+                viewer = shard.viewers[viewer_id] = _Viewer()
+            became_connected = not viewer.sids
+            viewer.sids.add(sid)
+            if became_connected:
+                shard.connected += 1
+        self._sids[sid] = viewer_id
+        if became_connected:
+            self.joins += 1
+            self._publish_viewers()
+        return became_connected
+
+    def disconnect(self, sid: str) -> bool:
+        """
+        Forget a closed socket.
+
+        Returns:
+            True if its viewer has no sockets left
+        """
+        viewer_id = self._sids.pop(sid, None)
+        if viewer_id is None:
+            return False
+
+        shard = self._shard(viewer_id)
+        with shard.lock:
+            viewer = shard.viewers.get(viewer_id)
+            if viewer is None or sid not in viewer.sids:
+                return False
+            viewer.sids.discard(sid)
+            left = not viewer.sids
+            if left:
+                shard.connected -= 1
+                if viewer.vote is None:
+                    # Voters are remembered so a reconnect can't vote twice
+                    del shard.viewers[viewer_id]
+        if left:
+            self.leaves += 1
+            self._publish_viewers()
+        return left
+
+    def viewer_count(self) -> int:
+        return sum(shard.connected for shard in self._shards)
+
+    # ------------------------------------------------------------------
+    # Votes
+    # ------------------------------------------------------------------
+
+    def vote(self, sid: str, option: str) -> bool:
+        """
+        Record the single vote of the viewer a socket joined as.
+
+        Returns:
+            False if the option is invalid, the socket hasn't joined, or
+            the viewer already voted
+        """
+        viewer_id = self._sids.get(sid)
+        if option not in VOTE_OPTIONS or viewer_id is None:
+            self.votes_rejected += 1
+            return False
+
+        shard = self._shard(viewer_id)
+        with shard.lock:
+            viewer = shard.viewers.get(viewer_id)
+            if viewer is None or viewer.vote is not None:
+                self.votes_rejected += 1
+                return False
+            viewer.vote = option
+            shard.votes[option] += 1
+        self.votes_cast += 1
+        self._publish_votes()
+        return True
+
+    def votes(self) -> Dict[str, int]:
+        totals = {option: 0 for option in VOTE_OPTIONS}
+        for shard in self._shards:
+            for option, count in shard.votes.items():
+                totals[option] += count
+        return totals
+
+    def reset_votes(self):
+        """Clear all votes (new battle); disconnected voters are dropped."""
+        for shard in self._shards:
+            with shard.lock:
+                for option in shard.votes:
+                    shard.votes[option] = 0
+                for viewer_id in [v for v, viewer in shard.viewers.items() if not viewer.sids]:
+                    del shard.viewers[viewer_id]
+                for viewer in shard.viewers.values():
+                    viewer.vote = None
+        self._publish_votes()
+
+    # ------------------------------------------------------------------
+    # Power-up cooldowns
+    # ------------------------------------------------------------------
+
+    def try_powerup(self, viewer_id: str, powerup: str, cooldown: float = 30.0) -> float:
+        """
+        Start a viewer's power-up cooldown if it has expired.
+
+        Returns:
+            0 if the power-up may fire, else seconds left on the cooldown
+        """
+        viewer_id = str(viewer_id)
+        now = self.clock()
+        key = f"{viewer_id}_{powerup}"
+        shard = self._shard(viewer_id)
+        with shard.lock:
+            expires_at = shard.cooldowns.get(key, 0.0)
+            if expires_at > now:
+                return expires_at - now
+            shard.cooldowns[key] = now + cooldown
+            if len(shard.cooldowns) > 1024:
+                shard.cooldowns = {k: t for k, t in shard.cooldowns.items() if t > now}
+        return 0.0
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def _publish_votes(self):
+        if self._publish is not None:
+            self._publish('vote_update', self.votes())
+
+    def _publish_viewers(self):
+        if self._publish is not None:
+            self._publish('viewer_count', {'count': self.viewer_count()})
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'votes': self.votes(), 'total_viewers': self.viewer_count()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for /api/health."""
+        return {
+            'shards': len(self._shards),
+            'connected': self.viewer_count(),
+            'tracked_viewers': sum(len(shard.viewers) for shard in self._shards),
+            'sockets': len(self._sids),
+            'joins': self.joins,
+            'leaves': self.leaves,
+            'votes_cast': self.votes_cast,
+            'votes_rejected': self.votes_rejected,
+        }
@@ -0,0 +1,251 @@
+"""
+Broadcast Aggregator - coalesced, rate-limited Socket.IO fan-out.
+
+Gift storms and big audiences produce far more updates than a browser can
+render. Instead of one Socket.IO message per gift / vote / join, updates
+are merged per (event, room, key) channel and flushed as frames:
+
+- "latest": latest value wins (scores, viewer counts, vote totals)
+- "batch": payloads are collected and sent as one `<event>_batch`
+  message `{"events": [...]}` (gift feeds, agent actions)
+- emit_now(): flushes the room's pending frames, then sends immediately
+  (battle start/end, phase changes) so clients see events in order
+
+Frames go out at most `rate_hz` times per second per event (overridable
+per event). Counters compare what would have been sent (messages_in) with
+what actually was (messages_out); with measure_bytes=True every payload is
+also JSON-encoded once more to count bytes_in / bytes_out (off by default,
+since it doubles serialization on the hot path).
+
+Usage:
+    broadcaster = BroadcastAggregator(socketio.emit, rate_hz=10,
+                                      start_task=socketio.start_background_task,
+                                      sleep=socketio.sleep)
+    broadcaster.emit('live_gift', payload, mode='batch')
+    broadcaster.emit('live_score_update', scores)           # latest wins
+    broadcaster.emit_now('live_battle_ended', result)
+"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+LATEST = "latest"
+BATCH = "batch"
+
+
+def _payload_size(payload: Any) -> int:
+    try:
+        return len(json.dumps(payload, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class BroadcastAggregator:
+    """Merges Socket.IO updates per channel and emits them as rate-limited frames."""
+
+    def __init__(self, emit: Callable[..., Any], rate_hz: float = 10.0,
+                 event_rates: Optional[Dict[str, float]] = None,
+                 max_batch: int = 200,
+                 start_task: Optional[Callable[..., Any]] = None,
+                 sleep: Callable[[float], Any] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic,
+                 measure_bytes: bool = False):
+        """
+        Args:
+            emit: Socket.IO emit function (socketio.emit)
+            rate_hz: Default frames per second per event (0 disables
+                aggregation: every emit goes straight out)
+            event_rates: Per-event overrides, e.g. {'viewer_count': 2}
+            max_batch: Flush a batch channel early once it holds this many
+                payloads
+            start_task: Background task starter (socketio.start_background_task);
+                a daemon thread is used when omitted
+            sleep: Sleep function matching start_task (socketio.sleep)
+            clock: Time source (injectable for tests)
+            measure_bytes: Count payload bytes in/out (extra json.dumps per message)
+        """
+        self._emit = emit
+        self.rate_hz = rate_hz
+        self.event_rates = dict(event_rates or {})
+        self.max_batch = max_batch
+        self._start_task = start_task
+        self._sleep = sleep
+        self.clock = clock
+        self.measure_bytes = measure_bytes
+
+        # (event, room, key) -> [mode, payload or list of payloads]
+        self._pending: Dict[tuple, list] = {}
+        self._last_frame: Dict[str, float] = {}  # event -> last flush time
+        self._lock = threading.RLock()
+        self._running = False
+        self._started_at = clock()
+
+        # Stats
+        self.messages_in = 0
+        self.bytes_in = 0
+        self.messages_out = 0
+        self.bytes_out = 0
+        self.frames = 0
+        self.coalesced = 0
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def emit(self, event: str, payload: Any, room: Optional[str] = None,
+             mode: str = LATEST, key: Any = None):
+        """
+        Queue an update for the next frame.
+
+        Args:
+            event: Socket.IO event name
+            payload: Message data
+            room: Target room (None = everyone)
+            mode: LATEST (replace pending value) or BATCH (append)
+            key: Extra channel key (e.g. battle_id) so independent streams
+                on one event don't overwrite each other
+        """
+        self.messages_in += 1
+        if self.measure_bytes:
+            self.bytes_in += _payload_size(payload)
+
+        if self.rate_hz <= 0:
+            self._send(event, payload, room)
+            return
+
+        channel = (event, room, key)
+        flush_now = False
+        with self._lock:
+            pending = self._pending.get(channel)
+            if mode == BATCH:
+                if pending is None:
+                    self._pending[channel] = [BATCH, [payload]]
+                else:
+                    pending[1].append(payload)
+                    self.coalesced += 1
+                    flush_now = len(pending[1]) >= self.max_batch
+            else:
+                if pending is not None:
+                    self.coalesced += 1
+                self._pending[channel] = [LATEST, payload]
+
+            if flush_now:
+                self._flush_channel(channel)
+
+        self._ensure_running()
+
+    def emit_now(self, event: str, payload: Any, room: Optional[str] = None):
+        """Send immediately, after flushing anything pending for the room."""
+        self.messages_in += 1
+        if self.measure_bytes:
+            self.bytes_in += _payload_size(payload)
+        with self._lock:
+            for channel in [c for c in self._pending if c[1] == room or room is None]:
+                self._flush_channel(channel)
+            self._send(event, payload, room)
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def _interval(self, event: str) -> float:
+        rate = self.event_rates.get(event, self.rate_hz)
+        return 1.0 / rate if rate > 0 else 0.0
+
+    def _send(self, event: str, payload: Any, room: Optional[str]):
+        if room is None:
+            self._emit(event, payload)
+        else:
+            self._emit(event, payload, to=room)
+        self.messages_out += 1
+        if self.measure_bytes:
+            self.bytes_out += _payload_size(payload)
+
+    def _flush_channel(self, channel: tuple):
+        event, room, _ = channel
+        mode, value = self._pending.pop(channel)
+        if mode == BATCH:
+            self._send(f"{event}_batch", {"events": value}, room)
+        else:
+            self._send(event, value, room)
+        self._last_frame[event] = self.clock()
+
+    def flush(self, force: bool = False) -> int:
+        """
+        Emit frames for every channel whose event is due.
+
+        Args:
+            force: Ignore rate limits and flush everything
+
+        Returns:
+            Frames emitted
+        """
+        now = self.clock()
+        sent = 0
+        with self._lock:
+            # Decide per event up front so every channel of a due event goes out
+            due = {event for event, _, _ in self._pending
+                   if force or now - self._last_frame.get(event, float("-inf")) >= self._interval(event)}
+            for channel in [c for c in self._pending if c[0] in due]:
+                self._flush_channel(channel)
+                sent += 1
+            if sent:
+                self.frames += 1
+        return sent
+
+    def _ensure_running(self):
+        if self._running:
+            return
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        if self._start_task is not None:
+            self._start_task(self._run)
+        else:
+            threading.Thread(target=self._run, name="BroadcastAggregator", daemon=True).start()
+
+    def _run(self):
+        """Flusher loop (stops once idle; restarted by the next emit)."""
+        tick = 1.0 / max([self.rate_hz] + list(self.event_rates.values()))
+        idle = 0
+        while idle < 50:
+            self._sleep(tick)
+            if self.flush():
+                idle = 0
+            elif not self._pending:
+                idle += 1
+        with self._lock:
+            self._running = False
+            pending = bool(self._pending)
+        if pending:
+            self._ensure_running()
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Inbound (unaggregated) vs outbound message rates (and bytes if measured)."""
+        elapsed = max(self.clock() - self._started_at, 1e-9)
+        stats = {
+            "rate_hz": self.rate_hz,
+            "messages_in": self.messages_in,
+            "messages_out": self.messages_out,
+            "messages_in_per_sec": round(self.messages_in / elapsed, 2),
+            "messages_out_per_sec": round(self.messages_out / elapsed, 2),
+            "frames": self.frames,
+            "coalesced": self.coalesced,
+            "pending_channels": len(self._pending),
+        }
+        if self.measure_bytes:
+            stats.update({
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "bytes_in_per_sec": round(self.bytes_in / elapsed, 2),
+                "bytes_out_per_sec": round(self.bytes_out / elapsed, 2),
+            })
+        return stats
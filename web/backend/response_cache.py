@@ -0,0 +1,200 @@
+"""
+Response Cache - in-process TTL + LRU cache for read-heavy API endpoints.
+
+Dashboards and OBS overlays poll the leaderboard / analytics / replay
+endpoints every few seconds; this keeps the rendered JSON per
+(route, query args) for a short TTL instead of hitting the database on
+every request.
+
+Entries carry tags ("battles", "leaderboard", "tournaments") and are
+dropped when matching data changes:
+- core.database write notifications (add_change_listener)
+- BATTLE_ENDED on any attached EventBus
+- explicit invalidate() calls (e.g. from broadcast_battle_end)
+
+Usage:
+    response_cache = ResponseCache(max_entries=512, ttl=10.0)
+
+    @app.route('/api/leaderboard/agents')
+    @response_cache.cached('leaderboard')
+    def get_leaderboard_agents():
+        ...
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+try:
+    from flask import current_app, make_response, request
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+from core.event_bus import EventBus, EventType
+
+
+# Which cached data each kind of change makes stale
+INVALIDATION_MAP: Dict[str, tuple] = {
+    "battles": ("battles", "leaderboard"),
+    "leaderboard": ("leaderboard",),
+    "tournaments": ("tournaments", "battles", "leaderboard"),
+}
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache with tag-based invalidation.
+
+    Values are opaque to the cache; the Flask decorator stores
+    (body bytes, status, mimetype) so every hit builds a fresh response.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: Least recently used entries are evicted past this
+            ttl: Default entry lifetime in seconds
+            clock: Time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()  # key -> (expires_at, tags, value)
+        self._tags: Dict[str, Set[Any]] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    # ------------------------------------------------------------------
+    # Core operations
+    # ------------------------------------------------------------------
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Cached value for key, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= self.clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key: Any, value: Any, tags: Iterable[str] = (), ttl: Optional[float] = None):
+        """Store a value, evicting the least recently used entry when full."""
+        tags = tuple(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self.clock() + (self.ttl if ttl is None else ttl), tags, value)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Any):
+        _, tags, _ = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop every entry carrying any of the tags. Returns entries dropped."""
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys |= self._tags.get(tag, set())
+            for key in keys:
+                self._remove(key)
+            if keys:
+                self.invalidations += 1
+            return len(keys)
+
+    def clear(self):
+        """Drop everything (stats are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Invalidation sources
+    # ------------------------------------------------------------------
+
+    def on_data_changed(self, topic: str):
+        """core.database change listener: drop entries made stale by `topic`."""
+        self.invalidate(*INVALIDATION_MAP.get(topic, (topic,)))
+
+    def _on_battle_ended(self, event):
+        self.on_data_changed("battles")
+
+    def attach(self, event_bus: EventBus):
+        """Invalidate battle-derived entries when the bus publishes BATTLE_ENDED."""
+        event_bus.subscribe(EventType.BATTLE_ENDED, self._on_battle_ended, inline=True)
+
+    def detach(self, event_bus: EventBus):
+        event_bus.unsubscribe(EventType.BATTLE_ENDED, self._on_battle_ended)
+
+    # ------------------------------------------------------------------
+    # Flask integration
+    # ------------------------------------------------------------------
+
+    def cached(self, *tags: str, ttl: Optional[float] = None):
+        """
+        Cache a Flask view's 200 responses by path and query args.
+
+        Place it below @app.route so the route registers the cached view.
+        """
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                key = (request.path, tuple(sorted(request.args.items(multi=True))))
+                hit = self.get(key)
+                if hit is not None:
+                    body, status, mimetype = hit
+                    return current_app.response_class(body, status=status, mimetype=mimetype)
+
+                response = make_response(view(*args, **kwargs))
+                if response.status_code == 200 and not response.direct_passthrough:
+                    self.set(key, (response.get_data(), response.status_code, response.mimetype),
+                             tags=tags, ttl=ttl)
+                return response
+            return wrapper
+        return decorator
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for /api/health."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,420 @@
+"""
+Session Host - many concurrent battles/tournaments on a shared event loop pool.
+
+Every start request (live battle, tournament, AI vs Live, Battle Platform,
+demo battle) becomes a BattleSession keyed by a session id with its own
+Socket.IO room (`session:<id>`). Engine coroutines run on a small pool of
+long-lived asyncio loops instead of one new thread + event loop per start,
+so a single server process can host many creators at once.
+
+Sessions are garbage-collected by a janitor task:
+- finished sessions are kept `finished_ttl` seconds (so clients can still
+  read the final state), then dropped
+- running sessions with no activity (engine callbacks, client requests)
+  for `idle_timeout` seconds are stopped and dropped
+
+Usage:
+    session_host = SessionHost(loop_count=2, idle_timeout=900)
+    session = session_host.start('live', engine, engine.start_live_battle,
+                                 stop=engine.stop_battle, owner=request.sid)
+    join_room(session.room)
+    socketio.emit('live_gift', payload, to=session.room)
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+def session_room(session_id: str) -> str:
+    """Socket.IO room carrying a session's events."""
+    return f"session:{session_id}"
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+@dataclass
+class BattleSession:
+    """One hosted battle/tournament and its bookkeeping."""
+    session_id: str
+    kind: str
+    engine: Any
+    owner: Optional[str] = None
+    created_at: float = 0.0
+    last_activity: float = 0.0
+    finished_at: Optional[float] = None
+    status: str = "starting"  # starting, running, stopping, finished, failed
+    error: Optional[str] = None
+    loop_index: int = 0
+    members: set = field(default_factory=set)
+    _stop: Optional[Callable[[], Any]] = field(default=None, repr=False)
+    _future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def room(self) -> str:
+        return session_room(self.session_id)
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("starting", "running", "stopping")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "kind": self.kind,
+            "room": self.room,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at,
+            "last_activity": self.last_activity,
+            "finished_at": self.finished_at,
+            "members": len(self.members),
+        }
+
+
+class _LoopWorker:
+    """A daemon thread running one asyncio loop forever."""
+
+    def __init__(self, index: int):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name=f"SessionLoop-{index}", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Awaitable) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+        if not self.loop.is_running():
+            self.loop.close()
+
+
+class SessionHost:
+    """Registry of battle sessions running on a shared loop pool."""
+
+    def __init__(self, loop_count: int = 1, idle_timeout: float = 900.0,
+                 finished_ttl: float = 300.0, gc_interval: float = 30.0,
+                 max_sessions: int = 0,
+                 on_session_end: Optional[Callable[[BattleSession], Any]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            loop_count: Event loop threads shared by all sessions
+            idle_timeout: Stop running sessions idle this long (0 = never)
+            finished_ttl: Keep finished sessions this long before dropping
+            gc_interval: Seconds between janitor sweeps (0 = no janitor;
+                call collect_garbage() yourself)
+            max_sessions: Refuse new sessions past this many active ones (0 = no limit)
+            on_session_end: Called with the session once its engine finishes
+            clock: Time source (injectable for tests)
+        """
+        self.loop_count = max(1, loop_count)
+        self.idle_timeout = idle_timeout
+        self.finished_ttl = finished_ttl
+        self.gc_interval = gc_interval
+        self.max_sessions = max_sessions
+        self.on_session_end = on_session_end
+        self.clock = clock
+
+        self._sessions: Dict[str, BattleSession] = {}
+        self._workers: List[_LoopWorker] = []
+        self._lock = threading.RLock()
+        self._janitor: Optional[Future] = None
+        self._round_robin = itertools.count()
+
+        # Stats
+        self.started = 0
+        self.finished = 0
+        self.failed = 0
+        self.collected = 0
+
+    # ------------------------------------------------------------------
+    # Loop pool
+    # ------------------------------------------------------------------
+
+    def _ensure_workers(self):
+        if self._workers:
+            return
+        self._workers = [_LoopWorker(i) for i in range(self.loop_count)]
+        if self.gc_interval > 0:
+            self._janitor = self._workers[0].submit(self._janitor_loop())
+
+    def _pick_loop(self) -> int:
+        """Index of the loop hosting the fewest active sessions."""
+        load = [0] * self.loop_count
+        for session in self._sessions.values():
+            if session.active:
+                load[session.loop_index] += 1
+        fewest = min(load)
+        candidates = [i for i, n in enumerate(load) if n == fewest]
+        return candidates[next(self._round_robin) % len(candidates)]
+
+    def run(self, coro: Awaitable, session_id: Optional[str] = None) -> Future:
+        """Schedule a coroutine on a session's loop (or loop 0)."""
+        with self._lock:
+            self._ensure_workers()
+            session = self._sessions.get(session_id) if session_id else None
+            worker = self._workers[session.loop_index if session else 0]
+        return worker.submit(coro)
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def start(self, kind: str, engine: Any, runner: Callable[[], Awaitable],
+              stop: Optional[Callable[[], Any]] = None, owner: Optional[str] = None,
+              session_id: Optional[str] = None) -> BattleSession:
+        """
+        Register a session and run its engine coroutine on the loop pool.
+
+        Args:
+            kind: Session type ('live', 'tournament', 'ai_vs_live', ...)
+            engine: Engine object (kept for state queries)
+            runner: Zero-arg callable returning the engine's main coroutine
+            stop: Zero-arg callable asking the engine to stop (sync or async)
+            owner: Socket.IO sid of the client that started it
+            session_id: Explicit id (random when omitted)
+
+        Returns:
+            The new BattleSession
+
+        Raises:
+            ValueError: If the session id is taken or max_sessions is reached
+        """
+        now = self.clock()
+        with self._lock:
+            session_id = session_id or new_session_id()
+            existing = self._sessions.get(session_id)
+            if existing is not None and existing.active:
+                raise ValueError(f"Session {session_id} is already running")
+            if self.max_sessions and self.active_count() >= self.max_sessions:
+                raise ValueError(f"Session limit reached ({self.max_sessions})")
+
+            self._ensure_workers()
+            session = BattleSession(
+                session_id=session_id, kind=kind, engine=engine, owner=owner,
+                created_at=now, last_activity=now, loop_index=self._pick_loop(),
+                _stop=stop
+            )
+            if owner:
+                session.members.add(owner)
+            self._sessions[session_id] = session
+            self.started += 1
+            session._future = self._workers[session.loop_index].submit(self._drive(session, runner))
+        return session
+
+    async def _drive(self, session: BattleSession, runner: Callable[[], Awaitable]):
+        session.status = "running"
+        try:
+            await runner()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            session.status = "failed"
+            session.error = str(e)
+            self.failed += 1
+            print(f"Session {session.session_id} ({session.kind}) error: {e}")
+        finally:
+            if session.status != "failed":
+                session.status = "finished"
+            session.finished_at = self.clock()
+            self.finished += 1
+            if self.on_session_end:
+                try:
+                    self.on_session_end(session)
+                except Exception as e:
+                    print(f"Session end callback error: {e}")
+
+    def get(self, session_id: Optional[str]) -> Optional[BattleSession]:
+        return self._sessions.get(session_id) if session_id else None
+
+    def sessions(self, kind: Optional[str] = None, active_only: bool = False) -> List[BattleSession]:
+        """Sessions, oldest first, optionally filtered by kind/activity."""
+        return [s for s in list(self._sessions.values())
+                if (kind is None or s.kind == kind) and (s.active or not active_only)]
+
+    def active_count(self, kind: Optional[str] = None) -> int:
+        return len(self.sessions(kind, active_only=True))
+
+    def resolve(self, kind: str, session_id: Optional[str] = None,
+                member: Optional[str] = None,
+                owner: Optional[str] = None) -> Optional[BattleSession]:
+        """
+        Find the session a request refers to.
+
+        Client requests pass `member` (the client's sid) and only see
+        sessions the client belongs to: the explicit id, else the newest
+        session of `kind` it joined. Control requests (stop, pause, ...)
+        pass `owner` instead and only see sessions that client started.
+        Server-side callers pass neither and get the explicit id, else the
+        only active session of `kind`.
+        """
+        if session_id:
+            session = self.get(session_id)
+            if session is None or session.kind != kind:
+                return None
+            candidates = [session]
+        else:
+            candidates = self.sessions(kind)
+
+        if owner:
+            candidates = [s for s in candidates if s.owner == owner]
+        elif member:
+            candidates = [s for s in candidates if member in s.members]
+        elif not session_id:
+            candidates = [s for s in candidates if s.active]
+            return candidates[0] if len(candidates) == 1 else None
+        return candidates[-1] if candidates else None
+
+    def touch(self, session_id: str):
+        """Record activity so the session isn't collected as idle."""
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.last_activity = self.clock()
+
+    def join(self, session_id: str, member: str) -> Optional[BattleSession]:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.members.add(member)
+            session.last_activity = self.clock()
+        return session
+
+    def leave(self, member: str):
+        """Forget a disconnected client in every session."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.members.discard(member)
+
+    def stop(self, session_id: str, timeout: float = 5.0) -> bool:
+        """
+        Ask a session's engine to stop, cancelling it if it doesn't finish.
+
+        Safe to call from any thread except the session's own loop.
+
+        Returns:
+            True if the session existed and was active
+        """
+        session = self._sessions.get(session_id)
+        if session is None or not session.active:
+            return False
+        session.status = "stopping"
+
+        if session._stop is not None:
+            try:
+                result = session._stop()
+                if asyncio.iscoroutine(result):
+                    self.run(result, session_id).result(timeout=timeout)
+            except Exception as e:
+                print(f"Error stopping session {session_id}: {e}")
+
+        future = session._future
+        if future is not None:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                future.cancel()
+        return True
+
+    def remove(self, session_id: str) -> Optional[BattleSession]:
+        with self._lock:
+            return self._sessions.pop(session_id, None)
+
+    # ------------------------------------------------------------------
+    # Garbage collection
+    # ------------------------------------------------------------------
+
+    def collect_garbage(self) -> List[str]:
+        """
+        Drop expired finished sessions and stop idle running ones.
+
+        Returns:
+            Ids of the sessions removed
+        """
+        now = self.clock()
+        expired, idle = [], []
+        with self._lock:
+            for session in self._sessions.values():
+                if session.finished_at is not None:
+                    if now - session.finished_at >= self.finished_ttl:
+                        expired.append(session.session_id)
+                elif self.idle_timeout and now - session.last_activity >= self.idle_timeout:
+                    idle.append(session.session_id)
+
+        for session_id in idle:
+            print(f"🧹 Stopping idle session {session_id}")
+            self._cancel(session_id)
+            expired.append(session_id)
+
+        with self._lock:
+            for session_id in expired:
+                self._sessions.pop(session_id, None)
+            self.collected += len(expired)
+        return expired
+
+    def _cancel(self, session_id: str):
+        """Stop without blocking (used by the janitor, which runs on loop 0)."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            return
+        session.status = "stopping"
+        if session._stop is not None:
+            try:
+                result = session._stop()
+                if asyncio.iscoroutine(result):
+                    self.run(result, session_id)
+            except Exception as e:
+                print(f"Error stopping session {session_id}: {e}")
+        if session._future is not None:
+            session._future.cancel()
+
+    async def _janitor_loop(self):
+        while True:
+            await asyncio.sleep(self.gc_interval)
+            try:
+                self.collect_garbage()
+            except Exception as e:
+                print(f"Session janitor error: {e}")
+
+    # ------------------------------------------------------------------
+    # Lifecycle / stats
+    # ------------------------------------------------------------------
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop every active session and the loop threads."""
+        for session in self.sessions(active_only=True):
+            self.stop(session.session_id, timeout=timeout)
+        with self._lock:
+            if self._janitor is not None:
+                self._janitor.cancel()
+                self._janitor = None
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts for /api/health and /api/sessions."""
+        by_kind: Dict[str, int] = {}
+        for session in self.sessions(active_only=True):
+            by_kind[session.kind] = by_kind.get(session.kind, 0) + 1
+        return {
+            "loops": len(self._workers),
+            "sessions": len(self._sessions),
+            "active": sum(by_kind.values()),
+            "active_by_kind": by_kind,
+            "started": self.started,
+            "finished": self.finished,
+            "failed": self.failed,
+            "collected": self.collected,
+        }